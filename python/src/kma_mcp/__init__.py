@@ -3,14 +3,20 @@
 MCP server for Korea Meteorological Administration API access
 """
 
-from importlib.metadata import PackageNotFoundError, version
-
-try:
-    __version__ = version('kma_mcp')
-except PackageNotFoundError:
-    __version__ = 'unknown'
-
 __author__ = """Jongsu Liam Kim"""
 __email__ = 'jongsukim8@gmail.com'
 
 __all__ = ['__version__']
+
+
+def __getattr__(name: str) -> str:
+    # Looking up the installed version is slow, so it is done on first access
+    if name != '__version__':
+        msg = f'module {__name__!r} has no attribute {name!r}'
+        raise AttributeError(msg)
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version('kma_mcp')
+    except PackageNotFoundError:
+        return 'unknown'
@@ -6,16 +6,28 @@ KMA weather observation data through standardized async tools, including:
 - Weather forecasts and warnings
 """
 
+import asyncio
 import logging
 import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 
 from dotenv import load_dotenv
 from fastmcp import FastMCP
 
-from kma_mcp.surface.async_aws_client import AsyncAWSClient
-from kma_mcp.tools import async_forecast_tools, async_surface_tools
+from kma_mcp.core.cache import configure_cache_from_env, get_cache
+from kma_mcp.core.lazy import lazy_module
+from kma_mcp.core.offload import configure_offload_from_env, get_offloader
+from kma_mcp.core.ratelimit import configure_rate_limit_from_env, quota_status
+from kma_mcp.core.resilience import configure_resilience_from_env, resilience_stats
+from kma_mcp.core.store import configure_store_from_env, get_store
+from kma_mcp.core.transport import aclose_http_clients, configure_from_env, get_async_http_client
+from kma_mcp.tools import async_forecast_tools, async_surface_tools, paging, warmup
+
+# Only needed once the API key check runs, after the server has started
+async_aws_client = lazy_module('kma_mcp.surface.async_aws_client')
 
 # Configure logging
 logging.basicConfig(
@@ -30,12 +42,56 @@ env_path = Path(__file__).resolve().parent.parent.parent.parent / '.env'
 load_dotenv(dotenv_path=env_path)
 logger.info('Loading environment from: %s', env_path)
 
-# Initialize FastMCP server
-mcp = FastMCP('KMA Weather Data (Async)')
+# Configure the response cache (KMA_CACHE_* variables), the observation store
+# (KMA_STORE_* variables), retries and circuit breakers (KMA_RETRY_*,
+# KMA_CIRCUIT_*, KMA_HEDGE_DELAY), rate limiting and quotas (KMA_RATE_*,
+# KMA_DAILY_QUOTA) and the shared HTTP connection pool (KMA_HTTP_* variables)
+# that uses them, and the page size of tool output (KMA_PAGE_* variables)
+configure_cache_from_env()
+configure_store_from_env()
+configure_resilience_from_env()
+configure_rate_limit_from_env()
+configure_from_env()
+paging.configure_paging_from_env()
+# Decode large responses in worker processes, off the event loop (KMA_PARSE_* variables)
+configure_offload_from_env()
 
 # Get API key from environment (from .env file or environment variable)
 API_KEY = os.getenv('KMA_API_KEY', '')
 
+# Prefetch live products right after each issuance (KMA_PREFETCH* variables)
+prefetcher = warmup.prefetch_from_env(API_KEY)
+
+
+@asynccontextmanager
+async def lifespan(_server: FastMCP) -> AsyncIterator[None]:
+    """Run the prefetcher; close the HTTP connection pool and parse workers on shutdown."""
+    if prefetcher is not None:
+        prefetcher.start()
+    try:
+        yield
+    finally:
+        if prefetcher is not None:
+            await prefetcher.stop()
+            logger.info('Prefetch stats: %s', prefetcher.stats())
+        await aclose_http_clients()
+        offloader = get_offloader()
+        if offloader is not None:
+            offloader.shutdown()
+            logger.info('Parse offload stats: %s', offloader.stats())
+        cache = get_cache()
+        if cache is not None:
+            logger.info('Response cache stats: %s', cache.stats())
+        store = get_store()
+        if store is not None:
+            logger.info('Observation store stats: %s', store.stats())
+        logger.info('Retry stats: %s', resilience_stats())
+        logger.info('API quota usage: %s', quota_status())
+
+
+# Initialize FastMCP server
+mcp = FastMCP('KMA Weather Data (Async)', lifespan=lifespan)
+
 # Set API key in modular tools
 async_surface_tools.set_api_key(API_KEY)
 async_forecast_tools.set_api_key(API_KEY)
@@ -64,17 +120,30 @@ mcp.tool(async_surface_tools.get_season_period)
 # Station Info
 mcp.tool(async_surface_tools.get_asos_station_list)
 mcp.tool(async_surface_tools.get_aws_station_list)
+mcp.tool(async_surface_tools.get_nearby_stations)
+# Observation Summaries
+mcp.tool(async_surface_tools.get_observation_summary)
+# Weather Snapshots
+mcp.tool(async_surface_tools.get_weather_snapshot)
 
 # Register forecast tools
 # Forecasts
 mcp.tool(async_forecast_tools.get_short_term_forecast)
 mcp.tool(async_forecast_tools.get_short_term_overview)
+mcp.tool(async_forecast_tools.get_village_forecast_by_location)
+mcp.tool(async_forecast_tools.get_village_forecast_batch)
 mcp.tool(async_forecast_tools.get_medium_term_forecast)
 # Weather Warnings
 mcp.tool(async_forecast_tools.get_current_weather_warnings)
+mcp.tool(async_forecast_tools.get_weather_warning_changes)
+mcp.tool(async_forecast_tools.get_warnings_at_location)
+mcp.tool(async_forecast_tools.get_warning_zones_batch)
 mcp.tool(async_forecast_tools.get_weather_warning_history)
 mcp.tool(async_forecast_tools.get_special_weather_report)
 
+# Register the continuation tool of paged results
+mcp.tool(paging.get_result_page)
+
 
 async def validate_api_key(api_key: str) -> bool:
     """Validate API key by making a simple API call.
@@ -92,8 +161,11 @@ async def validate_api_key(api_key: str) -> bool:
         return False
 
     try:
-        # Use AWS minutely data for validation (lightweight endpoint)
-        async with AsyncAWSClient(api_key) as client:
+        # Use AWS minutely data for validation (lightweight endpoint).
+        # Going through the shared pool leaves a warm connection for the first tool call.
+        async with async_aws_client.AsyncAWSClient(
+            api_key, http_client=get_async_http_client()
+        ) as client:
             # Get data from 10 minutes ago to ensure data availability
             test_time = datetime.now(UTC) - timedelta(minutes=10)
             # Test with a single station (104 = Bukgangneung)
@@ -112,29 +184,37 @@ async def validate_api_key(api_key: str) -> bool:
         return False
 
 
+async def _check_api_key(api_key: str) -> None:
+    """Validate the API key and log the outcome."""
+    if await validate_api_key(api_key):
+        logger.info('API key is valid and working')
+    else:
+        logger.error('API key validation failed - API calls may not work properly')
+        logger.error('Please check your API key at https://apihub.kma.go.kr/')
+
+
 async def main() -> None:
     """Initialize and run the async MCP server with API key validation."""
     logger.info('Starting KMA Async MCP server...')
 
-    # Validate API key on startup
+    # Validate API key in the background while the server starts
+    check = None
     if not API_KEY:
         logger.warning('KMA_API_KEY environment variable not set')
         logger.warning('Server will start but API calls will fail')
     else:
-        logger.info('Validating API key...')
-        if await validate_api_key(API_KEY):
-            logger.info('API key is valid and working')
-        else:
-            logger.error('API key validation failed - API calls may not work properly')
-            logger.error('Please check your API key at https://apihub.kma.go.kr/')
+        logger.info('Validating API key in the background...')
+        check = asyncio.create_task(_check_api_key(API_KEY))
 
     # Initialize and run the server
     logger.info('Server initialized successfully')
-    mcp.run(transport='stdio')
+    try:
+        await mcp.run_async(transport='stdio')
+    finally:
+        if check is not None:
+            check.cancel()
 
 
 if __name__ == '__main__':
     # Run the async MCP server
-    import asyncio
-
     asyncio.run(main())
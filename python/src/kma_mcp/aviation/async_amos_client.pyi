@@ -0,0 +1,8 @@
+# Generated by scripts/generate_async_stubs.py from the sync client; do not edit.
+from typing import Any
+
+from kma_mcp.core.client import AsyncKMAClient
+
+class AsyncAMOSClient(AsyncKMAClient):
+    async def get_airport_observations(self, tm: str, dtm: int = 60) -> dict[str, Any]: ...
+    async def get_amdar_data(self, tm1: str, tm2: str, st: str = 'E') -> dict[str, Any]: ...
@@ -0,0 +1,229 @@
+"""Core infrastructure shared by all KMA API clients.
+
+This package contains cross-cutting building blocks used by every client:
+- Sync and async client base classes built from one endpoint declaration
+- Pooled HTTP transport shared across client instances
+- Persistent response cache with per-class TTLs
+- Local store of past observations, read through by period endpoints
+- Retries, backoff and per-endpoint circuit breakers
+- Priority-aware rate limiting and daily quota accounting
+- Prefetching live products right after each issuance
+- Response decoding, including KMA fixed-width text responses
+- Decoding large responses in worker processes off the event loop
+- Columnar, NumPy-backed observation frames
+- Group-by reductions of observations per station, region and time bucket
+- Splitting long period queries into API-legal windows
+- Tailing live minutely feeds, fetching only new or corrected rows
+"""
+
+from typing import TYPE_CHECKING
+
+from kma_mcp.core.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from kma_mcp.core.aggregate import Aggregator, aggregate
+    from kma_mcp.core.cache import (
+        CacheClass,
+        ResponseCache,
+        configure_cache,
+        configure_cache_from_env,
+        get_cache,
+    )
+    from kma_mcp.core.client import AsyncKMAClient, KMAClient, async_client
+    from kma_mcp.core.columnar import ObservationFrame, to_frame
+    from kma_mcp.core.offload import (
+        ParseOffloader,
+        configure_offload,
+        configure_offload_from_env,
+        get_offloader,
+    )
+    from kma_mcp.core.parsing import (
+        MISSING_VALUES,
+        decode_response,
+        find_key_columns,
+        parse_fixed_width,
+    )
+    from kma_mcp.core.prefetch import (
+        PrefetchJob,
+        PrefetchScheduler,
+        configure_prefetch,
+        get_prefetch_store,
+    )
+    from kma_mcp.core.ratelimit import (
+        Priority,
+        QuotaExceededError,
+        configure_rate_limit,
+        configure_rate_limit_from_env,
+        quota_status,
+        request_priority,
+    )
+    from kma_mcp.core.resilience import (
+        CircuitOpenError,
+        RetryPolicy,
+        configure_resilience,
+        configure_resilience_from_env,
+        resilience_stats,
+    )
+    from kma_mcp.core.store import (
+        ObservationStore,
+        configure_store,
+        configure_store_from_env,
+        get_store,
+    )
+    from kma_mcp.core.tailing import TailCursor, atail, tail
+    from kma_mcp.core.transport import (
+        aclose_http_clients,
+        close_http_clients,
+        configure,
+        configure_from_env,
+        get_async_http_client,
+        get_http_client,
+        http2_available,
+    )
+    from kma_mcp.core.windowing import (
+        DAILY,
+        HOURLY,
+        MINUTELY,
+        PeriodSpec,
+        afetch_period,
+        fetch_period,
+        merge_chunks,
+        split_period,
+    )
+
+# Members are imported on first access, so that importing one submodule (as
+# the MCP servers do at start-up) does not import NumPy and every other module
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        'kma_mcp.core.aggregate': ('Aggregator', 'aggregate'),
+        'kma_mcp.core.cache': (
+            'CacheClass',
+            'ResponseCache',
+            'configure_cache',
+            'configure_cache_from_env',
+            'get_cache',
+        ),
+        'kma_mcp.core.client': ('AsyncKMAClient', 'KMAClient', 'async_client'),
+        'kma_mcp.core.columnar': ('ObservationFrame', 'to_frame'),
+        'kma_mcp.core.offload': (
+            'ParseOffloader',
+            'configure_offload',
+            'configure_offload_from_env',
+            'get_offloader',
+        ),
+        'kma_mcp.core.parsing': (
+            'MISSING_VALUES',
+            'decode_response',
+            'find_key_columns',
+            'parse_fixed_width',
+        ),
+        'kma_mcp.core.prefetch': (
+            'PrefetchJob',
+            'PrefetchScheduler',
+            'configure_prefetch',
+            'get_prefetch_store',
+        ),
+        'kma_mcp.core.ratelimit': (
+            'Priority',
+            'QuotaExceededError',
+            'configure_rate_limit',
+            'configure_rate_limit_from_env',
+            'quota_status',
+            'request_priority',
+        ),
+        'kma_mcp.core.resilience': (
+            'CircuitOpenError',
+            'RetryPolicy',
+            'configure_resilience',
+            'configure_resilience_from_env',
+            'resilience_stats',
+        ),
+        'kma_mcp.core.store': (
+            'ObservationStore',
+            'configure_store',
+            'configure_store_from_env',
+            'get_store',
+        ),
+        'kma_mcp.core.tailing': ('TailCursor', 'atail', 'tail'),
+        'kma_mcp.core.transport': (
+            'aclose_http_clients',
+            'close_http_clients',
+            'configure',
+            'configure_from_env',
+            'get_async_http_client',
+            'get_http_client',
+            'http2_available',
+        ),
+        'kma_mcp.core.windowing': (
+            'DAILY',
+            'HOURLY',
+            'MINUTELY',
+            'PeriodSpec',
+            'afetch_period',
+            'fetch_period',
+            'merge_chunks',
+            'split_period',
+        ),
+    },
+)
+
+__all__ = [
+    'DAILY',
+    'HOURLY',
+    'MINUTELY',
+    'MISSING_VALUES',
+    'Aggregator',
+    'AsyncKMAClient',
+    'CacheClass',
+    'CircuitOpenError',
+    'KMAClient',
+    'ObservationFrame',
+    'ObservationStore',
+    'ParseOffloader',
+    'PeriodSpec',
+    'PrefetchJob',
+    'PrefetchScheduler',
+    'Priority',
+    'QuotaExceededError',
+    'ResponseCache',
+    'RetryPolicy',
+    'TailCursor',
+    'aclose_http_clients',
+    'afetch_period',
+    'aggregate',
+    'async_client',
+    'atail',
+    'close_http_clients',
+    'configure',
+    'configure_cache',
+    'configure_cache_from_env',
+    'configure_from_env',
+    'configure_offload',
+    'configure_offload_from_env',
+    'configure_prefetch',
+    'configure_rate_limit',
+    'configure_rate_limit_from_env',
+    'configure_resilience',
+    'configure_resilience_from_env',
+    'configure_store',
+    'configure_store_from_env',
+    'decode_response',
+    'fetch_period',
+    'find_key_columns',
+    'get_async_http_client',
+    'get_cache',
+    'get_http_client',
+    'get_offloader',
+    'get_prefetch_store',
+    'get_store',
+    'http2_available',
+    'merge_chunks',
+    'parse_fixed_width',
+    'quota_status',
+    'request_priority',
+    'resilience_stats',
+    'split_period',
+    'tail',
+    'to_frame',
+]
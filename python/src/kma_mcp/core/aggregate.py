@@ -0,0 +1,276 @@
+"""Server-side group-by reductions of observation tables.
+
+Agents that need an hourly mean of every AWS station should not receive
+every minutely row. :class:`Aggregator` reduces observation tables to
+min/max/mean/sum/count per station (or region, or all stations together)
+and per time bucket (10 minutes, hour, day or the whole period), so that
+only the summary leaves the server.
+
+Reductions are vectorized with NumPy: rows are sorted by group and every
+statistic is one ``reduceat`` call per variable. Results are mergeable, so a
+long period can be fed window by window (see
+:func:`kma_mcp.core.windowing.fetch_period`) and only the partial sums,
+counts and extremes of the groups seen so far are kept in memory.
+
+Example:
+    >>> from kma_mcp.core.aggregate import Aggregator
+    >>> from kma_mcp.core.windowing import fetch_period
+    >>> from kma_mcp.surface.aws_client import AWSClient
+    >>> aggregator = Aggregator(['TA', 'HM'], bucket='hour', statistics=('mean', 'max'))
+    >>> with AWSClient('your_auth_key') as client:
+    ...     for chunk in fetch_period(client.get_minutely_data, '202501010000', '202501012359'):
+    ...         aggregator.add(chunk)
+    >>> summary = aggregator.result()  # {'STN': [...], 'TM': [...], 'TA_mean': [...], ...}
+"""
+
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+from kma_mcp.core.columnar import ObservationFrame, to_frame
+
+# Bucket sizes in seconds (0 reduces the whole period to one bucket)
+BUCKETS = {'10min': 600, 'hour': 3600, 'day': 86400, 'all': 0}
+GROUPS = ('station', 'region', 'all')
+STATISTICS = ('mean', 'min', 'max', 'sum', 'count')
+
+UNKNOWN_REGION = 'unknown'
+
+# Partial state of one variable: sum, count, min and max per group
+_Partial = tuple[
+    npt.NDArray[np.float64],
+    npt.NDArray[np.int64],
+    npt.NDArray[np.float64],
+    npt.NDArray[np.float64],
+]
+
+
+def _empty(size: int) -> _Partial:
+    """Partial state of a variable absent from ``size`` groups."""
+    missing = np.full(size, np.nan)
+    return np.zeros(size), np.zeros(size, dtype=np.int64), missing, missing
+
+
+def _check_choice(name: str, value: str, choices: Sequence[str]) -> None:
+    if value not in choices:
+        msg = f'{name} must be one of {", ".join(choices)}, got {value!r}'
+        raise ValueError(msg)
+
+
+class Aggregator:
+    """Accumulate observation tables and reduce them per group and time bucket."""
+
+    def __init__(
+        self,
+        variables: Sequence[str] | None = None,
+        *,
+        group_by: str = 'station',
+        bucket: str = 'hour',
+        statistics: Sequence[str] = ('mean', 'min', 'max'),
+        regions: Mapping[int, str] | None = None,
+    ) -> None:
+        """Initialize the aggregator.
+
+        Args:
+            variables: Columns to reduce, matched case-insensitively (default:
+                every numeric column except the station and time columns)
+            group_by: 'station', 'region' or 'all'
+            bucket: Time bucket, one of '10min', 'hour', 'day' or 'all'
+            statistics: Statistics to report, from 'mean', 'min', 'max', 'sum', 'count'
+            regions: Region name of each station ID, required to group by region
+
+        Raises:
+            ValueError: If an option is not one of the supported values
+        """
+        _check_choice('group_by', group_by, GROUPS)
+        _check_choice('bucket', bucket, tuple(BUCKETS))
+        for statistic in statistics:
+            _check_choice('statistic', statistic, STATISTICS)
+        if group_by == 'region' and regions is None:
+            msg = 'regions are required to group by region'
+            raise ValueError(msg)
+
+        self.variables = None if variables is None else list(variables)
+        self.group_by = group_by
+        self.bucket = bucket
+        self.statistics = tuple(statistics)
+        self.regions = regions
+        self._keys: npt.NDArray[Any] = np.array([], dtype=object)
+        self._buckets = np.array([], dtype=np.int64)
+        self._rows = np.array([], dtype=np.int64)
+        self._partials: dict[str, _Partial] = {}
+
+    def _select(self, frame: ObservationFrame) -> list[str]:
+        keys = {frame.station_column, frame.time_column}
+        numeric = [
+            name for name in frame.columns if name not in keys and frame[name].dtype.kind in 'iuf'
+        ]
+        if self.variables is None:
+            return numeric
+        by_key = {name.lower(): name for name in numeric}
+        unknown = [name for name in self.variables if name.lower() not in by_key]
+        if unknown:
+            msg = f'Unknown variables {unknown}, available: {", ".join(numeric)}'
+            raise ValueError(msg)
+        return [by_key[name.lower()] for name in self.variables]
+
+    def _group_keys(self, frame: ObservationFrame) -> npt.NDArray[Any]:
+        if self.group_by == 'all':
+            return np.zeros(len(frame), dtype=np.int64)
+        if frame.station_column is None:
+            msg = f'Cannot group by {self.group_by}: the data has no station column'
+            raise ValueError(msg)
+        stations = frame[frame.station_column]
+        if self.group_by == 'station':
+            return stations
+        # Look up each distinct station once, then broadcast to the rows
+        ids, inverse = np.unique(stations, return_inverse=True)
+        names = [(self.regions or {}).get(int(stn), UNKNOWN_REGION) for stn in ids.tolist()]
+        return np.array(names, dtype=object)[inverse]
+
+    def _bucket_starts(self, frame: ObservationFrame) -> npt.NDArray[np.int64]:
+        size = BUCKETS[self.bucket]
+        times = frame.times
+        if size == 0 or times is None:
+            if size:
+                msg = f'Cannot bucket by {self.bucket}: the data has no time column'
+                raise ValueError(msg)
+            return np.zeros(len(frame), dtype=np.int64)
+        return times.astype(np.int64) // size * size
+
+    def add(self, data: Mapping[str, Any] | ObservationFrame) -> None:
+        """Reduce one table (e.g. one period window) into the running result.
+
+        Args:
+            data: Client response or frame
+
+        Raises:
+            ValueError: If a variable is missing or the data cannot be grouped as requested
+        """
+        frame = data if isinstance(data, ObservationFrame) else to_frame(data)
+        if not len(frame):
+            return
+        variables = self._select(frame)
+        keys = self._group_keys(frame)
+        buckets = self._bucket_starts(frame)
+        observed = np.ones(len(frame), dtype=bool)
+        if frame.times is not None and BUCKETS[self.bucket]:
+            observed = ~np.isnat(frame.times)
+
+        partials: dict[str, _Partial] = {}
+        for name in variables:
+            values = frame[name].astype(np.float64)[observed]
+            valid = ~np.isnan(values)
+            partials[name] = (np.where(valid, values, 0.0), valid.astype(np.int64), values, values)
+
+        rows = np.ones(int(observed.sum()), dtype=np.int64)
+        self._merge(keys[observed], buckets[observed], rows, partials)
+
+    def _merge(
+        self,
+        keys: npt.NDArray[Any],
+        buckets: npt.NDArray[np.int64],
+        rows: npt.NDArray[np.int64],
+        partials: dict[str, _Partial],
+    ) -> None:
+        """Reduce new partial states together with the running ones."""
+        if len(self._rows):
+            old_size, new_size = len(self._rows), len(rows)
+            partials = {
+                name: tuple(  # type: ignore[misc]
+                    np.concatenate([old, new])
+                    for old, new in zip(
+                        self._partials.get(name) or _empty(old_size),
+                        partials.get(name) or _empty(new_size),
+                        strict=True,
+                    )
+                )
+                for name in dict.fromkeys([*self._partials, *partials])
+            }
+            keys = np.concatenate([self._keys, keys])
+            buckets = np.concatenate([self._buckets, buckets])
+            rows = np.concatenate([self._rows, rows])
+
+        _, key_codes = np.unique(keys, return_inverse=True)
+        order = np.lexsort((buckets, key_codes))
+        key_codes, buckets = key_codes[order], buckets[order]
+        changed = np.ones(len(order), dtype=bool)
+        changed[1:] = (key_codes[1:] != key_codes[:-1]) | (buckets[1:] != buckets[:-1])
+        starts = np.flatnonzero(changed)
+
+        self._keys = keys[order][starts]
+        self._buckets = buckets[starts]
+        self._rows = np.add.reduceat(rows[order], starts)
+        self._partials = {
+            name: (
+                np.add.reduceat(total[order], starts),
+                np.add.reduceat(count[order], starts),
+                # fmin/fmax skip NaN unless every value of the group is missing
+                np.fmin.reduceat(low[order], starts),
+                np.fmax.reduceat(high[order], starts),
+            )
+            for name, (total, count, low, high) in partials.items()
+        }
+
+    def result(self) -> dict[str, list[Any]]:
+        """Return the summary as columnar data.
+
+        Returns:
+            Columns 'STN' or 'REGION' (unless grouping all stations together),
+            'TM' (bucket start as 'YYYYMMDDHHmm', unless bucket is 'all'),
+            'rows', and '<variable>_<statistic>' for every variable and
+            statistic. Statistics of groups without valid values are None.
+        """
+        result: dict[str, list[Any]] = {}
+        if self.group_by != 'all':
+            result['STN' if self.group_by == 'station' else 'REGION'] = self._keys.tolist()
+        if BUCKETS[self.bucket]:
+            starts = self._buckets.astype('datetime64[s]').astype('datetime64[m]')
+            result['TM'] = [
+                text.replace('-', '').replace('T', '').replace(':', '')
+                for text in np.datetime_as_string(starts).tolist()
+            ]
+        result['rows'] = self._rows.tolist()
+
+        for name, (total, count, low, high) in self._partials.items():
+            missing = count == 0
+            with np.errstate(invalid='ignore', divide='ignore'):
+                values = {
+                    'mean': total / count,
+                    'min': low,
+                    'max': high,
+                    'sum': total,
+                    'count': count,
+                }
+            for statistic in self.statistics:
+                column = values[statistic]
+                if statistic == 'count':
+                    result[f'{name}_count'] = column.tolist()
+                    continue
+                result[f'{name}_{statistic}'] = [
+                    None if empty else value
+                    for value, empty in zip(column.tolist(), missing.tolist(), strict=True)
+                ]
+        return result
+
+
+def aggregate(
+    data: Mapping[str, Any] | ObservationFrame,
+    variables: Sequence[str] | None = None,
+    **options: Any,  # noqa: ANN401
+) -> dict[str, list[Any]]:
+    """Reduce one table per group and time bucket.
+
+    Args:
+        data: Client response or frame
+        variables: Columns to reduce (default: every numeric column)
+        **options: ``group_by``, ``bucket``, ``statistics`` and ``regions``, see :class:`Aggregator`
+
+    Returns:
+        Summary as columnar data, see :meth:`Aggregator.result`
+    """
+    aggregator = Aggregator(variables, **options)
+    aggregator.add(data)
+    return aggregator.result()
@@ -0,0 +1,513 @@
+"""Persistent response cache for KMA API requests.
+
+Much of what the API Hub serves never changes once it is in the past
+(observations for past days, climate normals, typhoon history) or changes
+rarely (station and zone lists), yet every call counts against the daily
+quota. This module caches response bodies keyed by endpoint and query
+parameters (the auth key excluded), with a TTL chosen by request class:
+
+- ``immutable``: every time parameter lies further in the past than the
+  settle period, or the endpoint serves fixed reference data such as normals
+- ``slow``: station lists, forecast and warning zone codes
+- ``live``: everything else (current observations, latest forecasts)
+
+The cache is an httpx transport wrapper, so it sits beneath every client's
+``_make_request`` without changing it. It is disabled unless configured;
+when enabled, the shared clients from :mod:`kma_mcp.core.transport` use it.
+
+Example:
+    >>> from kma_mcp.core.cache import configure_cache, get_cache
+    >>> from kma_mcp.core.transport import get_http_client
+    >>> from kma_mcp.surface.asos_client import ASOSClient
+    >>> configure_cache('~/.cache/kma-mcp/responses.sqlite')
+    >>> with ASOSClient('your_auth_key', http_client=get_http_client()) as client:
+    ...     client.get_daily_period('20200101', '20200131')  # miss, stored
+    ...     client.get_daily_period('20200101', '20200131')  # hit, no API call
+    >>> get_cache().stats()['immutable']
+    {'hits': 1, 'misses': 1}
+"""
+
+import hashlib
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections.abc import Mapping
+from datetime import datetime, timedelta, timezone
+from enum import StrEnum
+from pathlib import Path
+from typing import Protocol
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+KST = timezone(timedelta(hours=9))
+
+# Parameters that never take part in the cache key
+_IGNORED_PARAMS = frozenset({'authKey', 'serviceKey'})
+# Query parameters holding the last observation, forecast or issue time of a request
+_TIME_PARAMS = ('tm', 'tm2', 'tm_ed', 'tm_fc', 'tm_ef', 'tmFc', 'year', 'year2')
+_DATE_PARAMS = ('base_date',)
+# Start of a range and the parameters that end it; without an end the range runs until now
+_RANGE_ENDS = {'tm1': ('tm2',), 'tm_st': ('tm_ed', 'tm'), 'year1': ('year2',)}
+
+# Endpoints serving reference data that does not depend on time
+_IMMUTABLE_ENDPOINTS = frozenset(
+    {
+        'kma_clm_daily.php',
+        'kma_clm_tenday.php',
+        'kma_clm_month.php',
+        'kma_clm_year.php',
+        'sfc_norm1.php',
+    }
+)
+_SLOW_ENDPOINTS = frozenset(
+    {
+        'kma_stnlist.php',
+        'kma_aws_stnlist.php',
+        'fct_shrt_reg.php',
+        'fct_medm_reg.php',
+        'wrn_reg.php',
+        'wrn_reg_aws2.php',
+        'getFcstZoneCd',
+        'getWrnZoneCd',
+    }
+)
+
+
+# The API Hub answers bad keys, spent quotas and empty results with status 200 too
+_RESULT_CODE = re.compile(rb'<?"?resultCode"?\s*[:>]\s*"?(\w+)')
+_HUB_ERROR = re.compile(rb'\A\s*\{\s*"result"\s*:\s*\{\s*"status"')
+_DATA_LINE = re.compile(rb'^[ \t]*[^#\s]', re.MULTILINE)
+# OpenAPI result codes are in the header at the start of the body
+_HEADER_BYTES = 1024
+
+
+class CacheClass(StrEnum):
+    """How long a response may be reused."""
+
+    IMMUTABLE = 'immutable'
+    SLOW = 'slow'
+    LIVE = 'live'
+
+
+DEFAULT_TTLS = {
+    CacheClass.IMMUTABLE: 365 * 24 * 3600.0,
+    CacheClass.SLOW: 24 * 3600.0,
+    # Live data is not cached on disk by default
+    CacheClass.LIVE: 0.0,
+}
+# How long after the fact observations may still be corrected by quality control
+DEFAULT_SETTLE = timedelta(days=2)
+
+
+def _period_end(value: str) -> datetime | None:
+    """Return the end of the period a KMA time parameter refers to."""
+    digits = value.strip()
+    if not digits.isdigit():
+        return None
+    try:
+        if len(digits) == 4:
+            return datetime(int(digits) + 1, 1, 1, tzinfo=KST)
+        if len(digits) == 6:
+            start = datetime.strptime(digits, '%Y%m').replace(tzinfo=KST)
+            return (start + timedelta(days=32)).replace(day=1)
+        if len(digits) == 8:
+            return datetime.strptime(digits, '%Y%m%d').replace(tzinfo=KST) + timedelta(days=1)
+        if len(digits) == 10:
+            return datetime.strptime(digits, '%Y%m%d%H').replace(tzinfo=KST) + timedelta(hours=1)
+        if len(digits) == 12:
+            return datetime.strptime(digits, '%Y%m%d%H%M').replace(tzinfo=KST)
+    except ValueError:
+        return None
+    return None
+
+
+def classify(
+    endpoint: str,
+    params: Mapping[str, str],
+    *,
+    settle: timedelta = DEFAULT_SETTLE,
+    now: datetime | None = None,
+) -> CacheClass:
+    """Classify a request by how long its response stays valid.
+
+    Time-dependent requests are classified by the end of the period they
+    cover; a range given only by its start (``tm1`` without ``tm2``) runs
+    until now and is live.
+
+    Args:
+        endpoint: URL path of the request
+        params: Query parameters
+        settle: Age after which past data is considered final
+        now: Current time (defaults to the wall clock)
+
+    Returns:
+        Cache class of the request
+    """
+    name = endpoint.rstrip('/').rsplit('/', 1)[-1]
+    if name in _IMMUTABLE_ENDPOINTS:
+        return CacheClass.IMMUTABLE
+    if name in _SLOW_ENDPOINTS:
+        return CacheClass.SLOW
+
+    for start, end_params in _RANGE_ENDS.items():
+        if params.get(start) and not any(params.get(key) for key in end_params):
+            return CacheClass.LIVE
+    ends = [_period_end(params[key]) for key in _TIME_PARAMS + _DATE_PARAMS if params.get(key)]
+    if not ends or None in ends:
+        return CacheClass.LIVE
+    now = now or datetime.now(KST)
+    latest = max(end for end in ends if end is not None)
+    return CacheClass.IMMUTABLE if latest + settle <= now else CacheClass.LIVE
+
+
+def carries_data(content: bytes) -> bool:
+    """Tell whether a 200 response body holds data rather than a KMA error.
+
+    OpenAPI services report errors and empty results with a ``resultCode``
+    other than ``00`` (``03`` is NO_DATA, ``30`` an unregistered key), API Hub
+    endpoints with a JSON ``result`` status, and a text table without rows
+    means there was nothing to return.
+
+    Args:
+        content: Response body
+
+    Returns:
+        True if the body may be cached
+    """
+    head = content[:_HEADER_BYTES]
+    code = _RESULT_CODE.search(head)
+    if code is not None:
+        return code.group(1) == b'00'
+    if _HUB_ERROR.match(head) or b'cmmMsgHeader' in head:
+        return False
+    if head.lstrip()[:1] in {b'{', b'['}:
+        return True
+    return _DATA_LINE.search(content) is not None
+
+
+def cache_key(url: httpx.URL) -> str:
+    """Build the cache key of a request URL, ignoring the auth key and parameter order.
+
+    Args:
+        url: Request URL including query parameters
+
+    Returns:
+        Hex digest identifying the request
+    """
+    params = sorted((k, v) for k, v in url.params.multi_items() if k not in _IGNORED_PARAMS)
+    query = '&'.join(f'{key}={value}' for key, value in params)
+    return hashlib.sha256(f'{url.host}{url.path}?{query}'.encode()).hexdigest()
+
+
+class CacheBackend(Protocol):
+    """Storage used by :class:`ResponseCache`."""
+
+    def get(self, key: str) -> tuple[bytes, str] | None:
+        """Return the (content, content type) stored under key, if not expired."""
+        ...
+
+    def set(self, key: str, content: bytes, content_type: str, expires: float) -> None:
+        """Store a response body until the given UNIX time."""
+        ...
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        ...
+
+
+class MemoryCacheBackend:
+    """In-process cache storage, lost when the process exits."""
+
+    def __init__(self) -> None:
+        """Initialize an empty store."""
+        self._entries: dict[str, tuple[bytes, str, float]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> tuple[bytes, str] | None:
+        """Return the (content, content type) stored under key, if not expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[2] <= time.time():
+                del self._entries[key]
+                return None
+            return entry[0], entry[1]
+
+    def set(self, key: str, content: bytes, content_type: str, expires: float) -> None:
+        """Store a response body until the given UNIX time."""
+        with self._lock:
+            self._entries[key] = (content, content_type, expires)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._entries.clear()
+
+
+class SQLiteCacheBackend:
+    """Cache storage in a SQLite database file, shared between processes."""
+
+    def __init__(self, path: str | Path) -> None:
+        """Open (or create) the cache database.
+
+        Args:
+            path: Database file path; parent directories are created
+        """
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS responses ('
+            'key TEXT PRIMARY KEY, content BLOB NOT NULL, '
+            'content_type TEXT NOT NULL, expires REAL NOT NULL)'
+        )
+
+    def get(self, key: str) -> tuple[bytes, str] | None:
+        """Return the (content, content type) stored under key, if not expired."""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT content, content_type FROM responses WHERE key = ? AND expires > ?',
+                (key, time.time()),
+            ).fetchone()
+        return None if row is None else (bytes(row[0]), row[1])
+
+    def set(self, key: str, content: bytes, content_type: str, expires: float) -> None:
+        """Store a response body until the given UNIX time."""
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)',
+                (key, content, content_type, expires),
+            )
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._conn.execute('DELETE FROM responses')
+
+    def purge_expired(self) -> int:
+        """Delete expired entries.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            cursor = self._conn.execute('DELETE FROM responses WHERE expires <= ?', (time.time(),))
+        return cursor.rowcount
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+class ResponseCache:
+    """Response cache with per-class TTLs and hit/miss counters."""
+
+    def __init__(
+        self,
+        backend: CacheBackend,
+        *,
+        ttls: Mapping[CacheClass, float] | None = None,
+        settle: timedelta = DEFAULT_SETTLE,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            backend: Storage for response bodies
+            ttls: Seconds to keep responses of each class (0 disables caching for a class)
+            settle: Age after which past data is considered final
+        """
+        self.backend = backend
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.settle = settle
+        self._lock = threading.Lock()
+        self._counters = {cls: {'hits': 0, 'misses': 0} for cls in CacheClass}
+
+    def classify(self, request: httpx.Request) -> CacheClass:
+        """Classify a request by how long its response stays valid."""
+        return classify(request.url.path, dict(request.url.params), settle=self.settle)
+
+    def _count(self, cls: CacheClass, counter: str) -> None:
+        with self._lock:
+            self._counters[cls][counter] += 1
+
+    def lookup(self, request: httpx.Request) -> httpx.Response | None:
+        """Return the cached response for a request, or None on a miss."""
+        if request.method != 'GET':
+            return None
+        cls = self.classify(request)
+        if self.ttls[cls] <= 0:
+            return None
+        entry = self.backend.get(cache_key(request.url))
+        if entry is None:
+            self._count(cls, 'misses')
+            return None
+        self._count(cls, 'hits')
+        content, content_type = entry
+        return httpx.Response(
+            200,
+            headers={'Content-Type': content_type, 'X-KMA-Cache': cls.value},
+            content=content,
+            request=request,
+        )
+
+    def store(self, request: httpx.Request, response: httpx.Response) -> None:
+        """Store a successful response whose body has been read.
+
+        Errors the API Hub returns with status 200 are not stored: the cache
+        key ignores the auth key, so they would be served to every caller.
+        """
+        if request.method != 'GET' or response.status_code != httpx.codes.OK:
+            return
+        ttl = self.ttls[self.classify(request)]
+        if ttl <= 0 or not carries_data(response.content):
+            return
+        self.backend.set(
+            cache_key(request.url),
+            response.content,
+            response.headers.get('Content-Type', ''),
+            time.time() + ttl,
+        )
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """Return hit and miss counts per cache class."""
+        with self._lock:
+            return {cls.value: dict(counts) for cls, counts in self._counters.items()}
+
+    def clear(self) -> None:
+        """Remove every cached response and reset the counters."""
+        self.backend.clear()
+        with self._lock:
+            for counts in self._counters.values():
+                counts.update(hits=0, misses=0)
+
+
+class CachingTransport(httpx.BaseTransport):
+    """Sync httpx transport that answers from a :class:`ResponseCache` when it can."""
+
+    def __init__(self, transport: httpx.BaseTransport, cache: ResponseCache) -> None:
+        """Wrap a transport.
+
+        Args:
+            transport: Transport used on cache misses
+            cache: Response cache
+        """
+        self._transport = transport
+        self._cache = cache
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        """Serve a request from the cache or forward it."""
+        cached = self._cache.lookup(request)
+        if cached is not None:
+            return cached
+        response = self._transport.handle_request(request)
+        if response.status_code == httpx.codes.OK:
+            response.read()
+            self._cache.store(request, response)
+        return response
+
+    def close(self) -> None:
+        """Close the wrapped transport."""
+        self._transport.close()
+
+
+class AsyncCachingTransport(httpx.AsyncBaseTransport):
+    """Async httpx transport that answers from a :class:`ResponseCache` when it can."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, cache: ResponseCache) -> None:
+        """Wrap a transport.
+
+        Args:
+            transport: Transport used on cache misses
+            cache: Response cache
+        """
+        self._transport = transport
+        self._cache = cache
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Serve a request from the cache or forward it."""
+        # Lookups are local SQLite reads, well below a network round trip
+        cached = self._cache.lookup(request)
+        if cached is not None:
+            return cached
+        response = await self._transport.handle_async_request(request)
+        if response.status_code == httpx.codes.OK:
+            await response.aread()
+            self._cache.store(request, response)
+        return response
+
+    async def aclose(self) -> None:
+        """Close the wrapped transport."""
+        await self._transport.aclose()
+
+
+_cache: ResponseCache | None = None
+
+
+def configure_cache(
+    path: str | Path | None,
+    *,
+    ttls: Mapping[CacheClass, float] | None = None,
+    settle: timedelta = DEFAULT_SETTLE,
+) -> ResponseCache | None:
+    """Enable, replace or disable the process-wide response cache.
+
+    Shared HTTP clients created after this call use the new cache.
+
+    Args:
+        path: SQLite database path, ':memory:' for an in-process cache, or None to disable
+        ttls: Seconds to keep responses of each class
+        settle: Age after which past data is considered final
+
+    Returns:
+        The configured cache, or None when disabled
+    """
+    global _cache
+    if path is None:
+        _cache = None
+        return None
+    backend: CacheBackend = (
+        MemoryCacheBackend() if str(path) == ':memory:' else SQLiteCacheBackend(path)
+    )
+    _cache = ResponseCache(backend, ttls=ttls, settle=settle)
+    return _cache
+
+
+def configure_cache_from_env() -> ResponseCache | None:
+    """Configure the response cache from environment variables.
+
+    Recognised variables:
+        KMA_CACHE_PATH: SQLite database path, or ':memory:' (cache disabled when unset)
+        KMA_CACHE_TTL_IMMUTABLE: Seconds to keep past data
+        KMA_CACHE_TTL_SLOW: Seconds to keep station and zone lists
+        KMA_CACHE_TTL_LIVE: Seconds to keep current data (default 0, not cached)
+        KMA_CACHE_SETTLE_HOURS: Hours after which past observations are final
+
+    Returns:
+        The configured cache, or None when disabled
+    """
+    ttls = {}
+    for cls in CacheClass:
+        value = os.getenv(f'KMA_CACHE_TTL_{cls.name}')
+        if value:
+            ttls[cls] = float(value)
+    settle_hours = os.getenv('KMA_CACHE_SETTLE_HOURS')
+    settle = timedelta(hours=float(settle_hours)) if settle_hours else DEFAULT_SETTLE
+
+    cache = configure_cache(os.getenv('KMA_CACHE_PATH') or None, ttls=ttls, settle=settle)
+    if cache is not None:
+        logger.info('Response cache enabled: %s', os.getenv('KMA_CACHE_PATH'))
+    return cache
+
+
+def get_cache() -> ResponseCache | None:
+    """Get the process-wide response cache, or None when caching is disabled."""
+    return _cache
@@ -0,0 +1,327 @@
+"""Base classes shared by all KMA API clients.
+
+Every client declares its endpoints once, as methods that build the query
+parameters and return ``self._make_request(endpoint, params)``. Those methods
+never touch the HTTP client themselves, so the same method body serves both
+transports: :class:`KMAClient` performs the request and returns the decoded
+data, while :class:`AsyncKMAClient` returns an awaitable of it.
+
+The async variant of a client is derived at runtime with :func:`async_client`,
+which copies the endpoint methods onto :class:`AsyncKMAClient`; its typed
+signatures live in the ``async_*_client.pyi`` stub next to it, generated with
+``scripts/generate_async_stubs.py``. Anything
+implemented in the request path (connection pooling, caching, decoding,
+retries, rate limiting) is therefore written once and applies to every
+endpoint of both the sync and the async clients. Period endpoints listed in a
+client's ``TIME_SERIES`` are read through the local observation store when
+one is configured (see :mod:`kma_mcp.core.store`), and the async clients
+decode large bodies in worker processes when offloading is configured (see
+:mod:`kma_mcp.core.offload`).
+
+Example:
+    >>> class UVClient(KMAClient):
+    ...     def get_observation_data(self, tm: str) -> dict[str, Any]:
+    ...         return self._make_request('kma_sfctm_uv.php', {'tm': tm})
+    >>> AsyncUVClient = async_client(UVClient, __name__)
+    >>> async with AsyncUVClient('your_auth_key') as client:
+    ...     data = await client.get_observation_data('202203211500')
+"""
+
+import functools
+import inspect
+from collections.abc import Callable
+from datetime import datetime
+from typing import Any, ClassVar, Self, TypeVar
+
+import httpx
+
+from kma_mcp.core.offload import adecode_response
+from kma_mcp.core.parsing import decode_response
+from kma_mcp.core.resilience import AsyncResilientTransport, ResilientTransport
+from kma_mcp.core.store import ReadPlan, get_store
+from kma_mcp.core.windowing import PeriodSpec
+
+TYP01_URL = 'https://apihub.kma.go.kr/api/typ01/url'
+CGI_URL = 'https://apihub.kma.go.kr/api/typ01/cgi-bin/url'
+OPENAPI_URL = 'https://apihub.kma.go.kr/api/typ02/openApi'
+
+T = TypeVar('T')
+
+
+class _BaseClient:
+    """Configuration and request building common to both transports."""
+
+    BASE_URL: ClassVar[str] = TYP01_URL
+    CGI_BASE_URL: ClassVar[str] = CGI_URL
+    OPENAPI_BASE_URL: ClassVar[str] = OPENAPI_URL
+    DEFAULT_TIMEOUT: ClassVar[float] = 30.0
+    # Period endpoints whose settled rows may be kept in the observation store
+    TIME_SERIES: ClassVar[dict[str, PeriodSpec]] = {}
+
+    def __init__(
+        self,
+        auth_key: str,
+        timeout: float | None = None,
+        http_client: httpx.Client | httpx.AsyncClient | None = None,
+    ) -> None:
+        """Initialize the client.
+
+        Args:
+            auth_key: KMA API authentication key
+            timeout: Request timeout in seconds (default: ``DEFAULT_TIMEOUT``)
+            http_client: Shared HTTP client to reuse instead of creating one.
+                The caller owns it and closing this client leaves it open.
+        """
+        self.auth_key = auth_key
+        self.timeout = self.DEFAULT_TIMEOUT if timeout is None else timeout
+        self._owns_client = http_client is None
+        self._client = http_client or self._new_client()
+
+    def _new_client(self) -> Any:  # noqa: ANN401
+        raise NotImplementedError
+
+    def _url(self, endpoint: str, params: dict[str, Any], base_url: str | None) -> str:
+        """Add the authentication key to the parameters and build the request URL."""
+        params['authKey'] = self.auth_key
+        return f'{base_url or self.BASE_URL}/{endpoint}'
+
+    def _plan(self, endpoint: str, params: dict[str, Any]) -> ReadPlan | None:
+        """Plan a period request against the observation store, when it applies."""
+        spec = self.TIME_SERIES.get(endpoint)
+        store = get_store() if spec is not None else None
+        return None if store is None or spec is None else store.plan(endpoint, params, spec)
+
+    @staticmethod
+    def _format_datetime(dt: datetime) -> str:
+        """Format datetime object to YYYYMMDDHHmm string.
+
+        Args:
+            dt: Datetime object to format
+
+        Returns:
+            Formatted datetime string in YYYYMMDDHHmm format
+        """
+        return dt.strftime('%Y%m%d%H%M')
+
+
+class KMAClient(_BaseClient):
+    """Base class of the synchronous API clients."""
+
+    _client: httpx.Client
+
+    def _new_client(self) -> httpx.Client:
+        return httpx.Client(timeout=self.timeout, transport=ResilientTransport())
+
+    def __enter__(self) -> Self:
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """Context manager exit."""
+        self.close()
+
+    def close(self) -> None:
+        """Close the HTTP client unless it is shared."""
+        if self._owns_client:
+            self._client.close()
+
+    def _make_request(
+        self,
+        endpoint: str,
+        params: dict[str, Any],
+        *,
+        base_url: str | None = None,
+    ) -> dict[str, Any]:
+        """Make HTTP request to the API.
+
+        Args:
+            endpoint: API endpoint path (for OpenAPI, use format: 'ServiceName/methodName')
+            params: Query parameters
+            base_url: Base URL of the endpoint (default: ``BASE_URL``)
+
+        Returns:
+            Decoded response
+
+        Raises:
+            httpx.HTTPError: If request fails
+        """
+        url = self._url(endpoint, params, base_url)
+        plan = self._plan(endpoint, params)
+        if plan is None:
+            return self._get(url, params, decode_response)
+        for tm1, tm2 in plan.gaps:
+            data = self._get(url, {**params, 'tm1': tm1, 'tm2': tm2}, decode_response)
+            if not plan.add(tm1, tm2, data):
+                return data
+        return plan.result()
+
+    def _make_parsed_request(
+        self,
+        endpoint: str,
+        params: dict[str, Any],
+        parse: Callable[[httpx.Response], T],
+        *,
+        base_url: str | None = None,
+    ) -> T:
+        """Make HTTP request to the API and turn the response into the result with ``parse``.
+
+        Args:
+            endpoint: API endpoint path
+            params: Query parameters
+            parse: Function turning the response into the result
+            base_url: Base URL of the endpoint (default: ``BASE_URL``)
+
+        Returns:
+            Value returned by ``parse``
+
+        Raises:
+            httpx.HTTPError: If request fails
+        """
+        return self._get(self._url(endpoint, params, base_url), params, parse)
+
+    def _get(self, url: str, params: dict[str, Any], parse: Callable[[httpx.Response], T]) -> T:
+        response = self._client.get(url, params=params, timeout=self.timeout)
+        response.raise_for_status()
+        return parse(response)
+
+    def _result(self, value: T) -> T:
+        """Return a value computed without a request, as an endpoint result."""
+        return value
+
+
+class AsyncKMAClient(_BaseClient):
+    """Base class of the asynchronous API clients.
+
+    Endpoint methods share their body with the sync client; ``_make_request``,
+    ``_make_parsed_request`` and ``_result`` return awaitables here, which
+    :func:`async_client` awaits.
+    """
+
+    _client: httpx.AsyncClient
+
+    def _new_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(timeout=self.timeout, transport=AsyncResilientTransport())
+
+    async def __aenter__(self) -> Self:
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        """Async context manager exit."""
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the HTTP client unless it is shared."""
+        if self._owns_client:
+            await self._client.aclose()
+
+    async def _make_request(
+        self,
+        endpoint: str,
+        params: dict[str, Any],
+        *,
+        base_url: str | None = None,
+    ) -> dict[str, Any]:
+        """Make HTTP request to the API.
+
+        Args:
+            endpoint: API endpoint path (for OpenAPI, use format: 'ServiceName/methodName')
+            params: Query parameters
+            base_url: Base URL of the endpoint (default: ``BASE_URL``)
+
+        Returns:
+            Decoded response
+
+        Raises:
+            httpx.HTTPError: If request fails
+        """
+        url = self._url(endpoint, params, base_url)
+        plan = self._plan(endpoint, params)
+        if plan is None:
+            return await self._get_decoded(url, params)
+        for tm1, tm2 in plan.gaps:
+            data = await self._get_decoded(url, {**params, 'tm1': tm1, 'tm2': tm2})
+            if not plan.add(tm1, tm2, data):
+                return data
+        return plan.result()
+
+    async def _make_parsed_request(
+        self,
+        endpoint: str,
+        params: dict[str, Any],
+        parse: Callable[[httpx.Response], T],
+        *,
+        base_url: str | None = None,
+    ) -> T:
+        """Make HTTP request to the API and turn the response into the result with ``parse``.
+
+        Args:
+            endpoint: API endpoint path
+            params: Query parameters
+            parse: Function turning the response into the result
+            base_url: Base URL of the endpoint (default: ``BASE_URL``)
+
+        Returns:
+            Value returned by ``parse``
+
+        Raises:
+            httpx.HTTPError: If request fails
+        """
+        response = await self._fetch(self._url(endpoint, params, base_url), params)
+        return parse(response)
+
+    async def _get_decoded(self, url: str, params: dict[str, Any]) -> dict[str, Any]:
+        response = await self._fetch(url, params)
+        # Large bodies are decoded off the event loop when offloading is configured
+        data: dict[str, Any] = await adecode_response(response)
+        return data
+
+    async def _fetch(self, url: str, params: dict[str, Any]) -> httpx.Response:
+        response = await self._client.get(url, params=params, timeout=self.timeout)
+        response.raise_for_status()
+        return response
+
+    async def _result(self, value: T) -> T:
+        """Return a value computed without a request, as an awaitable endpoint result."""
+        return value
+
+
+def _coroutine(method: Callable[..., Any]) -> Callable[..., Any]:
+    """Turn an endpoint method returning an awaitable into a coroutine function."""
+
+    @functools.wraps(method)
+    async def endpoint(self: AsyncKMAClient, *args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+        return await method(self, *args, **kwargs)
+
+    return endpoint
+
+
+def async_client(cls: type[KMAClient], module: str) -> type[AsyncKMAClient]:
+    """Derive the async variant of a sync client class.
+
+    The methods and class attributes declared on ``cls`` (and on its bases
+    below :class:`KMAClient`) are copied onto a new subclass of
+    :class:`AsyncKMAClient` named ``Async<cls name>``. Public methods become
+    coroutine functions; private helpers are copied unchanged.
+
+    Args:
+        cls: Sync client class
+        module: Module the async class is defined in (usually ``__name__``)
+
+    Returns:
+        Async client class
+    """
+    namespace: dict[str, Any] = {}
+    for base in reversed(cls.__mro__[: cls.__mro__.index(KMAClient)]):
+        for name, value in vars(base).items():
+            if name in {'__dict__', '__weakref__'}:
+                continue
+            public = inspect.isfunction(value) and not name.startswith('_')
+            namespace[name] = _coroutine(value) if public else value
+    name = f'Async{cls.__name__}'
+    namespace.update(
+        __module__=module,
+        __qualname__=name,
+        __doc__=(cls.__doc__ or '').replace('Client for', 'Async client for', 1),
+    )
+    return type(name, (AsyncKMAClient,), namespace)
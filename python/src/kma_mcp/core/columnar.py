@@ -0,0 +1,309 @@
+"""Columnar, NumPy-backed result type for observation pulls.
+
+All-station, multi-day pulls (``ASOSClient.get_hourly_period``,
+``AWSClient.get_minutely_data``, ``DustClient.get_hourly_period``, ...) can
+return hundreds of thousands of rows. :class:`ObservationFrame` stores such a
+result as one NumPy array per column, sorted by station and time, so that
+selecting a station (or a time range of one station) is a zero-copy view and
+conversion to pandas or Arrow does not go through per-row Python objects.
+
+Example:
+    >>> from kma_mcp.core.columnar import to_frame
+    >>> from kma_mcp.surface.asos_client import ASOSClient
+    >>> with ASOSClient('your_auth_key') as client:
+    ...     frame = to_frame(client.get_hourly_period('202501010000', '202501312300'))
+    >>> seoul = frame.station(108)
+    >>> seoul['TA'].mean()
+"""
+
+import contextlib
+from collections.abc import Iterator, Mapping
+from datetime import datetime
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+from kma_mcp.core.parsing import find_key_columns
+
+_TIME_UNIT = 'datetime64[s]'
+
+
+def _to_array(values: list[Any]) -> npt.NDArray[Any]:
+    """Convert a column to the narrowest array type (int64, float64, object)."""
+    if values and all(isinstance(value, str) for value in values):
+        # JSON endpoints return numbers as strings
+        with contextlib.suppress(ValueError):
+            values = [int(value) for value in values]
+    if all(isinstance(value, int) and not isinstance(value, bool) for value in values):
+        try:
+            return np.array(values, dtype=np.int64)
+        except OverflowError:
+            pass
+    try:
+        # None becomes NaN for float arrays
+        return np.array(values, dtype=np.float64)
+    except (TypeError, ValueError):
+        return np.array(values, dtype=object)
+
+
+def _parse_digits(text: list[str]) -> npt.NDArray[np.datetime64]:
+    """Convert equal-width 'YYYYMMDD', 'YYYYMMDDHH' or 'YYYYMMDDHHMI' strings."""
+    digits = np.array(text, dtype=np.int64) * 10 ** (12 - len(text[0]))
+    year = digits // 10**8
+    month = digits // 10**6 % 100
+    day = digits // 10**4 % 100
+    minutes = (day - 1) * 1440 + digits // 100 % 100 * 60 + digits % 100
+    months = ((year - 1970) * 12 + month - 1).astype('datetime64[M]')
+    return months.astype(_TIME_UNIT) + (minutes * 60).astype('timedelta64[s]')
+
+
+def _parse_times(values: list[Any]) -> npt.NDArray[np.datetime64]:
+    """Convert KMA 'YYYYMMDD[HH[MI]]' time strings to datetime64 values."""
+    text = ['' if value is None else str(value) for value in values]
+    width = len(text[0]) if text else 0
+    if width in {8, 10, 12} and all(len(item) == width and item.isdigit() for item in text):
+        return _parse_digits(text)
+
+    parsed = np.full(len(text), np.datetime64('NaT'), dtype=_TIME_UNIT)
+    for index, item in enumerate(text):
+        if item.isdigit():
+            if len(item) in {8, 10, 12}:
+                parsed[index] = _parse_digits([item])[0]
+            continue
+        with contextlib.suppress(ValueError):
+            parsed[index] = np.datetime64(item.replace(' ', 'T'), 's')
+    return parsed
+
+
+def _to_datetime64(value: str | datetime | np.datetime64) -> np.datetime64:
+    if isinstance(value, np.datetime64):
+        return value.astype(_TIME_UNIT)
+    if isinstance(value, datetime):
+        return np.datetime64(value.replace(tzinfo=None), 's')
+    return _parse_times([value])[0]
+
+
+class ObservationFrame:
+    """Columnar table of observations backed by NumPy arrays.
+
+    Rows are kept sorted by station and then time. Numeric columns are int64
+    or float64 arrays (missing values are NaN), the time column is a
+    ``datetime64[s]`` array and anything else is an object array.
+
+    Frames are normally built with :func:`to_frame`; the constructor expects
+    columns that are already sorted.
+    """
+
+    def __init__(
+        self,
+        columns: Mapping[str, npt.NDArray[Any]],
+        *,
+        station_column: str | None = None,
+        time_column: str | None = None,
+    ) -> None:
+        """Initialize a frame from sorted column arrays.
+
+        Args:
+            columns: Column name to array mapping, all of equal length
+            station_column: Name of the station ID column (None if absent)
+            time_column: Name of the observation time column (None if absent)
+        """
+        self._columns = dict(columns)
+        self.station_column = station_column
+        self.time_column = time_column
+        self._length = len(next(iter(self._columns.values()))) if self._columns else 0
+
+        if station_column is not None and self._length:
+            self._station_ids, starts = np.unique(self._columns[station_column], return_index=True)
+            self._station_bounds = np.append(starts, self._length)
+        else:
+            self._station_ids = np.array([], dtype=np.int64)
+            self._station_bounds = np.array([0], dtype=np.int64)
+
+    @classmethod
+    def from_columns(cls, data: Mapping[str, list[Any]]) -> 'ObservationFrame':
+        """Build a frame from columnar lists such as ``parse_fixed_width`` output.
+
+        Args:
+            data: Column name to list of values mapping
+
+        Returns:
+            Frame sorted by station and time
+        """
+        station_column, time_column = find_key_columns(list(data))
+
+        arrays = {
+            name: _parse_times(values) if name == time_column else _to_array(values)
+            for name, values in data.items()
+        }
+
+        sort_keys = [arrays[name] for name in (time_column, station_column) if name is not None]
+        if sort_keys and len(sort_keys[0]) > 1:
+            order = np.lexsort(sort_keys)
+            if np.any(order != np.arange(len(order))):
+                arrays = {name: array[order] for name, array in arrays.items()}
+
+        return cls(arrays, station_column=station_column, time_column=time_column)
+
+    def __len__(self) -> int:
+        """Return the number of rows."""
+        return self._length
+
+    def __getitem__(self, name: str) -> npt.NDArray[Any]:
+        """Return the array for a column."""
+        return self._columns[name]
+
+    def __contains__(self, name: object) -> bool:
+        """Check whether a column exists."""
+        return name in self._columns
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over column names."""
+        return iter(self._columns)
+
+    def __repr__(self) -> str:
+        """Return a short description of the frame."""
+        return (
+            f'ObservationFrame(rows={self._length}, stations={len(self._station_ids)}, '
+            f'columns={self.columns})'
+        )
+
+    @property
+    def columns(self) -> list[str]:
+        """Column names in response order."""
+        return list(self._columns)
+
+    @property
+    def stations(self) -> npt.NDArray[Any]:
+        """Sorted unique station IDs."""
+        return self._station_ids
+
+    @property
+    def times(self) -> npt.NDArray[np.datetime64] | None:
+        """Observation times, or None if the frame has no time column."""
+        return None if self.time_column is None else self._columns[self.time_column]
+
+    def _slice(self, rows: slice | npt.NDArray[np.bool_]) -> 'ObservationFrame':
+        return ObservationFrame(
+            {name: array[rows] for name, array in self._columns.items()},
+            station_column=self.station_column,
+            time_column=self.time_column,
+        )
+
+    def station(self, stn: int | str) -> 'ObservationFrame':
+        """Select one station's rows.
+
+        Args:
+            stn: Station ID
+
+        Returns:
+            Frame whose arrays are views into this frame's buffers
+        """
+        if isinstance(stn, str) and self._station_ids.dtype.kind in 'iu':
+            stn = int(stn)
+        index = int(np.searchsorted(self._station_ids, stn))
+        if index >= len(self._station_ids) or self._station_ids[index] != stn:
+            return self._slice(slice(0, 0))
+        start, stop = self._station_bounds[index], self._station_bounds[index + 1]
+        return self._slice(slice(int(start), int(stop)))
+
+    def between(
+        self,
+        start: str | datetime | np.datetime64 | None = None,
+        end: str | datetime | np.datetime64 | None = None,
+    ) -> 'ObservationFrame':
+        """Select rows observed between two times (inclusive).
+
+        For a single-station frame the result is a zero-copy view; across
+        several stations the matching rows are gathered into new arrays.
+
+        Args:
+            start: First time to keep ('YYYYMMDDHHmm' string or datetime), None for no bound
+            end: Last time to keep ('YYYYMMDDHHmm' string or datetime), None for no bound
+
+        Returns:
+            Frame restricted to the time range
+        """
+        times = self.times
+        if times is None:
+            msg = 'Frame has no time column'
+            raise ValueError(msg)
+
+        lower = None if start is None else _to_datetime64(start)
+        upper = None if end is None else _to_datetime64(end)
+        if len(self._station_ids) <= 1:
+            first = 0 if lower is None else int(np.searchsorted(times, lower, side='left'))
+            last = self._length if upper is None else int(np.searchsorted(times, upper, 'right'))
+            return self._slice(slice(first, max(first, last)))
+
+        mask = np.ones(self._length, dtype=bool)
+        if lower is not None:
+            mask &= times >= lower
+        if upper is not None:
+            mask &= times <= upper
+        return self._slice(mask)
+
+    def to_dict(self) -> dict[str, list[Any]]:
+        """Convert to a column name to list mapping."""
+        return {name: array.tolist() for name, array in self._columns.items()}
+
+    def to_pandas(self) -> Any:  # noqa: ANN401
+        """Convert to a pandas DataFrame (requires the optional ``pandas`` package).
+
+        Returns:
+            pandas.DataFrame sharing numeric buffers where pandas allows it
+        """
+        import pandas as pd
+
+        return pd.DataFrame(self._columns, copy=False)
+
+    def to_arrow(self) -> Any:  # noqa: ANN401
+        """Convert to a pyarrow Table (requires the optional ``pyarrow`` package).
+
+        Returns:
+            pyarrow.Table; numeric columns without nulls are wrapped without copying
+        """
+        import pyarrow as pa
+
+        return pa.table(
+            {
+                name: pa.array(array, from_pandas=array.dtype.kind == 'f')
+                for name, array in self._columns.items()
+            }
+        )
+
+
+def _find_records(data: Mapping[str, Any]) -> list[dict[str, Any]]:
+    """Locate the item list in an API Hub JSON document."""
+    node: Any = data
+    for key in ('response', 'body', 'items', 'item'):
+        if isinstance(node, Mapping) and key in node:
+            node = node[key]
+    if isinstance(node, Mapping):
+        return [dict(node)]
+    if isinstance(node, list):
+        return [item for item in node if isinstance(item, Mapping)]
+    return []
+
+
+def to_frame(data: Mapping[str, Any]) -> ObservationFrame:
+    """Build an :class:`ObservationFrame` from a client response.
+
+    Accepts both the columnar records produced for fixed-width text responses
+    and JSON documents with a ``response.body.items.item`` record list.
+
+    Args:
+        data: Response returned by a client method
+
+    Returns:
+        Columnar frame sorted by station and time
+    """
+    if data and all(isinstance(values, list) for values in data.values()):
+        return ObservationFrame.from_columns(data)
+
+    records = _find_records(data)
+    names = list(dict.fromkeys(name for record in records for name in record))
+    return ObservationFrame.from_columns(
+        {name: [record.get(name) for record in records] for name in names}
+    )
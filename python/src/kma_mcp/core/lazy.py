@@ -0,0 +1,86 @@
+"""Deferred imports for a fast MCP server start-up.
+
+The MCP servers are spawned once per session, so every module imported at
+start-up delays the first response. Tool modules refer to the client modules
+they call through :func:`lazy_module`, and packages re-export their members
+through :func:`lazy_exports`. A module (and NumPy, which most clients pull
+in) is then imported the first time a tool actually needs it.
+
+Example:
+    >>> aws_client = lazy_module('kma_mcp.surface.aws_client')
+    >>> aws_client.AWSClient  # imported here
+    <class 'kma_mcp.surface.aws_client.AWSClient'>
+"""
+
+import importlib
+import sys
+from collections.abc import Callable, Iterable
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from types import ModuleType
+
+
+class LazyModule:
+    """Stand-in for a module that is imported on first attribute access."""
+
+    def __init__(self, name: str) -> None:
+        """Remember the module to import.
+
+        Args:
+            name: Absolute module name
+        """
+        self._name = name
+        self._module: ModuleType | None = None
+
+    def __getattr__(self, attr: str) -> Any:  # noqa: ANN401
+        """Import the module if needed and return one of its attributes."""
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+    def __repr__(self) -> str:
+        """Describe the proxy without importing the module."""
+        state = 'loaded' if self._module is not None else 'not loaded'
+        return f'<lazy module {self._name!r} ({state})>'
+
+
+def lazy_module(name: str) -> Any:  # noqa: ANN401
+    """Return a proxy that imports a module on first attribute access.
+
+    Args:
+        name: Absolute module name
+
+    Returns:
+        The module itself if it is already imported, otherwise a :class:`LazyModule`
+    """
+    return sys.modules.get(name) or LazyModule(name)
+
+
+def lazy_exports(
+    package: str, exports: dict[str, Iterable[str]]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Build module ``__getattr__`` and ``__dir__`` functions for lazy re-exports.
+
+    Args:
+        package: Name of the re-exporting package (its ``__name__``)
+        exports: Names to re-export, keyed by the module defining them
+
+    Returns:
+        ``(__getattr__, __dir__)`` to assign in the package namespace
+    """
+    owners = {name: module for module, names in exports.items() for name in names}
+
+    def getattr_(name: str) -> Any:  # noqa: ANN401
+        module = owners.get(name)
+        if module is None:
+            msg = f'module {package!r} has no attribute {name!r}'
+            raise AttributeError(msg)
+        value = getattr(importlib.import_module(module), name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def dir_() -> list[str]:
+        return sorted({*vars(sys.modules[package]), *owners})
+
+    return getattr_, dir_
@@ -0,0 +1,323 @@
+"""Decoding of large responses in worker processes.
+
+All-station pulls (an hour of minutely AWS data with ``stn=0``, a month of
+hourly ASOS data) return text bodies of tens of MB. Decoding such a body
+takes seconds of CPU time, and on the async server's event loop that stalls
+every other request in flight. :class:`ParseOffloader` decodes bodies of at
+least ``threshold`` bytes in a process pool instead; smaller bodies are
+decoded inline, where the round trip to a worker would cost more than it
+saves.
+
+The decoded columns come back through shared memory: every int or float
+column is written into one block as an int64 or float64 array (with a mask
+of the missing values), so only text columns are pickled, and rebuilding the
+lists on the event loop is one NumPy ``tolist`` per column. The result is
+the same as :func:`~kma_mcp.core.parsing.decode_response` would return.
+
+Example:
+    >>> from kma_mcp.core.offload import configure_offload
+    >>> configure_offload(threshold=2 * 1024 * 1024, max_workers=2)
+    >>> async with AsyncAWSClient('your_auth_key') as client:
+    ...     data = await client.get_minutely_data(tm1=start, tm2=end, stn=0)  # parsed in a worker
+"""
+
+import asyncio
+import json
+import logging
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any
+
+import httpx
+
+from kma_mcp.core.lazy import lazy_module
+from kma_mcp.core.parsing import decode_response, parse_fixed_width
+
+# Only needed once a body is large enough to be offloaded
+np = lazy_module('numpy')
+shared_memory = lazy_module('multiprocessing.shared_memory')
+resource_tracker = lazy_module('multiprocessing.resource_tracker')
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_THRESHOLD = 2 * 1024 * 1024
+DEFAULT_WORKERS = 2
+
+# Shared memory blocks outlive the worker's handle on POSIX only
+_SHARED_MEMORY = os.name == 'posix'
+_ALIGNMENT = 8
+
+# (name, dtype or None for pickled values, offset, length, offset of the missing-value mask)
+Layout = list[tuple[str, str | None, int, int, int | None]]
+Packed = tuple[str, Any]
+
+
+def _numeric_dtype(values: list[Any]) -> str | None:
+    """Return the array type a decoded column fits in, or None to keep it as a list."""
+    types = {type(value) for value in values}
+    types.discard(type(None))
+    if types == {int}:
+        return 'int64'
+    if types == {float}:
+        return 'float64'
+    return None
+
+
+def _to_arrays(values: list[Any], dtype: str) -> tuple[Any, Any]:
+    missing = [value is None for value in values]
+    if dtype == 'int64':
+        array = np.array([0 if value is None else value for value in values], dtype=np.int64)
+    else:
+        array = np.array(values, dtype=np.float64)
+    return array, np.array(missing, dtype=np.bool_) if any(missing) else None
+
+
+def _aligned(offset: int) -> int:
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
+
+
+def pack_columns(columns: dict[str, list[Any]], *, shared: bool = _SHARED_MEMORY) -> Packed:
+    """Move the numeric columns of a decoded table into arrays for the hand-off.
+
+    Args:
+        columns: Columnar result of :func:`~kma_mcp.core.parsing.parse_fixed_width`
+        shared: Write the arrays into a shared memory block (else they are pickled)
+
+    Returns:
+        Value for :func:`unpack` in the receiving process
+    """
+    layout: Layout = []
+    values: dict[str, Any] = {}
+    arrays: list[tuple[int, Any]] = []
+    size = 0
+    for name, column in columns.items():
+        dtype = _numeric_dtype(column)
+        if dtype is None:
+            layout.append((name, None, 0, len(column), None))
+            values[name] = column
+            continue
+        try:
+            array, missing = _to_arrays(column, dtype)
+        except OverflowError:
+            layout.append((name, None, 0, len(column), None))
+            values[name] = column
+            continue
+        offset, size = size, _aligned(size + array.nbytes)
+        arrays.append((offset, array))
+        mask_offset = None
+        if missing is not None:
+            mask_offset, size = size, _aligned(size + missing.nbytes)
+            arrays.append((mask_offset, missing))
+        layout.append((name, dtype, offset, len(column), mask_offset))
+
+    if not arrays:
+        return 'columns', (None, layout, values)
+    if not shared:
+        return 'columns', (None, layout, {**values, '': dict(arrays)})
+
+    block = shared_memory.SharedMemory(create=True, size=size)
+    for offset, array in arrays:
+        np.ndarray(array.shape, array.dtype, buffer=block.buf, offset=offset)[:] = array
+    name = block.name
+    block.close()
+    # The receiving process unlinks the block; this worker must not at exit
+    resource_tracker.unregister(f'/{name}' if os.name == 'posix' else name, 'shared_memory')
+    return 'columns', (name, layout, values)
+
+
+def decode_packed(body: bytes) -> Packed:
+    """Decode a response body like ``decode_response``, packed for :func:`unpack`.
+
+    Runs in the worker processes.
+    """
+    try:
+        return 'json', json.loads(body)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return pack_columns(parse_fixed_width(body))
+
+
+def _column(array: Any, missing: Any) -> list[Any]:  # noqa: ANN401
+    column = array.tolist()
+    if missing is not None:
+        for row in np.flatnonzero(missing):
+            column[row] = None
+    return column
+
+
+def _view(buffer: memoryview, dtype: Any, offset: int | None, length: int) -> Any:  # noqa: ANN401
+    if offset is None:
+        return None
+    return np.ndarray(length, dtype, buffer=buffer, offset=offset)
+
+
+def unpack(packed: Packed) -> Any:  # noqa: ANN401
+    """Rebuild the decoded response from the value returned by a worker.
+
+    Frees the shared memory block, if any.
+    """
+    kind, payload = packed
+    if kind == 'json':
+        return payload
+    name, layout, values = payload
+    if name is None:
+        arrays = values.pop('', {})
+        return {
+            column: values[column]
+            if dtype is None
+            else _column(arrays[offset], None if mask is None else arrays[mask])
+            for column, dtype, offset, length, mask in layout
+        }
+
+    block = shared_memory.SharedMemory(name=name)
+    try:
+        # The views must be gone before the block is closed, so none is kept
+        return {
+            column: values[column]
+            if dtype is None
+            else _column(
+                _view(block.buf, dtype, offset, length), _view(block.buf, np.bool_, mask, length)
+            )
+            for column, dtype, offset, length, mask in layout
+        }
+    finally:
+        block.close()
+        block.unlink()
+
+
+def _discard(future: Future[Packed]) -> None:
+    """Free the shared memory of a result nobody waits for any more."""
+    if not future.cancelled() and future.exception() is None:
+        unpack(future.result())
+
+
+class ParseOffloader:
+    """Decodes large response bodies in a pool of worker processes."""
+
+    def __init__(
+        self, *, threshold: int = DEFAULT_THRESHOLD, max_workers: int = DEFAULT_WORKERS
+    ) -> None:
+        """Initialize the offloader; workers are started with the first large body.
+
+        Args:
+            threshold: Bodies of at least this many bytes are decoded in a worker
+            max_workers: Number of worker processes
+        """
+        self.threshold = threshold
+        self.max_workers = max_workers
+        self.inline = 0
+        self.offloaded = 0
+        self.fallbacks = 0
+        self._pool: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    def _executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                # Forking a process that runs an event loop and threads is unsafe
+                context = lazy_module('multiprocessing').get_context('spawn')
+                self._pool = ProcessPoolExecutor(self.max_workers, mp_context=context)
+            return self._pool
+
+    async def decode(self, response: httpx.Response) -> Any:  # noqa: ANN401
+        """Decode a response, in a worker process if its body is large.
+
+        Args:
+            response: HTTP response whose body has been read
+
+        Returns:
+            The same value as :func:`~kma_mcp.core.parsing.decode_response`
+        """
+        body = response.content
+        if len(body) < self.threshold:
+            self.inline += 1
+            return decode_response(response)
+        try:
+            future = self._executor().submit(decode_packed, body)
+        except (BrokenProcessPool, RuntimeError) as e:
+            return self._fallback(response, e)
+        try:
+            packed = await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            future.add_done_callback(_discard)
+            raise
+        except BrokenProcessPool as e:
+            return self._fallback(response, e)
+        self.offloaded += 1
+        return unpack(packed)
+
+    def _fallback(self, response: httpx.Response, error: Exception) -> Any:  # noqa: ANN401
+        logger.warning('Parse workers unavailable (%s); decoding inline', error)
+        self.fallbacks += 1
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+        return decode_response(response)
+
+    def stats(self) -> dict[str, int]:
+        """Return how many bodies were decoded inline, in workers, and inline after a failure."""
+        return {'inline': self.inline, 'offloaded': self.offloaded, 'fallbacks': self.fallbacks}
+
+    def shutdown(self) -> None:
+        """Stop the worker processes; they are started again when needed."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+
+_offloader: ParseOffloader | None = None
+
+
+def configure_offload(
+    *, threshold: int = DEFAULT_THRESHOLD, max_workers: int | None = DEFAULT_WORKERS
+) -> ParseOffloader | None:
+    """Enable, replace or disable decoding of large bodies in worker processes.
+
+    Args:
+        threshold: Bodies of at least this many bytes are decoded in a worker
+        max_workers: Number of worker processes (0 or None to decode everything inline)
+
+    Returns:
+        The configured offloader, or None when disabled
+    """
+    global _offloader
+    if _offloader is not None:
+        _offloader.shutdown()
+    _offloader = None
+    if max_workers:
+        _offloader = ParseOffloader(threshold=threshold, max_workers=max_workers)
+    return _offloader
+
+
+def configure_offload_from_env() -> ParseOffloader | None:
+    """Configure worker decoding from environment variables.
+
+    Recognised variables:
+        KMA_PARSE_WORKERS: Number of worker processes (0 decodes everything inline)
+        KMA_PARSE_THRESHOLD: Body size in bytes from which decoding is offloaded
+
+    Returns:
+        The configured offloader, or None when disabled
+    """
+    workers = os.getenv('KMA_PARSE_WORKERS')
+    threshold = os.getenv('KMA_PARSE_THRESHOLD')
+    return configure_offload(
+        threshold=int(threshold) if threshold else DEFAULT_THRESHOLD,
+        max_workers=int(workers) if workers else min(DEFAULT_WORKERS, os.cpu_count() or 1),
+    )
+
+
+def get_offloader() -> ParseOffloader | None:
+    """Get the process-wide offloader, or None when every body is decoded inline."""
+    return _offloader
+
+
+async def adecode_response(response: httpx.Response) -> Any:  # noqa: ANN401
+    """Decode a response like ``decode_response``, offloading large bodies when configured."""
+    offloader = _offloader
+    if offloader is None:
+        return decode_response(response)
+    return await offloader.decode(response)
@@ -0,0 +1,223 @@
+"""Response decoding for KMA API Hub endpoints.
+
+Most typ01 endpoints (``kma_sfctm2.php``, ``nph-aws2_min``, ``kma_buoy.php``,
+...) answer with ``disp=0`` fixed-width text rather than JSON::
+
+    #START7777
+    #--------------------------------------------------------------------
+    # YYMMDDHHMI STN  WD   WS    TA    HM
+    #        KST  ID  16  m/s     C     %
+    201007151200 108  18  2.8  27.0  75.0
+    201007151200 112  -9 -9.0  26.1  -9.0
+    #7777END
+
+This module turns such bodies into columnar records: one list per column,
+keyed by the column names found in the ``#`` header block, with numeric
+columns converted to ``int``/``float`` and missing-value sentinels replaced
+by ``None``. The short ``-9`` sentinel is only applied to columns that cannot
+be negative: a temperature of -9.0 is a reading, and KMA marks a missing one
+with ``-99.0`` (or ``-999``). The body is scanned once, line by line, using plain string
+splitting (no regular expressions). Rows whose whitespace-split width does
+not match the header (blank fields) fall back to slicing at the header's
+column boundaries, since KMA right-aligns values under their column names.
+"""
+
+import json
+from typing import Any
+
+import httpx
+
+# Sentinels KMA uses for "not observed" in fixed-width output
+MISSING_VALUES = frozenset({'-9', '-9.0', '-99', '-99.0', '-99.9', '-999', '-999.0'})
+# Sentinels that are real readings in columns which can be negative
+_SIGNED_VALUES = frozenset({'-9', '-9.0'})
+# Temperature columns (TA, TD, TS, TE, TG, TW, TMN, TMX, T1H, ...)
+_SIGNED_PREFIXES = ('T',)
+
+_SEPARATOR_CHARS = frozenset('-=*# ')
+_MARKERS = frozenset({'START7777', '7777END'})
+# How many comment lines directly above the data are searched for the header
+_HEADER_LOOKBACK = 3
+_STATION_PREFIXES = ('STN',)
+_TIME_PREFIXES = ('YY', 'TM')
+
+
+def decode_body(body: str | bytes) -> str:
+    """Decode a response body, falling back to EUC-KR for Korean text.
+
+    Args:
+        body: Raw response body
+
+    Returns:
+        Decoded text
+    """
+    if isinstance(body, str):
+        return body
+    try:
+        return body.decode('utf-8')
+    except UnicodeDecodeError:
+        return body.decode('cp949', errors='replace')
+
+
+def _is_separator(content: str) -> bool:
+    return not content or content in _MARKERS or set(content) <= _SEPARATOR_CHARS
+
+
+def _split(line: str) -> list[str]:
+    if ',' in line:
+        fields = [field.strip() for field in line.split(',')]
+        # Comma-separated rows are terminated with a trailing '=' field
+        while fields and fields[-1] in {'', '='}:
+            fields.pop()
+        return fields
+    return line.split()
+
+
+def _is_time_column(name: str) -> bool:
+    return name.upper().startswith(_TIME_PREFIXES)
+
+
+def find_key_columns(names: list[str]) -> tuple[str | None, str | None]:
+    """Find the station ID and observation time columns among column names.
+
+    Args:
+        names: Column names, in response order
+
+    Returns:
+        Tuple of (station column, time column); either is None when absent
+    """
+    station = next((name for name in names if name.upper().startswith(_STATION_PREFIXES)), None)
+    time = next((name for name in names if _is_time_column(name)), None)
+    return station, time
+
+
+def _unique_names(names: list[str]) -> list[str]:
+    seen: dict[str, int] = {}
+    unique = []
+    for name in names:
+        count = seen.get(name, 0) + 1
+        seen[name] = count
+        unique.append(name if count == 1 else f'{name}_{count}')
+    return unique
+
+
+def _column_bounds(header_line: str) -> list[int]:
+    """Return the end offset of each header token within the raw line."""
+    bounds = []
+    in_token = False
+    for index, char in enumerate(header_line):
+        if char.isspace() or char == '#':
+            if in_token:
+                bounds.append(index)
+            in_token = False
+        else:
+            in_token = True
+    if in_token:
+        bounds.append(len(header_line))
+    return bounds
+
+
+def _slice(line: str, bounds: list[int]) -> list[str]:
+    fields = []
+    start = 0
+    for end in bounds:
+        fields.append(line[start:end].strip())
+        start = end
+    return fields
+
+
+def _choose_header(comments: list[str], width: int) -> str | None:
+    candidates = comments[-_HEADER_LOOKBACK:]
+    # Prefer the earliest matching line: names come before units
+    for line in candidates:
+        if len(_split(line.lstrip('#'))) == width:
+            return line
+    return max(candidates, key=lambda line: len(_split(line.lstrip('#'))), default=None)
+
+
+def _missing_for(name: str, missing: frozenset[str]) -> frozenset[str]:
+    """Return the sentinels of a column, keeping -9 as a value where it can be one."""
+    return missing - _SIGNED_VALUES if name.upper().startswith(_SIGNED_PREFIXES) else missing
+
+
+def _convert(values: list[str], missing: frozenset[str], *, keep_text: bool) -> list[Any]:
+    if keep_text:
+        return [value or None for value in values]
+    cleaned = [None if not value or value in missing else value for value in values]
+    for cast in (int, float):
+        try:
+            return [None if value is None else cast(value) for value in cleaned]
+        except ValueError:
+            continue
+    return [value or None for value in values]
+
+
+def parse_fixed_width(
+    body: str | bytes,
+    *,
+    missing: frozenset[str] = MISSING_VALUES,
+) -> dict[str, list[Any]]:
+    r"""Parse a KMA fixed-width (or comma-separated) text response into columns.
+
+    Args:
+        body: Raw response body
+        missing: Values that mean "not observed" and are mapped to None; in
+            temperature columns, -9 and -9.0 are kept as readings
+
+    Returns:
+        Mapping of column name to column values, in header order. Time columns
+        (names starting with 'YY' or 'TM') are kept as strings; other columns
+        are converted to int or float when every value allows it.
+
+    Example:
+        >>> text = '# TM STN TA\n202501011200 108 -1.5\n202501011200 112 -99.0\n'
+        >>> parse_fixed_width(text)
+        {'TM': ['202501011200', '202501011200'], 'STN': [108, 112], 'TA': [-1.5, None]}
+    """
+    comments: list[str] = []
+    names: list[str] = []
+    bounds: list[int] = []
+    rows: list[list[str]] = []
+
+    for line in decode_body(body).splitlines():
+        stripped = line.strip()
+        if not stripped:
+            continue
+        if stripped[0] == '#':
+            if not rows and not _is_separator(stripped.lstrip('#').strip()):
+                comments.append(line)
+            continue
+
+        fields = _split(stripped)
+        if not names:
+            header_line = _choose_header(comments, len(fields))
+            if header_line is None:
+                names = [f'col{index + 1}' for index in range(len(fields))]
+            else:
+                names = _unique_names(_split(header_line.lstrip('#')))
+                bounds = _column_bounds(header_line)
+        if len(fields) != len(names):
+            fields = _slice(line, bounds) if len(bounds) == len(names) else fields
+            fields = (fields + [''] * len(names))[: len(names)]
+        rows.append(fields)
+
+    columns = list(zip(*rows, strict=True)) if rows else [() for _ in names]
+    return {
+        name: _convert(list(values), _missing_for(name, missing), keep_text=_is_time_column(name))
+        for name, values in zip(names, columns, strict=True)
+    }
+
+
+def decode_response(response: httpx.Response) -> dict[str, Any]:
+    """Decode an API response as JSON, or as fixed-width text when it is not JSON.
+
+    Args:
+        response: HTTP response from the KMA API Hub
+
+    Returns:
+        Parsed JSON document, or columnar records for text responses
+    """
+    try:
+        return response.json()
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return parse_fixed_width(response.content)
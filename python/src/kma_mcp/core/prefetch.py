@@ -0,0 +1,287 @@
+"""Background prefetching of live products right after they are issued.
+
+Live products are issued on a fixed schedule: the village forecast 8 times a
+day, the ultra short-term forecast every hour at half past, AWS observations
+every minute. Without prefetching, the first tool call after each issuance
+waits for the full upstream round trip. :class:`PrefetchScheduler` runs one
+task per :class:`PrefetchJob` that sleeps until the job's next issuance (plus
+a random jitter, so that several servers do not all call at the same second),
+then fetches it through the shared async HTTP client.
+
+Responses fetched by a job are kept in memory by :class:`PrefetchStore` until
+the job's next issuance. The store sits in the shared async connection pool
+as the outermost transport, so any later request for the same URL (the
+auth key ignored) is answered from memory whichever tool makes it.
+Prefetches are sent at ``Priority.NORMAL``, behind interactive calls.
+
+Example:
+    >>> from kma_mcp.core.prefetch import PrefetchJob, PrefetchScheduler, configure_prefetch, every
+    >>> configure_prefetch()
+    >>> scheduler = PrefetchScheduler([PrefetchJob('warnings', fetch_warnings, every(60))])
+    >>> scheduler.start()  # inside the running event loop
+"""
+
+import asyncio
+import logging
+import random
+import threading
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from contextvars import ContextVar
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any
+
+import httpx
+
+from kma_mcp.core.cache import KST, cache_key, carries_data
+from kma_mcp.core.ratelimit import Priority, request_priority
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_JITTER = 15.0
+# Jitter never delays a prefetch by more than this share of the job's period
+MAX_JITTER_SHARE = 0.25
+
+Schedule = Callable[[datetime], datetime]
+
+# Expiry (UNIX time) of the responses of the prefetch running in this context
+_expires: ContextVar[float | None] = ContextVar('kma_prefetch_expires', default=None)
+
+
+def every(seconds: float) -> Schedule:
+    """Build the schedule of a product issued every ``seconds`` (aligned to the epoch).
+
+    Args:
+        seconds: Issuance period, e.g. 60 for minutely observations
+
+    Returns:
+        Function returning the first issuance strictly after a given time
+    """
+
+    def next_issue(now: datetime) -> datetime:
+        timestamp = (now.timestamp() // seconds + 1) * seconds
+        return datetime.fromtimestamp(timestamp, KST)
+
+    return next_issue
+
+
+class PrefetchStore:
+    """Responses fetched ahead of time, each kept until its product is issued again."""
+
+    def __init__(self) -> None:
+        """Initialize an empty store."""
+        self._entries: dict[str, tuple[bytes, str, float]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.stored = 0
+
+    def lookup(self, request: httpx.Request) -> httpx.Response | None:
+        """Return the prefetched response for a request, or None."""
+        if request.method != 'GET':
+            return None
+        with self._lock:
+            entry = self._entries.get(cache_key(request.url))
+            if entry is None or entry[2] <= time.time():
+                return None
+            self.hits += 1
+        content, content_type, _ = entry
+        return httpx.Response(
+            200,
+            headers={'Content-Type': content_type, 'X-KMA-Cache': 'prefetch'},
+            content=content,
+            request=request,
+        )
+
+    def store(self, request: httpx.Request, response: httpx.Response, expires: float) -> None:
+        """Keep a successful response whose body has been read until ``expires``.
+
+        Errors the API Hub answers with status 200 (an invalid key, a spent quota, no
+        data) are not kept, since the key ignores ``authKey``.
+        """
+        if request.method != 'GET' or response.status_code != httpx.codes.OK:
+            return
+        if not carries_data(response.content):
+            return
+        now = time.time()
+        with self._lock:
+            # Minutely URLs change every minute; drop what can no longer be served
+            for key in [key for key, entry in self._entries.items() if entry[2] <= now]:
+                del self._entries[key]
+            content_type = response.headers.get('Content-Type', '')
+            self._entries[cache_key(request.url)] = (response.content, content_type, expires)
+            self.stored += 1
+
+    def __len__(self) -> int:
+        """Return the number of responses held, including expired ones not yet dropped."""
+        return len(self._entries)
+
+    def stats(self) -> dict[str, int]:
+        """Return the number of responses stored and of requests answered."""
+        with self._lock:
+            return {'stored': self.stored, 'hits': self.hits, 'held': len(self._entries)}
+
+    def clear(self) -> None:
+        """Remove every response and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.stored = 0
+
+
+class AsyncPrefetchTransport(httpx.AsyncBaseTransport):
+    """Async httpx transport answering from a :class:`PrefetchStore` and filling it."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, store: PrefetchStore) -> None:
+        """Wrap a transport.
+
+        Args:
+            transport: Transport used for requests that were not prefetched
+            store: Prefetched responses
+        """
+        self._transport = transport
+        self._store = store
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Serve a request from the store, or forward it (and store it when prefetching)."""
+        expires = _expires.get()
+        if expires is None:
+            prefetched = self._store.lookup(request)
+            if prefetched is not None:
+                return prefetched
+        response = await self._transport.handle_async_request(request)
+        if expires is not None and response.status_code == httpx.codes.OK:
+            await response.aread()
+            self._store.store(request, response, expires)
+        return response
+
+    async def aclose(self) -> None:
+        """Close the wrapped transport."""
+        await self._transport.aclose()
+
+
+@dataclass(frozen=True)
+class PrefetchJob:
+    """One product to fetch after each of its issuances."""
+
+    name: str
+    fetch: Callable[[], Awaitable[Any]]
+    next_issue: Schedule
+
+
+class PrefetchScheduler:
+    """Runs every job right after each issuance, until stopped."""
+
+    def __init__(
+        self,
+        jobs: Iterable[PrefetchJob],
+        *,
+        jitter: float = DEFAULT_JITTER,
+        warm_on_start: bool = True,
+        rng: random.Random | None = None,
+    ) -> None:
+        """Initialize the scheduler; nothing runs before :meth:`start`.
+
+        Args:
+            jobs: Products to prefetch
+            jitter: Largest random delay in seconds after an issuance
+            warm_on_start: Fetch every job once when started, before its first issuance
+            rng: Random source of the jitter
+        """
+        self.jobs = list(jobs)
+        self.jitter = jitter
+        self.warm_on_start = warm_on_start
+        self._rng = rng or random.Random()  # noqa: S311
+        self._tasks: list[asyncio.Task[None]] = []
+        self._stats = {job.name: {'runs': 0, 'failures': 0, 'last_ms': 0} for job in self.jobs}
+
+    def due(self, job: PrefetchJob, now: datetime) -> datetime:
+        """Return when to run a job next: its next issuance plus jitter."""
+        issue = job.next_issue(now)
+        period = (job.next_issue(issue) - issue).total_seconds()
+        jitter = min(self.jitter, period * MAX_JITTER_SHARE)
+        return issue + timedelta(seconds=self._rng.uniform(0, jitter))
+
+    async def run(self, job: PrefetchJob, now: datetime | None = None) -> bool:
+        """Fetch a job once, keeping its responses until its next issuance.
+
+        Args:
+            job: Job to run
+            now: Current time (default: now)
+
+        Returns:
+            True if the fetch succeeded; failures are logged, not raised
+        """
+        now = datetime.now(KST) if now is None else now
+        token = _expires.set(job.next_issue(now).timestamp())
+        started = time.perf_counter()
+        stats = self._stats[job.name]
+        try:
+            with request_priority(Priority.NORMAL):
+                await job.fetch()
+        except Exception as e:  # noqa: BLE001
+            stats['failures'] += 1
+            logger.warning('Prefetch of %s failed: %s', job.name, e)
+            return False
+        finally:
+            _expires.reset(token)
+            stats['runs'] += 1
+            stats['last_ms'] = round((time.perf_counter() - started) * 1000)
+        return True
+
+    async def _loop(self, job: PrefetchJob) -> None:
+        if self.warm_on_start:
+            await self.run(job)
+        while True:
+            now = datetime.now(KST)
+            await asyncio.sleep(max((self.due(job, now) - now).total_seconds(), 0))
+            await self.run(job)
+
+    @property
+    def running(self) -> bool:
+        """Whether the job tasks are running."""
+        return any(not task.done() for task in self._tasks)
+
+    def start(self) -> None:
+        """Start one task per job in the running event loop."""
+        if self.running:
+            return
+        self._tasks = [
+            asyncio.create_task(self._loop(job), name=f'prefetch-{job.name}') for job in self.jobs
+        ]
+        logger.info('Prefetching %s', ', '.join(job.name for job in self.jobs))
+
+    async def stop(self) -> None:
+        """Cancel the job tasks and wait for them to finish."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """Return runs, failures and the duration of the last run (ms) per job."""
+        return {name: dict(counts) for name, counts in self._stats.items()}
+
+
+_store: PrefetchStore | None = None
+
+
+def configure_prefetch(*, enabled: bool = True) -> PrefetchStore | None:
+    """Enable or disable the process-wide prefetch store.
+
+    Shared async HTTP clients created after this call use the store.
+
+    Args:
+        enabled: False to disable the store
+
+    Returns:
+        The configured store, or None when disabled
+    """
+    global _store
+    _store = PrefetchStore() if enabled else None
+    return _store
+
+
+def get_prefetch_store() -> PrefetchStore | None:
+    """Get the process-wide prefetch store, or None when prefetching is disabled."""
+    return _store
@@ -0,0 +1,642 @@
+"""Client-side rate limiting and daily quota accounting for KMA API requests.
+
+API Hub keys are limited both per second and per day. This module sits
+beneath the retry layer (see :mod:`kma_mcp.core.resilience`) as an httpx
+transport wrapper, so every attempt any client makes in the process goes
+through:
+
+- one token bucket shared by all sync and async clients, optionally shared
+  across processes through a SQLite file
+- priority classes: waiting requests are served in priority order, so
+  interactive tool calls overtake bulk backfills queued before them
+  (:func:`fetch_period`/:func:`afetch_period` run at ``Priority.BULK``)
+- a quota ledger that counts calls per endpoint family and KST day, and
+  rejects requests with :class:`QuotaExceededError` once a daily limit is
+  spent
+
+Example:
+    >>> from kma_mcp.core.ratelimit import Priority, configure_rate_limit, request_priority
+    >>> configure_rate_limit(rate=5, daily_quota=20000, path='~/.cache/kma-mcp/quota.sqlite')
+    >>> with request_priority(Priority.BULK):
+    ...     client.get_daily_period('20200101', '20201231')
+    >>> quota_status()
+    {'kma_sfcdd3.php': {'used': 1, 'limit': 20000, 'remaining': 19999}}
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import Counter, defaultdict
+from collections.abc import Callable, Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from enum import IntEnum
+from pathlib import Path
+from typing import Protocol
+
+import httpx
+
+from kma_mcp.core.cache import KST
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RATE = 10.0
+DEFAULT_BURST = 10
+
+
+class Priority(IntEnum):
+    """Request priority; lower values are served first."""
+
+    INTERACTIVE = 0
+    NORMAL = 1
+    BULK = 2
+
+
+_priority: ContextVar[Priority] = ContextVar('kma_request_priority', default=Priority.INTERACTIVE)
+
+
+@contextmanager
+def request_priority(priority: Priority) -> Iterator[None]:
+    """Send the requests made inside the block with the given priority.
+
+    The priority follows the context into tasks created inside the block.
+
+    Args:
+        priority: Priority of the requests
+    """
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def current_priority() -> Priority:
+    """Get the priority of requests made in the current context."""
+    return _priority.get()
+
+
+class QuotaExceededError(httpx.RequestError):
+    """Raised when the daily quota of an endpoint family is spent."""
+
+
+def endpoint_family(url: httpx.URL) -> str:
+    """Name the quota family of a request URL.
+
+    OpenAPI methods share the quota of their service (e.g.
+    ``VilageFcstInfoService_2.0``); other endpoints are their own family
+    (e.g. ``kma_sfctm2.php``, ``nph-dfs_shrt_grd``).
+
+    Args:
+        url: Request URL
+
+    Returns:
+        Family name
+    """
+    segments = [segment for segment in url.path.split('/') if segment]
+    if 'openApi' in segments[:-1]:
+        return segments[segments.index('openApi') + 1]
+    return segments[-1] if segments else url.host
+
+
+def _connect(path: str | Path) -> sqlite3.Connection:
+    if str(path) != ':memory:':
+        path = Path(path).expanduser()
+        path.parent.mkdir(parents=True, exist_ok=True)
+    # Autocommit mode, transactions are opened explicitly with BEGIN IMMEDIATE
+    return sqlite3.connect(path, timeout=30, isolation_level=None, check_same_thread=False)
+
+
+class Bucket(Protocol):
+    """Token bucket interface."""
+
+    def reserve(self) -> float:
+        """Take a token, or return the seconds until one is available (0 when taken)."""
+        ...
+
+    def refund(self) -> None:
+        """Put back a token taken for a request that was not sent."""
+        ...
+
+
+class TokenBucket:
+    """In-process token bucket."""
+
+    def __init__(
+        self, rate: float, burst: int, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        """Initialize a full bucket.
+
+        Args:
+            rate: Tokens added per second
+            burst: Bucket capacity
+            clock: Monotonic clock
+        """
+        if rate <= 0 or burst < 1:
+            msg = f'rate must be positive and burst at least 1, got: {rate}, {burst}'
+            raise ValueError(msg)
+        self.rate = rate
+        self.burst = burst
+        self._clock = clock
+        self._tokens = float(burst)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take a token, or return the seconds until one is available (0 when taken)."""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self.rate
+
+    def refund(self) -> None:
+        """Put back a token taken for a request that was not sent."""
+        with self._lock:
+            self._tokens = min(float(self.burst), self._tokens + 1)
+
+
+class SQLiteTokenBucket:
+    """Token bucket stored in SQLite, shared by every process using the same file."""
+
+    def __init__(
+        self,
+        path: str | Path,
+        rate: float,
+        burst: int,
+        name: str = 'default',
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Open or create the bucket.
+
+        Args:
+            path: SQLite database path
+            rate: Tokens added per second
+            burst: Bucket capacity
+            name: Bucket name, to keep several buckets in one file
+            clock: Wall clock (shared between processes)
+        """
+        if rate <= 0 or burst < 1:
+            msg = f'rate must be positive and burst at least 1, got: {rate}, {burst}'
+            raise ValueError(msg)
+        self.rate = rate
+        self.burst = burst
+        self.name = name
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._conn = _connect(path)
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS buckets '
+            '(name TEXT PRIMARY KEY, tokens REAL NOT NULL, updated REAL NOT NULL)'
+        )
+
+    def reserve(self) -> float:
+        """Take a token, or return the seconds until one is available (0 when taken)."""
+        with self._lock:
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                now = self._clock()
+                row = self._conn.execute(
+                    'SELECT tokens, updated FROM buckets WHERE name = ?', (self.name,)
+                ).fetchone()
+                tokens = self.burst if row is None else row[0] + (now - row[1]) * self.rate
+                tokens = min(float(self.burst), tokens)
+                wait = 0.0
+                if tokens >= 1:
+                    tokens -= 1
+                else:
+                    wait = (1 - tokens) / self.rate
+                self._conn.execute(
+                    'INSERT OR REPLACE INTO buckets (name, tokens, updated) VALUES (?, ?, ?)',
+                    (self.name, tokens, now),
+                )
+            except BaseException:
+                self._conn.execute('ROLLBACK')
+                raise
+            self._conn.execute('COMMIT')
+            return wait
+
+    def refund(self) -> None:
+        """Put back a token taken for a request that was not sent."""
+        with self._lock:
+            self._conn.execute(
+                'UPDATE buckets SET tokens = MIN(?, tokens + 1) WHERE name = ?',
+                (float(self.burst), self.name),
+            )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+
+class RateLimiter:
+    """Blocking limiter that hands out bucket tokens to threads in priority order."""
+
+    def __init__(self, bucket: Bucket) -> None:
+        """Initialize the limiter.
+
+        Args:
+            bucket: Token bucket to draw from
+        """
+        self.bucket = bucket
+        self.waited = defaultdict[Priority, float](float)
+        self.granted = Counter[Priority]()
+        self._cond = threading.Condition()
+        self._queue: list[tuple[int, int]] = []
+        self._seq = itertools.count()
+
+    def acquire(self, priority: Priority | None = None) -> None:
+        """Block until a token is granted.
+
+        Args:
+            priority: Request priority (default: the current context's priority)
+        """
+        priority = current_priority() if priority is None else priority
+        ticket = (int(priority), next(self._seq))
+        start = time.monotonic()
+        with self._cond:
+            heapq.heappush(self._queue, ticket)
+            try:
+                while True:
+                    timeout = None
+                    if self._queue[0] == ticket:
+                        timeout = self.bucket.reserve()
+                        if timeout == 0:
+                            heapq.heappop(self._queue)
+                            break
+                    self._cond.wait(timeout)
+            except BaseException:
+                self._queue.remove(ticket)
+                heapq.heapify(self._queue)
+                raise
+            finally:
+                self._cond.notify_all()
+        self.granted[priority] += 1
+        self.waited[priority] += time.monotonic() - start
+
+    def release(self, priority: Priority | None = None) -> None:
+        """Give back a granted token whose request was not sent.
+
+        Args:
+            priority: Priority the token was granted at (default: the current context's)
+        """
+        priority = current_priority() if priority is None else priority
+        self.bucket.refund()
+        self.granted[priority] -= 1
+        with self._cond:
+            self._cond.notify_all()
+
+
+class AsyncRateLimiter:
+    """Async limiter that hands out bucket tokens to tasks in priority order.
+
+    Tasks may wait on several event loops, even in different threads. Waiters
+    form one queue; each waiter is granted its token by its own loop, which
+    also keeps the timer for when the bucket next has a token.
+    """
+
+    def __init__(self, bucket: Bucket) -> None:
+        """Initialize the limiter.
+
+        Args:
+            bucket: Token bucket to draw from (may be shared with a sync limiter)
+        """
+        self.bucket = bucket
+        self.waited = defaultdict[Priority, float](float)
+        self.granted = Counter[Priority]()
+        self._queue: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._seq = itertools.count()
+        self._lock = threading.Lock()
+        self._timers: dict[asyncio.AbstractEventLoop, asyncio.TimerHandle] = {}
+
+    async def acquire(self, priority: Priority | None = None) -> None:
+        """Wait until a token is granted.
+
+        Args:
+            priority: Request priority (default: the current context's priority)
+        """
+        priority = current_priority() if priority is None else priority
+        start = time.monotonic()
+        future = asyncio.get_running_loop().create_future()
+        with self._lock:
+            heapq.heappush(self._queue, (int(priority), next(self._seq), future))
+        self._dispatch()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Cancelled after the token was granted: give it to the next waiter
+                self.bucket.refund()
+            raise
+        finally:
+            # Cancelled waiters stay queued as done futures and are skipped
+            self._dispatch()
+        self.granted[priority] += 1
+        self.waited[priority] += time.monotonic() - start
+
+    def release(self, priority: Priority | None = None) -> None:
+        """Give back a granted token whose request was not sent.
+
+        Args:
+            priority: Priority the token was granted at (default: the current context's)
+        """
+        priority = current_priority() if priority is None else priority
+        self.bucket.refund()
+        self.granted[priority] -= 1
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        try:
+            running: asyncio.AbstractEventLoop | None = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        with self._lock:
+            # Timers of closed loops never fire
+            for loop in [loop for loop in self._timers if loop.is_closed()]:
+                del self._timers[loop]
+            while self._queue:
+                future = self._queue[0][2]
+                loop = future.get_loop()
+                if future.done() or loop.is_closed():
+                    heapq.heappop(self._queue)
+                    continue
+                if loop is not running:
+                    # Futures may only be completed by their own loop
+                    loop.call_soon_threadsafe(self._dispatch)
+                    return
+                wait = self.bucket.reserve()
+                if wait > 0:
+                    if loop not in self._timers:
+                        self._timers[loop] = loop.call_later(wait, self._wake, loop)
+                    return
+                heapq.heappop(self._queue)
+                future.set_result(None)
+
+    def _wake(self, loop: asyncio.AbstractEventLoop) -> None:
+        with self._lock:
+            self._timers.pop(loop, None)
+        self._dispatch()
+
+
+class QuotaLedger:
+    """Daily call counts per endpoint family, optionally shared through SQLite."""
+
+    def __init__(
+        self,
+        daily_limit: int | None = None,
+        *,
+        limits: Mapping[str, int] | None = None,
+        path: str | Path = ':memory:',
+        clock: Callable[[], datetime] = lambda: datetime.now(KST),
+    ) -> None:
+        """Open or create the ledger.
+
+        Args:
+            daily_limit: Calls allowed per family and KST day (None for no limit)
+            limits: Limits of individual families, overriding ``daily_limit``
+            path: SQLite database path, or ':memory:' for this process only
+            clock: Current time, used to find the KST day
+        """
+        self.daily_limit = daily_limit
+        self.limits = dict(limits or {})
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._conn = _connect(path)
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS quota (day TEXT NOT NULL, family TEXT NOT NULL, '
+            'used INTEGER NOT NULL, PRIMARY KEY (day, family))'
+        )
+
+    def _today(self) -> str:
+        return self._clock().astimezone(KST).strftime('%Y%m%d')
+
+    def limit(self, family: str) -> int | None:
+        """Get the daily limit of a family (None for no limit)."""
+        return self.limits.get(family, self.daily_limit)
+
+    def spend(self, family: str) -> None:
+        """Count one call, or refuse it when the family's daily limit is spent.
+
+        Raises:
+            QuotaExceededError: If the limit is already reached
+        """
+        limit = self.limit(family)
+        day = self._today()
+        with self._lock:
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                row = self._conn.execute(
+                    'SELECT used FROM quota WHERE day = ? AND family = ?', (day, family)
+                ).fetchone()
+                used = 0 if row is None else row[0]
+                if limit is not None and used >= limit:
+                    msg = f'Daily quota of {limit} calls for {family} spent'
+                    raise QuotaExceededError(msg)
+                self._conn.execute(
+                    'INSERT OR REPLACE INTO quota (day, family, used) VALUES (?, ?, ?)',
+                    (day, family, used + 1),
+                )
+            except BaseException:
+                self._conn.execute('ROLLBACK')
+                raise
+            self._conn.execute('COMMIT')
+
+    def used(self, family: str) -> int:
+        """Get today's call count of a family."""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT used FROM quota WHERE day = ? AND family = ?', (self._today(), family)
+            ).fetchone()
+        return 0 if row is None else row[0]
+
+    def remaining(self, family: str) -> int | None:
+        """Get today's remaining calls of a family (None for no limit)."""
+        limit = self.limit(family)
+        return None if limit is None else max(0, limit - self.used(family))
+
+    def status(self) -> dict[str, dict[str, int | None]]:
+        """Get today's usage of every family called today or given a limit."""
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT family, used FROM quota WHERE day = ?', (self._today(),)
+            ).fetchall()
+        used = dict(rows)
+        status = {}
+        for family in sorted(used.keys() | self.limits.keys()):
+            limit = self.limit(family)
+            count = used.get(family, 0)
+            status[family] = {
+                'used': count,
+                'limit': limit,
+                'remaining': None if limit is None else max(0, limit - count),
+            }
+        return status
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+
+_default_bucket = TokenBucket(DEFAULT_RATE, DEFAULT_BURST)
+_bucket: Bucket | None = _default_bucket
+_limiter: RateLimiter | None = RateLimiter(_default_bucket)
+_async_limiter: AsyncRateLimiter | None = AsyncRateLimiter(_default_bucket)
+_ledger = QuotaLedger()
+
+
+class RateLimitedTransport(httpx.BaseTransport):
+    """Sync httpx transport that waits for a rate limit token and spends quota."""
+
+    def __init__(
+        self,
+        transport: httpx.BaseTransport | None = None,
+        limiter: RateLimiter | None = None,
+        ledger: QuotaLedger | None = None,
+    ) -> None:
+        """Wrap a transport.
+
+        Args:
+            transport: Transport that sends the requests (default: a new HTTP transport)
+            limiter: Rate limiter (default: the process-wide one)
+            ledger: Quota ledger (default: the process-wide one)
+        """
+        self._transport = transport or httpx.HTTPTransport()
+        self._limiter = limiter
+        self._ledger = ledger
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        """Send a request once the rate limit and the quota allow it."""
+        limiter = self._limiter or _limiter
+        if limiter is not None:
+            limiter.acquire()
+        try:
+            # Spent only once the token is granted, so abandoned waits cost no quota
+            (self._ledger or _ledger).spend(endpoint_family(request.url))
+        except QuotaExceededError:
+            if limiter is not None:
+                limiter.release()
+            raise
+        return self._transport.handle_request(request)
+
+    def close(self) -> None:
+        """Close the wrapped transport."""
+        self._transport.close()
+
+
+class AsyncRateLimitedTransport(httpx.AsyncBaseTransport):
+    """Async httpx transport that waits for a rate limit token and spends quota."""
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport | None = None,
+        limiter: AsyncRateLimiter | None = None,
+        ledger: QuotaLedger | None = None,
+    ) -> None:
+        """Wrap a transport.
+
+        Args:
+            transport: Transport that sends the requests (default: a new HTTP transport)
+            limiter: Rate limiter (default: the process-wide one)
+            ledger: Quota ledger (default: the process-wide one)
+        """
+        self._transport = transport or httpx.AsyncHTTPTransport()
+        self._limiter = limiter
+        self._ledger = ledger
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Send a request once the rate limit and the quota allow it."""
+        limiter = self._limiter or _async_limiter
+        if limiter is not None:
+            await limiter.acquire()
+        try:
+            # Spent only once the token is granted, so cancelled waits cost no quota
+            (self._ledger or _ledger).spend(endpoint_family(request.url))
+        except QuotaExceededError:
+            if limiter is not None:
+                limiter.release()
+            raise
+        return await self._transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        """Close the wrapped transport."""
+        await self._transport.aclose()
+
+
+def configure_rate_limit(
+    rate: float | None = DEFAULT_RATE,
+    burst: int | None = None,
+    *,
+    daily_quota: int | None = None,
+    quotas: Mapping[str, int] | None = None,
+    path: str | Path | None = None,
+) -> None:
+    """Replace the process-wide rate limiter and quota ledger.
+
+    Args:
+        rate: Requests per second (None to disable rate limiting)
+        burst: Requests allowed at once after an idle period (default: ``rate``, at least 1)
+        daily_quota: Calls allowed per endpoint family and KST day (None for no limit)
+        quotas: Limits of individual endpoint families
+        path: SQLite file that shares the bucket and the ledger between processes
+    """
+    global _bucket, _limiter, _async_limiter, _ledger
+    if rate is None:
+        _bucket = _limiter = _async_limiter = None
+    else:
+        burst = burst or max(1, int(rate))
+        bucket: Bucket
+        bucket = TokenBucket(rate, burst) if path is None else SQLiteTokenBucket(path, rate, burst)
+        _bucket, _limiter, _async_limiter = bucket, RateLimiter(bucket), AsyncRateLimiter(bucket)
+    _ledger = QuotaLedger(daily_quota, limits=quotas, path=path or ':memory:')
+
+
+def configure_rate_limit_from_env() -> None:
+    """Configure rate limiting and quotas from environment variables.
+
+    Recognised variables:
+        KMA_RATE_LIMIT: Requests per second for the whole process (0 disables limiting)
+        KMA_RATE_BURST: Requests allowed at once after an idle period
+        KMA_DAILY_QUOTA: Calls allowed per endpoint family and KST day
+        KMA_RATE_LIMIT_PATH: SQLite file shared by every server process on the host
+    """
+    rate = os.getenv('KMA_RATE_LIMIT')
+    burst = os.getenv('KMA_RATE_BURST')
+    daily_quota = os.getenv('KMA_DAILY_QUOTA')
+    path = os.getenv('KMA_RATE_LIMIT_PATH') or None
+
+    rate_value = DEFAULT_RATE if not rate else float(rate)
+    configure_rate_limit(
+        rate_value or None,
+        int(burst) if burst else None,
+        daily_quota=int(daily_quota) if daily_quota else None,
+        path=path,
+    )
+    if path is not None:
+        logger.info('Rate limit and quota shared through: %s', path)
+
+
+def quota_status() -> dict[str, dict[str, int | None]]:
+    """Get today's call counts and remaining quota per endpoint family."""
+    return _ledger.status()
+
+
+def rate_limit_stats() -> dict[str, dict[str, float]]:
+    """Get granted tokens and total seconds waited per priority class."""
+    stats: dict[str, dict[str, float]] = {}
+    for limiter in (_limiter, _async_limiter):
+        if limiter is None:
+            continue
+        for priority in Priority:
+            entry = stats.setdefault(priority.name.lower(), {'granted': 0, 'waited': 0.0})
+            entry['granted'] += limiter.granted[priority]
+            entry['waited'] = round(entry['waited'] + limiter.waited[priority], 3)
+    return stats
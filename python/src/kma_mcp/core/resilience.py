@@ -0,0 +1,495 @@
+"""Retry, backoff, circuit breaking and request hedging for KMA API requests.
+
+apihub.kma.go.kr regularly answers with bursts of 5xx/429 at the top of the
+hour, when every consumer fetches the new observations. This module wraps an
+httpx transport so that every client's ``_make_request`` gets, without
+changing it:
+
+- retries of idempotent requests on connection errors, timeouts and
+  retryable statuses, with full-jitter exponential backoff
+- ``Retry-After`` handling (seconds or HTTP date), capped at the maximum delay
+- a circuit breaker per endpoint that fails fast after repeated failures and
+  lets a single probe through (half-open) once the reset timeout has passed
+- optional hedging for async requests: when the first attempt has not
+  answered after ``hedge_delay`` seconds a second one is sent, and the first
+  to answer wins
+- counters (:func:`resilience_stats`) that show retry amplification
+
+The last retryable response is returned unchanged when attempts run out, so
+clients keep raising ``httpx.HTTPStatusError`` from ``raise_for_status``.
+Requests rejected by an open circuit raise :class:`CircuitOpenError`.
+
+Example:
+    >>> from kma_mcp.core.resilience import RetryPolicy, configure_resilience
+    >>> configure_resilience(RetryPolicy(max_attempts=5, hedge_delay=2.0))
+    >>> with ASOSClient('your_auth_key', http_client=get_http_client()) as client:
+    ...     client.get_hourly_data(tm='202501011200')
+    >>> resilience_stats()
+    {'requests': 1, 'attempts': 2, 'retries': 1, ..., 'amplification': 2.0}
+"""
+
+import asyncio
+import logging
+import os
+import random
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from enum import StrEnum
+
+import httpx
+
+from kma_mcp.core.ratelimit import AsyncRateLimitedTransport, RateLimitedTransport
+
+logger = logging.getLogger(__name__)
+
+IDEMPOTENT_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS'})
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+COUNTERS = (
+    'requests',
+    'attempts',
+    'retries',
+    'retry_after',
+    'exhausted',
+    'circuit_opened',
+    'circuit_rejected',
+    'hedges',
+    'hedge_wins',
+)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Retry, circuit breaker and hedging settings."""
+
+    max_attempts: int = 4
+    base_delay: float = 0.5
+    max_delay: float = 30.0
+    retry_statuses: frozenset[int] = RETRY_STATUSES
+    failure_threshold: int = 5
+    reset_timeout: float = 30.0
+    hedge_delay: float | None = None
+
+    def __post_init__(self) -> None:
+        """Validate the settings."""
+        if self.max_attempts < 1:
+            msg = f'max_attempts must be at least 1, got: {self.max_attempts}'
+            raise ValueError(msg)
+        if self.failure_threshold < 1:
+            msg = f'failure_threshold must be at least 1, got: {self.failure_threshold}'
+            raise ValueError(msg)
+
+
+class CircuitOpenError(httpx.TransportError):
+    """Raised when a request is rejected because its endpoint's circuit is open."""
+
+
+class CircuitState(StrEnum):
+    """Circuit breaker state."""
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker with a single half-open probe."""
+
+    def __init__(
+        self,
+        failure_threshold: int,
+        reset_timeout: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize a closed breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout: Seconds the circuit stays open before a probe is allowed
+            clock: Monotonic clock
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state, with an expired open circuit reported as half-open."""
+        with self._lock:
+            if (
+                self._state is CircuitState.OPEN
+                and self._clock() - self._opened_at >= self.reset_timeout
+            ):
+                return CircuitState.HALF_OPEN
+            return self._state
+
+    def allow(self) -> bool:
+        """Check whether a request may be sent, claiming the probe when half-open."""
+        with self._lock:
+            if self._state is CircuitState.CLOSED:
+                return True
+            if (
+                self._state is CircuitState.OPEN
+                and self._clock() - self._opened_at >= self.reset_timeout
+            ):
+                self._state = CircuitState.HALF_OPEN
+                self._probing = False
+            if self._state is CircuitState.HALF_OPEN and not self._probing:
+                self._probing = True
+                return True
+            return False
+
+    def release(self) -> None:
+        """Give back a claimed probe whose request ended without an outcome.
+
+        Called when a request is cancelled or fails before reaching the
+        endpoint (e.g. the daily quota is spent), so that the next request
+        can probe instead of the circuit staying half-open forever.
+        """
+        with self._lock:
+            self._probing = False
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful request."""
+        with self._lock:
+            self._state = CircuitState.CLOSED
+            self._failures = 0
+            self._probing = False
+
+    def record_failure(self) -> bool:
+        """Count a failed request.
+
+        Returns:
+            True if this failure opened the circuit
+        """
+        with self._lock:
+            self._failures += 1
+            if self._state is CircuitState.HALF_OPEN or (
+                self._state is CircuitState.CLOSED and self._failures >= self.failure_threshold
+            ):
+                self._state = CircuitState.OPEN
+                self._opened_at = self._clock()
+                self._probing = False
+                return True
+            return False
+
+
+@dataclass
+class Resilience:
+    """Shared retry policy, per-endpoint circuit breakers and counters."""
+
+    policy: RetryPolicy = field(default_factory=RetryPolicy)
+    clock: Callable[[], float] = time.monotonic
+    jitter: Callable[[], float] = random.random
+
+    def __post_init__(self) -> None:
+        """Create the breaker registry and counters."""
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._counters: Counter[str] = Counter()
+        self._lock = threading.Lock()
+
+    def breaker(self, request: httpx.Request) -> CircuitBreaker:
+        """Get the circuit breaker of a request's endpoint."""
+        key = f'{request.url.host}{request.url.path}'
+        with self._lock:
+            breaker = self._breakers.get(key)
+            if breaker is None:
+                breaker = CircuitBreaker(
+                    self.policy.failure_threshold, self.policy.reset_timeout, self.clock
+                )
+                self._breakers[key] = breaker
+            return breaker
+
+    def count(self, name: str, value: int = 1) -> None:
+        """Increment a counter."""
+        with self._lock:
+            self._counters[name] += value
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter exponential backoff before retry number ``attempt``."""
+        cap = min(self.policy.max_delay, self.policy.base_delay * 2 ** (attempt - 1))
+        return cap * self.jitter()
+
+    def retry_delay(self, attempt: int, response: httpx.Response) -> float:
+        """Delay before retrying a response, honouring ``Retry-After``."""
+        retry_after = _parse_retry_after(response.headers.get('Retry-After'))
+        if retry_after is None:
+            return self.backoff(attempt)
+        self.count('retry_after')
+        return min(retry_after, self.policy.max_delay)
+
+    def stats(self) -> dict[str, float]:
+        """Snapshot of the counters and the retry amplification (attempts per request)."""
+        with self._lock:
+            stats: dict[str, float] = {name: self._counters[name] for name in COUNTERS}
+            open_circuits = [
+                key
+                for key, breaker in self._breakers.items()
+                if breaker.state is not CircuitState.CLOSED
+            ]
+        stats['amplification'] = (
+            round(stats['attempts'] / stats['requests'], 3) if stats['requests'] else 0.0
+        )
+        stats['open_circuits'] = len(open_circuits)
+        return stats
+
+    def reset(self) -> None:
+        """Reset the counters and close every circuit."""
+        with self._lock:
+            self._counters.clear()
+            self._breakers.clear()
+
+    def rejected(self, request: httpx.Request) -> CircuitOpenError:
+        """Count a request rejected by an open circuit and build its error."""
+        self.count('circuit_rejected')
+        url = f'{request.url.host}{request.url.path}'
+        return CircuitOpenError(f'Circuit open for {url}', request=request)
+
+    def failed(self, breaker: CircuitBreaker, request: httpx.Request) -> None:
+        """Record a failed attempt, logging when it opens the circuit."""
+        if breaker.record_failure():
+            self.count('circuit_opened')
+            logger.warning('Circuit opened for %s%s', request.url.host, request.url.path)
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+_resilience = Resilience()
+
+
+class ResilientTransport(httpx.BaseTransport):
+    """Sync httpx transport that retries and circuit-breaks idempotent requests."""
+
+    def __init__(
+        self,
+        transport: httpx.BaseTransport | None = None,
+        resilience: Resilience | None = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """Wrap a transport.
+
+        Args:
+            transport: Transport that sends the requests (default: a rate-limited HTTP transport)
+            resilience: Policy, breakers and counters (default: the process-wide ones)
+            sleep: Function used to wait between attempts
+        """
+        self._transport = transport or RateLimitedTransport()
+        self._resilience = resilience
+        self._sleep = sleep
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        """Send a request, retrying retryable failures."""
+        if request.method not in IDEMPOTENT_METHODS:
+            return self._transport.handle_request(request)
+        layer = self._resilience or _resilience
+        policy = layer.policy
+        breaker = layer.breaker(request)
+        layer.count('requests')
+
+        for attempt in range(1, policy.max_attempts + 1):
+            if not breaker.allow():
+                raise layer.rejected(request)
+            layer.count('attempts')
+            try:
+                response = self._transport.handle_request(request)
+            except httpx.TransportError:
+                layer.failed(breaker, request)
+                if attempt == policy.max_attempts:
+                    layer.count('exhausted')
+                    raise
+                delay = layer.backoff(attempt)
+            except BaseException:
+                # Failed before reaching the endpoint: no outcome to record
+                breaker.release()
+                raise
+            else:
+                if response.status_code not in policy.retry_statuses:
+                    breaker.record_success()
+                    return response
+                layer.failed(breaker, request)
+                if attempt == policy.max_attempts:
+                    layer.count('exhausted')
+                    return response
+                delay = layer.retry_delay(attempt, response)
+                response.close()
+            layer.count('retries')
+            self._sleep(delay)
+        msg = 'unreachable'
+        raise AssertionError(msg)
+
+    def close(self) -> None:
+        """Close the wrapped transport."""
+        self._transport.close()
+
+
+class AsyncResilientTransport(httpx.AsyncBaseTransport):
+    """Async httpx transport that retries, circuit-breaks and hedges idempotent requests."""
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport | None = None,
+        resilience: Resilience | None = None,
+    ) -> None:
+        """Wrap a transport.
+
+        Args:
+            transport: Transport that sends the requests (default: a rate-limited HTTP transport)
+            resilience: Policy, breakers and counters (default: the process-wide ones)
+        """
+        self._transport = transport or AsyncRateLimitedTransport()
+        self._resilience = resilience
+
+    async def _send(self, request: httpx.Request, layer: Resilience) -> httpx.Response:
+        hedge_delay = layer.policy.hedge_delay
+        primary = asyncio.ensure_future(self._transport.handle_async_request(request))
+        if hedge_delay is None:
+            return await primary
+        done, _ = await asyncio.wait({primary}, timeout=hedge_delay)
+        if done:
+            return primary.result()
+
+        layer.count('hedges')
+        hedge = asyncio.ensure_future(self._transport.handle_async_request(request))
+        pending = {primary, hedge}
+        try:
+            while True:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                # Prefer a completed response; fall back to the other attempt on errors
+                winner = next((task for task in done if task.exception() is None), None)
+                if winner is not None or not pending:
+                    break
+            if winner is None:
+                return primary.result()
+            if winner is hedge:
+                layer.count('hedge_wins')
+            for task in done - {winner}:
+                if task.exception() is None:
+                    await task.result().aclose()
+            return winner.result()
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Send a request, retrying retryable failures."""
+        if request.method not in IDEMPOTENT_METHODS:
+            return await self._transport.handle_async_request(request)
+        layer = self._resilience or _resilience
+        policy = layer.policy
+        breaker = layer.breaker(request)
+        layer.count('requests')
+
+        for attempt in range(1, policy.max_attempts + 1):
+            if not breaker.allow():
+                raise layer.rejected(request)
+            layer.count('attempts')
+            try:
+                response = await self._send(request, layer)
+            except httpx.TransportError:
+                layer.failed(breaker, request)
+                if attempt == policy.max_attempts:
+                    layer.count('exhausted')
+                    raise
+                delay = layer.backoff(attempt)
+            except BaseException:
+                # Cancelled, or failed before reaching the endpoint: no outcome to record
+                breaker.release()
+                raise
+            else:
+                if response.status_code not in policy.retry_statuses:
+                    breaker.record_success()
+                    return response
+                layer.failed(breaker, request)
+                if attempt == policy.max_attempts:
+                    layer.count('exhausted')
+                    return response
+                delay = layer.retry_delay(attempt, response)
+                await response.aclose()
+            layer.count('retries')
+            await asyncio.sleep(delay)
+        msg = 'unreachable'
+        raise AssertionError(msg)
+
+    async def aclose(self) -> None:
+        """Close the wrapped transport."""
+        await self._transport.aclose()
+
+
+def configure_resilience(policy: RetryPolicy | None = None) -> Resilience:
+    """Replace the process-wide retry policy, resetting breakers and counters.
+
+    Args:
+        policy: New policy (default: the default policy)
+
+    Returns:
+        The new process-wide resilience state
+    """
+    global _resilience
+    _resilience = Resilience(policy or RetryPolicy())
+    return _resilience
+
+
+def configure_resilience_from_env() -> Resilience:
+    """Configure the retry policy from environment variables.
+
+    Recognised variables:
+        KMA_RETRY_MAX_ATTEMPTS: Attempts per request including the first (1 disables retries)
+        KMA_RETRY_BASE_DELAY: Backoff base in seconds
+        KMA_RETRY_MAX_DELAY: Upper bound of a single wait in seconds
+        KMA_CIRCUIT_FAILURES: Consecutive failures that open an endpoint's circuit
+        KMA_CIRCUIT_RESET: Seconds before an open circuit lets a probe through
+        KMA_HEDGE_DELAY: Seconds before an async request is hedged (hedging off when unset)
+
+    Returns:
+        The configured resilience state
+    """
+    defaults = RetryPolicy()
+
+    def number(name: str, default: float) -> float:
+        value = os.getenv(name)
+        return float(value) if value else default
+
+    hedge_delay = os.getenv('KMA_HEDGE_DELAY')
+    return configure_resilience(
+        RetryPolicy(
+            max_attempts=int(number('KMA_RETRY_MAX_ATTEMPTS', defaults.max_attempts)),
+            base_delay=number('KMA_RETRY_BASE_DELAY', defaults.base_delay),
+            max_delay=number('KMA_RETRY_MAX_DELAY', defaults.max_delay),
+            failure_threshold=int(number('KMA_CIRCUIT_FAILURES', defaults.failure_threshold)),
+            reset_timeout=number('KMA_CIRCUIT_RESET', defaults.reset_timeout),
+            hedge_delay=float(hedge_delay) if hedge_delay else None,
+        )
+    )
+
+
+def get_resilience() -> Resilience:
+    """Get the process-wide retry policy, circuit breakers and counters."""
+    return _resilience
+
+
+def resilience_stats() -> dict[str, float]:
+    """Get the process-wide retry and circuit breaker counters."""
+    return _resilience.stats()
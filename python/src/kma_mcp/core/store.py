@@ -0,0 +1,514 @@
+"""Local time-series store of settled observations, read through by period endpoints.
+
+Analyses keep asking for the same histories (ASOS hourly and daily periods,
+AWS minutes, dust, North Korea and buoy observations). The response cache
+(:mod:`kma_mcp.core.cache`) only helps when a request repeats exactly; this
+store keeps the rows themselves, so any range that overlaps earlier requests
+is answered locally and only the missing parts are requested upstream.
+
+Rows are kept in SQLite, clustered by (series, station, time), where a
+series is one endpoint with one set of non-time parameters. For each series
+the store records which time intervals it holds, for all stations or for one
+station. A request is planned against those intervals; the gaps are fetched
+(at most the requested range, so every fetch stays within the endpoint's
+limits), written, and the answer is read back from the store. Only rows
+older than the settle period are stored, so recent observations that may
+still be corrected are always fetched.
+
+Clients opt in per endpoint through their ``TIME_SERIES`` mapping, and the
+store is disabled unless configured.
+
+Example:
+    >>> from kma_mcp.core.store import configure_store
+    >>> from kma_mcp.surface.asos_client import ASOSClient
+    >>> store = configure_store('~/.cache/kma-mcp/observations.sqlite')
+    >>> with ASOSClient('your_auth_key') as client:
+    ...     client.get_hourly_period('202401010000', '202401312300')  # fetched, stored
+    ...     client.get_hourly_period('202401150000', '202402152300')  # only February fetched
+    >>> store.compact()
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from kma_mcp.core.cache import DEFAULT_SETTLE, KST
+from kma_mcp.core.parsing import find_key_columns
+from kma_mcp.core.windowing import PeriodSpec
+
+logger = logging.getLogger(__name__)
+
+# Parameters that identify the rows of a request rather than its series
+_ROW_PARAMS = frozenset({'tm1', 'tm2', 'stn', 'authKey', 'serviceKey'})
+# Station key of intervals fetched for every station (stn=0)
+ALL_STATIONS = 0
+
+_SCHEMA = (
+    'CREATE TABLE IF NOT EXISTS series ('
+    'id INTEGER PRIMARY KEY, key TEXT NOT NULL UNIQUE, columns TEXT NOT NULL)',
+    'CREATE TABLE IF NOT EXISTS observations ('
+    'series INTEGER NOT NULL, stn INTEGER NOT NULL, tm TEXT NOT NULL, data TEXT NOT NULL, '
+    'PRIMARY KEY (series, stn, tm)) WITHOUT ROWID',
+    'CREATE TABLE IF NOT EXISTS coverage ('
+    'series INTEGER NOT NULL, stn INTEGER NOT NULL, start TEXT NOT NULL, end TEXT NOT NULL, '
+    'PRIMARY KEY (series, stn, start)) WITHOUT ROWID',
+)
+
+Interval = tuple[datetime, datetime]
+
+
+def _merge(intervals: list[Interval], step: timedelta) -> list[Interval]:
+    """Merge overlapping or adjacent intervals (inclusive, ``step`` apart)."""
+    merged: list[Interval] = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1] + step:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def find_gaps(
+    start: datetime, end: datetime, covered: list[Interval], step: timedelta
+) -> list[Interval]:
+    """Return the parts of ``[start, end]`` not covered by any interval.
+
+    Args:
+        start: First time of the range
+        end: Last time of the range, inclusive
+        covered: Inclusive intervals held locally, in any order
+        step: Resolution of the times
+
+    Returns:
+        Inclusive gaps, in time order
+
+    Example:
+        >>> hour = timedelta(hours=1)
+        >>> find_gaps(datetime(2025, 1, 1, 0), datetime(2025, 1, 1, 5),
+        ...           [(datetime(2025, 1, 1, 2), datetime(2025, 1, 1, 3))], hour)
+        [(datetime(2025, 1, 1, 0, 0), datetime(2025, 1, 1, 1, 0)),
+         (datetime(2025, 1, 1, 4, 0), datetime(2025, 1, 1, 5, 0))]
+    """
+    gaps = []
+    cursor = start
+    for low, high in _merge(covered, step):
+        if high < cursor:
+            continue
+        if low > end:
+            break
+        if low > cursor:
+            gaps.append((cursor, low - step))
+        cursor = high + step
+    if cursor <= end:
+        gaps.append((cursor, end))
+    return gaps
+
+
+@dataclass
+class ReadPlan:
+    """One request planned against the store: the gaps to fetch and how to answer.
+
+    Attributes:
+        store: Store the plan reads from and writes to
+        series: Series ID
+        stn: Requested station (0 for all stations)
+        start: First requested time
+        end: Last requested time
+        spec: Time format and resolution of the endpoint
+        settled: Last time whose rows are final and may be stored
+        gaps: (tm1, tm2) parameters of the upstream requests still needed
+    """
+
+    store: 'ObservationStore'
+    series: int
+    stn: int
+    start: datetime
+    end: datetime
+    spec: PeriodSpec
+    settled: datetime
+    gaps: list[tuple[str, str]]
+    _live: dict[str, list[Any]] = field(default_factory=dict)
+
+    def add(self, tm1: str, tm2: str, data: Any) -> bool:  # noqa: ANN401
+        """Store the response to one gap request.
+
+        Args:
+            tm1: Start of the gap, as requested
+            tm2: End of the gap, as requested
+            data: Decoded response
+
+        Returns:
+            False if the response is not an observation table (e.g. an error
+            document), which should then be returned to the caller as it is
+        """
+        table = _table(data)
+        if table is None:
+            return False
+        start = datetime.strptime(tm1, self.spec.time_format)  # noqa: DTZ007
+        end = min(datetime.strptime(tm2, self.spec.time_format), self.settled)  # noqa: DTZ007
+        self.store.write(self.series, self.stn, table, self.spec, self.settled)
+        if start <= end:
+            self.store.cover(self.series, self.stn, start, end, self.spec)
+        # Rows newer than the settle period are answered but never stored
+        _extend(self._live, _rows_after(table, self.settled, self.end, self.spec))
+        return True
+
+    def result(self) -> dict[str, list[Any]]:
+        """Return the requested range: stored rows followed by unsettled ones."""
+        stored = self.store.read(self.series, self.stn, self.start, self.end, self.spec)
+        _extend(stored, self._live)
+        return stored
+
+
+def _table(data: Any) -> dict[str, list[Any]] | None:  # noqa: ANN401
+    """Return the data if it is an observation table (an empty body counts as one)."""
+    if not isinstance(data, dict):
+        return None
+    if not data:
+        return {}
+    _, time = find_key_columns(list(data))
+    if time is None or not all(isinstance(values, list) for values in data.values()):
+        return None
+    return data
+
+
+def _parse_interval(start: str, end: str, spec: PeriodSpec) -> Interval:
+    return (
+        datetime.strptime(start, spec.time_format),  # noqa: DTZ007
+        datetime.strptime(end, spec.time_format),  # noqa: DTZ007
+    )
+
+
+def _time_key(value: Any, spec: PeriodSpec) -> str:  # noqa: ANN401
+    """Normalize a row time to the width of the endpoint's time format."""
+    width = len(datetime(2000, 1, 1).strftime(spec.time_format))  # noqa: DTZ001
+    return str(value)[:width].ljust(width, '0')
+
+
+def _rows_after(
+    table: dict[str, list[Any]], settled: datetime, end: datetime, spec: PeriodSpec
+) -> dict[str, list[Any]]:
+    """Select the rows after the settle time, up to the requested end."""
+    if not table:
+        return {}
+    _, time = find_key_columns(list(table))
+    low, high = settled.strftime(spec.time_format), end.strftime(spec.time_format)
+    keep = [
+        index
+        for index, value in enumerate(table[time or ''])
+        if low < _time_key(value, spec) <= high
+    ]
+    return {name: [values[index] for index in keep] for name, values in table.items()}
+
+
+def _extend(target: dict[str, list[Any]], rows: dict[str, list[Any]]) -> None:
+    """Append columnar rows, padding columns missing on either side with None."""
+    size = len(next(iter(rows.values()), []))
+    if not size:
+        return
+    before = len(next(iter(target.values()), []))
+    for name, values in rows.items():
+        target.setdefault(name, [None] * before).extend(values)
+    for values in target.values():
+        values.extend([None] * (before + size - len(values)))
+
+
+class ObservationStore:
+    """SQLite store of observation rows and the time intervals it holds."""
+
+    def __init__(self, path: str | Path, *, settle: timedelta = DEFAULT_SETTLE) -> None:
+        """Open (or create) the store.
+
+        Args:
+            path: Database file path, or ':memory:'; parent directories are created
+            settle: Age after which observations are final and may be stored
+        """
+        self.path = str(path) if str(path) == ':memory:' else Path(path).expanduser()
+        if isinstance(self.path, Path):
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.settle = settle
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        for statement in _SCHEMA:
+            self._conn.execute(statement)
+        self._columns: dict[int, list[str]] = {}
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        with self._lock:
+            self._conn.execute('BEGIN')
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute('ROLLBACK')
+                raise
+            self._conn.execute('COMMIT')
+
+    def series_id(self, endpoint: str, params: Mapping[str, Any]) -> int:
+        """Return the ID of the series of a request, registering it if new."""
+        identity = sorted((str(k), str(v)) for k, v in params.items() if k not in _ROW_PARAMS)
+        key = json.dumps([endpoint, identity])
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO series (key, columns) VALUES (?, '[]')", (key,)
+            )
+            row = self._conn.execute(
+                'SELECT id, columns FROM series WHERE key = ?', (key,)
+            ).fetchone()
+        self._columns.setdefault(row[0], json.loads(row[1]))
+        return row[0]
+
+    def plan(
+        self,
+        endpoint: str,
+        params: Mapping[str, Any],
+        spec: PeriodSpec,
+        *,
+        now: datetime | None = None,
+    ) -> ReadPlan | None:
+        """Plan a period request against the rows held locally.
+
+        Args:
+            endpoint: Endpoint of the request
+            params: Query parameters, with 'tm1' and 'tm2'
+            spec: Time format and resolution of the endpoint
+            now: Current time as a naive KST datetime (defaults to the wall clock)
+
+        Returns:
+            The plan, or None when the request cannot be served from the store
+            (no time range, or a station list instead of one station)
+        """
+        stn = str(params.get('stn', ALL_STATIONS))
+        if not stn.isdigit() or not params.get('tm1') or not params.get('tm2'):
+            return None
+        try:
+            start = datetime.strptime(str(params['tm1']), spec.time_format)  # noqa: DTZ007
+            end = datetime.strptime(str(params['tm2']), spec.time_format)  # noqa: DTZ007
+        except ValueError:
+            return None
+        if start > end:
+            return None
+
+        now = now or datetime.now(KST).replace(tzinfo=None)
+        settled_text = (now - self.settle).strftime(spec.time_format)
+        settled = datetime.strptime(settled_text, spec.time_format)  # noqa: DTZ007
+        series = self.series_id(endpoint, params)
+        gaps = find_gaps(start, end, self.coverage(series, int(stn), spec), spec.step)
+        windows = [
+            (low.strftime(spec.time_format), high.strftime(spec.time_format)) for low, high in gaps
+        ]
+        return ReadPlan(self, series, int(stn), start, end, spec, settled, windows)
+
+    def coverage(self, series: int, stn: int, spec: PeriodSpec) -> list[Interval]:
+        """Return the intervals held for a station (including all-station intervals)."""
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT start, end FROM coverage WHERE series = ? AND stn IN (?, ?)',
+                (series, stn, ALL_STATIONS),
+            ).fetchall()
+        return [_parse_interval(start, end, spec) for start, end in rows]
+
+    def write(
+        self,
+        series: int,
+        stn: int,
+        table: dict[str, list[Any]],
+        spec: PeriodSpec,
+        settled: datetime,
+    ) -> int:
+        """Upsert the settled rows of a response.
+
+        Args:
+            series: Series ID
+            stn: Requested station, used when the table has no station column
+            table: Columnar response
+            spec: Time format of the endpoint
+            settled: Last time whose rows are final
+
+        Returns:
+            Number of rows written
+        """
+        if not table:
+            return 0
+        station, time = find_key_columns(list(table))
+        names = list(table)
+        limit = settled.strftime(spec.time_format)
+        rows = []
+        for values in zip(*table.values(), strict=True):
+            record = dict(zip(names, values, strict=True))
+            key = _time_key(record[time], spec)
+            if key <= limit:
+                owner = record[station] if station is not None else stn
+                rows.append((series, int(owner), key, json.dumps(record, ensure_ascii=False)))
+
+        known = self._columns.setdefault(series, [])
+        added = [name for name in names if name not in known]
+        with self._transaction() as conn:
+            if added:
+                known.extend(added)
+                conn.execute(
+                    'UPDATE series SET columns = ? WHERE id = ?', (json.dumps(known), series)
+                )
+            conn.executemany('INSERT OR REPLACE INTO observations VALUES (?, ?, ?, ?)', rows)
+        return len(rows)
+
+    def cover(
+        self, series: int, stn: int, start: datetime, end: datetime, spec: PeriodSpec
+    ) -> None:
+        """Record that every row of a station in ``[start, end]`` is held.
+
+        Adjacent and overlapping intervals of the station are merged, so the
+        coverage of a series stays a handful of rows however it was filled.
+        """
+        with self._transaction() as conn:
+            rows = conn.execute(
+                'SELECT start, end FROM coverage WHERE series = ? AND stn = ?', (series, stn)
+            ).fetchall()
+            intervals = [_parse_interval(low, high, spec) for low, high in rows]
+            merged = _merge([*intervals, (start, end)], spec.step)
+            conn.execute('DELETE FROM coverage WHERE series = ? AND stn = ?', (series, stn))
+            conn.executemany(
+                'INSERT INTO coverage VALUES (?, ?, ?, ?)',
+                [
+                    (series, stn, low.strftime(spec.time_format), high.strftime(spec.time_format))
+                    for low, high in merged
+                ],
+            )
+
+    def read(
+        self, series: int, stn: int, start: datetime, end: datetime, spec: PeriodSpec
+    ) -> dict[str, list[Any]]:
+        """Return the stored rows of a range as columnar data, ordered by time and station.
+
+        Args:
+            series: Series ID
+            stn: Station, or 0 for every station
+            start: First time
+            end: Last time, inclusive
+            spec: Time format of the endpoint
+
+        Returns:
+            Mapping of column name to values ({} when nothing is stored)
+        """
+        low, high = start.strftime(spec.time_format), end.strftime(spec.time_format)
+        query = 'SELECT data FROM observations WHERE series = ? AND tm BETWEEN ? AND ?'
+        args: tuple[Any, ...] = (series, low, high)
+        if stn != ALL_STATIONS:
+            # One station is a range scan of the (series, stn, tm) primary key
+            query += ' AND stn = ?'
+            args = (*args, stn)
+        with self._lock:
+            rows = self._conn.execute(f'{query} ORDER BY tm, stn', args).fetchall()
+        if not rows:
+            return {}
+        names = self._columns.get(series, [])
+        records = [json.loads(data) for (data,) in rows]
+        return {name: [record.get(name) for record in records] for name in names}
+
+    def compact(self) -> dict[str, int]:
+        """Merge coverage intervals, drop redundant ones and reclaim free space.
+
+        Station intervals inside an all-station interval of the same series are
+        dropped, and the remaining intervals of every station are merged.
+
+        Returns:
+            Number of coverage intervals before and after compaction
+        """
+        with self._transaction() as conn:
+            before = conn.execute('SELECT COUNT(*) FROM coverage').fetchone()[0]
+            conn.execute(
+                'DELETE FROM coverage AS station WHERE stn != ? AND EXISTS ('
+                'SELECT 1 FROM coverage AS every WHERE every.series = station.series '
+                'AND every.stn = ? AND every.start <= station.start AND every.end >= station.end)',
+                (ALL_STATIONS, ALL_STATIONS),
+            )
+            # Merge overlapping intervals left over from older writes; adjacency
+            # needs the series' resolution and is handled when intervals are added
+            rows = conn.execute(
+                'SELECT series, stn, start, end FROM coverage ORDER BY series, stn, start'
+            ).fetchall()
+            merged: list[list[Any]] = []
+            for series, stn, start, end in rows:
+                last = merged[-1] if merged else None
+                if last and last[:2] == [series, stn] and start <= last[3]:
+                    last[3] = max(last[3], end)
+                else:
+                    merged.append([series, stn, start, end])
+            conn.execute('DELETE FROM coverage')
+            conn.executemany('INSERT INTO coverage VALUES (?, ?, ?, ?)', merged)
+        with self._lock:
+            self._conn.execute('VACUUM')
+            self._conn.execute('PRAGMA optimize')
+        return {'intervals_before': before, 'intervals_after': len(merged)}
+
+    def stats(self) -> dict[str, int]:
+        """Return the number of series, rows and coverage intervals held."""
+        with self._lock:
+            return {
+                table: self._conn.execute(f'SELECT COUNT(*) FROM {table}').fetchone()[0]  # noqa: S608
+                for table in ('series', 'observations', 'coverage')
+            }
+
+    def clear(self) -> None:
+        """Remove every stored row and interval."""
+        with self._transaction() as conn:
+            for table in ('observations', 'coverage', 'series'):
+                conn.execute(f'DELETE FROM {table}')  # noqa: S608
+        self._columns.clear()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+_store: ObservationStore | None = None
+
+
+def configure_store(
+    path: str | Path | None, *, settle: timedelta = DEFAULT_SETTLE
+) -> ObservationStore | None:
+    """Enable, replace or disable the process-wide observation store.
+
+    Args:
+        path: SQLite database path, ':memory:' for an in-process store, or None to disable
+        settle: Age after which observations are final and may be stored
+
+    Returns:
+        The configured store, or None when disabled
+    """
+    global _store
+    _store = None if path is None else ObservationStore(path, settle=settle)
+    return _store
+
+
+def configure_store_from_env() -> ObservationStore | None:
+    """Configure the observation store from environment variables.
+
+    Recognised variables:
+        KMA_STORE_PATH: SQLite database path, or ':memory:' (store disabled when unset)
+        KMA_STORE_SETTLE_HOURS: Hours after which observations are final
+
+    Returns:
+        The configured store, or None when disabled
+    """
+    settle_hours = os.getenv('KMA_STORE_SETTLE_HOURS')
+    settle = timedelta(hours=float(settle_hours)) if settle_hours else DEFAULT_SETTLE
+    store = configure_store(os.getenv('KMA_STORE_PATH') or None, settle=settle)
+    if store is not None:
+        logger.info('Observation store enabled: %s', os.getenv('KMA_STORE_PATH'))
+    return store
+
+
+def get_store() -> ObservationStore | None:
+    """Get the process-wide observation store, or None when it is disabled."""
+    return _store
@@ -0,0 +1,220 @@
+"""Follow live minutely feeds, fetching and yielding only what is new.
+
+A monitoring loop that polls ``AWSClient.get_minutely_data`` every minute
+would otherwise download the same overlapping window again and again.
+:class:`TailCursor` remembers the last observation time of every station and
+a fingerprint of each recent row, so that every poll requests only the
+minutes since the newest observation (plus a short ``lookback`` for data
+that arrives late) and passes on only rows that are new or whose values
+changed. After a stall, the missed span is fetched in API-legal windows
+(see :func:`kma_mcp.core.windowing.fetch_period`).
+
+Example:
+    >>> from kma_mcp.core.tailing import tail
+    >>> from kma_mcp.surface.aws_client import AWSClient
+    >>> with AWSClient('your_auth_key') as client:
+    ...     for rows in tail(client.get_minutely_data, interval=60):
+    ...         ingest(rows)  # columnar, only new or corrected rows
+
+    >>> from kma_mcp.core.tailing import atail
+    >>> from kma_mcp.surface.async_aws_client import AsyncAWSClient
+    >>> async with AsyncAWSClient('your_auth_key') as client:
+    ...     async for rows in atail(client.get_minutely_data, stn=108):
+    ...         await ingest(rows)
+"""
+
+import asyncio
+import itertools
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Iterator
+from datetime import datetime, timedelta
+from typing import Any
+
+from kma_mcp.core.cache import KST
+from kma_mcp.core.parsing import find_key_columns
+from kma_mcp.core.windowing import MINUTELY, PeriodSpec, afetch_period, fetch_period
+
+DEFAULT_INTERVAL = 60.0
+DEFAULT_LOOKBACK = timedelta(minutes=10)
+
+
+def _now() -> datetime:
+    return datetime.now(KST).replace(tzinfo=None)
+
+
+class TailCursor:
+    """Position of a live feed: what was already seen, and what to request next.
+
+    Only the rows of the last ``lookback`` are fingerprinted, so memory is
+    bounded by the number of stations times the lookback, not by how long the
+    feed has been followed.
+    """
+
+    def __init__(
+        self,
+        *,
+        since: str | datetime | None = None,
+        lookback: timedelta = DEFAULT_LOOKBACK,
+        spec: PeriodSpec = MINUTELY,
+        clock: Callable[[], datetime] = _now,
+    ) -> None:
+        """Initialize the cursor.
+
+        Args:
+            since: Time of the first observation to fetch (default: ``lookback``
+                before the first poll)
+            lookback: How much of the span before the newest observation each
+                poll requests again, to pick up late or corrected rows (0 requests
+                only the minutes after it)
+            spec: Limits and time format of the endpoint
+            clock: Returns the current time as a naive KST datetime
+        """
+        if lookback < timedelta(0):
+            msg = f'lookback must not be negative, got: {lookback}'
+            raise ValueError(msg)
+        self.lookback = lookback
+        self.spec = spec
+        self._clock = clock
+        self._since = since
+        self._newest: str | None = None
+        self._last_seen: dict[Any, str] = {}
+        self._fingerprints: dict[tuple[Any, Any], int] = {}
+
+    @property
+    def last_seen(self) -> dict[Any, str]:
+        """Time of the newest observation of each station seen so far."""
+        return dict(self._last_seen)
+
+    def _parse(self, value: str) -> datetime:
+        return datetime.strptime(value, self.spec.time_format)  # noqa: DTZ007
+
+    def window(self) -> tuple[str, str]:
+        """Return the (tm1, tm2) span the next poll should request."""
+        end = self._clock().replace(second=0, microsecond=0)
+        if self._newest is not None:
+            start = self._parse(self._newest) + self.spec.step - self.lookback
+        elif self._since is not None:
+            since = self._since
+            start = since if isinstance(since, datetime) else self._parse(since)
+        else:
+            start = end - self.lookback
+        start = min(start, end)
+        return start.strftime(self.spec.time_format), end.strftime(self.spec.time_format)
+
+    def update(self, chunks: Iterable[dict[str, Any]]) -> dict[str, list[Any]]:
+        """Record the rows of one poll and keep those not seen before.
+
+        Args:
+            chunks: Columnar responses covering the span of :meth:`window`
+
+        Returns:
+            Columnar rows that are new, or whose values changed since they
+            were last seen, in response order
+
+        Raises:
+            ValueError: If a response is not a columnar table with a time column
+        """
+        fresh: dict[str, list[Any]] = {}
+        for chunk in chunks:
+            station, time_column = find_key_columns(list(chunk))
+            if time_column is None or not all(isinstance(col, list) for col in chunk.values()):
+                msg = 'Tailing needs columnar (text) responses with an observation time column'
+                raise ValueError(msg)
+
+            stations = chunk[station] if station is not None else [None] * len(chunk[time_column])
+            keep = []
+            for index, row in enumerate(zip(*chunk.values(), strict=True)):
+                stn, observed = stations[index], str(chunk[time_column][index])
+                fingerprint = hash(row)
+                if self._fingerprints.get((stn, observed)) == fingerprint:
+                    continue
+                self._fingerprints[stn, observed] = fingerprint
+                if observed > self._last_seen.get(stn, ''):
+                    self._last_seen[stn] = observed
+                keep.append(index)
+
+            rows = len(fresh[next(iter(fresh))]) if fresh else 0
+            for name, values in chunk.items():
+                # Columns missing from earlier chunks are padded with None
+                fresh.setdefault(name, [None] * rows).extend(values[index] for index in keep)
+            for values in fresh.values():
+                values.extend([None] * (rows + len(keep) - len(values)))
+
+        if self._last_seen:
+            self._newest = max(self._last_seen.values())
+            self._forget_before(self._parse(self._newest) - self.lookback)
+        return fresh
+
+    def _forget_before(self, horizon: datetime) -> None:
+        """Drop fingerprints of rows older than the next poll will request."""
+        oldest = horizon.strftime(self.spec.time_format)
+        self._fingerprints = {
+            key: fingerprint for key, fingerprint in self._fingerprints.items() if key[1] >= oldest
+        }
+
+
+def _has_rows(rows: dict[str, list[Any]]) -> bool:
+    return any(rows.values())
+
+
+def tail(
+    method: Callable[..., dict[str, Any]],
+    *,
+    cursor: TailCursor | None = None,
+    interval: float = DEFAULT_INTERVAL,
+    polls: int | None = None,
+    **kwargs: Any,  # noqa: ANN401
+) -> Iterator[dict[str, list[Any]]]:
+    """Poll a sync client method and yield only new or changed rows.
+
+    Args:
+        method: Bound client method taking tm1 and tm2 (e.g. ``client.get_minutely_data``)
+        cursor: Feed position to resume from (default: a new :class:`TailCursor`)
+        interval: Seconds to wait between polls
+        polls: Number of polls before stopping (default: follow forever)
+        **kwargs: Extra arguments passed to every call (e.g. ``stn=108``)
+
+    Yields:
+        Columnar rows of each poll that returned anything new
+    """
+    cursor = TailCursor() if cursor is None else cursor
+    for poll in range(polls) if polls is not None else itertools.count():
+        if poll:
+            time.sleep(interval)
+        tm1, tm2 = cursor.window()
+        rows = cursor.update(fetch_period(method, tm1, tm2, spec=cursor.spec, **kwargs))
+        if _has_rows(rows):
+            yield rows
+
+
+async def atail(
+    method: Callable[..., Awaitable[dict[str, Any]]],
+    *,
+    cursor: TailCursor | None = None,
+    interval: float = DEFAULT_INTERVAL,
+    polls: int | None = None,
+    **kwargs: Any,  # noqa: ANN401
+) -> AsyncIterator[dict[str, list[Any]]]:
+    """Poll an async client method and yield only new or changed rows.
+
+    Args:
+        method: Bound async client method taking tm1 and tm2
+        cursor: Feed position to resume from (default: a new :class:`TailCursor`)
+        interval: Seconds to wait between polls
+        polls: Number of polls before stopping (default: follow forever)
+        **kwargs: Extra arguments passed to every call (e.g. ``stn=108``)
+
+    Yields:
+        Columnar rows of each poll that returned anything new
+    """
+    cursor = TailCursor() if cursor is None else cursor
+    for poll in range(polls) if polls is not None else itertools.count():
+        if poll:
+            await asyncio.sleep(interval)
+        tm1, tm2 = cursor.window()
+        chunks = [
+            chunk async for chunk in afetch_period(method, tm1, tm2, spec=cursor.spec, **kwargs)
+        ]
+        rows = cursor.update(chunks)
+        if _has_rows(rows):
+            yield rows
@@ -0,0 +1,217 @@
+"""Shared, pooled HTTP transport for KMA API clients.
+
+Every client class builds its own ``httpx.Client`` by default, which means a
+fresh TCP/TLS connection to apihub.kma.go.kr per client instance. This module
+keeps one process-wide sync client and one async client with a keep-alive
+connection pool (and HTTP/2 when the optional ``h2`` package is installed)
+that can be injected into any client through its ``http_client`` argument.
+
+The MCP servers create the shared clients lazily on first use and close them
+on shutdown. Requests that reach the network are retried and circuit-broken
+(see :mod:`kma_mcp.core.resilience`) and rate-limited (see
+:mod:`kma_mcp.core.ratelimit`), and when a response cache is configured
+(see :mod:`kma_mcp.core.cache`) the shared clients serve repeated requests from it.
+
+Example:
+    >>> from kma_mcp.core.transport import get_http_client
+    >>> from kma_mcp.surface.aws_client import AWSClient
+    >>> with AWSClient('your_auth_key', http_client=get_http_client()) as client:
+    ...     data = client.get_minutely_data(tm2='202501011200')
+"""
+
+import asyncio
+import importlib.util
+import logging
+import os
+import threading
+
+import httpx
+
+from kma_mcp.core.cache import AsyncCachingTransport, CachingTransport, get_cache
+from kma_mcp.core.prefetch import AsyncPrefetchTransport, get_prefetch_store
+from kma_mcp.core.ratelimit import AsyncRateLimitedTransport, RateLimitedTransport
+from kma_mcp.core.resilience import AsyncResilientTransport, ResilientTransport
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUT = 30.0
+DEFAULT_MAX_CONNECTIONS = 20
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 10
+DEFAULT_KEEPALIVE_EXPIRY = 30.0
+
+_limits = httpx.Limits(
+    max_connections=DEFAULT_MAX_CONNECTIONS,
+    max_keepalive_connections=DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    keepalive_expiry=DEFAULT_KEEPALIVE_EXPIRY,
+)
+_timeout: float = DEFAULT_TIMEOUT
+_http2: bool | None = None
+
+_lock = threading.Lock()
+_client: httpx.Client | None = None
+# Async clients by the event loop their connections are bound to
+_async_clients: dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+
+
+def http2_available() -> bool:
+    """Check whether HTTP/2 support (the ``h2`` package) is installed.
+
+    Returns:
+        True if httpx can negotiate HTTP/2, False otherwise
+    """
+    return importlib.util.find_spec('h2') is not None
+
+
+def configure(
+    *,
+    max_connections: int | None = None,
+    max_keepalive_connections: int | None = None,
+    keepalive_expiry: float | None = None,
+    timeout: float | None = None,
+    http2: bool | None = None,
+) -> None:
+    """Configure the shared connection pool.
+
+    Settings apply to shared clients created after this call; clients that
+    already exist are left untouched until they are closed.
+
+    Args:
+        max_connections: Maximum number of concurrent connections
+        max_keepalive_connections: Maximum number of idle keep-alive connections
+        keepalive_expiry: Seconds an idle connection is kept open
+        timeout: Default request timeout in seconds
+        http2: Enable HTTP/2 (None to enable it only when ``h2`` is installed)
+    """
+    global _limits, _timeout, _http2
+    _limits = httpx.Limits(
+        max_connections=_limits.max_connections if max_connections is None else max_connections,
+        max_keepalive_connections=(
+            _limits.max_keepalive_connections
+            if max_keepalive_connections is None
+            else max_keepalive_connections
+        ),
+        keepalive_expiry=(
+            _limits.keepalive_expiry if keepalive_expiry is None else keepalive_expiry
+        ),
+    )
+    if timeout is not None:
+        _timeout = timeout
+    _http2 = http2
+
+
+def configure_from_env() -> None:
+    """Configure the shared connection pool from environment variables.
+
+    Recognised variables:
+        KMA_HTTP_MAX_CONNECTIONS: Maximum number of concurrent connections
+        KMA_HTTP_MAX_KEEPALIVE: Maximum number of idle keep-alive connections
+        KMA_HTTP_KEEPALIVE_EXPIRY: Seconds an idle connection is kept open
+        KMA_HTTP_TIMEOUT: Default request timeout in seconds
+        KMA_HTTP2: '1'/'true' to force HTTP/2, '0'/'false' to disable it
+    """
+    http2_env = os.getenv('KMA_HTTP2', '').strip().lower()
+    http2 = None if not http2_env else http2_env in {'1', 'true', 'yes', 'on'}
+
+    max_connections = os.getenv('KMA_HTTP_MAX_CONNECTIONS')
+    max_keepalive = os.getenv('KMA_HTTP_MAX_KEEPALIVE')
+    keepalive_expiry = os.getenv('KMA_HTTP_KEEPALIVE_EXPIRY')
+    timeout = os.getenv('KMA_HTTP_TIMEOUT')
+
+    configure(
+        max_connections=int(max_connections) if max_connections else None,
+        max_keepalive_connections=int(max_keepalive) if max_keepalive else None,
+        keepalive_expiry=float(keepalive_expiry) if keepalive_expiry else None,
+        timeout=float(timeout) if timeout else None,
+        http2=http2,
+    )
+
+
+def _use_http2() -> bool:
+    if _http2 is None:
+        return http2_available()
+    if _http2 and not http2_available():
+        logger.warning('HTTP/2 requested but the h2 package is not installed')
+        return False
+    return _http2
+
+
+def get_http_client() -> httpx.Client:
+    """Get the process-wide pooled sync HTTP client.
+
+    The client is created on first use and reused until
+    :func:`close_http_clients` is called. It is safe to share between threads.
+
+    Returns:
+        Shared ``httpx.Client`` instance
+    """
+    global _client
+    with _lock:
+        if _client is None or _client.is_closed:
+            transport: httpx.BaseTransport = ResilientTransport(
+                RateLimitedTransport(httpx.HTTPTransport(limits=_limits, http2=_use_http2()))
+            )
+            cache = get_cache()
+            if cache is not None:
+                transport = CachingTransport(transport, cache)
+            _client = httpx.Client(timeout=_timeout, transport=transport)
+        return _client
+
+
+def get_async_http_client() -> httpx.AsyncClient:
+    """Get the pooled async HTTP client for the running event loop.
+
+    Connections in an ``httpx.AsyncClient`` are bound to the event loop that
+    opened them, so each loop gets its own client. Clients of loops that have
+    since been closed are dropped, as their connections can no longer be used.
+
+    Returns:
+        Shared ``httpx.AsyncClient`` instance
+    """
+    loop = asyncio.get_running_loop()
+    with _lock:
+        for stale in [other for other in _async_clients if other.is_closed()]:
+            del _async_clients[stale]
+        client = _async_clients.get(loop)
+        if client is None or client.is_closed:
+            client = _async_clients[loop] = _new_async_client()
+        return client
+
+
+def _new_async_client() -> httpx.AsyncClient:
+    transport: httpx.AsyncBaseTransport = AsyncResilientTransport(
+        AsyncRateLimitedTransport(httpx.AsyncHTTPTransport(limits=_limits, http2=_use_http2()))
+    )
+    cache = get_cache()
+    if cache is not None:
+        transport = AsyncCachingTransport(transport, cache)
+    prefetched = get_prefetch_store()
+    if prefetched is not None:
+        transport = AsyncPrefetchTransport(transport, prefetched)
+    return httpx.AsyncClient(timeout=_timeout, transport=transport)
+
+
+def close_http_clients() -> None:
+    """Close the shared sync HTTP client, if one was created."""
+    global _client
+    with _lock:
+        if _client is not None:
+            _client.close()
+            _client = None
+
+
+async def aclose_http_clients() -> None:
+    """Close the shared async and sync HTTP clients, if they were created.
+
+    The client of the running event loop is closed before returning; clients of
+    other loops that are still open are closed on their own loop.
+    """
+    loop = asyncio.get_running_loop()
+    with _lock:
+        clients = dict(_async_clients)
+        _async_clients.clear()
+    for owner, client in clients.items():
+        if owner is not loop and not owner.is_closed():
+            asyncio.run_coroutine_threadsafe(client.aclose(), owner)
+    if loop in clients:
+        await clients[loop].aclose()
+    close_http_clients()
@@ -0,0 +1,247 @@
+"""Split long period queries into API-legal windows and fetch them in order.
+
+Period endpoints cap the span a single request may cover (for example
+``kma_sfctm2.php`` accepts at most 31 days between ``tm1`` and ``tm2``).
+This module plans an arbitrary span as a sequence of consecutive windows,
+fetches them (concurrently for async clients, with a bounded number of
+requests in flight) and yields the results back in time order. Rows that
+appear in two neighbouring windows are dropped from the later one. Window
+requests are sent at bulk priority, so interactive calls overtake them in
+the rate limiter.
+
+Example:
+    >>> from kma_mcp.core.windowing import fetch_period, merge_chunks
+    >>> from kma_mcp.surface.asos_client import ASOSClient
+    >>> with ASOSClient('your_auth_key') as client:
+    ...     chunks = fetch_period(client.get_hourly_period, '201501010000', '202412312300', stn=108)
+    ...     data = merge_chunks(chunks)
+
+    >>> from kma_mcp.core.windowing import afetch_period
+    >>> from kma_mcp.surface.async_asos_client import AsyncASOSClient
+    >>> async with AsyncASOSClient('your_auth_key') as client:
+    ...     async for chunk in afetch_period(
+    ...         client.get_hourly_period, '201501010000', '202412312300', concurrency=4
+    ...     ):
+    ...         process(chunk)
+"""
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Iterator
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any
+
+from kma_mcp.core.parsing import find_key_columns
+from kma_mcp.core.ratelimit import Priority, request_priority
+
+DEFAULT_CONCURRENCY = 4
+
+
+@dataclass(frozen=True)
+class PeriodSpec:
+    """Limits of a period endpoint.
+
+    Attributes:
+        max_span: Longest span one request may cover, from tm1 to tm2 inclusive
+        step: Resolution of the data; the next window starts one step after the last
+        time_format: strftime format of the tm1/tm2 parameters
+    """
+
+    max_span: timedelta
+    step: timedelta
+    time_format: str
+
+
+MINUTELY = PeriodSpec(timedelta(days=1), timedelta(minutes=1), '%Y%m%d%H%M')
+HOURLY = PeriodSpec(timedelta(days=31), timedelta(hours=1), '%Y%m%d%H%M')
+DAILY = PeriodSpec(timedelta(days=31), timedelta(days=1), '%Y%m%d')
+
+# Spec used when none is given, by client method name
+_METHOD_SPECS = {
+    'get_minutely_data': MINUTELY,
+    'get_hourly_period': HOURLY,
+    'get_element_data': HOURLY,
+    'get_daily_period': DAILY,
+}
+
+
+def _to_datetime(value: str | datetime) -> datetime:
+    if isinstance(value, datetime):
+        return value
+    formats = {8: '%Y%m%d', 10: '%Y%m%d%H', 12: '%Y%m%d%H%M'}
+    if len(value) not in formats:
+        msg = f'Time must be in YYYYMMDD[HH[mm]] format, got: {value}'
+        raise ValueError(msg)
+    return datetime.strptime(value, formats[len(value)])  # noqa: DTZ007
+
+
+def split_period(
+    tm1: str | datetime,
+    tm2: str | datetime,
+    spec: PeriodSpec,
+) -> list[tuple[str, str]]:
+    """Split a time span into consecutive windows no longer than ``spec.max_span``.
+
+    Args:
+        tm1: Start time ('YYYYMMDD[HH[mm]]' string or datetime)
+        tm2: End time ('YYYYMMDD[HH[mm]]' string or datetime), inclusive
+        spec: Limits of the endpoint
+
+    Returns:
+        List of (tm1, tm2) parameter pairs, formatted with ``spec.time_format``
+
+    Example:
+        >>> split_period('20250101', '20250305', DAILY)
+        [('20250101', '20250131'), ('20250201', '20250303'), ('20250304', '20250305')]
+    """
+    start, end = _to_datetime(tm1), _to_datetime(tm2)
+    if start > end:
+        msg = f'Start time {tm1} is after end time {tm2}'
+        raise ValueError(msg)
+
+    windows = []
+    while start <= end:
+        stop = min(start + spec.max_span - spec.step, end)
+        windows.append((start.strftime(spec.time_format), stop.strftime(spec.time_format)))
+        start = stop + spec.step
+    return windows
+
+
+def _resolve_spec(method: Callable[..., Any], spec: PeriodSpec | None) -> PeriodSpec:
+    if spec is not None:
+        return spec
+    name = getattr(method, '__name__', '')
+    if name not in _METHOD_SPECS:
+        msg = f'No period limits known for {name!r}; pass spec explicitly'
+        raise ValueError(msg)
+    return _METHOD_SPECS[name]
+
+
+class _Deduplicator:
+    """Drop rows of a window that were already returned by the previous window."""
+
+    def __init__(self) -> None:
+        self._previous: set[tuple[Any, ...]] = set()
+
+    def __call__(self, chunk: dict[str, Any]) -> dict[str, Any]:
+        station, time = find_key_columns(list(chunk))
+        # Only columnar (text) responses carry rows we can key; JSON passes through
+        if time is None or not all(isinstance(values, list) for values in chunk.values()):
+            return chunk
+
+        key_columns = [chunk[name] for name in (time, station) if name is not None]
+        keys = list(zip(*key_columns, strict=True))
+        keep = [index for index, key in enumerate(keys) if key not in self._previous]
+        self._previous = set(keys)
+        if len(keep) == len(keys):
+            return chunk
+        return {name: [values[index] for index in keep] for name, values in chunk.items()}
+
+
+def fetch_period(
+    method: Callable[..., dict[str, Any]],
+    tm1: str | datetime,
+    tm2: str | datetime,
+    *,
+    spec: PeriodSpec | None = None,
+    **kwargs: Any,  # noqa: ANN401
+) -> Iterator[dict[str, Any]]:
+    """Fetch an arbitrary span window by window with a sync client method.
+
+    Args:
+        method: Bound client method taking tm1 and tm2 (e.g. ``client.get_hourly_period``)
+        tm1: Start time ('YYYYMMDD[HH[mm]]' string or datetime)
+        tm2: End time ('YYYYMMDD[HH[mm]]' string or datetime)
+        spec: Endpoint limits (inferred from the method name when omitted)
+        **kwargs: Extra arguments passed to every call (e.g. ``stn=108``)
+
+    Yields:
+        One response per window, in time order
+    """
+    deduplicate = _Deduplicator()
+    for start, end in split_period(tm1, tm2, _resolve_spec(method, spec)):
+        with request_priority(Priority.BULK):
+            chunk = method(tm1=start, tm2=end, **kwargs)
+        yield deduplicate(chunk)
+
+
+async def afetch_period(
+    method: Callable[..., Awaitable[dict[str, Any]]],
+    tm1: str | datetime,
+    tm2: str | datetime,
+    *,
+    spec: PeriodSpec | None = None,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    **kwargs: Any,  # noqa: ANN401
+) -> AsyncIterator[dict[str, Any]]:
+    """Fetch an arbitrary span with an async client method, several windows at a time.
+
+    At most ``concurrency`` requests are in flight, and at most twice that
+    many windows are buffered ahead of the consumer. Results are yielded in
+    time order regardless of completion order.
+
+    Args:
+        method: Bound async client method taking tm1 and tm2
+        tm1: Start time ('YYYYMMDD[HH[mm]]' string or datetime)
+        tm2: End time ('YYYYMMDD[HH[mm]]' string or datetime)
+        spec: Endpoint limits (inferred from the method name when omitted)
+        concurrency: Maximum number of concurrent requests
+        **kwargs: Extra arguments passed to every call (e.g. ``stn=108``)
+
+    Yields:
+        One response per window, in time order
+    """
+    if concurrency < 1:
+        msg = f'concurrency must be at least 1, got: {concurrency}'
+        raise ValueError(msg)
+
+    windows = iter(split_period(tm1, tm2, _resolve_spec(method, spec)))
+    semaphore = asyncio.Semaphore(concurrency)
+    pending: deque[asyncio.Task[dict[str, Any]]] = deque()
+    deduplicate = _Deduplicator()
+
+    async def fetch(start: str, end: str) -> dict[str, Any]:
+        async with semaphore:
+            with request_priority(Priority.BULK):
+                return await method(tm1=start, tm2=end, **kwargs)
+
+    def schedule() -> None:
+        while len(pending) < concurrency * 2:
+            window = next(windows, None)
+            if window is None:
+                return
+            pending.append(asyncio.create_task(fetch(*window)))
+
+    try:
+        schedule()
+        while pending:
+            result = await pending.popleft()
+            schedule()
+            yield deduplicate(result)
+    finally:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+def merge_chunks(chunks: Iterable[dict[str, Any]]) -> dict[str, list[Any]]:
+    """Concatenate columnar window results into one columnar result.
+
+    Args:
+        chunks: Columnar responses, as yielded by :func:`fetch_period`
+
+    Returns:
+        Mapping of column name to the values of all windows, in order
+    """
+    merged: dict[str, list[Any]] = {}
+    rows = 0
+    for chunk in chunks:
+        size = len(next(iter(chunk.values()), []))
+        for name, values in chunk.items():
+            # Columns missing from earlier windows are padded with None
+            merged.setdefault(name, [None] * rows).extend(values)
+        rows += size
+        for values in merged.values():
+            values.extend([None] * (rows - len(values)))
+    return merged
@@ -0,0 +1,13 @@
+# Generated by scripts/generate_async_stubs.py from the sync client; do not edit.
+from datetime import datetime
+from typing import Any
+
+from kma_mcp.core.client import AsyncKMAClient
+
+class AsyncEarthquakeClient(AsyncKMAClient):
+    async def get_recent_earthquake(
+        self, tm: str | datetime | None = None, disp: int = 0
+    ) -> dict[str, Any]: ...
+    async def get_earthquake_list(
+        self, tm1: str | datetime, tm2: str | datetime, disp: int = 0
+    ) -> dict[str, Any]: ...
@@ -7,10 +7,10 @@ epicenter location, depth, and seismic intensity data.
 from datetime import UTC, datetime
 from typing import Any
 
-import httpx
+from kma_mcp.core.client import KMAClient
 
 
-class EarthquakeClient:
+class EarthquakeClient(KMAClient):
     """Client for accessing KMA Earthquake monitoring data.
 
     Provides access to:
@@ -20,46 +20,6 @@ class EarthquakeClient:
     - Domestic and foreign earthquake data
     """
 
-    BASE_URL = 'https://apihub.kma.go.kr/api/typ01/url'
-
-    def __init__(self, auth_key: str, timeout: float = 30.0):
-        """Initialize the Earthquake client.
-
-        Args:
-            auth_key: KMA API authentication key
-            timeout: Request timeout in seconds (default: 30.0)
-        """
-        self.auth_key = auth_key
-        self._client = httpx.Client(timeout=timeout)
-
-    def __enter__(self) -> 'EarthquakeClient':
-        """Context manager entry."""
-        return self
-
-    def __exit__(self, *args: object) -> None:
-        """Context manager exit."""
-        self.close()
-
-    def close(self) -> None:
-        """Close the HTTP client."""
-        self._client.close()
-
-    def _make_request(self, endpoint: str, params: dict[str, Any]) -> dict[str, Any]:
-        """Make an API request.
-
-        Args:
-            endpoint: API endpoint name
-            params: Query parameters
-
-        Returns:
-            JSON response as dictionary
-        """
-        params['authKey'] = self.auth_key
-        url = f'{self.BASE_URL}/{endpoint}'
-        response = self._client.get(url, params=params)
-        response.raise_for_status()
-        return response.json()
-
     def get_recent_earthquake(
         self, tm: str | datetime | None = None, disp: int = 0
     ) -> dict[str, Any]:
@@ -0,0 +1,389 @@
+# Generated by scripts/generate_async_stubs.py from the sync client; do not edit.
+from datetime import datetime
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+from kma_mcp.core.client import AsyncKMAClient
+from kma_mcp.forecast.grid import GridStore
+
+class AsyncForecastClient(AsyncKMAClient):
+    async def get_short_term_region(
+        self,
+        stn: str | None = None,
+        reg: str | None = None,
+        tmfc: str | datetime | None = None,
+        tmfc1: str | datetime | None = None,
+        tmfc2: str | datetime | None = None,
+        tmef1: str | datetime | None = None,
+        tmef2: str | datetime | None = None,
+        disp: int = 0,
+    ) -> dict[str, Any]: ...
+    async def get_short_term_overview(
+        self,
+        stn: str | None = None,
+        reg: str | None = None,
+        tmfc: str | datetime | None = None,
+        tmfc1: str | datetime | None = None,
+        tmfc2: str | datetime | None = None,
+        tmef1: str | datetime | None = None,
+        tmef2: str | datetime | None = None,
+        disp: int = 0,
+    ) -> dict[str, Any]: ...
+    async def get_short_term_land(
+        self,
+        stn: str | None = None,
+        reg: str | None = None,
+        tmfc: str | datetime | None = None,
+        tmfc1: str | datetime | None = None,
+        tmfc2: str | datetime | None = None,
+        tmef1: str | datetime | None = None,
+        tmef2: str | datetime | None = None,
+        disp: int = 0,
+    ) -> dict[str, Any]: ...
+    async def get_short_term_land_v2(
+        self,
+        stn: str | None = None,
+        reg: str | None = None,
+        tmfc: str | datetime | None = None,
+        tmfc1: str | datetime | None = None,
+        tmfc2: str | datetime | None = None,
+        tmef1: str | datetime | None = None,
+        tmef2: str | datetime | None = None,
+        disp: int = 0,
+    ) -> dict[str, Any]: ...
+    async def get_short_term_sea(
+        self,
+        stn: str | None = None,
+        reg: str | None = None,
+        tmfc: str | datetime | None = None,
+        tmfc1: str | datetime | None = None,
+        tmfc2: str | datetime | None = None,
+        tmef1: str | datetime | None = None,
+        tmef2: str | datetime | None = None,
+        disp: int = 0,
+    ) -> dict[str, Any]: ...
+    async def get_village_short_term_grid(
+        self,
+        tmfc: str | datetime | None = None,
+        tmef: str | datetime | None = None,
+        vars: str | None = None,
+    ) -> dict[str, Any]: ...
+    async def get_village_very_short_term_grid(
+        self,
+        tmfc: str | datetime | None = None,
+        tmef: str | datetime | None = None,
+        vars: str | None = None,
+    ) -> dict[str, Any]: ...
+    async def get_village_observation_grid(
+        self, tmfc: str | datetime | None = None, vars: str | None = None
+    ) -> dict[str, Any]: ...
+    async def get_village_grid_array(
+        self,
+        product: str,
+        var: str,
+        tmfc: str | datetime,
+        tmef: str | datetime | None = None,
+        *,
+        store: GridStore | None = None,
+    ) -> npt.NDArray[np.float32]: ...
+    async def convert_grid_to_coords(
+        self, x: int, y: int, *, help: int = 1, local: bool = True
+    ) -> dict[str, Any]: ...
+    async def convert_coords_to_grid(
+        self, lon: float, lat: float, *, help: int = 1, local: bool = True
+    ) -> dict[str, Any]: ...
+    async def get_weather_situation(
+        self,
+        page_no: int = 1,
+        num_of_rows: int = 10,
+        data_type: str = 'JSON',
+        stn_id: str | None = None,
+    ) -> dict[str, Any]: ...
+    async def get_land_forecast_message(
+        self,
+        page_no: int = 1,
+        num_of_rows: int = 10,
+        data_type: str = 'JSON',
+        reg_id: str | None = None,
+    ) -> dict[str, Any]: ...
+    async def get_sea_forecast_message(
+        self,
+        page_no: int = 1,
+        num_of_rows: int = 10,
+        data_type: str = 'JSON',
+        reg_id: str | None = None,
+    ) -> dict[str, Any]: ...
+    async def get_ultra_short_term_observation(
+        self,
+        base_date: str,
+        base_time: str,
+        nx: int,
+        ny: int,
+        page_no: int = 1,
+        num_of_rows: int = 1000,
+        data_type: str = 'JSON',
+    ) -> dict[str, Any]: ...
+    async def get_ultra_short_term_forecast(
+        self,
+        base_date: str,
+        base_time: str,
+        nx: int,
+        ny: int,
+        page_no: int = 1,
+        num_of_rows: int = 1000,
+        data_type: str = 'JSON',
+    ) -> dict[str, Any]: ...
+    async def get_village_forecast(
+        self,
+        base_date: str,
+        base_time: str,
+        nx: int,
+        ny: int,
+        page_no: int = 1,
+        num_of_rows: int = 1000,
+        data_type: str = 'JSON',
+    ) -> dict[str, Any]: ...
+    async def get_forecast_version(
+        self,
+        ftype: str,
+        basedatetime: str,
+        page_no: int = 1,
+        num_of_rows: int = 1000,
+        data_type: str = 'JSON',
+    ) -> dict[str, Any]: ...
+    async def get_short_term_distribution_map(
+        self,
+        data0: str,
+        data1: str,
+        tm_fc: str | datetime,
+        tm_ef: str | datetime,
+        dtm: str = 'H0',
+        map: str = 'G1',
+        mask: str = 'M',
+        color: str = 'E',
+        size: int = 600,
+        effect: str = 'NTL',
+        overlay: str = 'S',
+        zoom_rate: int = 2,
+        zoom_level: int = 0,
+        zoom_x: str = '0000000',
+        zoom_y: str = '0000000',
+        auto_man: str = 'm',
+        mode: str = 'I',
+        interval: int = 1,
+        rand: int = 1412,
+    ) -> dict[str, Any]: ...
+    async def get_very_short_term_distribution_map(
+        self,
+        data0: str,
+        data1: str,
+        tm_fc: str | datetime,
+        tm_ef: str | datetime,
+        dtm: str = 'H0',
+        map: str = 'G1',
+        mask: str = 'M',
+        color: str = 'E',
+        size: int = 600,
+        effect: str = 'NTL',
+        overlay: str = 'S',
+        zoom_rate: int = 2,
+        zoom_level: int = 0,
+        zoom_x: str = '0000000',
+        zoom_y: str = '0000000',
+        auto_man: str = 'm',
+        mode: str = 'I',
+        interval: int = 1,
+        rand: int = 1412,
+    ) -> dict[str, Any]: ...
+    async def get_grid_latlon_data(
+        self, fct: str, latlon: str, disp: str = 'A'
+    ) -> dict[str, Any]: ...
+    async def get_grid_latlon_array(self, fct: str, latlon: str) -> npt.NDArray[np.float32]: ...
+    async def download_grid_latlon_netcdf(self, fct: str) -> dict[str, Any]: ...
+    async def get_medium_term_region(
+        self,
+        stn: str | None = None,
+        reg: str | None = None,
+        tmfc: str | datetime | None = None,
+        tmfc1: str | datetime | None = None,
+        tmfc2: str | datetime | None = None,
+        tmef1: str | datetime | None = None,
+        tmef2: str | datetime | None = None,
+        mode: int = 0,
+        disp: int = 0,
+    ) -> dict[str, Any]: ...
+    async def get_medium_term_overview(
+        self,
+        stn: str | None = None,
+        reg: str | None = None,
+        tmfc: str | datetime | None = None,
+        tmfc1: str | datetime | None = None,
+        tmfc2: str | datetime | None = None,
+        tmef1: str | datetime | None = None,
+        tmef2: str | datetime | None = None,
+        mode: int = 0,
+        disp: int = 0,
+    ) -> dict[str, Any]: ...
+    async def get_medium_term_land(
+        self,
+        stn: str | None = None,
+        reg: str | None = None,
+        tmfc: str | datetime | None = None,
+        tmfc1: str | datetime | None = None,
+        tmfc2: str | datetime | None = None,
+        tmef1: str | datetime | None = None,
+        tmef2: str | datetime | None = None,
+        disp: int = 0,
+    ) -> dict[str, Any]: ...
+    async def get_medium_term_temperature(
+        self,
+        stn: str | None = None,
+        reg: str | None = None,
+        tmfc: str | datetime | None = None,
+        tmfc1: str | datetime | None = None,
+        tmfc2: str | datetime | None = None,
+        tmef1: str | datetime | None = None,
+        tmef2: str | datetime | None = None,
+        disp: int = 0,
+    ) -> dict[str, Any]: ...
+    async def get_medium_term_sea(
+        self,
+        stn: str | None = None,
+        reg: str | None = None,
+        tmfc: str | datetime | None = None,
+        tmfc1: str | datetime | None = None,
+        tmfc2: str | datetime | None = None,
+        tmef1: str | datetime | None = None,
+        tmef2: str | datetime | None = None,
+        disp: int = 0,
+    ) -> dict[str, Any]: ...
+    async def get_medium_term_sea_forecast(
+        self,
+        reg_id: str,
+        tm_fc: str,
+        page_no: int = 1,
+        num_of_rows: int = 10,
+        data_type: str = 'JSON',
+    ) -> dict[str, Any]: ...
+    async def get_medium_term_temperature_forecast(
+        self,
+        reg_id: str,
+        tm_fc: str,
+        page_no: int = 1,
+        num_of_rows: int = 10,
+        data_type: str = 'JSON',
+    ) -> dict[str, Any]: ...
+    async def get_medium_term_land_forecast(
+        self,
+        reg_id: str,
+        tm_fc: str,
+        page_no: int = 1,
+        num_of_rows: int = 10,
+        data_type: str = 'JSON',
+    ) -> dict[str, Any]: ...
+    async def get_medium_term_outlook(
+        self,
+        stn_id: str,
+        tm_fc: str,
+        page_no: int = 1,
+        num_of_rows: int = 10,
+        data_type: str = 'JSON',
+    ) -> dict[str, Any]: ...
+    async def get_warning_region(
+        self,
+        wrn: str | None = None,
+        reg: str | None = None,
+        tmfc1: str | None = None,
+        tmfc2: str | None = None,
+        subcd: str | None = None,
+        disp: int = 0,
+    ) -> dict[str, Any]: ...
+    async def get_warning_data(
+        self,
+        wrn: str | None = None,
+        reg: str | None = None,
+        tmfc1: str | None = None,
+        tmfc2: str | None = None,
+        subcd: str | None = None,
+        disp: int = 0,
+    ) -> dict[str, Any]: ...
+    async def get_weather_information(
+        self,
+        wrn: str | None = None,
+        reg: str | None = None,
+        tmfc1: str | None = None,
+        tmfc2: str | None = None,
+        stn: str = '0',
+        subcd: str | None = None,
+        disp: int = 0,
+    ) -> dict[str, Any]: ...
+    async def get_weather_commentary(
+        self,
+        tmfc1: str | None = None,
+        tmfc2: str | None = None,
+        stn: str = '0',
+        subcd: str = '0',
+        disp: int = 0,
+    ) -> dict[str, Any]: ...
+    async def get_current_warning_status(
+        self, fe: str = 'f', tm: str | None = None, disp: int = 0
+    ) -> dict[str, Any]: ...
+    async def get_current_warning_status_new(
+        self, fe: str = 'f', tm: str | None = None, disp: int = 0
+    ) -> dict[str, Any]: ...
+    async def get_warning_image(
+        self,
+        tm: str,
+        lat: float,
+        lon: float,
+        range: int,
+        size: int,
+        wrn: str,
+        tmef: int = 1,
+        city: int = 1,
+        name: int = 0,
+        stn: str | None = None,
+        out: int = 0,
+    ) -> dict[str, Any]: ...
+    async def get_impact_forecast_status(
+        self,
+        tmfc1: str | None = None,
+        tmfc2: str | None = None,
+        tmef1: str | None = None,
+        tmef2: str | None = None,
+        ifpar: str | None = None,
+        ifarea: str = '0',
+        regid: str | None = None,
+    ) -> dict[str, Any]: ...
+    async def get_impact_risk_level_zone_count(
+        self,
+        tmfc1: str | None = None,
+        tmfc2: str | None = None,
+        tmef1: str | None = None,
+        tmef2: str | None = None,
+        ifarea: str = '0',
+        stn: str | None = None,
+        ilvl: int | None = None,
+    ) -> dict[str, Any]: ...
+    async def get_impact_risk_level_distribution_map(
+        self, tmfc: str, stn: str | None = None, ifpar: str | None = None, ifarea: int | None = None
+    ) -> dict[str, Any]: ...
+    async def get_forecast_zone_code(
+        self,
+        page_no: int = 1,
+        num_of_rows: int = 10,
+        data_type: str = 'JSON',
+        reg_id: str | None = None,
+    ) -> dict[str, Any]: ...
+    async def get_warning_zone_code(
+        self,
+        page_no: int = 1,
+        num_of_rows: int = 10,
+        data_type: str = 'JSON',
+        kor_name: str | None = None,
+    ) -> dict[str, Any]: ...
+    async def get_aws_warning_zone_code(
+        self, tm: str | None = None, disp: int = 1
+    ) -> dict[str, Any]: ...
@@ -0,0 +1,11 @@
+# Generated by scripts/generate_async_stubs.py from the sync client; do not edit.
+from typing import Any
+
+from kma_mcp.core.client import AsyncKMAClient
+
+class AsyncWarningClient(AsyncKMAClient):
+    async def get_current_warnings(self, stn: int | str = 0) -> dict[str, Any]: ...
+    async def get_warning_history(
+        self, start_date: str, end_date: str, stn: int | str = 0
+    ) -> dict[str, Any]: ...
+    async def get_special_weather_report(self, tm: str, stn: int | str = 0) -> dict[str, Any]: ...
@@ -11,9 +11,23 @@ from datetime import datetime
 from typing import Any
 
 import httpx
+import numpy as np
+import numpy.typing as npt
 
+from kma_mcp.core.client import KMAClient
+from kma_mcp.forecast.grid import GRID_ENDPOINTS, GridKey, GridStore, decode_grid
+from kma_mcp.forecast.projection import grid_to_latlon, latlon_to_grid
 
-class ForecastClient:
+TYP03_DFS_URL = 'https://apihub.kma.go.kr/api/typ03/cgi/dfs'
+TYP03_WRN_URL = 'https://apihub.kma.go.kr/api/typ03/cgi/wrn'
+
+
+def _grid_from_response(response: httpx.Response) -> npt.NDArray[np.float32]:
+    """Decode a grid response body."""
+    return decode_grid(response.content)
+
+
+class ForecastClient(KMAClient):
     """Client for KMA Weather Forecast API.
 
     The Weather Forecast system provides predicted meteorological
@@ -24,67 +38,6 @@ class ForecastClient:
     official KMA API Hub documentation.
     """
 
-    BASE_URL = 'https://apihub.kma.go.kr/api/typ01/url'
-    CGI_BASE_URL = 'https://apihub.kma.go.kr/api/typ01/cgi-bin/url'
-    OPENAPI_BASE_URL = 'https://apihub.kma.go.kr/api/typ02/openApi'
-
-    def __init__(self, auth_key: str, timeout: float = 30.0) -> None:
-        """Initialize Weather Forecast client.
-
-        Args:
-            auth_key: KMA API authentication key
-            timeout: Request timeout in seconds (default: 30.0)
-        """
-        self.auth_key = auth_key
-        self.timeout = timeout
-        self._client = httpx.Client(timeout=timeout)
-
-    def __enter__(self) -> 'ForecastClient':
-        """Context manager entry."""
-        return self
-
-    def __exit__(self, *args: object) -> None:
-        """Context manager exit."""
-        self.close()
-
-    def close(self) -> None:
-        """Close the HTTP client."""
-        self._client.close()
-
-    def _make_request(
-        self,
-        endpoint: str,
-        params: dict[str, Any],
-        *,
-        use_cgi: bool = False,
-        use_openapi: bool = False,
-    ) -> dict[str, Any]:
-        """Make HTTP request to Weather Forecast API.
-
-        Args:
-            endpoint: API endpoint path (for OpenAPI, use format: 'ServiceName/methodName')
-            params: Query parameters
-            use_cgi: Whether to use CGI base URL (default: False)
-            use_openapi: Whether to use OpenAPI base URL (default: False)
-
-        Returns:
-            API response as dictionary
-
-        Raises:
-            httpx.HTTPError: If request fails
-        """
-        params['authKey'] = self.auth_key
-        if use_openapi:
-            base_url = self.OPENAPI_BASE_URL
-        elif use_cgi:
-            base_url = self.CGI_BASE_URL
-        else:
-            base_url = self.BASE_URL
-        url = f'{base_url}/{endpoint}'
-        response = self._client.get(url, params=params)
-        response.raise_for_status()
-        return response.json()
-
     # ==================== Short-term Forecast (단기예보) ====================
 
     def get_short_term_region(
@@ -488,7 +441,7 @@ class ForecastClient:
         if vars is not None:
             params['vars'] = vars
 
-        return self._make_request('nph-dfs_shrt_grd', params, use_cgi=True)
+        return self._make_request('nph-dfs_shrt_grd', params, base_url=self.CGI_BASE_URL)
 
     def get_village_very_short_term_grid(
         self,
@@ -535,7 +488,7 @@ class ForecastClient:
         if vars is not None:
             params['vars'] = vars
 
-        return self._make_request('nph-dfs_vsrt_grd', params, use_cgi=True)
+        return self._make_request('nph-dfs_vsrt_grd', params, base_url=self.CGI_BASE_URL)
 
     def get_village_observation_grid(
         self,
@@ -578,7 +531,66 @@ class ForecastClient:
         if vars is not None:
             params['vars'] = vars
 
-        return self._make_request('nph-dfs_odam_grd', params, use_cgi=True)
+        return self._make_request('nph-dfs_odam_grd', params, base_url=self.CGI_BASE_URL)
+
+    def get_village_grid_array(
+        self,
+        product: str,
+        var: str,
+        tmfc: str | datetime,
+        tmef: str | datetime | None = None,
+        *,
+        store: GridStore | None = None,
+    ) -> npt.NDArray[np.float32]:
+        """Get one village forecast grid variable as a 2-D array.
+
+        Requests a single variable from ``nph-dfs_shrt_grd``, ``nph-dfs_vsrt_grd``
+        or ``nph-dfs_odam_grd`` and decodes the ASCII or binary body. With a
+        store, grids already stored are opened memory-mapped without a request,
+        and new grids are stored after download.
+
+        Args:
+            product: 'shrt' (short-term), 'vsrt' (very short-term) or 'odam' (observation)
+            var: Variable name (e.g., 'TMP' for shrt, 'T1H' for vsrt/odam)
+            tmfc: Issue time in 'YYYYMMDDHHmm' format or datetime object
+            tmef: Valid time in 'YYYYMMDDHHmm' format or datetime object (not used for odam)
+            store: Grid store used as a memory-mapped cache
+
+        Returns:
+            Array of shape (253, 149) where ``grid[y - 1, x - 1]`` is grid point (x, y);
+            missing values are NaN
+
+        Raises:
+            ValueError: If the product is unknown or the response is not a full grid
+
+        Example:
+            >>> client = ForecastClient(auth_key='your_key')
+            >>> grid = client.get_village_grid_array(
+            ...     'shrt', 'TMP', tmfc='202402250500', tmef='202402250600'
+            ... )
+            >>> grid[127 - 1, 60 - 1]
+
+        Reference: API_ENDPOINT_Forecast.md - Category 2: Village Forecast Grid Data
+        """
+        endpoint = GRID_ENDPOINTS.get(product)
+        if endpoint is None:
+            msg = f'Unknown grid product: {product!r} (expected one of {sorted(GRID_ENDPOINTS)})'
+            raise ValueError(msg)
+        tmfc = tmfc if isinstance(tmfc, str) else self._format_datetime(tmfc)
+        if tmef is not None:
+            tmef = tmef if isinstance(tmef, str) else self._format_datetime(tmef)
+        key = GridKey(product, var, tmfc, tmef or '')
+        if store is not None and (stored := store.get(key)) is not None:
+            return self._result(stored)
+
+        def parse(response: httpx.Response) -> npt.NDArray[np.float32]:
+            grid = _grid_from_response(response)
+            return grid if store is None else store.put(key, grid)
+
+        params: dict[str, Any] = {'tmfc': tmfc, 'vars': var}
+        if tmef is not None:
+            params['tmef'] = tmef
+        return self._make_parsed_request(endpoint, params, parse, base_url=self.CGI_BASE_URL)
 
     def convert_grid_to_coords(
         self,
@@ -586,18 +598,21 @@ class ForecastClient:
         y: int,
         *,
         help: int = 1,  # noqa: A002
+        local: bool = True,
     ) -> dict[str, Any]:
         """Convert village forecast grid numbers to latitude/longitude coordinates.
 
         Documented endpoint: nph-dfs_xy_lonlat (CGI)
 
         Converts village forecast grid coordinates (x, y) to geographic coordinates
-        (latitude, longitude).
+        (latitude, longitude). The Lambert Conformal Conic projection is computed
+        locally by default, without a request to the CGI endpoint.
 
         Args:
             x: Grid number (east-west direction). Range: 1 ~ 149
             y: Grid number (north-south direction). Range: 1 ~ 253
             help: Show help information. 0=no help, 1=show help (default: 1)
+            local: Compute the projection locally instead of calling the endpoint
 
         Returns:
             Latitude and longitude coordinates for the grid point
@@ -608,8 +623,13 @@ class ForecastClient:
 
         Reference: API_ENDPOINT_Forecast.md - Category 2: Village Forecast Grid Data
         """
+        if local:
+            lat, lon = grid_to_latlon(x, y)
+            return self._result(
+                {'LON': [round(lon, 6)], 'LAT': [round(lat, 6)], 'X': [x], 'Y': [y]}
+            )
         params = {'x': str(x), 'y': str(y), 'help': str(help)}
-        return self._make_request('nph-dfs_xy_lonlat', params, use_cgi=True)
+        return self._make_request('nph-dfs_xy_lonlat', params, base_url=self.CGI_BASE_URL)
 
     def convert_coords_to_grid(
         self,
@@ -617,18 +637,21 @@ class ForecastClient:
         lat: float,
         *,
         help: int = 1,  # noqa: A002
+        local: bool = True,
     ) -> dict[str, Any]:
         """Convert latitude/longitude coordinates to village forecast grid numbers.
 
         Documented endpoint: nph-dfs_xy_lonlat (CGI)
 
         Converts geographic coordinates (latitude, longitude) to the nearest
-        village forecast grid coordinates (x, y).
+        village forecast grid coordinates (x, y). The Lambert Conformal Conic
+        projection is computed locally by default, without a request to the CGI endpoint.
 
         Args:
             lon: Longitude. Range: 123.310165 ~ 132.774963
             lat: Latitude. Range: 31.651814 ~ 43.393490
             help: Show help information. 0=no help, 1=show help (default: 1)
+            local: Compute the projection locally instead of calling the endpoint
 
         Returns:
             Nearest village forecast grid numbers (x, y)
@@ -639,8 +662,11 @@ class ForecastClient:
 
         Reference: API_ENDPOINT_Forecast.md - Category 2: Village Forecast Grid Data
         """
+        if local:
+            x, y = latlon_to_grid(lat, lon)
+            return self._result({'LON': [lon], 'LAT': [lat], 'X': [x], 'Y': [y]})
         params = {'lon': str(lon), 'lat': str(lat), 'help': str(help)}
-        return self._make_request('nph-dfs_xy_lonlat', params, use_cgi=True)
+        return self._make_request('nph-dfs_xy_lonlat', params, base_url=self.CGI_BASE_URL)
 
     # ============================================================================
     # Category 3: Village Forecast Messages (동네예보 통보문)
@@ -684,7 +710,9 @@ class ForecastClient:
         if stn_id is not None:
             params['stnId'] = stn_id
 
-        return self._make_request('VilageFcstMsgService/getWthrSituation', params, use_openapi=True)
+        return self._make_request(
+            'VilageFcstMsgService/getWthrSituation', params, base_url=self.OPENAPI_BASE_URL
+        )
 
     def get_land_forecast_message(
         self,
@@ -725,7 +753,9 @@ class ForecastClient:
         if reg_id is not None:
             params['regId'] = reg_id
 
-        return self._make_request('VilageFcstMsgService/getLandFcst', params, use_openapi=True)
+        return self._make_request(
+            'VilageFcstMsgService/getLandFcst', params, base_url=self.OPENAPI_BASE_URL
+        )
 
     def get_sea_forecast_message(
         self,
@@ -766,7 +796,9 @@ class ForecastClient:
         if reg_id is not None:
             params['regId'] = reg_id
 
-        return self._make_request('VilageFcstMsgService/getSeaFcst', params, use_openapi=True)
+        return self._make_request(
+            'VilageFcstMsgService/getSeaFcst', params, base_url=self.OPENAPI_BASE_URL
+        )
 
     # ============================================================================
     # Category 4: Village Forecast API (동네예보 API)
@@ -822,7 +854,7 @@ class ForecastClient:
             'ny': str(ny),
         }
         return self._make_request(
-            'VilageFcstInfoService_2.0/getUltraSrtNcst', params, use_openapi=True
+            'VilageFcstInfoService_2.0/getUltraSrtNcst', params, base_url=self.OPENAPI_BASE_URL
         )
 
     def get_ultra_short_term_forecast(
@@ -875,7 +907,7 @@ class ForecastClient:
             'ny': str(ny),
         }
         return self._make_request(
-            'VilageFcstInfoService_2.0/getUltraSrtFcst', params, use_openapi=True
+            'VilageFcstInfoService_2.0/getUltraSrtFcst', params, base_url=self.OPENAPI_BASE_URL
         )
 
     def get_village_forecast(
@@ -929,7 +961,7 @@ class ForecastClient:
             'ny': str(ny),
         }
         return self._make_request(
-            'VilageFcstInfoService_2.0/getVilageFcst', params, use_openapi=True
+            'VilageFcstInfoService_2.0/getVilageFcst', params, base_url=self.OPENAPI_BASE_URL
         )
 
     def get_forecast_version(
@@ -975,7 +1007,7 @@ class ForecastClient:
             'basedatetime': basedatetime,
         }
         return self._make_request(
-            'VilageFcstInfoService_2.0/getFcstVersion', params, use_openapi=True
+            'VilageFcstInfoService_2.0/getFcstVersion', params, base_url=self.OPENAPI_BASE_URL
         )
 
     # ============================================================================
@@ -1068,13 +1100,7 @@ class ForecastClient:
             'interval': str(interval),
             'rand': str(rand),
         }
-        # This uses typ03 API base URL
-        base_url = 'https://apihub.kma.go.kr/api/typ03/cgi/dfs'
-        url = f'{base_url}/nph-dfs_shrt_ana_5d_test'
-        params['authKey'] = self.auth_key
-        response = self._client.get(url, params=params)
-        response.raise_for_status()
-        return response.json()
+        return self._make_request('nph-dfs_shrt_ana_5d_test', params, base_url=TYP03_DFS_URL)
 
     def get_very_short_term_distribution_map(
         self,
@@ -1161,13 +1187,7 @@ class ForecastClient:
             'interval': str(interval),
             'rand': str(rand),
         }
-        # This uses typ03 API base URL
-        base_url = 'https://apihub.kma.go.kr/api/typ03/cgi/dfs'
-        url = f'{base_url}/nph-dfs_shrt_ana_5d_test'
-        params['authKey'] = self.auth_key
-        response = self._client.get(url, params=params)
-        response.raise_for_status()
-        return response.json()
+        return self._make_request('nph-dfs_shrt_ana_5d_test', params, base_url=TYP03_DFS_URL)
 
     # ============================================================================
     # Category 6: Grid Coordinate Data (동네예보 격자데이터 위경도)
@@ -1206,7 +1226,32 @@ class ForecastClient:
         Reference: API_ENDPOINT_Forecast.md line 339-351
         """
         params = {'fct': fct, 'latlon': latlon, 'disp': disp}
-        return self._make_request('nph-dfs_latlon_api', params, use_cgi=True)
+        return self._make_request('nph-dfs_latlon_api', params, base_url=self.CGI_BASE_URL)
+
+    def get_grid_latlon_array(self, fct: str, latlon: str) -> npt.NDArray[np.float32]:
+        """Get village forecast grid latitudes or longitudes as a 2-D array.
+
+        Documented endpoint: nph-dfs_latlon_api (CGI)
+
+        Requests the binary variant (disp='B') and decodes it.
+
+        Args:
+            fct: Forecast type - 'SHRT' (short-term), 'VSRT' (very short-term/observation)
+            latlon: Coordinate type - 'lon' (longitude) or 'lat' (latitude)
+
+        Returns:
+            Array of shape (253, 149) where ``grid[y - 1, x - 1]`` is grid point (x, y)
+
+        Example:
+            >>> client = ForecastClient(auth_key='your_key')
+            >>> lons = client.get_grid_latlon_array(fct='SHRT', latlon='lon')
+
+        Reference: API_ENDPOINT_Forecast.md line 339-351
+        """
+        params = {'fct': fct, 'latlon': latlon, 'disp': 'B'}
+        return self._make_parsed_request(
+            'nph-dfs_latlon_api', params, _grid_from_response, base_url=self.CGI_BASE_URL
+        )
 
     def download_grid_latlon_netcdf(
         self,
@@ -1232,7 +1277,7 @@ class ForecastClient:
         Reference: API_ENDPOINT_Forecast.md line 353-362
         """
         params = {'fct': fct}
-        return self._make_request('nph-dfs_latlon_api', params, use_cgi=True)
+        return self._make_request('nph-dfs_latlon_api', params, base_url=self.CGI_BASE_URL)
 
     # ============================================================================
     # Category 7: Medium-term Forecast (중기예보)
@@ -1658,7 +1703,9 @@ class ForecastClient:
             'regId': reg_id,
             'tmFc': tm_fc,
         }
-        return self._make_request('MidFcstInfoService/getMidSeaFcst', params, use_openapi=True)
+        return self._make_request(
+            'MidFcstInfoService/getMidSeaFcst', params, base_url=self.OPENAPI_BASE_URL
+        )
 
     def get_medium_term_temperature_forecast(
         self,
@@ -1702,7 +1749,9 @@ class ForecastClient:
             'regId': reg_id,
             'tmFc': tm_fc,
         }
-        return self._make_request('MidFcstInfoService/getMidTa', params, use_openapi=True)
+        return self._make_request(
+            'MidFcstInfoService/getMidTa', params, base_url=self.OPENAPI_BASE_URL
+        )
 
     def get_medium_term_land_forecast(
         self,
@@ -1747,7 +1796,9 @@ class ForecastClient:
             'regId': reg_id,
             'tmFc': tm_fc,
         }
-        return self._make_request('MidFcstInfoService/getMidLandFcst', params, use_openapi=True)
+        return self._make_request(
+            'MidFcstInfoService/getMidLandFcst', params, base_url=self.OPENAPI_BASE_URL
+        )
 
     def get_medium_term_outlook(
         self,
@@ -1791,7 +1842,9 @@ class ForecastClient:
             'stnId': stn_id,
             'tmFc': tm_fc,
         }
-        return self._make_request('MidFcstInfoService/getMidFcst', params, use_openapi=True)
+        return self._make_request(
+            'MidFcstInfoService/getMidFcst', params, base_url=self.OPENAPI_BASE_URL
+        )
 
     # ============================================================================
     # Category 8: Weather Warnings (기상특보)
@@ -2123,13 +2176,7 @@ class ForecastClient:
         if stn is not None:
             params['stn'] = stn
 
-        # This uses typ03 API base URL
-        base_url = 'https://apihub.kma.go.kr/api/typ03/cgi/wrn'
-        url = f'{base_url}/nph-wrn7'
-        params['authKey'] = self.auth_key
-        response = self._client.get(url, params=params)
-        response.raise_for_status()
-        return response.json()
+        return self._make_request('nph-wrn7', params, base_url=TYP03_WRN_URL)
 
     # ============================================================================
     # Category 9: Impact Forecast (영향예보)
@@ -2328,7 +2375,9 @@ class ForecastClient:
         if reg_id is not None:
             params['regId'] = reg_id
 
-        return self._make_request('FcstZoneInfoService/getFcstZoneCd', params, use_openapi=True)
+        return self._make_request(
+            'FcstZoneInfoService/getFcstZoneCd', params, base_url=self.OPENAPI_BASE_URL
+        )
 
     def get_warning_zone_code(
         self,
@@ -2367,7 +2416,9 @@ class ForecastClient:
         if kor_name is not None:
             params['korName'] = kor_name
 
-        return self._make_request('WethrBasicInfoService/getWrnZoneCd', params, use_openapi=True)
+        return self._make_request(
+            'WethrBasicInfoService/getWrnZoneCd', params, base_url=self.OPENAPI_BASE_URL
+        )
 
     def get_aws_warning_zone_code(
         self,
@@ -2400,18 +2451,3 @@ class ForecastClient:
             params['tm'] = tm
 
         return self._make_request('wrn_reg_aws2.php', params)
-
-    # ============================================================================
-    # Helper methods
-    # ============================================================================
-
-    def _format_datetime(self, dt: datetime) -> str:
-        """Format datetime object to YYYYMMDDHHmm string.
-
-        Args:
-            dt: Datetime object to format
-
-        Returns:
-            Formatted datetime string in YYYYMMDDHHmm format
-        """
-        return dt.strftime('%Y%m%d%H%M')
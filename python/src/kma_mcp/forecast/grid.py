@@ -0,0 +1,239 @@
+"""Village forecast grid decoding and memory-mapped grid storage.
+
+The grid CGI endpoints (``nph-dfs_shrt_grd``, ``nph-dfs_vsrt_grd``,
+``nph-dfs_odam_grd``, ``nph-dfs_latlon_api``) return one value per point of
+the 149 x 253 village forecast grid, ordered from the bottom-left to the
+top-right corner, either as ASCII text or as binary (a 4-byte grid count
+followed by 4-byte floats). :func:`decode_grid` turns both variants into a
+``(253, 149)`` float32 array where ``grid[y - 1, x - 1]`` is grid point
+``(x, y)``.
+
+:class:`GridStore` persists decoded grids as ``.npy`` files keyed by
+(product, var, tmfc, tmef) and opens them memory-mapped, so reading one
+village from many forecast cycles touches a few bytes of each file instead
+of loading whole grids.
+
+Example:
+    >>> store = GridStore('~/.cache/kma-mcp/grids')
+    >>> key = GridKey('shrt', 'TMP', '202501010500', '202501010600')
+    >>> store.put(key, decode_grid(response.content))
+    >>> store.point(key, x=60, y=127)
+    -3.0
+    >>> store.series('shrt', 'TMP', x=60, y=127)
+    {GridKey(product='shrt', var='TMP', tmfc='202501010500', tmef='202501010600'): -3.0, ...}
+"""
+
+import os
+import re
+import tempfile
+from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+import numpy.typing as npt
+
+from kma_mcp.forecast.projection import GRID_NX, GRID_NY, in_grid
+
+GRID_SHAPE = (GRID_NY, GRID_NX)
+
+# Grid endpoints by product name
+GRID_ENDPOINTS = {
+    'shrt': 'nph-dfs_shrt_grd',
+    'vsrt': 'nph-dfs_vsrt_grd',
+    'odam': 'nph-dfs_odam_grd',
+}
+
+# Values at or below this are KMA missing markers (-99.0, -999.0, ...)
+MISSING_THRESHOLD = -90.0
+
+_KEY_PART = re.compile(r'^[0-9A-Za-z_.-]*$')
+
+
+class GridKey(NamedTuple):
+    """Identity of one stored grid."""
+
+    product: str
+    var: str
+    tmfc: str
+    tmef: str = ''
+
+
+def _decode_binary(content: bytes, size: int) -> npt.NDArray[np.float32] | None:
+    if len(content) != 4 * (size + 1):
+        return None
+    for order in ('<', '>'):
+        if int(np.frombuffer(content, f'{order}i4', count=1)[0]) == size:
+            return np.frombuffer(content, f'{order}f4', offset=4).astype(np.float32)
+    return None
+
+
+def _decode_ascii(content: bytes, size: int) -> npt.NDArray[np.float32]:
+    text = content.decode('utf-8', errors='replace')
+    lines = [line for line in text.splitlines() if not line.lstrip().startswith('#')]
+    tokens = ' '.join(lines).replace(',', ' ').split()
+    values = np.array(tokens, dtype=np.float32)
+    if len(values) < size:
+        msg = f'Grid response has {len(values)} values, expected {size}'
+        raise ValueError(msg)
+    # The ASCII variant may lead with the grid count
+    return values[len(values) - size :]
+
+
+def decode_grid(content: bytes, shape: tuple[int, int] = GRID_SHAPE) -> npt.NDArray[np.float32]:
+    """Decode an ASCII or binary grid response into a 2-D array.
+
+    Args:
+        content: Raw response body
+        shape: Grid shape as (ny, nx) (default: village forecast grid)
+
+    Returns:
+        float32 array of the given shape, row 0 at the southern edge; missing values are NaN
+
+    Raises:
+        ValueError: If the response holds fewer values than the grid has points
+    """
+    size = shape[0] * shape[1]
+    values = _decode_binary(content, size)
+    if values is None:
+        values = _decode_ascii(content, size)
+    grid = values.reshape(shape).copy()
+    grid[grid <= MISSING_THRESHOLD] = np.nan
+    return grid
+
+
+def _check_point(x: int, y: int) -> None:
+    if not in_grid(x, y):
+        msg = f'Grid point ({x}, {y}) is outside the {GRID_NX} x {GRID_NY} grid'
+        raise ValueError(msg)
+
+
+class GridStore:
+    """Directory of grids stored as memory-mappable ``.npy`` files."""
+
+    def __init__(self, directory: str | os.PathLike[str]) -> None:
+        """Initialize the store.
+
+        Args:
+            directory: Directory holding the grid files (created if missing)
+        """
+        self.directory = Path(directory).expanduser()
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def path(self, key: GridKey) -> Path:
+        """Return the file path of a grid."""
+        for part in key:
+            if not _KEY_PART.match(part):
+                msg = f'Invalid grid key component: {part!r}'
+                raise ValueError(msg)
+        return self.directory / key.product / key.var / f'{key.tmfc}_{key.tmef}.npy'
+
+    def __contains__(self, key: GridKey) -> bool:
+        """Check whether a grid is stored."""
+        return self.path(key).exists()
+
+    def put(self, key: GridKey, grid: npt.ArrayLike) -> np.memmap:
+        """Store a grid, replacing any previous one atomically.
+
+        Args:
+            key: Grid identity
+            grid: 2-D grid values
+
+        Returns:
+            The stored grid, memory-mapped read-only
+        """
+        path = self.path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                np.save(f, np.asarray(grid, dtype=np.float32))
+            Path(tmp).replace(path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        return self.get(key)  # type: ignore[return-value]
+
+    def get(self, key: GridKey) -> np.memmap | None:
+        """Open a stored grid memory-mapped, without reading its values.
+
+        Returns:
+            Read-only memory-mapped grid, or None if it is not stored
+        """
+        path = self.path(key)
+        if not path.exists():
+            return None
+        return np.load(path, mmap_mode='r')
+
+    def point(self, key: GridKey, x: int, y: int) -> float | None:
+        """Read the value of one grid point.
+
+        Args:
+            key: Grid identity
+            x: Grid number, east-west (1 ~ 149)
+            y: Grid number, north-south (1 ~ 253)
+
+        Returns:
+            Value at the point (NaN if missing), or None if the grid is not stored
+
+        Raises:
+            ValueError: If the point lies outside the grid
+        """
+        _check_point(x, y)
+        grid = self.get(key)
+        return None if grid is None else float(grid[y - 1, x - 1])
+
+    def bbox(
+        self, key: GridKey, x1: int, y1: int, x2: int, y2: int
+    ) -> npt.NDArray[np.float32] | None:
+        """Read the values inside a grid-number bounding box (inclusive).
+
+        Returns:
+            Array of shape (y2 - y1 + 1, x2 - x1 + 1), or None if the grid is not stored
+
+        Raises:
+            ValueError: If a corner lies outside the grid or (x1, y1) is not the lower-left one
+        """
+        _check_point(x1, y1)
+        _check_point(x2, y2)
+        if x1 > x2 or y1 > y2:
+            msg = f'({x1}, {y1}) is not the lower-left corner of ({x2}, {y2})'
+            raise ValueError(msg)
+        grid = self.get(key)
+        if grid is None:
+            return None
+        return np.array(grid[y1 - 1 : y2, x1 - 1 : x2])
+
+    def keys(self, product: str | None = None, var: str | None = None) -> list[GridKey]:
+        """List stored grids, optionally for one product and variable.
+
+        Returns:
+            Keys ordered by product, variable, issue time and valid time
+        """
+        pattern = f'{product or "*"}/{var or "*"}/*.npy'
+        keys = []
+        for path in self.directory.glob(pattern):
+            tmfc, _, tmef = path.stem.partition('_')
+            keys.append(GridKey(path.parent.parent.name, path.parent.name, tmfc, tmef))
+        return sorted(keys)
+
+    def series(self, product: str, var: str, x: int, y: int) -> dict[GridKey, float]:
+        """Read one grid point from every stored grid of a product and variable.
+
+        Args:
+            product: Product name ('shrt', 'vsrt' or 'odam')
+            var: Forecast variable (e.g., 'TMP')
+            x: Grid number, east-west
+            y: Grid number, north-south
+
+        Returns:
+            Value of the point by grid key, in time order
+
+        Raises:
+            ValueError: If the point lies outside the grid
+        """
+        _check_point(x, y)
+        values = {}
+        for key in self.keys(product, var):
+            grid = np.load(self.path(key), mmap_mode='r')
+            values[key] = float(grid[y - 1, x - 1])
+        return values
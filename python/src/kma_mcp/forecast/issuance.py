@@ -0,0 +1,93 @@
+"""Issuance schedule of the village forecasts.
+
+The village short-term forecast is issued 8 times daily (02, 05, 08, 11, 14,
+17, 20, 23 KST) and becomes available about 10 minutes after the issue time.
+The ultra short-term forecast is issued every hour at half past and becomes
+available about 15 minutes later.
+
+Example:
+    >>> latest_village_base(datetime(2025, 1, 1, 9, 30, tzinfo=KST))
+    ('20250101', '0800')
+"""
+
+from datetime import datetime, timedelta
+
+from kma_mcp.core.cache import KST
+
+VILLAGE_ISSUE_HOURS = (2, 5, 8, 11, 14, 17, 20, 23)
+VILLAGE_DELAY = timedelta(minutes=10)
+ULTRA_SHORT_MINUTE = 30
+ULTRA_SHORT_DELAY = timedelta(minutes=15)
+
+
+def _kst(now: datetime | None) -> datetime:
+    now = datetime.now(KST) if now is None else now
+    return now.replace(tzinfo=KST) if now.tzinfo is None else now.astimezone(KST)
+
+
+def latest_village_base(now: datetime | None = None) -> tuple[str, str]:
+    """Return the most recent village forecast issue that is already available.
+
+    Args:
+        now: Current time (default: now); naive datetimes are taken as KST
+
+    Returns:
+        Tuple of (base_date, base_time) in 'YYYYMMDD' and 'HHmm' format
+    """
+    available = _kst(now) - VILLAGE_DELAY
+    hours = [hour for hour in VILLAGE_ISSUE_HOURS if hour <= available.hour]
+    if hours:
+        issued = available.replace(hour=hours[-1], minute=0, second=0, microsecond=0)
+    else:
+        issued = (available - timedelta(days=1)).replace(
+            hour=VILLAGE_ISSUE_HOURS[-1], minute=0, second=0, microsecond=0
+        )
+    return issued.strftime('%Y%m%d'), issued.strftime('%H%M')
+
+
+def latest_ultra_short_base(now: datetime | None = None) -> tuple[str, str]:
+    """Return the most recent ultra short-term forecast issue that is already available.
+
+    Args:
+        now: Current time (default: now); naive datetimes are taken as KST
+
+    Returns:
+        Tuple of (base_date, base_time) in 'YYYYMMDD' and 'HHmm' format
+    """
+    available = _kst(now) - ULTRA_SHORT_DELAY - timedelta(minutes=ULTRA_SHORT_MINUTE)
+    issued = available.replace(minute=ULTRA_SHORT_MINUTE, second=0, microsecond=0)
+    return issued.strftime('%Y%m%d'), issued.strftime('%H%M')
+
+
+def next_village_available(now: datetime | None = None) -> datetime:
+    """Return when the next village forecast issue becomes available.
+
+    Args:
+        now: Current time (default: now); naive datetimes are taken as KST
+
+    Returns:
+        First availability time strictly after ``now``, in KST
+    """
+    now = _kst(now)
+    midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    times = (
+        midnight + timedelta(days=day, hours=hour) + VILLAGE_DELAY
+        for day in (0, 1)
+        for hour in VILLAGE_ISSUE_HOURS
+    )
+    return next(available for available in times if available > now)
+
+
+def next_ultra_short_available(now: datetime | None = None) -> datetime:
+    """Return when the next ultra short-term forecast issue becomes available.
+
+    Args:
+        now: Current time (default: now); naive datetimes are taken as KST
+
+    Returns:
+        First availability time strictly after ``now``, in KST
+    """
+    now = _kst(now)
+    offset = timedelta(minutes=ULTRA_SHORT_MINUTE) + ULTRA_SHORT_DELAY
+    available = now.replace(minute=0, second=0, microsecond=0) + offset
+    return available if available > now else available + timedelta(hours=1)
@@ -0,0 +1,205 @@
+"""Batched village forecasts for many locations.
+
+Every short-term forecast grid (one variable at one valid time) covers all
+of South Korea, so forecasts for hundreds of locations need one download per
+(variable, valid time), not one per location. Locations are converted to
+grid cells locally, grouped by cell, and each required grid is fetched once
+with :meth:`ForecastClient.get_village_grid_array`.
+
+Example:
+    >>> with ForecastClient('your_auth_key') as client:
+    ...     forecasts = forecast_points(client, [(37.5665, 126.9780), (35.1796, 129.0756)])
+    >>> forecasts[0]
+    {'latitude': 37.5665, 'longitude': 126.978, 'nx': 60, 'ny': 127,
+     'tmef': ['202501010600', ...], 'TMP': [-3.0, ...], 'POP': [20.0, ...], ...}
+"""
+
+import asyncio
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+from kma_mcp.forecast.async_forecast_client import AsyncForecastClient
+from kma_mcp.forecast.forecast_client import ForecastClient
+from kma_mcp.forecast.grid import GridStore
+from kma_mcp.forecast.issuance import latest_village_base
+from kma_mcp.forecast.projection import in_grid, latlon_to_grid
+
+DEFAULT_VARIABLES = ('TMP', 'POP', 'PTY', 'SKY')
+DEFAULT_HOURS = 12
+DEFAULT_CONCURRENCY = 4
+
+_TIME_FORMAT = '%Y%m%d%H%M'
+
+
+@dataclass(frozen=True)
+class PointPlan:
+    """Locations mapped to the unique grid cells that cover them."""
+
+    latitudes: npt.NDArray[np.float64]
+    longitudes: npt.NDArray[np.float64]
+    nx: npt.NDArray[np.int64]
+    ny: npt.NDArray[np.int64]
+    # Unique (x, y) cells inside the grid, shape (k, 2)
+    cells: npt.NDArray[np.int64]
+    # Row of ``cells`` for each location, -1 for locations outside the grid
+    cell_index: npt.NDArray[np.intp]
+
+
+def plan_points(points: Sequence[Sequence[float]]) -> PointPlan:
+    """Convert locations to grid cells and group them by cell.
+
+    Args:
+        points: Sequence of (latitude, longitude) pairs
+
+    Returns:
+        Plan with one entry per unique grid cell
+    """
+    coords = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    latitudes, longitudes = coords[:, 0], coords[:, 1]
+    nx, ny = latlon_to_grid(latitudes, longitudes)
+    inside = in_grid(nx, ny)
+    cell_index = np.full(len(coords), -1, dtype=np.intp)
+    if inside.any():
+        cells, inverse = np.unique(
+            np.stack([nx[inside], ny[inside]], axis=1), axis=0, return_inverse=True
+        )
+        cell_index[inside] = inverse.ravel()
+    else:
+        cells = np.empty((0, 2), dtype=np.int64)
+    return PointPlan(latitudes, longitudes, nx, ny, cells, cell_index)
+
+
+def valid_times(tmfc: str, hours: int) -> list[str]:
+    """Return the hourly valid times following an issue time.
+
+    Args:
+        tmfc: Issue time in 'YYYYMMDDHHmm' format
+        hours: Number of hourly valid times
+
+    Returns:
+        Valid times in 'YYYYMMDDHHmm' format, starting one hour after the issue
+    """
+    issued = datetime.strptime(tmfc, _TIME_FORMAT)  # noqa: DTZ007
+    return [(issued + timedelta(hours=hour)).strftime(_TIME_FORMAT) for hour in range(1, hours + 1)]
+
+
+def _latest_tmfc() -> str:
+    base_date, base_time = latest_village_base()
+    return base_date + base_time
+
+
+def _assemble(
+    plan: PointPlan,
+    tmefs: list[str],
+    variables: Sequence[str],
+    grids: dict[tuple[str, str], npt.NDArray[np.float32]],
+) -> list[dict[str, Any]]:
+    rows, cols = plan.cells[:, 1] - 1, plan.cells[:, 0] - 1
+    # (cells, times) matrix per variable, read with one fancy index per grid
+    values = {
+        var: np.stack([grids[var, tmef][rows, cols] for tmef in tmefs], axis=1)
+        if len(plan.cells)
+        else np.empty((0, len(tmefs)))
+        for var in variables
+    }
+
+    results = []
+    for i, cell in enumerate(plan.cell_index):
+        result: dict[str, Any] = {
+            'latitude': float(plan.latitudes[i]),
+            'longitude': float(plan.longitudes[i]),
+            'nx': int(plan.nx[i]),
+            'ny': int(plan.ny[i]),
+        }
+        if cell < 0:
+            result['error'] = 'location is outside the forecast grid'
+        else:
+            result['tmef'] = tmefs
+            for var in variables:
+                result[var] = [
+                    None if np.isnan(v) else round(float(v), 2) for v in values[var][cell]
+                ]
+        results.append(result)
+    return results
+
+
+def forecast_points(
+    client: ForecastClient,
+    points: Sequence[Sequence[float]],
+    tmfc: str | None = None,
+    variables: Sequence[str] = DEFAULT_VARIABLES,
+    hours: int = DEFAULT_HOURS,
+    *,
+    store: GridStore | None = None,
+) -> list[dict[str, Any]]:
+    """Get hourly short-term forecasts for many locations.
+
+    Args:
+        client: Forecast client used for the grid downloads
+        points: Sequence of (latitude, longitude) pairs
+        tmfc: Issue time in 'YYYYMMDDHHmm' format (None for the latest issue)
+        variables: Forecast variables (e.g., 'TMP', 'POP', 'PTY', 'SKY', 'REH', 'WSD')
+        hours: Number of hourly valid times after the issue time
+        store: Grid store used as a memory-mapped cache
+
+    Returns:
+        One time series per location, in input order
+    """
+    plan = plan_points(points)
+    tmfc = tmfc or _latest_tmfc()
+    tmefs = valid_times(tmfc, hours)
+    grids = {}
+    if len(plan.cells):
+        for var in variables:
+            for tmef in tmefs:
+                grids[var, tmef] = client.get_village_grid_array(
+                    'shrt', var, tmfc, tmef, store=store
+                )
+    return _assemble(plan, tmefs, variables, grids)
+
+
+async def aforecast_points(
+    client: AsyncForecastClient,
+    points: Sequence[Sequence[float]],
+    tmfc: str | None = None,
+    variables: Sequence[str] = DEFAULT_VARIABLES,
+    hours: int = DEFAULT_HOURS,
+    *,
+    store: GridStore | None = None,
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> list[dict[str, Any]]:
+    """Get hourly short-term forecasts for many locations, several grids at a time.
+
+    Args:
+        client: Async forecast client used for the grid downloads
+        points: Sequence of (latitude, longitude) pairs
+        tmfc: Issue time in 'YYYYMMDDHHmm' format (None for the latest issue)
+        variables: Forecast variables (e.g., 'TMP', 'POP', 'PTY', 'SKY', 'REH', 'WSD')
+        hours: Number of hourly valid times after the issue time
+        store: Grid store used as a memory-mapped cache
+        concurrency: Maximum number of concurrent grid downloads
+
+    Returns:
+        One time series per location, in input order
+    """
+    if concurrency < 1:
+        msg = f'concurrency must be at least 1, got: {concurrency}'
+        raise ValueError(msg)
+
+    plan = plan_points(points)
+    tmfc = tmfc or _latest_tmfc()
+    tmefs = valid_times(tmfc, hours)
+    keys = [(var, tmef) for var in variables for tmef in tmefs] if len(plan.cells) else []
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch(var: str, tmef: str) -> npt.NDArray[np.float32]:
+        async with semaphore:
+            return await client.get_village_grid_array('shrt', var, tmfc, tmef, store=store)
+
+    arrays = await asyncio.gather(*(fetch(*key) for key in keys))
+    return _assemble(plan, tmefs, variables, dict(zip(keys, arrays, strict=True)))
@@ -0,0 +1,136 @@
+"""Village forecast (DFS) grid <-> latitude/longitude conversion.
+
+The village forecast grid is a 5 km Lambert Conformal Conic grid (standard
+parallels 30N/60N, origin 38N 126E at grid point (43, 136)), 149 x 253
+points. Converting between grid numbers and coordinates is a deterministic
+projection, so it is computed locally instead of calling
+``nph-dfs_xy_lonlat``. Both directions are vectorized: pass scalars for one
+point or NumPy arrays for millions of points at once.
+
+Example:
+    >>> latlon_to_grid(37.5665, 126.9780)
+    (60, 127)
+    >>> grid_to_latlon(60, 127)
+    (37.5798..., 126.9893...)
+    >>> x, y = latlon_to_grid(np.array([37.5665, 35.1796]), np.array([126.9780, 129.0756]))
+"""
+
+import math
+from typing import Any, overload
+
+import numpy as np
+import numpy.typing as npt
+
+# KMA DFS projection parameters
+EARTH_RADIUS_KM = 6371.00877
+GRID_KM = 5.0
+STANDARD_LAT1 = 30.0
+STANDARD_LAT2 = 60.0
+ORIGIN_LON = 126.0
+ORIGIN_LAT = 38.0
+# Grid numbers are 1-based: the origin lies 210 km east and 675 km north of point (1, 1)
+ORIGIN_X = 210 / GRID_KM + 1
+ORIGIN_Y = 675 / GRID_KM + 1
+
+GRID_NX = 149
+GRID_NY = 253
+
+
+def _constants() -> tuple[float, float, float, float]:
+    rad = math.pi / 180
+    re = EARTH_RADIUS_KM / GRID_KM
+    slat1, slat2 = STANDARD_LAT1 * rad, STANDARD_LAT2 * rad
+    sn = math.log(math.cos(slat1) / math.cos(slat2)) / math.log(
+        math.tan(math.pi / 4 + slat2 / 2) / math.tan(math.pi / 4 + slat1 / 2)
+    )
+    sf = math.tan(math.pi / 4 + slat1 / 2) ** sn * math.cos(slat1) / sn
+    ro = re * sf / math.tan(math.pi / 4 + ORIGIN_LAT * rad / 2) ** sn
+    return re, sn, sf, ro
+
+
+_RE, _SN, _SF, _RO = _constants()
+
+
+def _project(
+    lat: npt.NDArray[np.float64], lon: npt.NDArray[np.float64]
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    """Project coordinates to continuous (unrounded) grid positions."""
+    ra = _RE * _SF / np.tan(np.pi / 4 + np.radians(lat) / 2) ** _SN
+    theta = np.radians(lon) - math.radians(ORIGIN_LON)
+    theta = (theta + np.pi) % (2 * np.pi) - np.pi
+    theta *= _SN
+    return ra * np.sin(theta) + ORIGIN_X, _RO - ra * np.cos(theta) + ORIGIN_Y
+
+
+@overload
+def latlon_to_grid(lat: float, lon: float) -> tuple[int, int]: ...
+
+
+@overload
+def latlon_to_grid(
+    lat: npt.ArrayLike, lon: npt.ArrayLike
+) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.int64]]: ...
+
+
+def latlon_to_grid(lat: Any, lon: Any) -> tuple[Any, Any]:
+    """Convert latitude/longitude to the nearest village forecast grid point.
+
+    Args:
+        lat: Latitude in degrees (scalar or array)
+        lon: Longitude in degrees (scalar or array)
+
+    Returns:
+        Tuple of (x, y) grid numbers; ints for scalar input, int64 arrays otherwise.
+        Points outside the 149 x 253 domain get numbers outside 1..149 / 1..253.
+    """
+    x, y = _project(np.asarray(lat, dtype=np.float64), np.asarray(lon, dtype=np.float64))
+    grid_x = np.floor(x + 0.5).astype(np.int64)
+    grid_y = np.floor(y + 0.5).astype(np.int64)
+    if grid_x.ndim == 0:
+        return int(grid_x), int(grid_y)
+    return grid_x, grid_y
+
+
+@overload
+def grid_to_latlon(x: int, y: int) -> tuple[float, float]: ...
+
+
+@overload
+def grid_to_latlon(
+    x: npt.ArrayLike, y: npt.ArrayLike
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]: ...
+
+
+def grid_to_latlon(x: Any, y: Any) -> tuple[Any, Any]:
+    """Convert village forecast grid numbers to the latitude/longitude of the grid point.
+
+    Args:
+        x: Grid number, east-west (1 ~ 149; scalar or array)
+        y: Grid number, north-south (1 ~ 253; scalar or array)
+
+    Returns:
+        Tuple of (lat, lon) in degrees; floats for scalar input, arrays otherwise
+    """
+    xn = np.asarray(x, dtype=np.float64) - ORIGIN_X
+    yn = _RO - np.asarray(y, dtype=np.float64) + ORIGIN_Y
+    ra = np.copysign(np.hypot(xn, yn), _SN)
+    lat = np.degrees(2 * np.arctan((_RE * _SF / ra) ** (1 / _SN)) - np.pi / 2)
+    lon = np.degrees(np.arctan2(xn, yn) / _SN) + ORIGIN_LON
+    if lat.ndim == 0:
+        return float(lat), float(lon)
+    return lat, lon
+
+
+def in_grid(x: npt.ArrayLike, y: npt.ArrayLike) -> Any:  # noqa: ANN401
+    """Check whether grid numbers lie inside the 149 x 253 village forecast domain.
+
+    Args:
+        x: Grid number, east-west
+        y: Grid number, north-south
+
+    Returns:
+        Boolean (array) that is True for points inside the domain
+    """
+    x, y = np.asarray(x), np.asarray(y)
+    inside = (x >= 1) & (x <= GRID_NX) & (y >= 1) & (y <= GRID_NY)
+    return bool(inside) if inside.ndim == 0 else inside
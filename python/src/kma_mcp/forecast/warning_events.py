@@ -0,0 +1,369 @@
+"""Change events of the active weather warnings.
+
+``kma_wn.php`` and ``wrn_now_data_new.php`` answer with the full national list
+of active warnings, so a monitor polling every minute would re-process every
+warning on every poll. :class:`WarningState` keeps the last list keyed by
+(zone, warning type) with its level, and turns each new list into the few
+events that changed it:
+
+- ``issue``: a warning type starts in a zone
+- ``upgrade`` / ``downgrade``: its level changes (e.g. 주의보 to 경보)
+- ``lift``: it is no longer in effect
+
+An unchanged list is recognised by its fingerprint and not compared at all.
+Events are kept in a short numbered log (for callers that poll, like the MCP
+tool) and passed to subscribers, so alerting does work in proportion to the
+changes, not to the number of active warnings.
+
+Example:
+    >>> from kma_mcp.forecast.warning_client import WarningClient
+    >>> from kma_mcp.forecast.warning_events import WarningState, watch
+    >>> state = WarningState()
+    >>> state.subscribe(page_on_call, kinds={'issue', 'upgrade'}, warnings={'호우'})
+    >>> with WarningClient('your_auth_key') as client:
+    ...     for events in watch(client.get_current_warnings, state=state, interval=30):
+    ...         log(events)
+"""
+
+import asyncio
+import itertools
+import threading
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Collection, Iterator
+from dataclasses import asdict, dataclass
+from typing import Any
+
+DEFAULT_INTERVAL = 60.0
+DEFAULT_HISTORY = 1000
+
+EVENT_KINDS = ('issue', 'upgrade', 'downgrade', 'lift')
+
+# Candidate column names, in order of preference
+_ZONE_COLUMNS = ('REG_ID', 'REG_CODE', 'STN_ID', 'STN')
+_ZONE_NAME_COLUMNS = ('REG_KO', 'REG_NAME', 'STN_KO')
+_WARNING_COLUMNS = ('WRN', 'WRN_ID', 'WRN_KO')
+_LEVEL_COLUMNS = ('LVL', 'LVL_ID', 'LVL_KO')
+_TIME_COLUMNS = ('TM_EF', 'TM_FC', 'TM')
+_COMMAND_COLUMNS = ('CMD', 'CMD_ID', 'CMD_KO')
+
+# Levels are reported as codes or in Korean; higher is more severe
+LEVELS: dict[Any, int] = {
+    1: 1,
+    2: 2,
+    3: 3,
+    '예비': 1,
+    '예비특보': 1,
+    '주의': 2,
+    '주의보': 2,
+    '경보': 3,
+}
+# Commands of rows that end a warning but may still be listed for a while
+_LIFT_COMMANDS = frozenset({3, '3', '해제'})
+
+Key = tuple[str, str]
+
+
+@dataclass(frozen=True)
+class WarningEvent:
+    """One change of the active warnings."""
+
+    seq: int
+    kind: str
+    zone: str
+    zone_name: str | None
+    warning: str
+    level: int | None
+    previous_level: int | None
+    time: str | None
+
+    def as_record(self) -> dict[str, Any]:
+        """Return the event as a flat record for tool output."""
+        return asdict(self)
+
+
+@dataclass(frozen=True)
+class _Warning:
+    level: int
+    zone_name: str | None
+    time: str | None
+
+
+@dataclass(frozen=True)
+class _Subscription:
+    callback: Callable[[list[WarningEvent]], None]
+    kinds: frozenset[str] | None
+    zones: frozenset[str] | None
+    warnings: frozenset[str] | None
+
+    def select(self, events: list[WarningEvent]) -> list[WarningEvent]:
+        return [
+            event
+            for event in events
+            if (self.kinds is None or event.kind in self.kinds)
+            and (self.zones is None or event.zone in self.zones)
+            and (self.warnings is None or event.warning in self.warnings)
+        ]
+
+
+def _column(names: Collection[str], candidates: tuple[str, ...]) -> str | None:
+    return next((name for name in candidates if name in names), None)
+
+
+def _level(value: Any) -> int:  # noqa: ANN401
+    """Rank a reported level, unknown levels counting as the lowest."""
+    if isinstance(value, str):
+        value = value.strip()
+        value = int(value) if value.isdigit() else value
+    return LEVELS.get(value, 1)
+
+
+def active_warnings(data: dict[str, Any]) -> dict[Key, _Warning]:
+    """Index a current-warnings response by (zone, warning type).
+
+    Args:
+        data: Columnar response of ``get_current_warnings`` or
+            ``get_current_warning_status_new``
+
+    Returns:
+        The highest level in effect for every zone and warning type
+
+    Raises:
+        ValueError: If the response has no zone, warning type or level column
+    """
+    columnar = isinstance(data, dict) and all(isinstance(values, list) for values in data.values())
+    names = list(data) if columnar else []
+    zone = _column(names, _ZONE_COLUMNS)
+    warning = _column(names, _WARNING_COLUMNS)
+    level = _column(names, _LEVEL_COLUMNS)
+    if zone is None or warning is None or level is None:
+        msg = f'Response is not a warning list: {str(data)[:200]}'
+        raise ValueError(msg)
+    zone_name = _column(names, _ZONE_NAME_COLUMNS)
+    issued = _column(names, _TIME_COLUMNS)
+    command = _column(names, _COMMAND_COLUMNS)
+
+    active: dict[Key, _Warning] = {}
+    for values in zip(*data.values(), strict=True):
+        row = dict(zip(names, values, strict=True))
+        if command is not None and row[command] in _LIFT_COMMANDS:
+            continue
+        key = (str(row[zone]), str(row[warning]))
+        current = _Warning(
+            _level(row[level]),
+            row[zone_name] if zone_name else None,
+            None if issued is None or row[issued] is None else str(row[issued]),
+        )
+        if key not in active or current.level > active[key].level:
+            active[key] = current
+    return active
+
+
+def _fingerprint(data: Any) -> int | None:  # noqa: ANN401
+    try:
+        return hash(tuple((name, tuple(values)) for name, values in data.items()))
+    except (AttributeError, TypeError):
+        return None
+
+
+class WarningState:
+    """Last known active warnings, with a log of the changes seen so far.
+
+    Thread-safe: one state can be shared by pollers and the MCP tools.
+    """
+
+    def __init__(self, *, history: int = DEFAULT_HISTORY) -> None:
+        """Initialize an empty state; the first update reports every warning as issued.
+
+        Args:
+            history: Number of recent events kept for :meth:`events_since`
+        """
+        self._active: dict[Key, _Warning] = {}
+        self._fingerprint: int | None = None
+        self._seq = 0
+        self._log: deque[WarningEvent] = deque(maxlen=history)
+        self._subscriptions: list[_Subscription] = []
+        self._lock = threading.Lock()
+
+    @property
+    def seq(self) -> int:
+        """Sequence number of the newest event (0 before any change)."""
+        return self._seq
+
+    @property
+    def active(self) -> dict[Key, int]:
+        """Level in effect for every (zone, warning type)."""
+        with self._lock:
+            return {key: warning.level for key, warning in self._active.items()}
+
+    def update(self, data: dict[str, Any]) -> list[WarningEvent]:
+        """Compare a new warning list with the last one and record the changes.
+
+        Args:
+            data: Columnar current-warnings response
+
+        Returns:
+            Events in (zone, warning type) order; empty when nothing changed
+
+        Raises:
+            ValueError: If the response is not a warning list
+        """
+        fingerprint = _fingerprint(data)
+        if fingerprint is not None and fingerprint == self._fingerprint:
+            return []
+        current = active_warnings(data)
+        with self._lock:
+            events = self._diff(current)
+            self._active, self._fingerprint = current, fingerprint
+            self._log.extend(events)
+            subscriptions = list(self._subscriptions)
+
+        for subscription in subscriptions:
+            selected = subscription.select(events)
+            if selected:
+                subscription.callback(selected)
+        return events
+
+    def _diff(self, current: dict[Key, _Warning]) -> list[WarningEvent]:
+        events = []
+        for key in sorted(self._active.keys() | current.keys()):
+            before, after = self._active.get(key), current.get(key)
+            if after is None:
+                kind = 'lift'
+            elif before is None:
+                kind = 'issue'
+            elif after.level != before.level:
+                kind = 'upgrade' if after.level > before.level else 'downgrade'
+            else:
+                continue
+            self._seq += 1
+            events.append(
+                WarningEvent(
+                    seq=self._seq,
+                    kind=kind,
+                    zone=key[0],
+                    zone_name=(after or before).zone_name,  # type: ignore[union-attr]
+                    warning=key[1],
+                    level=after.level if after else None,
+                    previous_level=before.level if before else None,
+                    time=after.time if after else None,
+                )
+            )
+        return events
+
+    def events_since(self, seq: int = 0) -> list[WarningEvent]:
+        """Return the logged events numbered after ``seq``.
+
+        Only the last ``history`` events are kept; a caller that fell further
+        behind receives the oldest ones still logged.
+        """
+        with self._lock:
+            return [event for event in self._log if event.seq > seq]
+
+    def subscribe(
+        self,
+        callback: Callable[[list[WarningEvent]], None],
+        *,
+        kinds: Collection[str] | None = None,
+        zones: Collection[str] | None = None,
+        warnings: Collection[str] | None = None,
+    ) -> Callable[[], None]:
+        """Call ``callback`` with the matching events of every update that has any.
+
+        Args:
+            callback: Receives a non-empty list of events
+            kinds: Event kinds to receive (default: all of :data:`EVENT_KINDS`)
+            zones: Warning zone IDs to receive (default: all zones)
+            warnings: Warning types to receive, as reported (default: all types)
+
+        Returns:
+            Function that cancels the subscription
+
+        Raises:
+            ValueError: If an event kind is unknown
+        """
+        unknown = set(kinds or ()) - set(EVENT_KINDS)
+        if unknown:
+            msg = f'Unknown event kinds {sorted(unknown)}, expected some of {EVENT_KINDS}'
+            raise ValueError(msg)
+        subscription = _Subscription(
+            callback,
+            None if kinds is None else frozenset(kinds),
+            None if zones is None else frozenset(str(zone) for zone in zones),
+            None if warnings is None else frozenset(warnings),
+        )
+        with self._lock:
+            self._subscriptions.append(subscription)
+
+        def unsubscribe() -> None:
+            with self._lock:
+                if subscription in self._subscriptions:
+                    self._subscriptions.remove(subscription)
+
+        return unsubscribe
+
+
+def watch(
+    method: Callable[..., dict[str, Any]],
+    *,
+    state: WarningState | None = None,
+    interval: float = DEFAULT_INTERVAL,
+    polls: int | None = None,
+    **kwargs: Any,  # noqa: ANN401
+) -> Iterator[list[WarningEvent]]:
+    """Poll a sync current-warnings method and yield the changes.
+
+    Args:
+        method: Bound client method (e.g. ``client.get_current_warnings``)
+        state: State to update (default: a new :class:`WarningState`)
+        interval: Seconds to wait between polls
+        polls: Number of polls before stopping (default: follow forever)
+        **kwargs: Extra arguments passed to every call
+
+    Yields:
+        Events of each poll that changed the active warnings
+    """
+    state = WarningState() if state is None else state
+    for poll in range(polls) if polls is not None else itertools.count():
+        if poll:
+            time.sleep(interval)
+        events = state.update(method(**kwargs))
+        if events:
+            yield events
+
+
+async def awatch(
+    method: Callable[..., Awaitable[dict[str, Any]]],
+    *,
+    state: WarningState | None = None,
+    interval: float = DEFAULT_INTERVAL,
+    polls: int | None = None,
+    **kwargs: Any,  # noqa: ANN401
+) -> AsyncIterator[list[WarningEvent]]:
+    """Poll an async current-warnings method and yield the changes.
+
+    Args:
+        method: Bound async client method
+        state: State to update (default: a new :class:`WarningState`)
+        interval: Seconds to wait between polls
+        polls: Number of polls before stopping (default: follow forever)
+        **kwargs: Extra arguments passed to every call
+
+    Yields:
+        Events of each poll that changed the active warnings
+    """
+    state = WarningState() if state is None else state
+    for poll in range(polls) if polls is not None else itertools.count():
+        if poll:
+            await asyncio.sleep(interval)
+        events = state.update(await method(**kwargs))
+        if events:
+            yield events
+
+
+_state = WarningState()
+
+
+def get_warning_state() -> WarningState:
+    """Get the process-wide warning state shared by the MCP tools."""
+    return _state
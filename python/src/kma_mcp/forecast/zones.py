@@ -0,0 +1,337 @@
+"""Grid-bucket index resolving locations to warning (or forecast) zones.
+
+The API Hub publishes which zone every AWS station belongs to
+(``wrn_reg_aws2.php``), but no zone boundaries. :class:`ZoneIndex` therefore
+represents each zone by the sites inside it and resolves a location to the
+zone of its nearest site, which follows the zone boundaries to within the
+spacing of the AWS network (about 13 km).
+
+The sites are bucketed into a regular latitude/longitude grid. For every
+cell, the index keeps only the few sites that can be nearest to some point
+of the cell (a site is dropped when it is farther from the cell centre than
+the nearest site plus the cell diameter). A lookup is then one bucket read
+and a handful of distances, and :meth:`ZoneIndex.locate_many` resolves
+thousands of points with a few vectorized NumPy operations.
+
+Example:
+    >>> from kma_mcp.forecast.forecast_client import ForecastClient
+    >>> from kma_mcp.forecast.zones import ZoneIndex
+    >>> with ForecastClient('your_auth_key') as client:
+    ...     zones = ZoneIndex.from_table(client.get_aws_warning_zone_code(), stations=stations)
+    >>> zones.locate(37.5665, 126.9780)
+    {'latitude': 37.5665, 'longitude': 126.978, 'zone_id': 'L1100200', ...}
+"""
+
+import math
+from collections.abc import Iterable, Mapping
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import numpy.typing as npt
+
+from kma_mcp.surface.station_index import EARTH_RADIUS_KM, chord_to_km, unit_vectors
+
+if TYPE_CHECKING:
+    from kma_mcp.surface.station_index import StationIndex
+
+DEFAULT_CELL_DEG = 0.2
+# Locations farther than this from every site are not in any zone
+DEFAULT_MAX_DISTANCE_KM = 50.0
+
+_ZONE_COLUMNS = ('REG_ID', 'REG_CODE', 'ZONE_ID')
+_ZONE_NAME_COLUMNS = ('REG_KO', 'REG_NAME', 'REG_NM', 'ZONE_NAME')
+_STATION_COLUMNS = ('STN_ID', 'STN', 'AWS_ID')
+_LATITUDE_COLUMNS = ('LAT', 'LATITUDE')
+_LONGITUDE_COLUMNS = ('LON', 'LONGITUDE')
+
+
+def _find(names: Iterable[str], candidates: tuple[str, ...]) -> str | None:
+    upper = {name.upper(): name for name in names}
+    return next((upper[name] for name in candidates if name in upper), None)
+
+
+def _float(value: Any) -> float:  # noqa: ANN401
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+class ZoneIndex:
+    """Zones as sets of sites, with nearest-site lookups through a grid of buckets."""
+
+    def __init__(
+        self,
+        zone_ids: npt.ArrayLike,
+        latitudes: npt.ArrayLike,
+        longitudes: npt.ArrayLike,
+        *,
+        names: npt.ArrayLike | None = None,
+        cell_deg: float = DEFAULT_CELL_DEG,
+        max_distance_km: float | None = DEFAULT_MAX_DISTANCE_KM,
+    ) -> None:
+        """Initialize the index from equal-length arrays, one entry per site.
+
+        Args:
+            zone_ids: Zone of each site
+            latitudes: Latitudes in degrees
+            longitudes: Longitudes in degrees
+            names: Zone name of each site
+            cell_deg: Size of the grid cells in degrees
+            max_distance_km: Locations farther than this from every site belong
+                to no zone (None for no limit)
+        """
+        self.zone_ids = np.asarray(zone_ids, dtype=object)
+        self.latitudes = np.asarray(latitudes, dtype=np.float64)
+        self.longitudes = np.asarray(longitudes, dtype=np.float64)
+        size = len(self.zone_ids)
+        self.names = np.full(size, '', dtype=object) if names is None else np.asarray(names, object)
+        self.cell_deg = cell_deg
+        self.max_distance_km = max_distance_km
+        self._vectors = unit_vectors(self.latitudes, self.longitudes).reshape(size, 3)
+        self._build_grid()
+
+    @classmethod
+    def from_table(
+        cls,
+        data: Mapping[str, Any],
+        *,
+        stations: 'StationIndex | None' = None,
+        cell_deg: float = DEFAULT_CELL_DEG,
+        max_distance_km: float | None = DEFAULT_MAX_DISTANCE_KM,
+    ) -> 'ZoneIndex':
+        """Build an index from a columnar table of sites and their zones.
+
+        Sites are located by the table's own LAT/LON columns, or else by
+        looking up its station column in ``stations``.
+
+        Args:
+            data: Response of ``get_aws_warning_zone_code``, or any table with a
+                zone column and either coordinates or station IDs
+            stations: Station index used when the table has no coordinates
+            cell_deg: Size of the grid cells in degrees
+            max_distance_km: Locations farther than this from every site belong to no zone
+
+        Returns:
+            Index of the sites that could be located
+
+        Raises:
+            ValueError: If the table has no zone column, or no way to locate its sites
+        """
+        names = list(data)
+        zone = _find(names, _ZONE_COLUMNS)
+        zone_name = _find(names, _ZONE_NAME_COLUMNS)
+        lat, lon = _find(names, _LATITUDE_COLUMNS), _find(names, _LONGITUDE_COLUMNS)
+        station = _find(names, _STATION_COLUMNS)
+        if zone is None:
+            msg = f'Zone table has no zone column: {names}'
+            raise ValueError(msg)
+
+        if lat is not None and lon is not None:
+            latitudes = np.array([_float(value) for value in data[lat]])
+            longitudes = np.array([_float(value) for value in data[lon]])
+        elif station is not None and stations is not None:
+            position = {int(stn): row for row, stn in enumerate(stations.station_ids.tolist())}
+            rows = [position.get(_station_id(value), -1) for value in data[station]]
+            known = np.array(rows, dtype=np.intp)
+            # Index only matched rows: -1 would wrap around, or fail on an empty index
+            latitudes = np.full(len(known), np.nan)
+            longitudes = np.full(len(known), np.nan)
+            latitudes[known >= 0] = stations.latitudes[known[known >= 0]]
+            longitudes[known >= 0] = stations.longitudes[known[known >= 0]]
+        else:
+            msg = f'Zone table has no coordinates and no station index was given: {names}'
+            raise ValueError(msg)
+
+        located = np.isfinite(latitudes) & np.isfinite(longitudes)
+        zone_ids = np.array([str(value) for value in data[zone]], dtype=object)
+        zone_names = None if zone_name is None else np.asarray(data[zone_name], dtype=object)
+        return cls(
+            zone_ids[located],
+            latitudes[located],
+            longitudes[located],
+            names=None if zone_names is None else zone_names[located],
+            cell_deg=cell_deg,
+            max_distance_km=max_distance_km,
+        )
+
+    def __len__(self) -> int:
+        """Return the number of sites."""
+        return len(self.zone_ids)
+
+    @property
+    def zones(self) -> dict[str, str]:
+        """Name of every zone, by zone ID."""
+        return dict(zip(self.zone_ids.tolist(), self.names.tolist(), strict=True))
+
+    def _build_grid(self) -> None:
+        """Keep, for every cell, the sites that can be nearest to a point in it."""
+        cell = self.cell_deg
+        if not len(self):
+            self._origin, self._shape = (0.0, 0.0), (0, 0)
+            self._candidates = np.empty((0, 0), dtype=np.intp)
+            self._buckets, self._site_vectors = [], []
+            return
+        # One spare cell around the sites, so nearby points also use the grid
+        self._origin = (
+            float(np.floor(self.latitudes.min() / cell) - 1) * cell,
+            float(np.floor(self.longitudes.min() / cell) - 1) * cell,
+        )
+        self._shape = (
+            int(np.ceil((self.latitudes.max() - self._origin[0]) / cell)) + 2,
+            int(np.ceil((self.longitudes.max() - self._origin[1]) / cell)) + 2,
+        )
+        rows, cols = np.indices(self._shape).reshape(2, -1)
+        south = self._origin[0] + rows * cell
+        west = self._origin[1] + cols * cell
+        centres = unit_vectors(south + cell / 2, west + cell / 2)
+        # Chord from the centre to the farthest corner of the cell
+        radius = np.max(
+            [
+                np.linalg.norm(unit_vectors(south + dlat, west + dlon) - centres, axis=1)
+                for dlat in (0, cell)
+                for dlon in (0, cell)
+            ],
+            axis=0,
+        )
+
+        distances = np.linalg.norm(centres[:, None, :] - self._vectors[None, :, :], axis=2)
+        reach = distances.min(axis=1) + 2 * radius
+        keep = distances <= reach[:, None]
+        width = int(keep.sum(axis=1).max())
+        # Candidates first in every row, padded with -1
+        order = np.argsort(~keep, axis=1, kind='stable')[:, :width]
+        self._candidates = np.where(np.take_along_axis(keep, order, axis=1), order, -1)
+        # Plain lists for single lookups, where NumPy call overhead would dominate
+        self._buckets = [[site for site in row if site >= 0] for row in self._candidates.tolist()]
+        self._site_vectors = self._vectors.tolist()
+
+    def _nearest(
+        self, vectors: npt.NDArray[np.float64], cells: npt.NDArray[np.intp] | None
+    ) -> tuple[npt.NDArray[np.intp], npt.NDArray[np.float64]]:
+        """Return the nearest site of each point and its chord distance."""
+        # The nearest site has the largest dot product with the point
+        if cells is None:
+            candidates = None
+            dots = vectors @ self._vectors.T
+        else:
+            candidates = self._candidates[cells]
+            dots = np.einsum('pkd,pd->pk', self._vectors[candidates], vectors)
+            dots[candidates < 0] = -np.inf
+        best = dots.argmax(axis=1)
+        picked = np.arange(len(vectors))
+        chords = np.sqrt(np.maximum(2 - 2 * dots[picked, best], 0.0))
+        return (best if candidates is None else candidates[picked, best]), chords
+
+    def locate_many(
+        self, latitudes: npt.ArrayLike, longitudes: npt.ArrayLike
+    ) -> dict[str, list[Any]]:
+        """Resolve many locations to their zones at once.
+
+        Args:
+            latitudes: Latitudes in degrees
+            longitudes: Longitudes in degrees
+
+        Returns:
+            Columnar rows with latitude, longitude, zone_id, zone_name and the
+            distance_km to the nearest site of the zone (None where no zone)
+        """
+        lat = np.atleast_1d(np.asarray(latitudes, dtype=np.float64))
+        lon = np.atleast_1d(np.asarray(longitudes, dtype=np.float64))
+        site = np.full(len(lat), -1, dtype=np.intp)
+        chord = np.full(len(lat), np.inf)
+
+        valid = np.isfinite(lat) & np.isfinite(lon)
+        if len(self) and valid.any():
+            vectors = unit_vectors(lat, lon).reshape(len(lat), 3)
+            row = np.floor((np.where(valid, lat, 0) - self._origin[0]) / self.cell_deg)
+            col = np.floor((np.where(valid, lon, 0) - self._origin[1]) / self.cell_deg)
+            gridded = valid & (row >= 0) & (row < self._shape[0]) & (col >= 0)
+            gridded &= col < self._shape[1]
+            cells = (row[gridded] * self._shape[1] + col[gridded]).astype(np.intp)
+            site[gridded], chord[gridded] = self._nearest(vectors[gridded], cells)
+            # Points off the grid are far from every site; compare all of them
+            outside = valid & ~gridded
+            if outside.any():
+                site[outside], chord[outside] = self._nearest(vectors[outside], None)
+
+        distance = chord_to_km(np.where(np.isfinite(chord), chord, 0.0))
+        found = site >= 0
+        if self.max_distance_km is not None:
+            found &= distance <= self.max_distance_km
+        zone_ids = np.full(len(lat), None, dtype=object)
+        names = np.full(len(lat), None, dtype=object)
+        distances = np.full(len(lat), None, dtype=object)
+        zone_ids[found] = self.zone_ids[site[found]]
+        names[found] = self.names[site[found]]
+        distances[found] = np.round(distance[found], 3)
+        return {
+            'latitude': lat.tolist(),
+            'longitude': lon.tolist(),
+            'zone_id': zone_ids.tolist(),
+            'zone_name': names.tolist(),
+            'distance_km': distances.tolist(),
+        }
+
+    def locate(self, latitude: float, longitude: float) -> dict[str, Any]:
+        """Resolve one location to its zone.
+
+        Args:
+            latitude: Latitude in degrees
+            longitude: Longitude in degrees
+
+        Returns:
+            Row like those of :meth:`locate_many`; zone_id is None outside every zone
+        """
+        row = (latitude - self._origin[0]) / self.cell_deg
+        col = (longitude - self._origin[1]) / self.cell_deg
+        if not (0 <= row < self._shape[0] and 0 <= col < self._shape[1]):
+            # Off the grid (or not a number): compare every site
+            columns = self.locate_many([latitude], [longitude])
+            return {name: values[0] for name, values in columns.items()}
+
+        lat, lon = math.radians(latitude), math.radians(longitude)
+        x, y, z = math.cos(lat) * math.cos(lon), math.cos(lat) * math.sin(lon), math.sin(lat)
+        vectors = self._site_vectors
+        dot, site = max(
+            (vectors[site][0] * x + vectors[site][1] * y + vectors[site][2] * z, site)
+            for site in self._buckets[int(row) * self._shape[1] + int(col)]
+        )
+        distance = 2 * EARTH_RADIUS_KM * math.asin(min(math.sqrt(max(2 - 2 * dot, 0.0)) / 2, 1.0))
+        found = self.max_distance_km is None or distance <= self.max_distance_km
+        return {
+            'latitude': latitude,
+            'longitude': longitude,
+            'zone_id': self.zone_ids[site] if found else None,
+            'zone_name': self.names[site] if found else None,
+            'distance_km': round(distance, 3) if found else None,
+        }
+
+
+def _station_id(value: Any) -> int:  # noqa: ANN401
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return -1
+
+
+def select_zones(data: Mapping[str, Any], zone_ids: Iterable[str]) -> dict[str, list[Any]]:
+    """Keep the rows of a columnar warning list that are issued for the given zones.
+
+    Args:
+        data: Columnar response with a zone column (e.g. ``get_current_warnings``)
+        zone_ids: Zones to keep
+
+    Returns:
+        Columnar rows of those zones
+
+    Raises:
+        ValueError: If the response has no zone column
+    """
+    zone = _find(list(data), _ZONE_COLUMNS)
+    if zone is None or not all(isinstance(values, list) for values in data.values()):
+        msg = f'Response has no zone column: {str(data)[:200]}'
+        raise ValueError(msg)
+    wanted = {str(zone_id) for zone_id in zone_ids}
+    rows = [index for index, value in enumerate(data[zone]) if str(value) in wanted]
+    return {name: [values[index] for index in rows] for name, values in data.items()}
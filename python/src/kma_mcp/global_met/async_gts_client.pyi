@@ -0,0 +1,18 @@
+# Generated by scripts/generate_async_stubs.py from the sync client; do not edit.
+from typing import Any
+
+from kma_mcp.core.client import AsyncKMAClient
+
+class AsyncGTSClient(AsyncKMAClient):
+    async def get_synop_observations(
+        self, tm: str, dtm: int = 3, stn: int = 0
+    ) -> dict[str, Any]: ...
+    async def get_ship_observations(self, tm: str, dtm: int = 3) -> dict[str, Any]: ...
+    async def get_buoy_observations(
+        self, tm: str, dtm: int = 3, stn: str = ''
+    ) -> dict[str, Any]: ...
+    async def get_aircraft_reports(
+        self, tm: str, dtm: int = 60, stn: int = 0
+    ) -> dict[str, Any]: ...
+    async def get_surface_chart(self, tm: str) -> dict[str, Any]: ...
+    async def get_synop_chart(self, tm: str) -> dict[str, Any]: ...
@@ -0,0 +1,10 @@
+# Generated by scripts/generate_async_stubs.py from the sync client; do not edit.
+from typing import Any
+
+from kma_mcp.core.client import AsyncKMAClient
+
+class AsyncIntegratedClient(AsyncKMAClient):
+    async def get_lightning_data(self, tm1: str, tm2: str) -> dict[str, Any]: ...
+    async def get_wind_profiler_data(
+        self, tm: str, stn: int = 0, mode: str = 'L'
+    ) -> dict[str, Any]: ...
@@ -6,10 +6,10 @@ observation sources and specialized data products.
 
 from typing import Any
 
-import httpx
+from kma_mcp.core.client import KMAClient
 
 
-class IntegratedClient:
+class IntegratedClient(KMAClient):
     """Client for accessing KMA Integrated Meteorology data.
 
     Provides access to:
@@ -18,38 +18,6 @@ class IntegratedClient:
     - Integrated observation products
     """
 
-    BASE_URL = 'https://apihub.kma.go.kr/api/typ01/url'
-
-    def __init__(self, auth_key: str, timeout: float = 30.0):
-        """Initialize Integrated client.
-
-        Args:
-            auth_key: KMA API authentication key
-            timeout: Request timeout in seconds (default: 30.0)
-        """
-        self.auth_key = auth_key
-        self._client = httpx.Client(timeout=timeout)
-
-    def __enter__(self) -> 'IntegratedClient':
-        """Context manager entry."""
-        return self
-
-    def __exit__(self, *args: object) -> None:
-        """Context manager exit."""
-        self.close()
-
-    def close(self) -> None:
-        """Close the HTTP client."""
-        self._client.close()
-
-    def _make_request(self, endpoint: str, params: dict[str, Any]) -> dict[str, Any]:
-        """Make an API request."""
-        params['authKey'] = self.auth_key
-        url = f'{self.BASE_URL}/{endpoint}'
-        response = self._client.get(url, params=params)
-        response.raise_for_status()
-        return response.json()
-
     def get_lightning_data(
         self,
         tm1: str,
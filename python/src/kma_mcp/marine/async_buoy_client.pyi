@@ -0,0 +1,14 @@
+# Generated by scripts/generate_async_stubs.py from the sync client; do not edit.
+from datetime import datetime
+from typing import Any
+
+from kma_mcp.core.client import AsyncKMAClient
+
+class AsyncBuoyClient(AsyncKMAClient):
+    async def get_buoy_data(self, tm: str | datetime, stn: int | str = 0) -> dict[str, Any]: ...
+    async def get_buoy_period(
+        self, tm1: str | datetime, tm2: str | datetime, stn: int | str = 0
+    ) -> dict[str, Any]: ...
+    async def get_comprehensive_marine_data(
+        self, tm: str | datetime, stn: int | str = 0
+    ) -> dict[str, Any]: ...
@@ -5,12 +5,13 @@ including wave height, water temperature, wind, and atmospheric data.
 """
 
 from datetime import datetime
-from typing import Any
+from typing import Any, ClassVar
 
-import httpx
+from kma_mcp.core.client import KMAClient
+from kma_mcp.core.windowing import MINUTELY, PeriodSpec
 
 
-class BuoyClient:
+class BuoyClient(KMAClient):
     """Client for accessing KMA Marine Meteorological Buoy data.
 
     Provides access to marine observation data including:
@@ -20,45 +21,8 @@ class BuoyClient:
     - Atmospheric pressure and humidity
     """
 
-    BASE_URL = 'https://apihub.kma.go.kr/api/typ01/url'
-
-    def __init__(self, auth_key: str, timeout: float = 30.0):
-        """Initialize the Buoy client.
-
-        Args:
-            auth_key: KMA API authentication key
-            timeout: Request timeout in seconds (default: 30.0)
-        """
-        self.auth_key = auth_key
-        self._client = httpx.Client(timeout=timeout)
-
-    def __enter__(self) -> 'BuoyClient':
-        """Context manager entry."""
-        return self
-
-    def __exit__(self, *args: object) -> None:
-        """Context manager exit."""
-        self.close()
-
-    def close(self) -> None:
-        """Close the HTTP client."""
-        self._client.close()
-
-    def _make_request(self, endpoint: str, params: dict[str, Any]) -> dict[str, Any]:
-        """Make an API request.
-
-        Args:
-            endpoint: API endpoint name
-            params: Query parameters
-
-        Returns:
-            JSON response as dictionary
-        """
-        params['authKey'] = self.auth_key
-        url = f'{self.BASE_URL}/{endpoint}'
-        response = self._client.get(url, params=params)
-        response.raise_for_status()
-        return response.json()
+    # Buoys report more often than hourly; minute resolution keeps gaps exact
+    TIME_SERIES: ClassVar[dict[str, PeriodSpec]] = {'kma_buoy2.php': MINUTELY}
 
     def get_buoy_data(self, tm: str | datetime, stn: int | str = 0) -> dict[str, Any]:
         """Get marine buoy observation data for a specific time.
@@ -8,14 +8,25 @@ KMA weather observation data through standardized tools, including:
 
 import logging
 import os
+import threading
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 
 from dotenv import load_dotenv
 from fastmcp import FastMCP
 
-from kma_mcp.surface.aws_client import AWSClient
-from kma_mcp.tools import forecast_tools, surface_tools
+from kma_mcp.core.cache import configure_cache_from_env, get_cache
+from kma_mcp.core.lazy import lazy_module
+from kma_mcp.core.ratelimit import configure_rate_limit_from_env, quota_status
+from kma_mcp.core.resilience import configure_resilience_from_env, resilience_stats
+from kma_mcp.core.store import configure_store_from_env, get_store
+from kma_mcp.core.transport import close_http_clients, configure_from_env, get_http_client
+from kma_mcp.tools import forecast_tools, paging, surface_tools
+
+# Only needed once the API key check runs, after the server has started
+aws_client = lazy_module('kma_mcp.surface.aws_client')
 
 # Configure logging
 logging.basicConfig(
@@ -30,8 +41,38 @@ env_path = Path(__file__).resolve().parent.parent.parent.parent / '.env'
 load_dotenv(dotenv_path=env_path)
 logger.info('Loading environment from: %s', env_path)
 
+# Configure the response cache (KMA_CACHE_* variables), the observation store
+# (KMA_STORE_* variables), retries and circuit breakers (KMA_RETRY_*,
+# KMA_CIRCUIT_*, KMA_HEDGE_DELAY), rate limiting and quotas (KMA_RATE_*,
+# KMA_DAILY_QUOTA) and the shared HTTP connection pool (KMA_HTTP_* variables)
+# that uses them, and the page size of tool output (KMA_PAGE_* variables)
+configure_cache_from_env()
+configure_store_from_env()
+configure_resilience_from_env()
+configure_rate_limit_from_env()
+configure_from_env()
+paging.configure_paging_from_env()
+
+
+@asynccontextmanager
+async def lifespan(_server: FastMCP) -> AsyncIterator[None]:
+    """Close the shared HTTP connection pool when the server shuts down."""
+    try:
+        yield
+    finally:
+        close_http_clients()
+        cache = get_cache()
+        if cache is not None:
+            logger.info('Response cache stats: %s', cache.stats())
+        store = get_store()
+        if store is not None:
+            logger.info('Observation store stats: %s', store.stats())
+        logger.info('Retry stats: %s', resilience_stats())
+        logger.info('API quota usage: %s', quota_status())
+
+
 # Initialize FastMCP server
-mcp = FastMCP('KMA Weather Data')
+mcp = FastMCP('KMA Weather Data', lifespan=lifespan)
 
 # Get API key from environment (from .env file or environment variable)
 API_KEY = os.getenv('KMA_API_KEY', '')
@@ -64,17 +105,30 @@ mcp.tool(surface_tools.get_season_period)
 # Station Info
 mcp.tool(surface_tools.get_asos_station_list)
 mcp.tool(surface_tools.get_aws_station_list)
+mcp.tool(surface_tools.get_nearby_stations)
+# Observation Summaries
+mcp.tool(surface_tools.get_observation_summary)
+# Weather Snapshots
+mcp.tool(surface_tools.get_weather_snapshot)
 
 # Register forecast tools
 # Forecasts
 mcp.tool(forecast_tools.get_short_term_forecast)
 mcp.tool(forecast_tools.get_short_term_overview)
+mcp.tool(forecast_tools.get_village_forecast_by_location)
+mcp.tool(forecast_tools.get_village_forecast_batch)
 mcp.tool(forecast_tools.get_medium_term_forecast)
 # Weather Warnings
 mcp.tool(forecast_tools.get_current_weather_warnings)
+mcp.tool(forecast_tools.get_weather_warning_changes)
+mcp.tool(forecast_tools.get_warnings_at_location)
+mcp.tool(forecast_tools.get_warning_zones_batch)
 mcp.tool(forecast_tools.get_weather_warning_history)
 mcp.tool(forecast_tools.get_special_weather_report)
 
+# Register the continuation tool of paged results
+mcp.tool(paging.get_result_page)
+
 
 def validate_api_key(api_key: str) -> bool:
     """Validate API key by making a simple API call.
@@ -92,8 +146,9 @@ def validate_api_key(api_key: str) -> bool:
         return False
 
     try:
-        # Use AWS minutely data for validation (lightweight endpoint)
-        with AWSClient(api_key) as client:
+        # Use AWS minutely data for validation (lightweight endpoint).
+        # Going through the shared pool leaves a warm connection for the first tool call.
+        with aws_client.AWSClient(api_key, http_client=get_http_client()) as client:
             # Get data from 10 minutes ago to ensure data availability
             test_time = datetime.now(UTC) - timedelta(minutes=10)
             # Test with a single station (104 = Bukgangneung)
@@ -112,21 +167,45 @@ def validate_api_key(api_key: str) -> bool:
         return False
 
 
+def _check_api_key(api_key: str) -> None:
+    """Validate the API key and log the outcome."""
+    if validate_api_key(api_key):
+        logger.info('API key is valid and working')
+    else:
+        logger.error('API key validation failed - API calls may not work properly')
+        logger.error('Please check your API key at https://apihub.kma.go.kr/')
+
+
+def start_api_key_check(api_key: str) -> threading.Thread:
+    """Validate the API key in a background thread.
+
+    The check is a network round trip, so it runs alongside the server instead
+    of delaying the first response to the client.
+
+    Args:
+        api_key: KMA API key to validate
+
+    Returns:
+        The started daemon thread
+    """
+    thread = threading.Thread(
+        target=_check_api_key, args=(api_key,), name='kma-api-key-check', daemon=True
+    )
+    thread.start()
+    return thread
+
+
 def main() -> None:
     """Initialize and run the MCP server with API key validation."""
     logger.info('Starting KMA MCP server...')
 
-    # Validate API key on startup
+    # Validate API key in the background while the server starts
     if not API_KEY:
         logger.warning('KMA_API_KEY environment variable not set')
         logger.warning('Server will start but API calls will fail')
     else:
-        logger.info('Validating API key...')
-        if validate_api_key(API_KEY):
-            logger.info('API key is valid and working')
-        else:
-            logger.error('API key validation failed - API calls may not work properly')
-            logger.error('Please check your API key at https://apihub.kma.go.kr/')
+        logger.info('Validating API key in the background...')
+        start_api_key_check(API_KEY)
 
     # Initialize and run the server
     logger.info('Server initialized successfully')
@@ -0,0 +1,16 @@
+# Generated by scripts/generate_async_stubs.py from the sync client; do not edit.
+from datetime import datetime
+from typing import Any
+
+from kma_mcp.core.client import AsyncKMAClient
+
+class AsyncRadarClient(AsyncKMAClient):
+    async def get_radar_image(
+        self, tm: str | datetime, radar_id: str = 'ALL'
+    ) -> dict[str, Any]: ...
+    async def get_radar_image_sequence(
+        self, tm1: str | datetime, tm2: str | datetime, radar_id: str = 'ALL'
+    ) -> dict[str, Any]: ...
+    async def get_radar_reflectivity(
+        self, tm: str | datetime, x: float, y: float
+    ) -> dict[str, Any]: ...
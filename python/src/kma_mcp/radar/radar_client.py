@@ -10,10 +10,10 @@ and movement for nowcasting and severe weather monitoring.
 from datetime import datetime
 from typing import Any
 
-import httpx
+from kma_mcp.core.client import KMAClient
 
 
-class RadarClient:
+class RadarClient(KMAClient):
     """Client for KMA Weather Radar API.
 
     The Weather Radar system provides real-time precipitation detection
@@ -21,50 +21,6 @@ class RadarClient:
     severe weather tracking, and precipitation analysis.
     """
 
-    BASE_URL = 'https://apihub.kma.go.kr/api/typ01/url'
-
-    def __init__(self, auth_key: str, timeout: float = 30.0) -> None:
-        """Initialize Weather Radar client.
-
-        Args:
-            auth_key: KMA API authentication key
-            timeout: Request timeout in seconds (default: 30.0)
-        """
-        self.auth_key = auth_key
-        self.timeout = timeout
-        self._client = httpx.Client(timeout=timeout)
-
-    def __enter__(self) -> 'RadarClient':
-        """Context manager entry."""
-        return self
-
-    def __exit__(self, *args: object) -> None:
-        """Context manager exit."""
-        self.close()
-
-    def close(self) -> None:
-        """Close the HTTP client."""
-        self._client.close()
-
-    def _make_request(self, endpoint: str, params: dict[str, Any]) -> dict[str, Any]:
-        """Make HTTP request to Weather Radar API.
-
-        Args:
-            endpoint: API endpoint path
-            params: Query parameters
-
-        Returns:
-            API response as dictionary
-
-        Raises:
-            httpx.HTTPError: If request fails
-        """
-        params['authKey'] = self.auth_key
-        url = f'{self.BASE_URL}/{endpoint}'
-        response = self._client.get(url, params=params)
-        response.raise_for_status()
-        return response.json()
-
     def get_radar_image(
         self,
         tm: str | datetime,
@@ -0,0 +1,17 @@
+# Generated by scripts/generate_async_stubs.py from the sync client; do not edit.
+from typing import Any
+
+from kma_mcp.core.client import AsyncKMAClient
+
+class AsyncSatelliteClient(AsyncKMAClient):
+    async def get_satellite_file_list(
+        self,
+        sat: str = 'GK2A',
+        vars: str = 'L1B',
+        area: str = 'FD',
+        fmt: str = 'NetCDF',
+        tm: str | None = None,
+    ) -> dict[str, Any]: ...
+    async def get_satellite_imagery(
+        self, level: str, product: str, area: str, tm: str
+    ) -> dict[str, Any]: ...
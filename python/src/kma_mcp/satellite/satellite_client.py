@@ -5,10 +5,10 @@ This module provides access to GK2A satellite imagery and data products.
 
 from typing import Any
 
-import httpx
+from kma_mcp.core.client import KMAClient
 
 
-class SatelliteClient:
+class SatelliteClient(KMAClient):
     """Client for accessing KMA GK2A Satellite data.
 
     Provides access to:
@@ -17,45 +17,7 @@ class SatelliteClient:
     - Various satellite imagery channels
     """
 
-    BASE_URL = 'https://apihub.kma.go.kr/api/typ01/url'
-
-    def __init__(self, auth_key: str, timeout: float = 60.0):
-        """Initialize Satellite client.
-
-        Args:
-            auth_key: KMA API authentication key
-            timeout: Request timeout in seconds (default: 60.0, longer for large files)
-        """
-        self.auth_key = auth_key
-        self._client = httpx.Client(timeout=timeout)
-
-    def __enter__(self) -> 'SatelliteClient':
-        """Context manager entry."""
-        return self
-
-    def __exit__(self, *args: object) -> None:
-        """Context manager exit."""
-        self.close()
-
-    def close(self) -> None:
-        """Close the HTTP client."""
-        self._client.close()
-
-    def _make_request(self, endpoint: str, params: dict[str, Any]) -> dict[str, Any]:
-        """Make an API request.
-
-        Args:
-            endpoint: API endpoint name
-            params: Query parameters
-
-        Returns:
-            JSON response as dictionary
-        """
-        params['authKey'] = self.auth_key
-        url = f'{self.BASE_URL}/{endpoint}'
-        response = self._client.get(url, params=params)
-        response.raise_for_status()
-        return response.json()
+    DEFAULT_TIMEOUT = 60.0
 
     def get_satellite_file_list(
         self,
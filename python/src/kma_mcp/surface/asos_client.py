@@ -5,12 +5,13 @@ ASOS (종관기상관측) API for surface weather observations.
 """
 
 from datetime import datetime
-from typing import Any, Literal
+from typing import Any, ClassVar, Literal
 
-import httpx
+from kma_mcp.core.client import KMAClient
+from kma_mcp.core.windowing import DAILY, HOURLY, PeriodSpec
 
 
-class ASOSClient:
+class ASOSClient(KMAClient):
     """Client for KMA ASOS API.
 
     The ASOS system collects atmospheric data at standardized times across all
@@ -18,49 +19,10 @@ class ASOSClient:
     wind direction/speed, solar radiation, sunshine duration, and snow depth.
     """
 
-    BASE_URL = 'https://apihub.kma.go.kr/api/typ01/url'
-
-    def __init__(self, auth_key: str, timeout: float = 30.0) -> None:
-        """Initialize ASOS client.
-
-        Args:
-            auth_key: KMA API authentication key
-            timeout: Request timeout in seconds (default: 30.0)
-        """
-        self.auth_key = auth_key
-        self.timeout = timeout
-        self._client = httpx.Client(timeout=timeout)
-
-    def __enter__(self) -> 'ASOSClient':
-        """Context manager entry."""
-        return self
-
-    def __exit__(self, *args: object) -> None:
-        """Context manager exit."""
-        self.close()
-
-    def close(self) -> None:
-        """Close the HTTP client."""
-        self._client.close()
-
-    def _make_request(self, endpoint: str, params: dict[str, Any]) -> dict[str, Any]:
-        """Make HTTP request to ASOS API.
-
-        Args:
-            endpoint: API endpoint path
-            params: Query parameters
-
-        Returns:
-            API response as dictionary
-
-        Raises:
-            httpx.HTTPError: If request fails
-        """
-        params['authKey'] = self.auth_key
-        url = f'{self.BASE_URL}/{endpoint}'
-        response = self._client.get(url, params=params)
-        response.raise_for_status()
-        return response.json()
+    TIME_SERIES: ClassVar[dict[str, PeriodSpec]] = {
+        'kma_sfctm3.php': HOURLY,
+        'kma_sfcdd3.php': DAILY,
+    }
 
     def get_hourly_data(
         self,
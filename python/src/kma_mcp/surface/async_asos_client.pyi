@@ -0,0 +1,72 @@
+# Generated by scripts/generate_async_stubs.py from the sync client; do not edit.
+from datetime import datetime
+from typing import Any, Literal
+
+from kma_mcp.core.client import AsyncKMAClient
+
+class AsyncASOSClient(AsyncKMAClient):
+    async def get_hourly_data(self, tm: str | datetime, stn: int | str = 0) -> dict[str, Any]: ...
+    async def get_hourly_period(
+        self, tm1: str | datetime, tm2: str | datetime, stn: int | str = 0
+    ) -> dict[str, Any]: ...
+    async def get_daily_data(
+        self, tm: str | datetime, stn: int | str = 0, disp: int = 0
+    ) -> dict[str, Any]: ...
+    async def get_daily_period(
+        self,
+        tm1: str | datetime,
+        tm2: str | datetime,
+        stn: int | str = 0,
+        obs: str = '',
+        mode: int = 0,
+    ) -> dict[str, Any]: ...
+    async def get_element_data(
+        self, tm1: str | datetime, tm2: str | datetime, obs: str, stn: int | str = 0
+    ) -> dict[str, Any]: ...
+    async def get_normals(
+        self,
+        norm: Literal['D', 'S', 'M', 'Y'],
+        tmst: Literal[1991, 2001, 2011, 2021],
+        mm1: int,
+        dd1: int,
+        mm2: int | None = None,
+        dd2: int | None = None,
+        stn: int | str = 0,
+    ) -> dict[str, Any]: ...
+    async def get_yearly_summary(
+        self, year: int, page_no: int = 1, num_of_rows: int = 10
+    ) -> None: ...
+    async def get_yearly_summary2(
+        self, year: int, page_no: int = 1, num_of_rows: int = 10
+    ) -> None: ...
+    async def get_avg_temp_anomaly(
+        self, year: int, page_no: int = 1, num_of_rows: int = 10
+    ) -> None: ...
+    async def get_precipitation_anomaly(
+        self, year: int, page_no: int = 1, num_of_rows: int = 10
+    ) -> None: ...
+    async def get_station_phenomenon_data(
+        self, year: int, station: int, page_no: int = 1, num_of_rows: int = 10
+    ) -> None: ...
+    async def get_station_phenomenon_data2(
+        self, year: int, station: int, page_no: int = 1, num_of_rows: int = 10
+    ) -> None: ...
+    async def get_station_phenomenon_data3(
+        self, year: int, station: int, page_no: int = 1, num_of_rows: int = 10
+    ) -> None: ...
+    async def get_monthly_note(
+        self, year: int, month: int, page_no: int = 1, num_of_rows: int = 10
+    ) -> None: ...
+    async def get_station_list_table(
+        self, year: int, month: int, page_no: int = 1, num_of_rows: int = 10
+    ) -> None: ...
+    async def get_monthly_summary(
+        self, year: int, month: int, page_no: int = 1, num_of_rows: int = 10
+    ) -> None: ...
+    async def get_monthly_summary2(
+        self, year: int, month: int, page_no: int = 1, num_of_rows: int = 10
+    ) -> None: ...
+    async def get_daily_weather_data(
+        self, year: int, month: int, station: int, page_no: int = 1, num_of_rows: int = 10
+    ) -> None: ...
+    async def get_yearly_climate_stats(self, stn: int, mm: int, dd: int) -> None: ...
@@ -0,0 +1,49 @@
+# Generated by scripts/generate_async_stubs.py from the sync client; do not edit.
+from datetime import datetime
+from typing import Any
+
+from kma_mcp.core.client import AsyncKMAClient
+
+class AsyncAWSClient(AsyncKMAClient):
+    async def get_minutely_data(
+        self,
+        tm1: str | datetime | None = None,
+        tm2: str | datetime | None = None,
+        stn: int | str = 0,
+        disp: int = 0,
+    ) -> dict[str, Any]: ...
+    async def get_land_surface_temperature(
+        self,
+        tm: str | datetime | None = None,
+        tm1: str | datetime | None = None,
+        tm2: str | datetime | None = None,
+        stn: int | str = 0,
+        disp: int = 0,
+    ) -> dict[str, Any]: ...
+    async def get_cloud_data(
+        self,
+        tm1: str | datetime | None = None,
+        tm2: str | datetime | None = None,
+        stn: int | str = 0,
+        itv: int | None = None,
+        sms: int | None = None,
+        disp: int = 0,
+    ) -> dict[str, Any]: ...
+    async def get_cloud_average(
+        self,
+        tm1: str | datetime | None = None,
+        tm2: str | datetime | None = None,
+        stn: int | str = 0,
+        itv: int = 10,
+        range_minutes: int = 10,
+        disp: int = 0,
+    ) -> dict[str, Any]: ...
+    async def get_cloud_min_max(
+        self,
+        tm1: str | datetime | None = None,
+        tm2: str | datetime | None = None,
+        stn: int | str = 0,
+        itv: int = 10,
+        range_minutes: int = 10,
+        disp: int = 0,
+    ) -> dict[str, Any]: ...
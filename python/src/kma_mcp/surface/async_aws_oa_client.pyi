@@ -0,0 +1,11 @@
+# Generated by scripts/generate_async_stubs.py from the sync client; do not edit.
+from datetime import datetime
+from typing import Any
+
+from kma_mcp.core.client import AsyncKMAClient
+
+class AsyncAWSOAClient(AsyncKMAClient):
+    async def get_analysis_data(self, tm: str | datetime, x: float, y: float) -> dict[str, Any]: ...
+    async def get_analysis_period(
+        self, tm1: str | datetime, tm2: str | datetime, x: float, y: float
+    ) -> dict[str, Any]: ...
@@ -0,0 +1,30 @@
+# Generated by scripts/generate_async_stubs.py from the sync client; do not edit.
+from typing import Any
+
+from kma_mcp.core.client import AsyncKMAClient
+
+class AsyncClimateClient(AsyncKMAClient):
+    async def get_daily_normals(
+        self, start_month: int, start_day: int, end_month: int, end_day: int, stn: int | str = 0
+    ) -> dict[str, Any]: ...
+    async def get_ten_day_normals(
+        self,
+        start_month: int,
+        start_period: int,
+        end_month: int,
+        end_period: int,
+        stn: int | str = 0,
+    ) -> dict[str, Any]: ...
+    async def get_monthly_normals(
+        self, start_month: int, end_month: int, stn: int | str = 0
+    ) -> dict[str, Any]: ...
+    async def get_annual_normals(self, stn: int | str = 0) -> dict[str, Any]: ...
+    async def get_normals_by_period(
+        self,
+        period_type: str,
+        start_month: int | None = None,
+        start_day: int | None = None,
+        end_month: int | None = None,
+        end_day: int | None = None,
+        stn: int | str = 0,
+    ) -> dict[str, Any]: ...
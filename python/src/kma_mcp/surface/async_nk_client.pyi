@@ -0,0 +1,15 @@
+# Generated by scripts/generate_async_stubs.py from the sync client; do not edit.
+from datetime import datetime
+from typing import Any
+
+from kma_mcp.core.client import AsyncKMAClient
+
+class AsyncNKClient(AsyncKMAClient):
+    async def get_hourly_data(self, tm: str | datetime, stn: int | str = 0) -> dict[str, Any]: ...
+    async def get_hourly_period(
+        self, tm1: str | datetime, tm2: str | datetime, stn: int | str = 0
+    ) -> dict[str, Any]: ...
+    async def get_daily_data(self, tm: str | datetime, stn: int | str = 0) -> dict[str, Any]: ...
+    async def get_daily_period(
+        self, tm1: str | datetime, tm2: str | datetime, stn: int | str = 0
+    ) -> dict[str, Any]: ...
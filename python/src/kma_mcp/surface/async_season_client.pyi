@@ -0,0 +1,10 @@
+# Generated by scripts/generate_async_stubs.py from the sync client; do not edit.
+from typing import Any
+
+from kma_mcp.core.client import AsyncKMAClient
+
+class AsyncSeasonClient(AsyncKMAClient):
+    async def get_observation_data(self, year: int | str, stn: int | str = 0) -> dict[str, Any]: ...
+    async def get_observation_period(
+        self, start_year: int | str, end_year: int | str, stn: int | str = 0
+    ) -> dict[str, Any]: ...
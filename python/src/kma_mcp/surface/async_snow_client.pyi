@@ -0,0 +1,21 @@
+# Generated by scripts/generate_async_stubs.py from the sync client; do not edit.
+from datetime import datetime
+from typing import Any, Literal
+
+from kma_mcp.core.client import AsyncKMAClient
+
+class AsyncSnowClient(AsyncKMAClient):
+    async def get_snow_depth(
+        self, tm: str | datetime, sd_type: Literal['tot', 'day', '3hr', '24h'] = 'tot'
+    ) -> dict[str, Any]: ...
+    async def get_snow_period(
+        self, tm: str | datetime, tm_st: str | datetime, snow: int = 0
+    ) -> dict[str, Any]: ...
+    async def get_max_snow_depth(
+        self,
+        tm: str | datetime,
+        tm_st: str | datetime,
+        sd_type: Literal['tot', 'day'] = 'tot',
+        stn: int | str = 0,
+        snow: int = 0,
+    ) -> dict[str, Any]: ...
@@ -0,0 +1,8 @@
+# Generated by scripts/generate_async_stubs.py from the sync client; do not edit.
+from typing import Any
+
+from kma_mcp.core.client import AsyncKMAClient
+
+class AsyncStationClient(AsyncKMAClient):
+    async def get_asos_stations(self, stn: int | str = 0) -> dict[str, Any]: ...
+    async def get_aws_stations(self, stn: int | str = 0) -> dict[str, Any]: ...
@@ -0,0 +1,10 @@
+# Generated by scripts/generate_async_stubs.py from the sync client; do not edit.
+from datetime import datetime
+from typing import Any
+
+from kma_mcp.core.client import AsyncKMAClient
+
+class AsyncUVClient(AsyncKMAClient):
+    async def get_observation_data(
+        self, tm: str | datetime, stn: int | str = 0
+    ) -> dict[str, Any]: ...
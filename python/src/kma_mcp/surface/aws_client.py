@@ -8,12 +8,13 @@ disaster prevention and monitoring, with more stations than ASOS.
 """
 
 from datetime import datetime
-from typing import Any
+from typing import Any, ClassVar
 
-import httpx
+from kma_mcp.core.client import KMAClient
+from kma_mcp.core.windowing import MINUTELY, PeriodSpec
 
 
-class AWSClient:
+class AWSClient(KMAClient):
     """Client for KMA AWS API.
 
     The AWS system provides real-time weather observations from automated weather
@@ -21,54 +22,7 @@ class AWSClient:
     points than ASOS and focuses on real-time monitoring.
     """
 
-    BASE_URL = 'https://apihub.kma.go.kr/api/typ01/url'
-    CGI_BASE_URL = 'https://apihub.kma.go.kr/api/typ01/cgi-bin/url'
-
-    def __init__(self, auth_key: str, timeout: float = 30.0) -> None:
-        """Initialize AWS client.
-
-        Args:
-            auth_key: KMA API authentication key
-            timeout: Request timeout in seconds (default: 30.0)
-        """
-        self.auth_key = auth_key
-        self.timeout = timeout
-        self._client = httpx.Client(timeout=timeout)
-
-    def __enter__(self) -> 'AWSClient':
-        """Context manager entry."""
-        return self
-
-    def __exit__(self, *args: object) -> None:
-        """Context manager exit."""
-        self.close()
-
-    def close(self) -> None:
-        """Close the HTTP client."""
-        self._client.close()
-
-    def _make_request(
-        self, endpoint: str, params: dict[str, Any], *, use_cgi: bool = False
-    ) -> dict[str, Any]:
-        """Make HTTP request to AWS API.
-
-        Args:
-            endpoint: API endpoint path
-            params: Query parameters
-            use_cgi: Use CGI base URL instead of regular URL (default: False)
-
-        Returns:
-            API response as dictionary
-
-        Raises:
-            httpx.HTTPError: If request fails
-        """
-        params['authKey'] = self.auth_key
-        base_url = self.CGI_BASE_URL if use_cgi else self.BASE_URL
-        url = f'{base_url}/{endpoint}'
-        response = self._client.get(url, params=params)
-        response.raise_for_status()
-        return response.json()
+    TIME_SERIES: ClassVar[dict[str, PeriodSpec]] = {'nph-aws2_min': MINUTELY}
 
     def get_minutely_data(
         self,
@@ -114,7 +68,7 @@ class AWSClient:
                 tm2 = tm2.strftime('%Y%m%d%H%M')
             params['tm2'] = tm2
 
-        return self._make_request('nph-aws2_min', params, use_cgi=True)
+        return self._make_request('nph-aws2_min', params, base_url=self.CGI_BASE_URL)
 
     def get_land_surface_temperature(
         self,
@@ -160,7 +114,7 @@ class AWSClient:
                 tm2 = tm2.strftime('%Y%m%d%H%M')
             params['tm2'] = tm2
 
-        return self._make_request('nph-aws2_min_lst', params, use_cgi=True)
+        return self._make_request('nph-aws2_min_lst', params, base_url=self.CGI_BASE_URL)
 
     def get_cloud_data(
         self,
@@ -209,7 +163,7 @@ class AWSClient:
         if sms is not None:
             params['sms'] = str(sms)
 
-        return self._make_request('nph-aws2_min_cloud', params, use_cgi=True)
+        return self._make_request('nph-aws2_min_cloud', params, base_url=self.CGI_BASE_URL)
 
     def get_cloud_average(
         self,
@@ -258,7 +212,7 @@ class AWSClient:
                 tm2 = tm2.strftime('%Y%m%d%H%M')
             params['tm2'] = tm2
 
-        return self._make_request('nph-aws2_min_ca2', params, use_cgi=True)
+        return self._make_request('nph-aws2_min_ca2', params, base_url=self.CGI_BASE_URL)
 
     def get_cloud_min_max(
         self,
@@ -307,4 +261,4 @@ class AWSClient:
                 tm2 = tm2.strftime('%Y%m%d%H%M')
             params['tm2'] = tm2
 
-        return self._make_request('nph-aws2_min_ca3', params, use_cgi=True)
+        return self._make_request('nph-aws2_min_ca3', params, base_url=self.CGI_BASE_URL)
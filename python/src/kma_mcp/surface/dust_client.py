@@ -8,12 +8,13 @@ concentrations for air quality assessment and public health alerts.
 """
 
 from datetime import datetime
-from typing import Any
+from typing import Any, ClassVar
 
-import httpx
+from kma_mcp.core.client import KMAClient
+from kma_mcp.core.windowing import DAILY, HOURLY, PeriodSpec
 
 
-class DustClient:
+class DustClient(KMAClient):
     """Client for KMA Yellow Dust (PM10) Observation API.
 
     The Yellow Dust observation system monitors PM10 particulate matter
@@ -21,49 +22,10 @@ class DustClient:
     critical air quality data for public health protection.
     """
 
-    BASE_URL = 'https://apihub.kma.go.kr/api/typ01/url'
-
-    def __init__(self, auth_key: str, timeout: float = 30.0) -> None:
-        """Initialize Yellow Dust client.
-
-        Args:
-            auth_key: KMA API authentication key
-            timeout: Request timeout in seconds (default: 30.0)
-        """
-        self.auth_key = auth_key
-        self.timeout = timeout
-        self._client = httpx.Client(timeout=timeout)
-
-    def __enter__(self) -> 'DustClient':
-        """Context manager entry."""
-        return self
-
-    def __exit__(self, *args: object) -> None:
-        """Context manager exit."""
-        self.close()
-
-    def close(self) -> None:
-        """Close the HTTP client."""
-        self._client.close()
-
-    def _make_request(self, endpoint: str, params: dict[str, Any]) -> dict[str, Any]:
-        """Make HTTP request to Yellow Dust API.
-
-        Args:
-            endpoint: API endpoint path
-            params: Query parameters
-
-        Returns:
-            API response as dictionary
-
-        Raises:
-            httpx.HTTPError: If request fails
-        """
-        params['authKey'] = self.auth_key
-        url = f'{self.BASE_URL}/{endpoint}'
-        response = self._client.get(url, params=params)
-        response.raise_for_status()
-        return response.json()
+    TIME_SERIES: ClassVar[dict[str, PeriodSpec]] = {
+        'kma_pm10_2.php': HOURLY,
+        'kma_pm10_day2.php': DAILY,
+    }
 
     def get_hourly_data(
         self,
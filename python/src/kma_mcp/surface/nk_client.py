@@ -8,12 +8,13 @@ in North Korea for regional weather analysis and monitoring.
 """
 
 from datetime import datetime
-from typing import Any
+from typing import Any, ClassVar
 
-import httpx
+from kma_mcp.core.client import KMAClient
+from kma_mcp.core.windowing import DAILY, HOURLY, PeriodSpec
 
 
-class NKClient:
+class NKClient(KMAClient):
     """Client for KMA North Korea Meteorological Observation API.
 
     The North Korea observation system provides meteorological data
@@ -21,49 +22,10 @@ class NKClient:
     forecasting, and cross-border weather monitoring.
     """
 
-    BASE_URL = 'https://apihub.kma.go.kr/api/typ01/url'
-
-    def __init__(self, auth_key: str, timeout: float = 30.0) -> None:
-        """Initialize North Korea Meteorological client.
-
-        Args:
-            auth_key: KMA API authentication key
-            timeout: Request timeout in seconds (default: 30.0)
-        """
-        self.auth_key = auth_key
-        self.timeout = timeout
-        self._client = httpx.Client(timeout=timeout)
-
-    def __enter__(self) -> 'NKClient':
-        """Context manager entry."""
-        return self
-
-    def __exit__(self, *args: object) -> None:
-        """Context manager exit."""
-        self.close()
-
-    def close(self) -> None:
-        """Close the HTTP client."""
-        self._client.close()
-
-    def _make_request(self, endpoint: str, params: dict[str, Any]) -> dict[str, Any]:
-        """Make HTTP request to North Korea Meteorological API.
-
-        Args:
-            endpoint: API endpoint path
-            params: Query parameters
-
-        Returns:
-            API response as dictionary
-
-        Raises:
-            httpx.HTTPError: If request fails
-        """
-        params['authKey'] = self.auth_key
-        url = f'{self.BASE_URL}/{endpoint}'
-        response = self._client.get(url, params=params)
-        response.raise_for_status()
-        return response.json()
+    TIME_SERIES: ClassVar[dict[str, PeriodSpec]] = {
+        'kma_nkobs_2.php': HOURLY,
+        'kma_nkobs_day2.php': DAILY,
+    }
 
     def get_hourly_data(
         self,
@@ -10,10 +10,10 @@ analysis, transportation safety, and disaster prevention.
 from datetime import datetime
 from typing import Any, Literal
 
-import httpx
+from kma_mcp.core.client import KMAClient
 
 
-class SnowClient:
+class SnowClient(KMAClient):
     """Client for KMA Snow Depth Observation API.
 
     The snow depth observation system monitors snow accumulation
@@ -27,50 +27,6 @@ class SnowClient:
         - 24h: 24-hour new snow (24시간 신적설)
     """
 
-    BASE_URL = 'https://apihub.kma.go.kr/api/typ01/url'
-
-    def __init__(self, auth_key: str, timeout: float = 30.0) -> None:
-        """Initialize Snow Depth client.
-
-        Args:
-            auth_key: KMA API authentication key
-            timeout: Request timeout in seconds (default: 30.0)
-        """
-        self.auth_key = auth_key
-        self.timeout = timeout
-        self._client = httpx.Client(timeout=timeout)
-
-    def __enter__(self) -> 'SnowClient':
-        """Context manager entry."""
-        return self
-
-    def __exit__(self, *args: object) -> None:
-        """Context manager exit."""
-        self.close()
-
-    def close(self) -> None:
-        """Close the HTTP client."""
-        self._client.close()
-
-    def _make_request(self, endpoint: str, params: dict[str, Any]) -> dict[str, Any]:
-        """Make HTTP request to Snow Depth API.
-
-        Args:
-            endpoint: API endpoint path
-            params: Query parameters
-
-        Returns:
-            API response as dictionary
-
-        Raises:
-            httpx.HTTPError: If request fails
-        """
-        params['authKey'] = self.auth_key
-        url = f'{self.BASE_URL}/{endpoint}'
-        response = self._client.get(url, params=params)
-        response.raise_for_status()
-        return response.json()
-
     def get_snow_depth(
         self,
         tm: str | datetime,
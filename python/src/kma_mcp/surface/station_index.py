@@ -0,0 +1,334 @@
+"""In-memory station index with nearest-neighbour and radius queries.
+
+The ASOS and AWS station lists (``kma_stnlist.php``, ``kma_aws_stnlist.php``)
+are downloaded once and kept as compact NumPy arrays (ID, latitude,
+longitude, altitude, station type, active flag). Stations are stored as unit
+vectors on the sphere, so nearest-N and radius queries are a single
+vectorized distance computation over at most a few thousand points, which
+answers in microseconds without any upstream call.
+
+Example:
+    >>> from kma_mcp.surface.station_client import StationClient
+    >>> from kma_mcp.surface.station_index import StationIndex
+    >>> with StationClient('your_auth_key') as client:
+    ...     index = StationIndex.from_responses(
+    ...         asos=client.get_asos_stations(), aws=client.get_aws_stations()
+    ...     )
+    >>> index.nearest(37.5665, 126.9780, count=3)
+    [{'station_id': 108, 'name': '서울', 'type': 'ASOS', 'distance_km': 0.9, ...}, ...]
+"""
+
+from collections.abc import Mapping
+from datetime import datetime
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+from kma_mcp.core.columnar import to_frame
+
+EARTH_RADIUS_KM = 6371.0088
+
+STATION_TYPES = ('ASOS', 'AWS')
+
+_NAME_COLUMNS = ('STN_KO', 'STN_NM', 'STN_NAME', 'NAME')
+_LAW_COLUMNS = ('LAW_ID', 'LAW_CD')
+
+# Province (시도) of the first two digits of a legal district code (법정동코드)
+PROVINCES = {
+    '11': '서울',
+    '26': '부산',
+    '27': '대구',
+    '28': '인천',
+    '29': '광주',
+    '30': '대전',
+    '31': '울산',
+    '36': '세종',
+    '41': '경기',
+    '42': '강원',
+    '43': '충북',
+    '44': '충남',
+    '45': '전북',
+    '46': '전남',
+    '47': '경북',
+    '48': '경남',
+    '50': '제주',
+    '51': '강원',
+    '52': '전북',
+}
+_END_COLUMNS = ('TM_ED', 'ED_TM', 'END_TM')
+
+
+def _find(names: list[str], exact: tuple[str, ...], prefixes: tuple[str, ...] = ()) -> str | None:
+    upper = {name.upper(): name for name in names}
+    for candidate in exact:
+        if candidate in upper:
+            return upper[candidate]
+    for name in names:
+        if prefixes and name.upper().startswith(prefixes):
+            return name
+    return None
+
+
+def unit_vectors(lat: npt.ArrayLike, lon: npt.ArrayLike) -> npt.NDArray[np.float64]:
+    """Convert latitudes and longitudes in degrees to unit vectors on the sphere."""
+    lat_rad = np.radians(np.asarray(lat, dtype=np.float64))
+    lon_rad = np.radians(np.asarray(lon, dtype=np.float64))
+    cos_lat = np.cos(lat_rad)
+    return np.stack(
+        [cos_lat * np.cos(lon_rad), cos_lat * np.sin(lon_rad), np.sin(lat_rad)], axis=-1
+    )
+
+
+def chord_to_km(chord: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+    """Convert the chord length between unit vectors to a great-circle distance in km."""
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.clip(chord / 2, 0.0, 1.0))
+
+
+class StationIndex:
+    """Station metadata as columnar arrays with spatial queries."""
+
+    def __init__(
+        self,
+        station_ids: npt.ArrayLike,
+        latitudes: npt.ArrayLike,
+        longitudes: npt.ArrayLike,
+        *,
+        altitudes: npt.ArrayLike | None = None,
+        names: npt.ArrayLike | None = None,
+        types: npt.ArrayLike | None = None,
+        active: npt.ArrayLike | None = None,
+        regions: npt.ArrayLike | None = None,
+    ) -> None:
+        """Initialize the index from equal-length arrays.
+
+        Args:
+            station_ids: Station IDs
+            latitudes: Latitudes in degrees
+            longitudes: Longitudes in degrees
+            altitudes: Altitudes in metres (NaN if unknown)
+            names: Station names
+            types: Station type of each station ('ASOS' or 'AWS')
+            active: Whether each station is still operating
+            regions: Province of each station ('' if unknown)
+        """
+        self.station_ids = np.asarray(station_ids, dtype=np.int64)
+        self.latitudes = np.asarray(latitudes, dtype=np.float64)
+        self.longitudes = np.asarray(longitudes, dtype=np.float64)
+        size = len(self.station_ids)
+        self.altitudes = (
+            np.full(size, np.nan) if altitudes is None else np.asarray(altitudes, dtype=np.float64)
+        )
+        self.names = np.full(size, '', dtype=object) if names is None else np.asarray(names, object)
+        self.types = np.full(size, 'ASOS', dtype=object) if types is None else np.asarray(types)
+        self.active = np.ones(size, dtype=bool) if active is None else np.asarray(active, bool)
+        self.regions = (
+            np.full(size, '', dtype=object) if regions is None else np.asarray(regions, object)
+        )
+        self._vectors = unit_vectors(self.latitudes, self.longitudes)
+
+    @classmethod
+    def from_response(
+        cls,
+        data: Mapping[str, Any],
+        station_type: str = 'ASOS',
+        *,
+        now: datetime | None = None,
+    ) -> 'StationIndex':
+        """Build an index from a station list response.
+
+        Args:
+            data: Response of ``get_asos_stations`` or ``get_aws_stations``
+            station_type: Type recorded for every station in the response
+            now: Time used to decide whether a station has closed (default: now)
+
+        Returns:
+            Index of the stations that have coordinates
+        """
+        frame = to_frame(data)
+        columns = frame.columns
+        stn = frame.station_column
+        lat = _find(columns, ('LAT',), ('LAT',))
+        lon = _find(columns, ('LON',), ('LON',))
+        if stn is None or lat is None or lon is None:
+            msg = f'Station list has no station/latitude/longitude columns: {columns}'
+            raise ValueError(msg)
+
+        latitudes = frame[lat].astype(np.float64)
+        longitudes = frame[lon].astype(np.float64)
+        valid = np.isfinite(latitudes) & np.isfinite(longitudes)
+
+        altitude = _find(columns, ('HT', 'ALT', 'HGT'), ('HT', 'ALT'))
+        name = _find(columns, _NAME_COLUMNS)
+        end = _find(columns, _END_COLUMNS)
+        law = _find(columns, _LAW_COLUMNS)
+        active = np.ones(len(frame), dtype=bool)
+        if end is not None:
+            # Closed stations carry the end of their operating period
+            now = now or datetime.now()  # noqa: DTZ005
+            ends = frame[end]
+            if ends.dtype.kind == 'M':
+                active = np.isnat(ends) | (ends >= np.datetime64(now.replace(tzinfo=None), 's'))
+            else:
+                today = int(now.strftime('%Y%m%d'))
+                end_dates = [str(value)[:8] for value in ends]
+                active = np.array(
+                    [not value.isdigit() or int(value) >= today for value in end_dates],
+                    dtype=bool,
+                )
+
+        regions = None
+        if law is not None:
+            regions = [PROVINCES.get(str(code)[:2], '') for code in frame[law][valid].tolist()]
+
+        return cls(
+            frame[stn][valid],
+            latitudes[valid],
+            longitudes[valid],
+            altitudes=None if altitude is None else frame[altitude].astype(np.float64)[valid],
+            names=None if name is None else frame[name][valid],
+            types=np.full(int(valid.sum()), station_type, dtype=object),
+            active=active[valid],
+            regions=regions,
+        )
+
+    @classmethod
+    def from_responses(
+        cls,
+        *,
+        asos: Mapping[str, Any] | None = None,
+        aws: Mapping[str, Any] | None = None,
+    ) -> 'StationIndex':
+        """Build one index from the ASOS and AWS station list responses.
+
+        Args:
+            asos: Response of ``get_asos_stations``
+            aws: Response of ``get_aws_stations``
+
+        Returns:
+            Combined index
+        """
+        parts = [
+            cls.from_response(data, station_type)
+            for data, station_type in ((asos, 'ASOS'), (aws, 'AWS'))
+            if data is not None
+        ]
+        return cls.concat(parts)
+
+    @classmethod
+    def concat(cls, indexes: list['StationIndex']) -> 'StationIndex':
+        """Concatenate several indexes into one."""
+        if not indexes:
+            return cls([], [], [])
+        return cls(
+            np.concatenate([index.station_ids for index in indexes]),
+            np.concatenate([index.latitudes for index in indexes]),
+            np.concatenate([index.longitudes for index in indexes]),
+            altitudes=np.concatenate([index.altitudes for index in indexes]),
+            names=np.concatenate([index.names for index in indexes]),
+            types=np.concatenate([index.types for index in indexes]),
+            active=np.concatenate([index.active for index in indexes]),
+            regions=np.concatenate([index.regions for index in indexes]),
+        )
+
+    def __len__(self) -> int:
+        """Return the number of stations."""
+        return len(self.station_ids)
+
+    def region_map(self) -> dict[int, str]:
+        """Return the province of every station whose province is known."""
+        return {
+            int(stn): region
+            for stn, region in zip(self.station_ids.tolist(), self.regions.tolist(), strict=True)
+            if region
+        }
+
+    def _candidates(self, station_type: str | None, *, active_only: bool) -> npt.NDArray[np.intp]:
+        mask = np.ones(len(self), dtype=bool)
+        if station_type is not None:
+            mask &= self.types == station_type.upper()
+        if active_only:
+            mask &= self.active
+        return np.flatnonzero(mask)
+
+    def _describe(
+        self, rows: npt.NDArray[np.intp], distances: npt.NDArray[np.float64]
+    ) -> list[dict[str, Any]]:
+        return [
+            {
+                'station_id': int(self.station_ids[row]),
+                'name': self.names[row],
+                'type': self.types[row],
+                'latitude': float(self.latitudes[row]),
+                'longitude': float(self.longitudes[row]),
+                'altitude_m': None if np.isnan(self.altitudes[row]) else float(self.altitudes[row]),
+                'active': bool(self.active[row]),
+                'distance_km': round(float(distance), 3),
+            }
+            for row, distance in zip(rows, distances, strict=True)
+        ]
+
+    def _distances(
+        self, rows: npt.NDArray[np.intp], lat: float, lon: float
+    ) -> npt.NDArray[np.float64]:
+        chord = np.linalg.norm(self._vectors[rows] - unit_vectors(lat, lon), axis=1)
+        return chord_to_km(chord)
+
+    def nearest(
+        self,
+        lat: float,
+        lon: float,
+        count: int = 5,
+        *,
+        station_type: str | None = None,
+        active_only: bool = True,
+    ) -> list[dict[str, Any]]:
+        """Find the stations closest to a point.
+
+        Args:
+            lat: Latitude in degrees
+            lon: Longitude in degrees
+            count: Number of stations to return
+            station_type: Restrict to 'ASOS' or 'AWS' stations (None for both)
+            active_only: Skip stations that have closed
+
+        Returns:
+            Stations ordered by great-circle distance, nearest first
+        """
+        rows = self._candidates(station_type, active_only=active_only)
+        if count <= 0 or not len(rows):
+            return []
+        distances = self._distances(rows, lat, lon)
+        if count < len(rows):
+            best = np.argpartition(distances, count - 1)[:count]
+            rows, distances = rows[best], distances[best]
+        order = np.argsort(distances, kind='stable')
+        return self._describe(rows[order], distances[order])
+
+    def within(
+        self,
+        lat: float,
+        lon: float,
+        radius_km: float,
+        *,
+        station_type: str | None = None,
+        active_only: bool = True,
+    ) -> list[dict[str, Any]]:
+        """Find all stations within a radius of a point.
+
+        Args:
+            lat: Latitude in degrees
+            lon: Longitude in degrees
+            radius_km: Search radius in kilometres
+            station_type: Restrict to 'ASOS' or 'AWS' stations (None for both)
+            active_only: Skip stations that have closed
+
+        Returns:
+            Stations inside the radius, nearest first
+        """
+        rows = self._candidates(station_type, active_only=active_only)
+        distances = self._distances(rows, lat, lon)
+        inside = distances <= radius_km
+        rows, distances = rows[inside], distances[inside]
+        order = np.argsort(distances, kind='stable')
+        return self._describe(rows[order], distances[order])
@@ -4,12 +4,33 @@ This module contains async tool functions for weather forecasts and warnings inc
 - Short-term forecasts (up to 3 days)
 - Medium-term forecasts (3-10 days)
 - Weekly forecasts
-- Weather warnings and alerts
+- Weather warnings and alerts, their changes, and warnings by location
 - Special weather reports
 """
 
-from kma_mcp.forecast.async_forecast_client import AsyncForecastClient
-from kma_mcp.forecast.async_warning_client import AsyncWarningClient
+import asyncio
+from typing import TYPE_CHECKING
+
+from kma_mcp.core.lazy import lazy_module
+from kma_mcp.core.transport import get_async_http_client
+from kma_mcp.tools.memo import DAILY, MINUTELY, clear_caches, memoize
+from kma_mcp.tools.paging import paginate
+
+if TYPE_CHECKING:
+    from kma_mcp.forecast.zones import ZoneIndex
+
+# Client modules are imported on first tool call, not at server start-up
+async_forecast_client = lazy_module('kma_mcp.forecast.async_forecast_client')
+async_warning_client = lazy_module('kma_mcp.forecast.async_warning_client')
+issuance = lazy_module('kma_mcp.forecast.issuance')
+point_forecasts = lazy_module('kma_mcp.forecast.points')
+projection = lazy_module('kma_mcp.forecast.projection')
+warning_events = lazy_module('kma_mcp.forecast.warning_events')
+zones = lazy_module('kma_mcp.forecast.zones')
+
+# Warning zones are located through the AWS station list
+async_station_client = lazy_module('kma_mcp.surface.async_station_client')
+station_index = lazy_module('kma_mcp.surface.station_index')
 
 # API key will be set by the main server
 API_KEY: str = ''
@@ -19,6 +40,7 @@ def set_api_key(api_key: str) -> None:
     """Set the API key for all tools in this module."""
     global API_KEY
     API_KEY = api_key
+    clear_caches()
 
 
 # ============================================================================
@@ -26,7 +48,13 @@ def set_api_key(api_key: str) -> None:
 # ============================================================================
 
 
-async def get_short_term_forecast(forecast_time: str, region_code: str | None = None) -> str:
+async def get_short_term_forecast(
+    forecast_time: str,
+    region_code: str | None = None,
+    fields: list[str] | None = None,
+    output_format: str = 'jsonl',
+    digits: int | None = None,
+) -> str:
     """Get short-term weather forecast (up to 3 days) by region.
 
     Provides weather predictions for the next 3 days including
@@ -35,22 +63,33 @@ async def get_short_term_forecast(forecast_time: str, region_code: str | None =
     Args:
         forecast_time: Forecast time in 'YYYYMMDDHHmm' format (e.g., '202501011200')
         region_code: Forecast region code (None for all regions)
+        fields: Columns to return, e.g. ['REG_ID', 'REG_NAME'] (default: all columns)
+        output_format: 'jsonl' (default), or 'csv' / 'tsv' for a compact table with one header
+        digits: Round decimal values to this many digits (default: as reported)
 
     Returns:
-        Short-term weather forecast in JSON format
+        Short-term weather forecast
     """
     if not API_KEY:
         return 'Error: KMA_API_KEY environment variable not set'
 
     try:
-        async with AsyncForecastClient(API_KEY) as client:
+        async with async_forecast_client.AsyncForecastClient(
+            API_KEY, http_client=get_async_http_client()
+        ) as client:
             data = await client.get_short_term_region(tmfc=forecast_time, reg=region_code)
-            return str(data)
+            return paginate(data, fields=fields, output_format=output_format, digits=digits)
     except Exception as e:  # noqa: BLE001
         return f'Error fetching short-term forecast: {e!s}'
 
 
-async def get_medium_term_forecast(forecast_time: str, region_code: str | None = None) -> str:
+async def get_medium_term_forecast(
+    forecast_time: str,
+    region_code: str | None = None,
+    fields: list[str] | None = None,
+    output_format: str = 'jsonl',
+    digits: int | None = None,
+) -> str:
     """Get medium-term weather forecast (3-10 days) by region.
 
     Provides weather predictions for 3-10 days ahead including
@@ -59,22 +98,33 @@ async def get_medium_term_forecast(forecast_time: str, region_code: str | None =
     Args:
         forecast_time: Forecast time in 'YYYYMMDDHHmm' format (e.g., '202501011200')
         region_code: Forecast region code (None for all regions)
+        fields: Columns to return, e.g. ['REG_ID', 'REG_NAME'] (default: all columns)
+        output_format: 'jsonl' (default), or 'csv' / 'tsv' for a compact table with one header
+        digits: Round decimal values to this many digits (default: as reported)
 
     Returns:
-        Medium-term weather forecast in JSON format
+        Medium-term weather forecast
     """
     if not API_KEY:
         return 'Error: KMA_API_KEY environment variable not set'
 
     try:
-        async with AsyncForecastClient(API_KEY) as client:
+        async with async_forecast_client.AsyncForecastClient(
+            API_KEY, http_client=get_async_http_client()
+        ) as client:
             data = await client.get_medium_term_region(tmfc=forecast_time, reg=region_code)
-            return str(data)
+            return paginate(data, fields=fields, output_format=output_format, digits=digits)
     except Exception as e:  # noqa: BLE001
         return f'Error fetching medium-term forecast: {e!s}'
 
 
-async def get_short_term_overview(forecast_time: str, region_code: str | None = None) -> str:
+async def get_short_term_overview(
+    forecast_time: str,
+    region_code: str | None = None,
+    fields: list[str] | None = None,
+    output_format: str = 'jsonl',
+    digits: int | None = None,
+) -> str:
     """Get short-term weather overview.
 
     Provides overview of short-term weather forecast.
@@ -82,27 +132,137 @@ async def get_short_term_overview(forecast_time: str, region_code: str | None =
     Args:
         forecast_time: Forecast time in 'YYYYMMDDHHmm' format (e.g., '202501011200')
         region_code: Forecast region code (None for all regions)
+        fields: Columns to return, as named in the response header (default: all columns)
+        output_format: 'jsonl' (default), or 'csv' / 'tsv' for a compact table with one header
+        digits: Round decimal values to this many digits (default: as reported)
 
     Returns:
-        Short-term weather overview in JSON format
+        Short-term weather overview
     """
     if not API_KEY:
         return 'Error: KMA_API_KEY environment variable not set'
 
     try:
-        async with AsyncForecastClient(API_KEY) as client:
+        async with async_forecast_client.AsyncForecastClient(
+            API_KEY, http_client=get_async_http_client()
+        ) as client:
             data = await client.get_short_term_overview(tmfc=forecast_time, reg=region_code)
-            return str(data)
+            return paginate(data, fields=fields, output_format=output_format, digits=digits)
     except Exception as e:  # noqa: BLE001
         return f'Error fetching short-term overview: {e!s}'
 
 
+async def get_village_forecast_by_location(
+    latitude: float,
+    longitude: float,
+    base_date: str | None = None,
+    base_time: str | None = None,
+    fields: list[str] | None = None,
+    output_format: str = 'jsonl',
+    digits: int | None = None,
+) -> str:
+    """Get the village forecast (up to 3 days) for a latitude/longitude.
+
+    The location is converted to its 5 km village forecast grid cell locally,
+    so only the forecast itself is requested from the API.
+
+    Args:
+        latitude: Latitude in degrees (e.g., 37.5665)
+        longitude: Longitude in degrees (e.g., 126.9780)
+        base_date: Issue date in 'YYYYMMDD' format (None for the latest issue)
+        base_time: Issue time in 'HHmm' format, one of 0200, 0500, ..., 2300
+            (None for the latest issue)
+        fields: Columns to return, e.g. ['category', 'fcstTime', 'fcstValue'] (default: all columns)
+        output_format: 'jsonl' (default), or 'csv' / 'tsv' for a compact table with one header
+        digits: Round decimal values to this many digits (default: as reported)
+
+    Returns:
+        Village forecast for the grid cell containing the location
+    """
+    if not API_KEY:
+        return 'Error: KMA_API_KEY environment variable not set'
+
+    nx, ny = projection.latlon_to_grid(latitude, longitude)
+    if not projection.in_grid(nx, ny):
+        return f'Error: location ({latitude}, {longitude}) is outside the forecast grid'
+    if base_date is None or base_time is None:
+        latest_date, latest_time = issuance.latest_village_base()
+        base_date, base_time = base_date or latest_date, base_time or latest_time
+
+    try:
+        async with async_forecast_client.AsyncForecastClient(
+            API_KEY, http_client=get_async_http_client()
+        ) as client:
+            data = await client.get_village_forecast(
+                base_date=base_date, base_time=base_time, nx=nx, ny=ny
+            )
+            return paginate(data, fields=fields, output_format=output_format, digits=digits)
+    except Exception as e:  # noqa: BLE001
+        return f'Error fetching village forecast: {e!s}'
+
+
+async def get_village_forecast_batch(
+    points: list[list[float]],
+    forecast_time: str | None = None,
+    variables: str = 'TMP,POP,PTY,SKY',
+    hours: int = 12,
+    fields: list[str] | None = None,
+    output_format: str = 'jsonl',
+    digits: int | None = None,
+) -> str:
+    """Get hourly village forecasts for many locations at once.
+
+    Locations are grouped by their 5 km forecast grid cell and each forecast
+    grid is downloaded once, so the number of upstream requests depends on
+    the variables and hours requested, not on the number of locations.
+
+    Args:
+        points: List of [latitude, longitude] pairs (e.g., [[37.5665, 126.9780]])
+        forecast_time: Issue time in 'YYYYMMDDHHmm' format (None for the latest issue)
+        variables: Comma-separated forecast variables. TMP(temperature),
+            POP(precipitation probability), PTY(precipitation type), SKY(sky condition),
+            PCP(1h precipitation), REH(humidity), WSD(wind speed), VEC(wind direction)
+        hours: Number of hourly forecasts after the issue time (1 ~ 72)
+        fields: Columns to return, e.g. ['latitude', 'tmef', 'TMP'] (default: all columns)
+        output_format: 'jsonl' (default), or 'csv' / 'tsv' for a compact table with one header
+        digits: Round decimal values to this many digits (default: as reported)
+
+    Returns:
+        Per-location forecast time series
+    """
+    if not API_KEY:
+        return 'Error: KMA_API_KEY environment variable not set'
+    if not 1 <= hours <= 72:
+        return f'Error: hours must be between 1 and 72, got: {hours}'
+
+    try:
+        async with async_forecast_client.AsyncForecastClient(
+            API_KEY, http_client=get_async_http_client()
+        ) as client:
+            data = await point_forecasts.aforecast_points(
+                client,
+                points,
+                tmfc=forecast_time,
+                variables=[var.strip() for var in variables.split(',') if var.strip()],
+                hours=hours,
+            )
+            return paginate(data, fields=fields, output_format=output_format, digits=digits)
+    except Exception as e:  # noqa: BLE001
+        return f'Error fetching village forecasts: {e!s}'
+
+
 # ============================================================================
 # Weather Warning Tools
 # ============================================================================
 
 
-async def get_current_weather_warnings(region_id: int = 0) -> str:
+@memoize(MINUTELY)
+async def get_current_weather_warnings(
+    region_id: int = 0,
+    fields: list[str] | None = None,
+    output_format: str = 'jsonl',
+    digits: int | None = None,
+) -> str:
     """Get current active weather warnings and alerts.
 
     Provides information about active severe weather warnings including
@@ -110,25 +270,186 @@ async def get_current_weather_warnings(region_id: int = 0) -> str:
 
     Args:
         region_id: Region code (0 for all regions, default: 0)
+        fields: Columns to return, e.g. ['REG_ID', 'WRN', 'LVL', 'TM_EF'] (default: all columns)
+        output_format: 'jsonl' (default), or 'csv' / 'tsv' for a compact table with one header
+        digits: Round decimal values to this many digits (default: as reported)
 
     Returns:
-        Current active weather warnings in JSON format
+        Current active weather warnings
     """
     if not API_KEY:
         return 'Error: KMA_API_KEY environment variable not set'
 
     try:
-        async with AsyncWarningClient(API_KEY) as client:
+        async with async_warning_client.AsyncWarningClient(
+            API_KEY, http_client=get_async_http_client()
+        ) as client:
             data = await client.get_current_warnings(stn=region_id)
-            return str(data)
+            return paginate(data, fields=fields, output_format=output_format, digits=digits)
     except Exception as e:  # noqa: BLE001
         return f'Error fetching current warnings: {e!s}'
 
 
+@memoize(MINUTELY)
+async def _poll_warnings() -> int:
+    """Feed the national warning list to the shared warning state once a minute."""
+    state = warning_events.get_warning_state()
+    async with async_warning_client.AsyncWarningClient(
+        API_KEY, http_client=get_async_http_client()
+    ) as client:
+        state.update(await client.get_current_warnings(stn=0))
+    return state.seq
+
+
+async def get_weather_warning_changes(
+    since: int = 0,
+    kinds: str = 'issue,upgrade,downgrade,lift',
+    fields: list[str] | None = None,
+    output_format: str = 'jsonl',
+    digits: int | None = None,
+) -> str:
+    """Get the weather warnings issued, upgraded, downgraded or lifted since an earlier call.
+
+    The national warning list is polled at most once a minute and compared
+    with the previous list on the server, so only the changes are returned.
+    Pass the 'seq' of the last change received as ``since`` to get only
+    newer ones. The first poll of the server reports every active warning
+    as issued.
+
+    Args:
+        since: Sequence number of the last change already seen (0 for all changes kept)
+        kinds: Comma-separated change kinds: issue, upgrade, downgrade, lift
+        fields: Columns to return, e.g. ['kind', 'zone', 'warning'] (default: all columns)
+        output_format: 'jsonl' (default), or 'csv' / 'tsv' for a compact table with one header
+        digits: Round decimal values to this many digits (default: as reported)
+
+    Returns:
+        One record per change with its seq, kind, zone, zone_name, warning
+        type, level and previous_level (1 preliminary, 2 advisory, 3 warning)
+        and time
+    """
+    if not API_KEY:
+        return 'Error: KMA_API_KEY environment variable not set'
+    wanted = {kind.strip() for kind in kinds.split(',') if kind.strip()}
+    if not wanted or not wanted <= set(warning_events.EVENT_KINDS):
+        return f"Error: kinds must be some of 'issue,upgrade,downgrade,lift', got {kinds!r}"
+
+    try:
+        latest = await _poll_warnings()
+        events = [
+            event.as_record()
+            for event in warning_events.get_warning_state().events_since(since)
+            if event.kind in wanted
+        ]
+        if not events:
+            return f'No warning changes after seq {since} (latest seq: {latest})'
+        return paginate(events, fields=fields, output_format=output_format, digits=digits)
+    except Exception as e:  # noqa: BLE001
+        return f'Error fetching warning changes: {e!s}'
+
+
+@memoize(DAILY)
+async def _load_warning_zones() -> 'ZoneIndex':
+    """Download the warning zone of every AWS site once a day and index the sites."""
+    async with (
+        async_forecast_client.AsyncForecastClient(
+            API_KEY, http_client=get_async_http_client()
+        ) as forecasts,
+        async_station_client.AsyncStationClient(
+            API_KEY, http_client=get_async_http_client()
+        ) as station_list,
+    ):
+        table, aws = await asyncio.gather(
+            forecasts.get_aws_warning_zone_code(), station_list.get_aws_stations()
+        )
+    stations = station_index.StationIndex.from_responses(aws=aws)
+    return zones.ZoneIndex.from_table(table, stations=stations)
+
+
+async def get_warnings_at_location(
+    latitude: float,
+    longitude: float,
+    fields: list[str] | None = None,
+    output_format: str = 'jsonl',
+    digits: int | None = None,
+) -> str:
+    """Get the weather warnings in effect at a location.
+
+    The location is resolved to its warning zone (the zone of the nearest
+    AWS site, from an index refreshed daily), and only the warnings issued
+    for that zone are returned.
+
+    Args:
+        latitude: Latitude in degrees (e.g., 37.5665)
+        longitude: Longitude in degrees (e.g., 126.9780)
+        fields: Columns to return, e.g. ['WRN', 'LVL', 'TM_EF'] (default: all columns)
+        output_format: 'jsonl' (default), or 'csv' / 'tsv' for a compact table with one header
+        digits: Round decimal values to this many digits (default: as reported)
+
+    Returns:
+        Active warnings of the zone containing the location
+    """
+    if not API_KEY:
+        return 'Error: KMA_API_KEY environment variable not set'
+
+    try:
+        zone = (await _load_warning_zones()).locate(latitude, longitude)
+        if zone['zone_id'] is None:
+            return f'Location ({latitude}, {longitude}) is not in any warning zone'
+        async with async_warning_client.AsyncWarningClient(
+            API_KEY, http_client=get_async_http_client()
+        ) as client:
+            data = await client.get_current_warnings(stn=0)
+        data = zones.select_zones(data, [zone['zone_id']])
+        if not any(data.values()):
+            return f'No active warnings in zone {zone["zone_id"]} ({zone["zone_name"]})'
+        return paginate(data, fields=fields, output_format=output_format, digits=digits)
+    except Exception as e:  # noqa: BLE001
+        return f'Error fetching warnings at location: {e!s}'
+
+
+async def get_warning_zones_batch(
+    points: list[list[float]],
+    fields: list[str] | None = None,
+    output_format: str = 'jsonl',
+    digits: int | None = None,
+) -> str:
+    """Get the warning zone of many locations at once.
+
+    Use the zone IDs to match locations against the REG_ID of current or
+    changed warnings.
+
+    Args:
+        points: List of [latitude, longitude] pairs (e.g., [[37.5665, 126.9780]])
+        fields: Columns to return, e.g. ['zone_id', 'zone_name'] (default: all columns)
+        output_format: 'jsonl' (default), or 'csv' / 'tsv' for a compact table with one header
+        digits: Round decimal values to this many digits (default: as reported)
+
+    Returns:
+        One row per location with its zone_id, zone_name and the distance_km
+        to the nearest site of the zone (None outside every zone)
+    """
+    if not API_KEY:
+        return 'Error: KMA_API_KEY environment variable not set'
+    if not points or any(len(point) != 2 for point in points):
+        return 'Error: points must be a non-empty list of [latitude, longitude] pairs'
+
+    try:
+        index = await _load_warning_zones()
+        latitudes, longitudes = zip(*points, strict=True)
+        data = index.locate_many(latitudes, longitudes)
+        return paginate(data, fields=fields, output_format=output_format, digits=digits)
+    except Exception as e:  # noqa: BLE001
+        return f'Error locating warning zones: {e!s}'
+
+
 async def get_weather_warning_history(
     start_date: str,
     end_date: str,
     region_id: int = 0,
+    fields: list[str] | None = None,
+    output_format: str = 'jsonl',
+    digits: int | None = None,
 ) -> str:
     """Get weather warning history for a date range.
 
@@ -136,24 +457,35 @@ async def get_weather_warning_history(
         start_date: Start date in 'YYYYMMDD' format (e.g., '20250101')
         end_date: End date in 'YYYYMMDD' format
         region_id: Region code (0 for all regions, default: 0)
+        fields: Columns to return, e.g. ['REG_ID', 'WRN', 'LVL', 'CMD'] (default: all columns)
+        output_format: 'jsonl' (default), or 'csv' / 'tsv' for a compact table with one header
+        digits: Round decimal values to this many digits (default: as reported)
 
     Returns:
-        Weather warning history in JSON format
+        Weather warning history
     """
     if not API_KEY:
         return 'Error: KMA_API_KEY environment variable not set'
 
     try:
-        async with AsyncWarningClient(API_KEY) as client:
+        async with async_warning_client.AsyncWarningClient(
+            API_KEY, http_client=get_async_http_client()
+        ) as client:
             data = await client.get_warning_history(
                 start_date=start_date, end_date=end_date, stn=region_id
             )
-            return str(data)
+            return paginate(data, fields=fields, output_format=output_format, digits=digits)
     except Exception as e:  # noqa: BLE001
         return f'Error fetching warning history: {e!s}'
 
 
-async def get_special_weather_report(report_time: str, region_id: int = 0) -> str:
+async def get_special_weather_report(
+    report_time: str,
+    region_id: int = 0,
+    fields: list[str] | None = None,
+    output_format: str = 'jsonl',
+    digits: int | None = None,
+) -> str:
     """Get special weather report.
 
     Provides special weather reports for significant weather events.
@@ -161,16 +493,21 @@ async def get_special_weather_report(report_time: str, region_id: int = 0) -> st
     Args:
         report_time: Report time in 'YYYYMMDDHHmm' format (e.g., '202501011200')
         region_id: Region code (0 for all regions, default: 0)
+        fields: Columns to return, as named in the response header (default: all columns)
+        output_format: 'jsonl' (default), or 'csv' / 'tsv' for a compact table with one header
+        digits: Round decimal values to this many digits (default: as reported)
 
     Returns:
-        Special weather report in JSON format
+        Special weather report
     """
     if not API_KEY:
         return 'Error: KMA_API_KEY environment variable not set'
 
     try:
-        async with AsyncWarningClient(API_KEY) as client:
+        async with async_warning_client.AsyncWarningClient(
+            API_KEY, http_client=get_async_http_client()
+        ) as client:
             data = await client.get_special_weather_report(tm=report_time, stn=region_id)
-            return str(data)
+            return paginate(data, fields=fields, output_format=output_format, digits=digits)
     except Exception as e:  # noqa: BLE001
         return f'Error fetching special weather report: {e!s}'
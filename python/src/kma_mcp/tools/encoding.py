@@ -0,0 +1,157 @@
+"""Output encodings of tool results.
+
+JSON lines repeat every column name on every row, which makes wide
+observation tables several times larger than their values. Tools can
+therefore also answer in CSV or TSV, where the column names are written once
+per page in a header line. Independently of the format, ``fields`` keeps only
+the named columns (matched case-insensitively, in the requested order) and
+``digits`` rounds decimal values.
+
+Example:
+    >>> encoding = Encoding('csv', fields=('ta', 'stn'), digits=1)
+    >>> columns = encoding.columns({'STN': 108, 'TA': -1.54, 'HM': 60.0})
+    >>> encoding.header(columns), encoding.line({'STN': 108, 'TA': -1.54}, columns)
+    ('TA,STN', '-1.5,108')
+"""
+
+import csv
+import io
+import json
+import math
+import re
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+ENCODINGS = ('jsonl', 'csv', 'tsv')
+_DELIMITERS = {'csv': ',', 'tsv': '\t'}
+_NEEDS_QUOTES = re.compile('["\r\n]')
+
+
+def _jsonable(value: Any) -> Any:  # noqa: ANN401
+    """Convert values json cannot encode (NumPy scalars and arrays, datetimes)."""
+    for method in ('tolist', 'isoformat'):
+        convert = getattr(value, method, None)
+        if callable(convert):
+            return convert()
+    return str(value)
+
+
+def dumps(record: Any) -> str:  # noqa: ANN401
+    """Serialize one record as a compact JSON line."""
+    return json.dumps(record, ensure_ascii=False, separators=(',', ':'), default=_jsonable)
+
+
+def _cell(value: Any) -> str:  # noqa: ANN401
+    """Write one CSV/TSV cell: missing values empty, nested values as JSON."""
+    if value is None:
+        return ''
+    if isinstance(value, dict | list | tuple) or hasattr(value, 'tolist'):
+        return dumps(value)
+    return str(value)
+
+
+# Cell writers of the common scalar types, looked up before the generic one
+_CELLS: dict[type, Callable[[Any], str]] = {type(None): _cell, str: str, int: str, float: str}
+
+
+@dataclass(frozen=True)
+class Encoding:
+    """How the records of a tool result are written.
+
+    Attributes:
+        output_format: 'jsonl', 'csv' or 'tsv'
+        fields: Columns to keep, or None for every column
+        digits: Decimal places to round float values to, or None to keep them
+    """
+
+    output_format: str = 'jsonl'
+    fields: tuple[str, ...] | None = None
+    digits: int | None = None
+
+    def __post_init__(self) -> None:
+        """Validate the options.
+
+        Raises:
+            ValueError: If the format is unknown or ``digits`` is negative
+        """
+        if self.output_format not in ENCODINGS:
+            msg = f'output_format must be one of {", ".join(ENCODINGS)}, got {self.output_format!r}'
+            raise ValueError(msg)
+        if self.digits is not None and self.digits < 0:
+            msg = f'digits must not be negative, got {self.digits}'
+            raise ValueError(msg)
+
+    def columns(self, record: Any) -> list[str] | None:  # noqa: ANN401
+        """Select the columns written for records shaped like ``record``.
+
+        Args:
+            record: First record of a page
+
+        Returns:
+            Column names, or None when records are not tables (they are then
+            written as JSON in every format)
+
+        Raises:
+            ValueError: If a requested field is not a column of the record
+        """
+        if not isinstance(record, dict):
+            return None
+        names = [str(name) for name in record]
+        if self.fields is None:
+            return names
+        by_key = {name.lower(): name for name in names}
+        unknown = [field for field in self.fields if field.lower() not in by_key]
+        if unknown:
+            msg = f'Unknown fields {unknown}, available: {", ".join(names)}'
+            raise ValueError(msg)
+        return [by_key[field.lower()] for field in self.fields]
+
+    def header(self, columns: list[str] | None) -> str | None:
+        """Return the header line of a page, if the format has one."""
+        if columns is None or self.output_format == 'jsonl':
+            return None
+        return self._join(columns)
+
+    def line(self, record: Any, columns: list[str] | None) -> str:  # noqa: ANN401
+        """Serialize one record."""
+        if columns is None or not isinstance(record, dict):
+            return dumps(self._round(record))
+        if self.output_format == 'jsonl' and self.fields is None and self.digits is None:
+            return dumps(record)
+        values = [record.get(name) for name in columns]
+        if self.digits is not None:
+            values = [self._round(value) for value in values]
+        if self.output_format == 'jsonl':
+            return dumps(dict(zip(columns, values, strict=True)))
+        return self._join([_CELLS.get(type(value), _cell)(value) for value in values])
+
+    def comment(self, message: dict[str, Any]) -> str:
+        """Serialize a control line (e.g. the next page cursor)."""
+        return dumps(message) if self.output_format == 'jsonl' else f'# {dumps(message)}'
+
+    def _round(self, value: Any) -> Any:  # noqa: ANN401
+        if self.digits is None:
+            return value
+        if isinstance(value, float):
+            if not math.isfinite(value):
+                # NaN and infinities cannot be rounded; write them as without digits
+                return value
+            # round(x, 0) still gives a float; write whole numbers without '.0'
+            return round(value, self.digits) if self.digits else round(value)
+        if isinstance(value, dict):
+            return {key: self._round(item) for key, item in value.items()}
+        if isinstance(value, list | tuple) or hasattr(value, 'tolist'):
+            items = value.tolist() if hasattr(value, 'tolist') else value
+            return [self._round(item) for item in items] if isinstance(items, list) else items
+        return value
+
+    def _join(self, cells: list[str]) -> str:
+        delimiter = _DELIMITERS[self.output_format]
+        line = delimiter.join(cells)
+        if line.count(delimiter) == len(cells) - 1 and not _NEEDS_QUOTES.search(line):
+            return line
+        # Let the csv module quote the few cells that need it
+        buffer = io.StringIO()
+        csv.writer(buffer, delimiter=delimiter, lineterminator='').writerow(cells)
+        return buffer.getvalue()
@@ -0,0 +1,195 @@
+"""In-process memoization for tools that return live "current" data.
+
+Many agents ask for the same current observation within the same minute.
+:func:`memoize` keeps recent tool results in a small LRU cache whose entries
+expire at the next upstream issuance boundary (every minute for AWS, every
+hour for UV and snow depth, ...), and coalesces concurrent identical calls of
+async tools so that they share a single upstream fetch.
+
+Error results (strings starting with 'Error') are never cached, nor are first
+pages of a paged result, whose cursor may expire before the cache entry.
+
+Example:
+    >>> @memoize(period=60)
+    ... async def get_aws_current_weather(station_id: int = 0) -> str: ...
+"""
+
+import asyncio
+import functools
+import inspect
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any, ParamSpec, TypeVar
+
+from kma_mcp.tools.paging import next_cursor
+
+P = ParamSpec('P')
+R = TypeVar('R')
+
+DEFAULT_MAXSIZE = 256
+
+# Issuance periods of the live products, in seconds
+MINUTELY = 60
+HOURLY = 3600
+DAILY = 86400
+
+_caches: list['ToolCache'] = []
+
+
+class ToolCache:
+    """LRU cache whose entries expire at the next multiple of ``period`` seconds."""
+
+    def __init__(self, period: float, maxsize: int = DEFAULT_MAXSIZE) -> None:
+        """Initialize the cache.
+
+        Args:
+            period: Issuance period in seconds; entries expire at the next boundary
+            maxsize: Maximum number of entries kept
+        """
+        self.period = period
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple[Any, ...], tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def expiry(self, now: float) -> float:
+        """Return when a result computed at ``now`` goes stale."""
+        return (now // self.period + 1) * self.period
+
+    def get(self, key: tuple[Any, ...]) -> tuple[bool, Any]:
+        """Look up a key.
+
+        Returns:
+            Tuple of (found, value)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.time():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True, entry[1]
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return False, None
+
+    def set(self, key: tuple[Any, ...], value: Any) -> None:  # noqa: ANN401
+        """Store a value until the next issuance boundary."""
+        with self._lock:
+            self._entries[key] = (self.expiry(time.time()), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove every entry and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+def _hashable(value: object) -> object:
+    """Make list arguments (e.g. ``fields``) usable in a cache key."""
+    if isinstance(value, list | tuple):
+        return tuple(_hashable(item) for item in value)
+    return value
+
+
+def _cacheable(value: object) -> bool:
+    if not isinstance(value, str):
+        return True
+    return not value.startswith('Error') and next_cursor(value) is None
+
+
+def memoize(
+    period: float, maxsize: int = DEFAULT_MAXSIZE
+) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """Memoize a tool until the next issuance boundary.
+
+    Works for sync and async tools. Concurrent calls of an async tool with the
+    same arguments wait for one shared upstream fetch.
+
+    Args:
+        period: Issuance period of the upstream product in seconds
+        maxsize: Maximum number of distinct argument combinations kept
+
+    Returns:
+        Decorator preserving the tool's signature and docstring
+    """
+
+    def decorator(func: Callable[P, R]) -> Callable[P, R]:
+        cache = ToolCache(period, maxsize)
+        _caches.append(cache)
+        signature = inspect.signature(func)
+
+        def make_key(*args: Any, **kwargs: Any) -> tuple[Any, ...]:  # noqa: ANN401
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            return tuple((name, _hashable(value)) for name, value in bound.arguments.items())
+
+        if inspect.iscoroutinefunction(func):
+            in_flight: dict[tuple[Any, ...], asyncio.Future[Any]] = {}
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: P.args, **kwargs: P.kwargs) -> Any:  # noqa: ANN401
+                key = make_key(*args, **kwargs)
+                found, value = cache.get(key)
+                if found:
+                    return value
+                while key in in_flight:
+                    try:
+                        return await asyncio.shield(in_flight[key])
+                    except asyncio.CancelledError:
+                        task = asyncio.current_task()
+                        if task is not None and task.cancelling():
+                            raise
+                        # The caller doing the fetch was cancelled; fetch again
+
+                future = asyncio.get_running_loop().create_future()
+                in_flight[key] = future
+                try:
+                    value = await func(*args, **kwargs)
+                except asyncio.CancelledError:
+                    future.cancel()
+                    raise
+                except Exception as e:
+                    future.set_exception(e)
+                    # Mark the exception retrieved when no other caller waits on it
+                    future.exception()
+                    raise
+                else:
+                    future.set_result(value)
+                    if _cacheable(value):
+                        cache.set(key, value)
+                    return value
+                finally:
+                    del in_flight[key]
+
+            async_wrapper.cache = cache  # type: ignore[attr-defined]
+            return async_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            key = make_key(*args, **kwargs)
+            found, value = cache.get(key)
+            if found:
+                return value
+            value = func(*args, **kwargs)
+            if _cacheable(value):
+                cache.set(key, value)
+            return value
+
+        wrapper.cache = cache  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorator
+
+
+def clear_caches() -> None:
+    """Clear every memoized tool result (e.g. after the API key changes)."""
+    for cache in _caches:
+        cache.clear()
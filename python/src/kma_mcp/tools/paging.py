@@ -0,0 +1,283 @@
+"""Paged output for tool results.
+
+A tool used to return ``str(data)`` of the whole decoded response, so an
+all-station AWS minutely query built a multi-megabyte string and sent it to
+the model at once. :func:`paginate` instead serializes the records of a result
+one per line (as JSON lines by default, or CSV/TSV, see
+:mod:`kma_mcp.tools.encoding`) and stops at a page budget. When records
+are left over, they stay in a small server-side store and the page ends with a
+cursor line::
+
+    {"TM":"202501011200","STN":90,"TA":-1.5}
+    {"TM":"202501011200","STN":93,"TA":-2.1}
+    {"next_cursor":"q3J0Vb1x:2","remaining_rows":538}
+
+The client passes the cursor to the ``get_result_page`` tool to receive the
+next page. Only one page is ever serialized at a time, and stored results
+expire after a few minutes of inactivity, so memory stays bounded on both
+sides.
+
+Records are taken from the result as follows:
+
+- columnar data (column name to a list or 1-D array of values, as parsed
+  from text responses): one record per row
+- Open API documents: the items in ``response.body.items.item``
+- lists: one record per element
+- anything else: a single record
+"""
+
+import json
+import os
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from typing import Any
+
+from kma_mcp.tools.encoding import Encoding, dumps
+
+DEFAULT_PAGE_BYTES = 64 * 1024
+DEFAULT_TTL = 600.0
+DEFAULT_MAXSIZE = 32
+
+
+class ColumnRows(Sequence[dict[str, Any]]):
+    """Row view of columnar data, building each row only when it is read."""
+
+    def __init__(self, columns: dict[str, Sequence[Any]]) -> None:
+        """Wrap columns of equal length.
+
+        Args:
+            columns: Mapping of column name to column values
+        """
+        self._columns = columns
+        self._length = len(next(iter(columns.values()), ()))
+
+    def __len__(self) -> int:
+        """Return the number of rows."""
+        return self._length
+
+    def __getitem__(self, index: int) -> dict[str, Any]:  # type: ignore[override]
+        """Return one row as a record."""
+        if not -self._length <= index < self._length:
+            raise IndexError(index)
+        return {name: values[index] for name, values in self._columns.items()}
+
+
+def _column_length(values: Any) -> int:  # noqa: ANN401
+    """Return the length of a list or 1-D array, or -1 for any other value."""
+    if isinstance(values, list) or getattr(values, 'ndim', None) == 1:
+        return len(values)
+    return -1
+
+
+def _is_columnar(data: dict[str, Any]) -> bool:
+    lengths = {_column_length(values) for values in data.values()}
+    return len(lengths) == 1 and -1 not in lengths
+
+
+def _openapi_items(data: dict[str, Any]) -> list[Any] | None:
+    try:
+        items = data['response']['body']['items']['item']
+    except (KeyError, TypeError):
+        return None
+    return items if isinstance(items, list) else [items]
+
+
+def records(data: Any) -> Sequence[Any]:  # noqa: ANN401
+    """Split a tool result into the records written one per line.
+
+    Args:
+        data: Decoded response or computed tool result
+
+    Returns:
+        Sequence of records (rows of columnar data are built on access)
+    """
+    if isinstance(data, dict):
+        if data and _is_columnar(data):
+            return ColumnRows(data)
+        items = _openapi_items(data)
+        if items is not None:
+            return items
+    if isinstance(data, list | tuple):
+        return data
+    return [data]
+
+
+class ResultStore:
+    """LRU store of paged results, expiring entries ``ttl`` seconds after last use."""
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_TTL,
+        maxsize: int = DEFAULT_MAXSIZE,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the store.
+
+        Args:
+            ttl: Seconds an unused result is kept
+            maxsize: Maximum number of results kept
+            clock: Monotonic time source
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of stored results."""
+        return len(self._entries)
+
+    def put(self, result: Any) -> str:  # noqa: ANN401
+        """Store a result and return the token identifying it."""
+        token = secrets.token_urlsafe(6)
+        with self._lock:
+            self._entries[token] = (self._clock() + self.ttl, result)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return token
+
+    def get(self, token: str) -> Any:  # noqa: ANN401
+        """Return a stored result and extend its lifetime, or None if it expired."""
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(token)
+            if entry is None or entry[0] <= now:
+                self._entries.pop(token, None)
+                return None
+            self._entries[token] = (now + self.ttl, entry[1])
+            self._entries.move_to_end(token)
+            return entry[1]
+
+    def discard(self, token: str) -> None:
+        """Forget a result once its last page has been read."""
+        with self._lock:
+            self._entries.pop(token, None)
+
+    def clear(self) -> None:
+        """Remove every stored result."""
+        with self._lock:
+            self._entries.clear()
+
+
+_store = ResultStore()
+_page_bytes = DEFAULT_PAGE_BYTES
+
+
+def _page(rows: Sequence[Any], encoding: Encoding, offset: int, token: str | None) -> str:
+    """Serialize records from ``offset`` until the page budget is spent."""
+    columns = encoding.columns(rows[offset])
+    header = encoding.header(columns)
+    lines = [] if header is None else [header]
+    size = sum(len(line.encode()) + 1 for line in lines)
+    end = offset
+    while end < len(rows):
+        line = encoding.line(rows[end], columns)
+        length = len(line.encode()) + 1
+        # Always make progress, even when a single record exceeds the budget
+        if end > offset and size + length > _page_bytes:
+            break
+        lines.append(line)
+        size += length
+        end += 1
+
+    if end < len(rows):
+        token = token or _store.put((rows, encoding))
+        lines.append(
+            encoding.comment({'next_cursor': f'{token}:{end}', 'remaining_rows': len(rows) - end})
+        )
+    elif token is not None:
+        _store.discard(token)
+    return '\n'.join(lines)
+
+
+def paginate(
+    data: Any,  # noqa: ANN401
+    *,
+    fields: Sequence[str] | None = None,
+    output_format: str = 'jsonl',
+    digits: int | None = None,
+) -> str:
+    """Render the first page of a tool result.
+
+    Args:
+        data: Decoded response or computed tool result
+        fields: Columns to keep (case-insensitive), or None for every column
+        output_format: 'jsonl', 'csv' or 'tsv'
+        digits: Decimal places to round float values to, or None to keep them
+
+    Returns:
+        Encoded records, ending with a ``next_cursor`` line when more pages remain
+
+    Raises:
+        ValueError: If an option is invalid or a field is not a column of the result
+    """
+    encoding = Encoding(output_format, None if fields is None else tuple(fields), digits)
+    rows = records(data)
+    if not rows:
+        # Keep the (column) structure of empty results visible
+        return dumps(data)
+    return _page(rows, encoding, 0, None)
+
+
+def next_cursor(page: str) -> str | None:
+    """Return the cursor of the page following ``page``, or None for the last page."""
+    last = page.rpartition('\n')[2].removeprefix('# ')
+    if not last.startswith('{"next_cursor":'):
+        return None
+    return json.loads(last)['next_cursor']
+
+
+def get_result_page(cursor: str) -> str:
+    """Get the next page of a large tool result.
+
+    Tools return large results in pages. When more data is available, the
+    last line of a page is {"next_cursor": ...} (prefixed by '# ' in CSV and
+    TSV); pass that cursor here to read the following page, in the same
+    format. Cursors expire after a few minutes without use.
+
+    Args:
+        cursor: The next_cursor value from the previous page
+
+    Returns:
+        The next page, ending with a next_cursor line if more remain
+    """
+    token, _, offset = cursor.rpartition(':')
+    stored = _store.get(token) if offset.isdigit() else None
+    if stored is None or int(offset) >= len(stored[0]):
+        return f'Error: cursor {cursor!r} is unknown or expired, call the original tool again'
+    rows, encoding = stored
+    return _page(rows, encoding, int(offset), token)
+
+
+def configure_paging(
+    page_bytes: int = DEFAULT_PAGE_BYTES, ttl: float = DEFAULT_TTL, maxsize: int = DEFAULT_MAXSIZE
+) -> None:
+    """Set the page budget and how long leftover records are kept.
+
+    Args:
+        page_bytes: Approximate size of one page in bytes
+        ttl: Seconds an unread result is kept for ``get_result_page``
+        maxsize: Maximum number of results kept at once
+    """
+    global _store, _page_bytes
+    _page_bytes = page_bytes
+    _store = ResultStore(ttl, maxsize)
+
+
+def configure_paging_from_env() -> None:
+    """Configure paging from environment variables.
+
+    Recognised variables:
+        KMA_PAGE_BYTES: Approximate size of one page of tool output in bytes
+        KMA_PAGE_TTL: Seconds the rest of a paged result is kept
+    """
+    page_bytes = os.getenv('KMA_PAGE_BYTES')
+    ttl = os.getenv('KMA_PAGE_TTL')
+    configure_paging(
+        int(page_bytes) if page_bytes else DEFAULT_PAGE_BYTES,
+        float(ttl) if ttl else DEFAULT_TTL,
+    )
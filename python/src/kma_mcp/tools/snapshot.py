@@ -0,0 +1,199 @@
+"""Concurrent fan-out of the weather snapshot tool.
+
+Answering "what is the weather here right now" takes the current AWS
+observation, UV, dust, snow depth, the active warnings and the ultra
+short-term forecast. Requested one after another, the answer takes as long
+as all of them together. :func:`gather_sources` (and the thread based
+:func:`collect_sources` of the sync server) starts every source at once and
+waits at most ``timeout`` seconds for each, so the snapshot takes as long as
+the slowest source, and a source that is slow or failing only loses its own
+part::
+
+    {"source":"aws","status":"ok","elapsed_ms":212,"data":{...},"error":null}
+    {"source":"uv","status":"timeout","elapsed_ms":5000,"data":null,"error":"..."}
+"""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any
+
+from kma_mcp.core.cache import KST
+from kma_mcp.core.parsing import find_key_columns
+from kma_mcp.tools.paging import records
+
+SOURCES = ('aws', 'uv', 'dust', 'snow', 'warnings', 'forecast')
+DEFAULT_TIMEOUT = 5.0
+
+# Hourly products are complete a few minutes after the hour
+HOURLY_DELAY = timedelta(minutes=10)
+
+
+def parse_sources(sources: str) -> list[str]:
+    """Split a comma-separated list of snapshot sources.
+
+    Args:
+        sources: Comma-separated source names, e.g. 'aws,warnings'
+
+    Returns:
+        Source names in the order given, without duplicates
+
+    Raises:
+        ValueError: If a name is not one of :data:`SOURCES`
+    """
+    names = list(dict.fromkeys(name.strip().lower() for name in sources.split(',')))
+    names = [name for name in names if name]
+    unknown = [name for name in names if name not in SOURCES]
+    if unknown or not names:
+        msg = f'Unknown sources {unknown}, expected some of {", ".join(SOURCES)}'
+        raise ValueError(msg)
+    return names
+
+
+def last_complete_hour(now: datetime | None = None) -> str:
+    """Return the most recent hour whose hourly observations are available.
+
+    Args:
+        now: Current time (default: now); naive datetimes are taken as KST
+
+    Returns:
+        Observation time in 'YYYYMMDDHHmm' format
+    """
+    now = datetime.now(KST) if now is None else now
+    now = now.replace(tzinfo=KST) if now.tzinfo is None else now.astimezone(KST)
+    return (now - HOURLY_DELAY).strftime('%Y%m%d%H00')
+
+
+def nearest_row(data: dict[str, Any], ranked: Iterable[dict[str, Any]]) -> dict[str, Any] | None:
+    """Pick the observation of the nearest station that reported.
+
+    Args:
+        data: Columnar observations of many stations
+        ranked: Stations ordered by distance, as returned by ``StationIndex.nearest``
+
+    Returns:
+        The newest row of the nearest reporting station, with its name and
+        distance added, or None if none of the ranked stations reported
+
+    Raises:
+        ValueError: If the response is not an observation table
+    """
+    rows = records(data)
+    station = find_key_columns(list(data))[0] if isinstance(data, dict) else None
+    if station is None or (rows and not isinstance(rows[0], dict)):
+        msg = f'Response is not an observation table: {str(data)[:200]}'
+        raise ValueError(msg)
+
+    latest = {row[station]: row for row in rows}
+    for candidate in ranked:
+        row = latest.get(candidate['station_id'])
+        if row is not None:
+            distance = candidate['distance_km']
+            return {**row, 'station_name': candidate['name'], 'distance_km': distance}
+    return None
+
+
+def hourly_forecast(data: dict[str, Any]) -> list[dict[str, Any]]:
+    """Reshape an ultra short-term forecast into one record per forecast hour.
+
+    Args:
+        data: Open API response with fcstDate, fcstTime, category and fcstValue items
+
+    Returns:
+        Records like ``{'time': '202501011500', 'T1H': '-1', 'SKY': '1', ...}``
+
+    Raises:
+        ValueError: If the response holds no forecast items
+    """
+    hours: dict[str, dict[str, Any]] = {}
+    for item in records(data):
+        if not isinstance(item, dict) or 'fcstValue' not in item:
+            msg = f'Response holds no forecast: {str(data)[:200]}'
+            raise ValueError(msg)
+        time_ = f'{item["fcstDate"]}{item["fcstTime"]}'
+        hours.setdefault(time_, {'time': time_})[item['category']] = item['fcstValue']
+    return list(hours.values())
+
+
+def _record(
+    source: str,
+    status: str,
+    started: float,
+    data: Any = None,  # noqa: ANN401
+    error: str | None = None,
+) -> dict[str, Any]:
+    elapsed = round((time.perf_counter() - started) * 1000)
+    return {'source': source, 'status': status, 'elapsed_ms': elapsed, 'data': data, 'error': error}
+
+
+async def _run(source: str, fetch: Callable[[], Awaitable[Any]], timeout: float) -> dict[str, Any]:
+    started = time.perf_counter()
+    try:
+        data = await asyncio.wait_for(fetch(), timeout)
+    except TimeoutError:
+        return _record(source, 'timeout', started, error=f'No response within {timeout:g} s')
+    except Exception as e:  # noqa: BLE001
+        return _record(source, 'error', started, error=str(e))
+    return _record(source, 'ok', started, data=data)
+
+
+async def gather_sources(
+    fetches: dict[str, Callable[[], Awaitable[Any]]], timeout: float = DEFAULT_TIMEOUT
+) -> list[dict[str, Any]]:
+    """Run the fetches of all sources concurrently, each with its own timeout.
+
+    Args:
+        fetches: Source name to a coroutine function returning its data
+        timeout: Seconds to wait for each source
+
+    Returns:
+        One record per source, in the order given, with its status
+        ('ok', 'timeout' or 'error'), elapsed milliseconds, data and error
+    """
+    return list(
+        await asyncio.gather(*(_run(name, fetch, timeout) for name, fetch in fetches.items()))
+    )
+
+
+def _timed(fetch: Callable[[], Any]) -> tuple[Any, int]:
+    started = time.perf_counter()
+    data = fetch()
+    return data, round((time.perf_counter() - started) * 1000)
+
+
+def collect_sources(
+    fetches: dict[str, Callable[[], Any]], timeout: float = DEFAULT_TIMEOUT
+) -> list[dict[str, Any]]:
+    """Run the fetches of all sources in threads, each with its own timeout.
+
+    A source that times out keeps running in its thread, but the snapshot
+    does not wait for it.
+
+    Args:
+        fetches: Source name to a function returning its data
+        timeout: Seconds to wait for each source
+
+    Returns:
+        One record per source, like :func:`gather_sources`
+    """
+    started = time.perf_counter()
+    executor = ThreadPoolExecutor(max_workers=max(len(fetches), 1))
+    futures = {name: executor.submit(_timed, fetch) for name, fetch in fetches.items()}
+
+    results = []
+    for name, future in futures.items():
+        # Every source started together, so all share one deadline
+        remaining = max(started + timeout - time.perf_counter(), 0)
+        try:
+            data, elapsed = future.result(timeout=remaining)
+        except TimeoutError:
+            message = f'No response within {timeout:g} s'
+            results.append(_record(name, 'timeout', started, error=message))
+        except Exception as e:  # noqa: BLE001
+            results.append(_record(name, 'error', started, error=str(e)))
+        else:
+            results.append({**_record(name, 'ok', started, data=data), 'elapsed_ms': elapsed})
+    executor.shutdown(wait=False, cancel_futures=True)
+    return results
@@ -8,17 +8,43 @@ This module contains tool functions for surface weather observations including:
 - North Korea observations
 - AWS Open API
 - Season observations
+- Server-side summaries of observation periods
+- Weather snapshots of a location from all sources at once
 """
 
 from datetime import UTC, datetime
-
-from kma_mcp.surface.aws_client import AWSClient
-from kma_mcp.surface.aws_oa_client import AWSOAClient
-from kma_mcp.surface.nk_client import NKClient
-from kma_mcp.surface.season_client import SeasonClient
-from kma_mcp.surface.snow_client import SnowClient
-from kma_mcp.surface.station_client import StationClient
-from kma_mcp.surface.uv_client import UVClient
+from typing import TYPE_CHECKING, Any
+
+from kma_mcp.core.lazy import lazy_module
+from kma_mcp.core.transport import get_http_client
+from kma_mcp.tools.memo import DAILY, HOURLY, MINUTELY, clear_caches, memoize
+from kma_mcp.tools.paging import paginate, records
+
+if TYPE_CHECKING:
+    from kma_mcp.surface.station_index import StationIndex
+
+# Client modules are imported on first tool call, not at server start-up
+asos_client = lazy_module('kma_mcp.surface.asos_client')
+aws_client = lazy_module('kma_mcp.surface.aws_client')
+aws_oa_client = lazy_module('kma_mcp.surface.aws_oa_client')
+dust_client = lazy_module('kma_mcp.surface.dust_client')
+nk_client = lazy_module('kma_mcp.surface.nk_client')
+season_client = lazy_module('kma_mcp.surface.season_client')
+snow_client = lazy_module('kma_mcp.surface.snow_client')
+station_client = lazy_module('kma_mcp.surface.station_client')
+station_index = lazy_module('kma_mcp.surface.station_index')
+uv_client = lazy_module('kma_mcp.surface.uv_client')
+
+# Summaries reduce the observations with NumPy, also imported on first use
+aggregate = lazy_module('kma_mcp.core.aggregate')
+windowing = lazy_module('kma_mcp.core.windowing')
+
+# Snapshots also read the forecast and warning clients
+forecast_client = lazy_module('kma_mcp.forecast.forecast_client')
+issuance = lazy_module('kma_mcp.forecast.issuance')
+projection = lazy_module('kma_mcp.forecast.projection')
+snapshot = lazy_module('kma_mcp.tools.snapshot')
+warning_client = lazy_module('kma_mcp.forecast.warning_client')
 
 # API key will be set by the main server
 API_KEY: str = ''
@@ -28,6 +54,7 @@ def set_api_key(api_key: str) -> None:
     """Set the API key for all tools in this module."""
     global API_KEY
     API_KEY = api_key
+    clear_caches()
 
 
 # ============================================================================
@@ -35,7 +62,13 @@ def set_api_key(api_key: str) -> None:
 # ============================================================================
 
 
-def get_aws_current_weather(station_id: int = 0) -> str:
+@memoize(MINUTELY)
+def get_aws_current_weather(
+    station_id: int = 0,
+    fields: list[str] | None = None,
+    output_format: str = 'jsonl',
+    digits: int | None = None,
+) -> str:
     """Get current AWS real-time weather observation data.
 
     AWS provides real-time weather data from automated weather stations
@@ -43,21 +76,24 @@ def get_aws_current_weather(station_id: int = 0) -> str:
 
     Args:
         station_id: AWS station ID (0 for all stations, default: 0)
+        fields: Columns to return, e.g. ['TA', 'HM', 'WS1', 'RN-60m'] (default: all columns)
+        output_format: 'jsonl' (default), or 'csv' / 'tsv' for a compact table with one header
+        digits: Round decimal values to this many digits (default: as reported)
 
     Returns:
-        Current AWS weather observation data in JSON format
+        Current AWS weather observation data
     """
     if not API_KEY:
         return 'Error: KMA_API_KEY environment variable not set'
 
     try:
-        with AWSClient(API_KEY) as client:
+        with aws_client.AWSClient(API_KEY, http_client=get_http_client()) as client:
             # Get current time (rounded to nearest minute)
             now = datetime.now(UTC)
             current_minute = now.replace(second=0, microsecond=0)
 
             data = client.get_minutely_data(tm1=current_minute, tm2=current_minute, stn=station_id)
-            return str(data)
+            return paginate(data, fields=fields, output_format=output_format, digits=digits)
     except Exception as e:  # noqa: BLE001
         return f'Error fetching AWS weather data: {e!s}'
 
@@ -66,6 +102,9 @@ def get_aws_minutely_weather(
     start_time: str,
     end_time: str,
     station_id: int = 0,
+    fields: list[str] | None = None,
+    output_format: str = 'jsonl',
+    digits: int | None = None,
 ) -> str:
     """Get AWS minutely weather observation data for a time period.
 
@@ -73,9 +112,12 @@ def get_aws_minutely_weather(
         start_time: Start time in 'YYYYMMDDHHmm' format (e.g., '202501011200')
         end_time: End time in 'YYYYMMDDHHmm' format
         station_id: AWS station ID (0 for all stations)
+        fields: Columns to return, e.g. ['TA', 'HM', 'WS1', 'RN-60m'] (default: all columns)
+        output_format: 'jsonl' (default), or 'csv' / 'tsv' for a compact table with one header
+        digits: Round decimal values to this many digits (default: as reported)
 
     Returns:
-        Minutely AWS weather observation data for the period in JSON format
+        Minutely AWS weather observation data for the period
 
     Example:
         get_aws_minutely_weather('202501011200', '202501011300', 108)
@@ -84,9 +126,9 @@ def get_aws_minutely_weather(
         return 'Error: KMA_API_KEY environment variable not set'
 
     try:
-        with AWSClient(API_KEY) as client:
+        with aws_client.AWSClient(API_KEY, http_client=get_http_client()) as client:
             data = client.get_minutely_data(tm1=start_time, tm2=end_time, stn=station_id)
-            return str(data)
+            return paginate(data, fields=fields, output_format=output_format, digits=digits)
     except Exception as e:  # noqa: BLE001
         return f'Error fetching AWS minutely weather data: {e!s}'
 
@@ -96,7 +138,13 @@ def get_aws_minutely_weather(
 # ============================================================================
 
 
-def get_uv_current_index(station_id: int = 0) -> str:
+@memoize(HOURLY)
+def get_uv_current_index(
+    station_id: int = 0,
+    fields: list[str] | None = None,
+    output_format: str = 'jsonl',
+    digits: int | None = None,
+) -> str:
     """Get current UV radiation index observation data.
 
     UV radiation observations monitor ultraviolet radiation levels
@@ -104,21 +152,24 @@ def get_uv_current_index(station_id: int = 0) -> str:
 
     Args:
         station_id: Weather station ID (0 for all stations, default: 0)
+        fields: Columns to return, e.g. ['STN', 'UVB', 'UVA', 'EUV'] (default: all columns)
+        output_format: 'jsonl' (default), or 'csv' / 'tsv' for a compact table with one header
+        digits: Round decimal values to this many digits (default: as reported)
 
     Returns:
-        Current UV index observation data in JSON format
+        Current UV index observation data
     """
     if not API_KEY:
         return 'Error: KMA_API_KEY environment variable not set'
 
     try:
-        with UVClient(API_KEY) as client:
+        with uv_client.UVClient(API_KEY, http_client=get_http_client()) as client:
             # Get current time (rounded to nearest hour)
             now = datetime.now(UTC)
             current_hour = now.replace(minute=0, second=0, microsecond=0)
 
             data = client.get_observation_data(tm=current_hour, stn=station_id)
-            return str(data)
+            return paginate(data, fields=fields, output_format=output_format, digits=digits)
     except Exception as e:  # noqa: BLE001
         return f'Error fetching UV index data: {e!s}'
 
@@ -128,26 +179,34 @@ def get_uv_current_index(station_id: int = 0) -> str:
 # ============================================================================
 
 
-def get_snow_current_depth() -> str:
+@memoize(HOURLY)
+def get_snow_current_depth(
+    fields: list[str] | None = None, output_format: str = 'jsonl', digits: int | None = None
+) -> str:
     """Get current snow depth observation data.
 
     Snow depth observations monitor snow accumulation for winter
     weather analysis, transportation safety, and disaster prevention.
 
+    Args:
+        fields: Columns to return, as named in the response header (default: all columns)
+        output_format: 'jsonl' (default), or 'csv' / 'tsv' for a compact table with one header
+        digits: Round decimal values to this many digits (default: as reported)
+
     Returns:
-        Current snow depth observation data in JSON format
+        Current snow depth observation data
     """
     if not API_KEY:
         return 'Error: KMA_API_KEY environment variable not set'
 
     try:
-        with SnowClient(API_KEY) as client:
+        with snow_client.SnowClient(API_KEY, http_client=get_http_client()) as client:
             # Get current time (rounded to nearest hour)
             now = datetime.now(UTC)
             current_hour = now.replace(minute=0, second=0, microsecond=0)
 
             data = client.get_snow_depth(tm=current_hour)
-            return str(data)
+            return paginate(data, fields=fields, output_format=output_format, digits=digits)
     except Exception as e:  # noqa: BLE001
         return f'Error fetching snow depth data: {e!s}'
 
@@ -155,15 +214,21 @@ def get_snow_current_depth() -> str:
 def get_snow_period_depth(
     start_time: str,
     end_time: str,
+    fields: list[str] | None = None,
+    output_format: str = 'jsonl',
+    digits: int | None = None,
 ) -> str:
     """Get snow depth observation data for a time period.
 
     Args:
         start_time: Start time in 'YYYYMMDDHHmm' format (e.g., '202501011200')
         end_time: End time in 'YYYYMMDDHHmm' format
+        fields: Columns to return, as named in the response header (default: all columns)
+        output_format: 'jsonl' (default), or 'csv' / 'tsv' for a compact table with one header
+        digits: Round decimal values to this many digits (default: as reported)
 
     Returns:
-        Snow depth data for the period in JSON format
+        Snow depth data for the period
 
     Example:
         get_snow_period_depth('202501011200', '202501011800')
@@ -172,9 +237,9 @@ def get_snow_period_depth(
         return 'Error: KMA_API_KEY environment variable not set'
 
     try:
-        with SnowClient(API_KEY) as client:
+        with snow_client.SnowClient(API_KEY, http_client=get_http_client()) as client:
             data = client.get_snow_period(tm=end_time, tm_st=start_time)
-            return str(data)
+            return paginate(data, fields=fields, output_format=output_format, digits=digits)
     except Exception as e:  # noqa: BLE001
         return f'Error fetching snow period depth data: {e!s}'
 
@@ -184,7 +249,13 @@ def get_snow_period_depth(
 # ============================================================================
 
 
-def get_nk_current_weather(station_id: int = 0) -> str:
+@memoize(HOURLY)
+def get_nk_current_weather(
+    station_id: int = 0,
+    fields: list[str] | None = None,
+    output_format: str = 'jsonl',
+    digits: int | None = None,
+) -> str:
     """Get current North Korea meteorological observation data.
 
     North Korea observations provide meteorological data from weather
@@ -192,21 +263,24 @@ def get_nk_current_weather(station_id: int = 0) -> str:
 
     Args:
         station_id: Weather station ID (0 for all stations, default: 0)
+        fields: Columns to return, as named in the response header (default: all columns)
+        output_format: 'jsonl' (default), or 'csv' / 'tsv' for a compact table with one header
+        digits: Round decimal values to this many digits (default: as reported)
 
     Returns:
-        Current North Korea meteorological observation data in JSON format
+        Current North Korea meteorological observation data
     """
     if not API_KEY:
         return 'Error: KMA_API_KEY environment variable not set'
 
     try:
-        with NKClient(API_KEY) as client:
+        with nk_client.NKClient(API_KEY, http_client=get_http_client()) as client:
             # Get current time (rounded to nearest hour)
             now = datetime.now(UTC)
             current_hour = now.replace(minute=0, second=0, microsecond=0)
 
             data = client.get_hourly_data(tm=current_hour, stn=station_id)
-            return str(data)
+            return paginate(data, fields=fields, output_format=output_format, digits=digits)
     except Exception as e:  # noqa: BLE001
         return f'Error fetching North Korea weather data: {e!s}'
 
@@ -215,6 +289,9 @@ def get_nk_hourly_weather(
     start_time: str,
     end_time: str,
     station_id: int = 0,
+    fields: list[str] | None = None,
+    output_format: str = 'jsonl',
+    digits: int | None = None,
 ) -> str:
     """Get hourly North Korea meteorological observation data for a time period.
 
@@ -222,9 +299,12 @@ def get_nk_hourly_weather(
         start_time: Start time in 'YYYYMMDDHHmm' format (e.g., '202501011200')
         end_time: End time in 'YYYYMMDDHHmm' format
         station_id: Weather station ID (0 for all stations)
+        fields: Columns to return, as named in the response header (default: all columns)
+        output_format: 'jsonl' (default), or 'csv' / 'tsv' for a compact table with one header
+        digits: Round decimal values to this many digits (default: as reported)
 
     Returns:
-        Hourly North Korea weather data for the period in JSON format
+        Hourly North Korea weather data for the period
 
     Example:
         get_nk_hourly_weather('202501011200', '202501011800', 108)
@@ -233,9 +313,9 @@ def get_nk_hourly_weather(
         return 'Error: KMA_API_KEY environment variable not set'
 
     try:
-        with NKClient(API_KEY) as client:
+        with nk_client.NKClient(API_KEY, http_client=get_http_client()) as client:
             data = client.get_hourly_period(tm1=start_time, tm2=end_time, stn=station_id)
-            return str(data)
+            return paginate(data, fields=fields, output_format=output_format, digits=digits)
     except Exception as e:  # noqa: BLE001
         return f'Error fetching hourly North Korea weather data: {e!s}'
 
@@ -244,6 +324,9 @@ def get_nk_daily_weather(
     start_date: str,
     end_date: str,
     station_id: int = 0,
+    fields: list[str] | None = None,
+    output_format: str = 'jsonl',
+    digits: int | None = None,
 ) -> str:
     """Get daily North Korea meteorological observation data for a date range.
 
@@ -251,9 +334,12 @@ def get_nk_daily_weather(
         start_date: Start date in 'YYYYMMDD' format (e.g., '20250101')
         end_date: End date in 'YYYYMMDD' format
         station_id: Weather station ID (0 for all stations)
+        fields: Columns to return, as named in the response header (default: all columns)
+        output_format: 'jsonl' (default), or 'csv' / 'tsv' for a compact table with one header
+        digits: Round decimal values to this many digits (default: as reported)
 
     Returns:
-        Daily North Korea weather data for the period in JSON format
+        Daily North Korea weather data for the period
 
     Example:
         get_nk_daily_weather('20250101', '20250131', 108)
@@ -262,9 +348,9 @@ def get_nk_daily_weather(
         return 'Error: KMA_API_KEY environment variable not set'
 
     try:
-        with NKClient(API_KEY) as client:
+        with nk_client.NKClient(API_KEY, http_client=get_http_client()) as client:
             data = client.get_daily_period(tm1=start_date, tm2=end_date, stn=station_id)
-            return str(data)
+            return paginate(data, fields=fields, output_format=output_format, digits=digits)
     except Exception as e:  # noqa: BLE001
         return f'Error fetching daily North Korea weather data: {e!s}'
 
@@ -274,7 +360,14 @@ def get_nk_daily_weather(
 # ============================================================================
 
 
-def get_aws_oa_current(longitude: float, latitude: float) -> str:
+@memoize(MINUTELY)
+def get_aws_oa_current(
+    longitude: float,
+    latitude: float,
+    fields: list[str] | None = None,
+    output_format: str = 'jsonl',
+    digits: int | None = None,
+) -> str:
     """Get current AWS objective analysis data for a location.
 
     AWS Objective Analysis provides gridded meteorological data derived
@@ -283,21 +376,24 @@ def get_aws_oa_current(longitude: float, latitude: float) -> str:
     Args:
         longitude: Longitude coordinate (e.g., 127.0 for Seoul)
         latitude: Latitude coordinate (e.g., 37.5 for Seoul)
+        fields: Columns to return, as named in the response header (default: all columns)
+        output_format: 'jsonl' (default), or 'csv' / 'tsv' for a compact table with one header
+        digits: Round decimal values to this many digits (default: as reported)
 
     Returns:
-        Current AWS objective analysis data in JSON format
+        Current AWS objective analysis data
     """
     if not API_KEY:
         return 'Error: KMA_API_KEY environment variable not set'
 
     try:
-        with AWSOAClient(API_KEY) as client:
+        with aws_oa_client.AWSOAClient(API_KEY, http_client=get_http_client()) as client:
             # Get current time (rounded to nearest hour)
             now = datetime.now(UTC)
             current_hour = now.replace(minute=0, second=0, microsecond=0)
 
             data = client.get_analysis_data(tm=current_hour, x=longitude, y=latitude)
-            return str(data)
+            return paginate(data, fields=fields, output_format=output_format, digits=digits)
     except Exception as e:  # noqa: BLE001
         return f'Error fetching AWS objective analysis data: {e!s}'
 
@@ -307,6 +403,9 @@ def get_aws_oa_period(
     end_time: str,
     longitude: float,
     latitude: float,
+    fields: list[str] | None = None,
+    output_format: str = 'jsonl',
+    digits: int | None = None,
 ) -> str:
     """Get AWS objective analysis data for a location over a time period.
 
@@ -315,9 +414,12 @@ def get_aws_oa_period(
         end_time: End time in 'YYYYMMDDHHmm' format
         longitude: Longitude coordinate
         latitude: Latitude coordinate
+        fields: Columns to return, as named in the response header (default: all columns)
+        output_format: 'jsonl' (default), or 'csv' / 'tsv' for a compact table with one header
+        digits: Round decimal values to this many digits (default: as reported)
 
     Returns:
-        AWS objective analysis data for the period in JSON format
+        AWS objective analysis data for the period
 
     Example:
         get_aws_oa_period('202501011200', '202501011800', 127.0, 37.5)
@@ -326,9 +428,9 @@ def get_aws_oa_period(
         return 'Error: KMA_API_KEY environment variable not set'
 
     try:
-        with AWSOAClient(API_KEY) as client:
+        with aws_oa_client.AWSOAClient(API_KEY, http_client=get_http_client()) as client:
             data = client.get_analysis_period(tm1=start_time, tm2=end_time, x=longitude, y=latitude)
-            return str(data)
+            return paginate(data, fields=fields, output_format=output_format, digits=digits)
     except Exception as e:  # noqa: BLE001
         return f'Error fetching AWS objective analysis data: {e!s}'
 
@@ -338,7 +440,13 @@ def get_aws_oa_period(
 # ============================================================================
 
 
-def get_season_current_year(station_id: int = 0) -> str:
+@memoize(DAILY)
+def get_season_current_year(
+    station_id: int = 0,
+    fields: list[str] | None = None,
+    output_format: str = 'jsonl',
+    digits: int | None = None,
+) -> str:
     """Get seasonal observation data for the current year.
 
     Seasonal observations monitor phenological events such as cherry
@@ -346,33 +454,45 @@ def get_season_current_year(station_id: int = 0) -> str:
 
     Args:
         station_id: Weather station ID (0 for all stations, default: 0)
+        fields: Columns to return, as named in the response header (default: all columns)
+        output_format: 'jsonl' (default), or 'csv' / 'tsv' for a compact table with one header
+        digits: Round decimal values to this many digits (default: as reported)
 
     Returns:
-        Seasonal observation data for the current year in JSON format
+        Seasonal observation data for the current year
     """
     if not API_KEY:
         return 'Error: KMA_API_KEY environment variable not set'
 
     try:
-        with SeasonClient(API_KEY) as client:
+        with season_client.SeasonClient(API_KEY, http_client=get_http_client()) as client:
             # Get current year
             current_year = datetime.now(UTC).year
 
             data = client.get_observation_data(year=current_year, stn=station_id)
-            return str(data)
+            return paginate(data, fields=fields, output_format=output_format, digits=digits)
     except Exception as e:  # noqa: BLE001
         return f'Error fetching seasonal observation data: {e!s}'
 
 
-def get_season_by_year(year: int, station_id: int = 0) -> str:
+def get_season_by_year(
+    year: int,
+    station_id: int = 0,
+    fields: list[str] | None = None,
+    output_format: str = 'jsonl',
+    digits: int | None = None,
+) -> str:
     """Get seasonal observation data for a specific year.
 
     Args:
         year: Year (e.g., 2025)
         station_id: Weather station ID (0 for all stations)
+        fields: Columns to return, as named in the response header (default: all columns)
+        output_format: 'jsonl' (default), or 'csv' / 'tsv' for a compact table with one header
+        digits: Round decimal values to this many digits (default: as reported)
 
     Returns:
-        Seasonal observation data for the year in JSON format
+        Seasonal observation data for the year
 
     Example:
         get_season_by_year(2025, 108)
@@ -381,9 +501,9 @@ def get_season_by_year(year: int, station_id: int = 0) -> str:
         return 'Error: KMA_API_KEY environment variable not set'
 
     try:
-        with SeasonClient(API_KEY) as client:
+        with season_client.SeasonClient(API_KEY, http_client=get_http_client()) as client:
             data = client.get_observation_data(year=year, stn=station_id)
-            return str(data)
+            return paginate(data, fields=fields, output_format=output_format, digits=digits)
     except Exception as e:  # noqa: BLE001
         return f'Error fetching seasonal observation data: {e!s}'
 
@@ -392,6 +512,9 @@ def get_season_period(
     start_year: int,
     end_year: int,
     station_id: int = 0,
+    fields: list[str] | None = None,
+    output_format: str = 'jsonl',
+    digits: int | None = None,
 ) -> str:
     """Get seasonal observation data for a year range.
 
@@ -399,9 +522,12 @@ def get_season_period(
         start_year: Start year (e.g., 2020)
         end_year: End year (e.g., 2025)
         station_id: Weather station ID (0 for all stations)
+        fields: Columns to return, as named in the response header (default: all columns)
+        output_format: 'jsonl' (default), or 'csv' / 'tsv' for a compact table with one header
+        digits: Round decimal values to this many digits (default: as reported)
 
     Returns:
-        Seasonal observation data for the period in JSON format
+        Seasonal observation data for the period
 
     Example:
         get_season_period(2020, 2025, 108)
@@ -410,11 +536,11 @@ def get_season_period(
         return 'Error: KMA_API_KEY environment variable not set'
 
     try:
-        with SeasonClient(API_KEY) as client:
+        with season_client.SeasonClient(API_KEY, http_client=get_http_client()) as client:
             data = client.get_observation_period(
                 start_year=start_year, end_year=end_year, stn=station_id
             )
-            return str(data)
+            return paginate(data, fields=fields, output_format=output_format, digits=digits)
     except Exception as e:  # noqa: BLE001
         return f'Error fetching seasonal observation data: {e!s}'
 
@@ -424,7 +550,13 @@ def get_season_period(
 # ============================================================================
 
 
-def get_asos_station_list(station_id: int = 0) -> str:
+@memoize(DAILY)
+def get_asos_station_list(
+    station_id: int = 0,
+    fields: list[str] | None = None,
+    output_format: str = 'jsonl',
+    digits: int | None = None,
+) -> str:
     """Get ASOS (synoptic) station information.
 
     Provides metadata about ASOS observation stations including
@@ -432,22 +564,31 @@ def get_asos_station_list(station_id: int = 0) -> str:
 
     Args:
         station_id: Weather station ID (0 for all stations, default: 0)
+        fields: Columns to return, e.g. ['STN_ID', 'STN_KO', 'LAT', 'LON'] (default: all columns)
+        output_format: 'jsonl' (default), or 'csv' / 'tsv' for a compact table with one header
+        digits: Round decimal values to this many digits (default: as reported)
 
     Returns:
-        ASOS station information in JSON format
+        ASOS station information
     """
     if not API_KEY:
         return 'Error: KMA_API_KEY environment variable not set'
 
     try:
-        with StationClient(API_KEY) as client:
+        with station_client.StationClient(API_KEY, http_client=get_http_client()) as client:
             data = client.get_asos_stations(stn=station_id)
-            return str(data)
+            return paginate(data, fields=fields, output_format=output_format, digits=digits)
     except Exception as e:  # noqa: BLE001
         return f'Error fetching ASOS station information: {e!s}'
 
 
-def get_aws_station_list(station_id: int = 0) -> str:
+@memoize(DAILY)
+def get_aws_station_list(
+    station_id: int = 0,
+    fields: list[str] | None = None,
+    output_format: str = 'jsonl',
+    digits: int | None = None,
+) -> str:
     """Get AWS station information.
 
     Provides metadata about AWS observation stations including
@@ -455,16 +596,273 @@ def get_aws_station_list(station_id: int = 0) -> str:
 
     Args:
         station_id: Weather station ID (0 for all stations, default: 0)
+        fields: Columns to return, e.g. ['STN_ID', 'STN_KO', 'LAT', 'LON'] (default: all columns)
+        output_format: 'jsonl' (default), or 'csv' / 'tsv' for a compact table with one header
+        digits: Round decimal values to this many digits (default: as reported)
 
     Returns:
-        AWS station information in JSON format
+        AWS station information
     """
     if not API_KEY:
         return 'Error: KMA_API_KEY environment variable not set'
 
     try:
-        with StationClient(API_KEY) as client:
+        with station_client.StationClient(API_KEY, http_client=get_http_client()) as client:
             data = client.get_aws_stations(stn=station_id)
-            return str(data)
+            return paginate(data, fields=fields, output_format=output_format, digits=digits)
     except Exception as e:  # noqa: BLE001
         return f'Error fetching AWS station information: {e!s}'
+
+
+@memoize(DAILY)
+def _load_station_index() -> 'StationIndex':
+    """Download both station lists once a day and index them."""
+    with station_client.StationClient(API_KEY, http_client=get_http_client()) as client:
+        return station_index.StationIndex.from_responses(
+            asos=client.get_asos_stations(), aws=client.get_aws_stations()
+        )
+
+
+def get_nearby_stations(
+    latitude: float,
+    longitude: float,
+    count: int = 5,
+    radius_km: float | None = None,
+    station_type: str = 'all',
+    fields: list[str] | None = None,
+    output_format: str = 'jsonl',
+    digits: int | None = None,
+) -> str:
+    """Find the observation stations nearest to a location.
+
+    Resolves a latitude/longitude to station IDs that can be passed to the
+    other observation tools. Station lists are downloaded once a day and
+    searched locally.
+
+    Args:
+        latitude: Latitude in degrees (e.g., 37.5665 for Seoul)
+        longitude: Longitude in degrees (e.g., 126.9780 for Seoul)
+        count: Number of nearest stations to return (default: 5)
+        radius_km: Return every station within this distance instead of the nearest N
+        station_type: 'asos', 'aws' or 'all' (default: 'all')
+        fields: Columns to return, e.g. ['station_id', 'name', 'distance_km'] (default: all columns)
+        output_format: 'jsonl' (default), or 'csv' / 'tsv' for a compact table with one header
+        digits: Round decimal values to this many digits (default: as reported)
+
+    Returns:
+        Nearby stations with IDs, names, coordinates and distance in km
+    """
+    if not API_KEY:
+        return 'Error: KMA_API_KEY environment variable not set'
+    if station_type.upper() not in {*station_index.STATION_TYPES, 'ALL'}:
+        return f"Error: station_type must be 'asos', 'aws' or 'all', got {station_type!r}"
+
+    try:
+        index = _load_station_index()
+        kind = None if station_type.upper() == 'ALL' else station_type
+        if radius_km is not None:
+            stations = index.within(latitude, longitude, radius_km, station_type=kind)
+        else:
+            stations = index.nearest(latitude, longitude, count, station_type=kind)
+        return paginate(stations, fields=fields, output_format=output_format, digits=digits)
+    except Exception as e:  # noqa: BLE001
+        return f'Error finding nearby stations: {e!s}'
+
+
+# ============================================================================
+# Observation Summary Tools
+# ============================================================================
+
+# Client module, class, period method and window limits of each summarized source
+_SUMMARY_SOURCES = {
+    'aws': (aws_client, 'AWSClient', 'get_minutely_data', 'MINUTELY'),
+    'asos': (asos_client, 'ASOSClient', 'get_hourly_period', 'HOURLY'),
+    'dust': (dust_client, 'DustClient', 'get_hourly_period', 'HOURLY'),
+}
+
+
+def get_observation_summary(
+    start_time: str,
+    end_time: str,
+    source: str = 'aws',
+    variables: str | None = None,
+    group_by: str = 'station',
+    bucket: str = 'hour',
+    statistics: str = 'mean,min,max',
+    station_id: int = 0,
+    fields: list[str] | None = None,
+    output_format: str = 'jsonl',
+    digits: int | None = 1,
+) -> str:
+    """Summarize observations per station or region and time bucket on the server.
+
+    Downloads the period window by window and reduces it to statistics, so
+    only the summary is returned (e.g. the hourly mean temperature of every
+    AWS station instead of every minutely row). Use this instead of pulling
+    raw data when averages, extremes or totals are needed.
+
+    Args:
+        start_time: Start time in 'YYYYMMDDHHmm' format (e.g., '202501010000')
+        end_time: End time in 'YYYYMMDDHHmm' format
+        source: 'aws' (minutely AWS), 'asos' (hourly ASOS) or 'dust' (hourly PM10)
+        variables: Comma-separated columns to summarize, e.g. 'TA,HM,WS1'
+            (default: every numeric column)
+        group_by: 'station', 'region' (province) or 'all' stations together
+        bucket: Time bucket: '10min', 'hour', 'day' or 'all' (the whole period)
+        statistics: Comma-separated statistics from mean, min, max, sum, count
+        station_id: Station ID (0 for all stations)
+        fields: Columns to return, e.g. ['STN', 'TA_mean'] (default: all columns)
+        output_format: 'jsonl' (default), or 'csv' / 'tsv' for a compact table with one header
+        digits: Round decimal values to this many digits (default: 1)
+
+    Returns:
+        One row per group and bucket with the number of observations ('rows')
+        and one '<variable>_<statistic>' column per variable and statistic
+
+    Example:
+        get_observation_summary('202501010000', '202501012359', variables='TA', bucket='day')
+    """
+    if not API_KEY:
+        return 'Error: KMA_API_KEY environment variable not set'
+    if source not in _SUMMARY_SOURCES:
+        return f"Error: source must be 'aws', 'asos' or 'dust', got {source!r}"
+
+    names = None if variables is None else [var.strip() for var in variables.split(',')]
+    try:
+        aggregator = aggregate.Aggregator(
+            names,
+            group_by=group_by,
+            bucket=bucket,
+            statistics=[stat.strip() for stat in statistics.split(',') if stat.strip()],
+            regions=_load_station_index().region_map() if group_by == 'region' else None,
+        )
+        module, client_class, method, spec = _SUMMARY_SOURCES[source]
+        with getattr(module, client_class)(API_KEY, http_client=get_http_client()) as client:
+            for chunk in windowing.fetch_period(
+                getattr(client, method),
+                start_time,
+                end_time,
+                spec=getattr(windowing, spec),
+                stn=station_id,
+            ):
+                aggregator.add(chunk)
+        return paginate(
+            aggregator.result(), fields=fields, output_format=output_format, digits=digits
+        )
+    except Exception as e:  # noqa: BLE001
+        return f'Error summarizing observations: {e!s}'
+
+
+# ============================================================================
+# Weather Snapshot Tools
+# ============================================================================
+
+
+def _nearest_observation(
+    client_class: Any,  # noqa: ANN401
+    method: str,
+    latitude: float,
+    longitude: float,
+    station_type: str | None = None,
+    **kwargs: Any,  # noqa: ANN401
+) -> dict[str, Any] | None:
+    """Fetch one source for all stations and keep the row of the nearest station."""
+    with client_class(API_KEY, http_client=get_http_client()) as client:
+        data = getattr(client, method)(**kwargs)
+    index = _load_station_index()
+    ranked = index.nearest(latitude, longitude, len(index), station_type=station_type)
+    return snapshot.nearest_row(data, ranked)
+
+
+def _aws_now(latitude: float, longitude: float) -> dict[str, Any] | None:
+    """Fetch the current observation of the nearest AWS station."""
+    nearest = _load_station_index().nearest(latitude, longitude, 1, station_type='AWS')
+    if not nearest:
+        return None
+    with aws_client.AWSClient(API_KEY, http_client=get_http_client()) as client:
+        data = client.get_minutely_data(stn=nearest[0]['station_id'])
+    return snapshot.nearest_row(data, nearest)
+
+
+def _warnings_now() -> list[Any]:
+    """Fetch the active warnings of all regions."""
+    with warning_client.WarningClient(API_KEY, http_client=get_http_client()) as client:
+        return list(records(client.get_current_warnings(stn=0)))
+
+
+def _forecast_now(nx: int, ny: int) -> list[dict[str, Any]]:
+    """Fetch the latest ultra short-term forecast of a grid cell."""
+    base_date, base_time = issuance.latest_ultra_short_base()
+    with forecast_client.ForecastClient(API_KEY, http_client=get_http_client()) as client:
+        data = client.get_ultra_short_term_forecast(
+            base_date=base_date, base_time=base_time, nx=nx, ny=ny
+        )
+    return snapshot.hourly_forecast(data)
+
+
+def get_weather_snapshot(
+    latitude: float,
+    longitude: float,
+    sources: str = 'aws,uv,dust,snow,warnings,forecast',
+    timeout_s: float = 5.0,
+    fields: list[str] | None = None,
+    output_format: str = 'jsonl',
+    digits: int | None = None,
+) -> str:
+    """Get the current weather at a location from several sources in one call.
+
+    All sources are requested concurrently and each is given at most
+    ``timeout_s`` seconds, so the snapshot takes as long as the slowest
+    source. A source that times out or fails is reported with its status
+    while the others are still returned. Use this instead of calling the
+    single-source tools one after another.
+
+    Args:
+        latitude: Latitude in degrees (e.g., 37.5665 for Seoul)
+        longitude: Longitude in degrees (e.g., 126.9780 for Seoul)
+        sources: Comma-separated sources: aws (current observation of the nearest
+            AWS station), uv, dust (PM10), snow (depth), warnings (active warnings
+            of all regions) and forecast (ultra short-term forecast, next 6 hours)
+        timeout_s: Seconds to wait for each source (default: 5)
+        fields: Columns to return, e.g. ['source', 'data'] (default: all columns)
+        output_format: 'jsonl' (default), or 'csv' / 'tsv' for a compact table with one header
+        digits: Round decimal values to this many digits (default: as reported)
+
+    Returns:
+        One record per source with its status ('ok', 'timeout' or 'error'),
+        elapsed milliseconds, data and error message
+    """
+    if not API_KEY:
+        return 'Error: KMA_API_KEY environment variable not set'
+    try:
+        names = snapshot.parse_sources(sources)
+    except ValueError as e:
+        return f'Error: {e!s}'
+
+    nx, ny = projection.latlon_to_grid(latitude, longitude)
+    if 'forecast' in names and not projection.in_grid(nx, ny):
+        return f'Error: location ({latitude}, {longitude}) is outside the forecast grid'
+
+    hour = snapshot.last_complete_hour()
+    point = (latitude, longitude)
+    fetches = {
+        'aws': lambda: _aws_now(*point),
+        'uv': lambda: _nearest_observation(
+            uv_client.UVClient, 'get_observation_data', *point, tm=hour, stn=0
+        ),
+        'dust': lambda: _nearest_observation(
+            dust_client.DustClient, 'get_hourly_data', *point, tm=hour, stn=0
+        ),
+        'snow': lambda: _nearest_observation(
+            snow_client.SnowClient, 'get_snow_depth', *point, tm=hour
+        ),
+        'warnings': _warnings_now,
+        'forecast': lambda: _forecast_now(nx, ny),
+    }
+    try:
+        results = snapshot.collect_sources(
+            {name: fetches[name] for name in names}, timeout=timeout_s
+        )
+        return paginate(results, fields=fields, output_format=output_format, digits=digits)
+    except Exception as e:  # noqa: BLE001
+        return f'Error fetching weather snapshot: {e!s}'
@@ -0,0 +1,212 @@
+"""Prefetch jobs of the async MCP server.
+
+Each job requests exactly what the matching tools request right after the
+product is issued, so their next calls are answered from the prefetch store
+(see :mod:`kma_mcp.core.prefetch`):
+
+- ``village``: village forecast of the configured locations
+  (``get_village_forecast_by_location``), after 02:10, 05:10, ... 23:10 KST
+- ``ultra_short``: ultra short-term forecast of the configured locations
+  (``get_weather_snapshot``), at 45 past every hour
+- ``warnings``: national warning list (``get_current_weather_warnings``,
+  ``get_weather_warning_changes``, ``get_warnings_at_location``), every minute
+- ``aws``: all-station AWS observation (``get_aws_current_weather``), every minute
+
+Forecasts are issued per 5 km grid cell, so forecast jobs need the locations
+to keep warm; locations in the same cell are fetched once.
+
+Prefetching is off unless ``KMA_PREFETCH`` lists products::
+
+    KMA_PREFETCH=all
+    KMA_PREFETCH_POINTS="37.5665,126.9780;35.1796,129.0756"
+"""
+
+import asyncio
+import logging
+import os
+from collections.abc import Awaitable, Callable, Iterable
+from datetime import UTC, datetime
+
+from kma_mcp.core.lazy import lazy_module
+from kma_mcp.core.prefetch import (
+    DEFAULT_JITTER,
+    PrefetchJob,
+    PrefetchScheduler,
+    configure_prefetch,
+    every,
+)
+from kma_mcp.core.transport import get_async_http_client
+from kma_mcp.tools.memo import MINUTELY
+
+# Client modules are imported when the first job runs, not at server start-up
+async_aws_client = lazy_module('kma_mcp.surface.async_aws_client')
+async_forecast_client = lazy_module('kma_mcp.forecast.async_forecast_client')
+async_warning_client = lazy_module('kma_mcp.forecast.async_warning_client')
+issuance = lazy_module('kma_mcp.forecast.issuance')
+projection = lazy_module('kma_mcp.forecast.projection')
+
+logger = logging.getLogger(__name__)
+
+PRODUCTS = ('village', 'ultra_short', 'warnings', 'aws')
+# Products issued per forecast grid cell, which need locations
+GRID_PRODUCTS = frozenset({'village', 'ultra_short'})
+
+
+def parse_products(value: str) -> list[str]:
+    """Split a comma-separated list of products to prefetch.
+
+    Args:
+        value: Product names, e.g. 'aws,warnings', or 'all'
+
+    Returns:
+        Product names without duplicates
+
+    Raises:
+        ValueError: If a name is not one of :data:`PRODUCTS`
+    """
+    names = [name.strip().lower() for name in value.split(',') if name.strip()]
+    if names == ['all']:
+        return list(PRODUCTS)
+    unknown = [name for name in names if name not in PRODUCTS]
+    if unknown:
+        msg = f'Unknown prefetch products {unknown}, expected some of {", ".join(PRODUCTS)}'
+        raise ValueError(msg)
+    return list(dict.fromkeys(names))
+
+
+def parse_points(value: str) -> list[tuple[float, float]]:
+    """Parse locations written as 'lat,lon;lat,lon'.
+
+    Raises:
+        ValueError: If a location is not a pair of numbers
+    """
+    points = []
+    for item in value.split(';'):
+        if not item.strip():
+            continue
+        parts = item.split(',')
+        if len(parts) != 2:
+            msg = f"Prefetch location must be 'lat,lon', got {item!r}"
+            raise ValueError(msg)
+        points.append((float(parts[0]), float(parts[1])))
+    return points
+
+
+def grid_cells(points: Iterable[tuple[float, float]]) -> list[tuple[int, int]]:
+    """Return the forecast grid cells of the locations inside the grid, each once."""
+    cells = (projection.latlon_to_grid(lat, lon) for lat, lon in points)
+    return list(dict.fromkeys(cell for cell in cells if projection.in_grid(*cell)))
+
+
+def _forecast_fetch(
+    api_key: str,
+    cells: list[tuple[int, int]],
+    method: str,
+    base: Callable[[], tuple[str, str]],
+) -> Callable[[], Awaitable[None]]:
+    async def fetch() -> None:
+        base_date, base_time = base()
+        async with async_forecast_client.AsyncForecastClient(
+            api_key, http_client=get_async_http_client()
+        ) as client:
+            request = getattr(client, method)
+            await asyncio.gather(
+                *(
+                    request(base_date=base_date, base_time=base_time, nx=nx, ny=ny)
+                    for nx, ny in cells
+                )
+            )
+
+    return fetch
+
+
+def _warnings_fetch(api_key: str) -> Callable[[], Awaitable[None]]:
+    async def fetch() -> None:
+        async with async_warning_client.AsyncWarningClient(
+            api_key, http_client=get_async_http_client()
+        ) as client:
+            await client.get_current_warnings(stn=0)
+
+    return fetch
+
+
+def _aws_fetch(api_key: str) -> Callable[[], Awaitable[None]]:
+    async def fetch() -> None:
+        # The same minute get_aws_current_weather asks for
+        current_minute = datetime.now(UTC).replace(second=0, microsecond=0)
+        async with async_aws_client.AsyncAWSClient(
+            api_key, http_client=get_async_http_client()
+        ) as client:
+            await client.get_minutely_data(tm1=current_minute, tm2=current_minute, stn=0)
+
+    return fetch
+
+
+def prefetch_jobs(
+    api_key: str,
+    products: Iterable[str] = PRODUCTS,
+    points: Iterable[tuple[float, float]] = (),
+) -> list[PrefetchJob]:
+    """Build the prefetch jobs of the given products.
+
+    Args:
+        api_key: KMA API key
+        products: Products to prefetch, some of :data:`PRODUCTS`
+        points: (latitude, longitude) of the locations whose forecasts are kept warm
+
+    Returns:
+        One job per product; forecast products are skipped when no location
+        lies inside the forecast grid
+    """
+    cells = grid_cells(points)
+    jobs = []
+    for product in products:
+        if product in GRID_PRODUCTS and not cells:
+            logger.warning('Not prefetching %s: no location inside the forecast grid', product)
+            continue
+        if product == 'village':
+            fetch = _forecast_fetch(
+                api_key, cells, 'get_village_forecast', issuance.latest_village_base
+            )
+            jobs.append(PrefetchJob(product, fetch, issuance.next_village_available))
+        elif product == 'ultra_short':
+            fetch = _forecast_fetch(
+                api_key, cells, 'get_ultra_short_term_forecast', issuance.latest_ultra_short_base
+            )
+            jobs.append(PrefetchJob(product, fetch, issuance.next_ultra_short_available))
+        elif product == 'warnings':
+            jobs.append(PrefetchJob(product, _warnings_fetch(api_key), every(MINUTELY)))
+        elif product == 'aws':
+            jobs.append(PrefetchJob(product, _aws_fetch(api_key), every(MINUTELY)))
+    return jobs
+
+
+def prefetch_from_env(api_key: str) -> PrefetchScheduler | None:
+    """Configure prefetching from environment variables.
+
+    Enables the prefetch store when any job is configured. Call it before the
+    shared async HTTP client is created, and start the scheduler in the
+    server's event loop.
+
+    Recognised variables:
+        KMA_PREFETCH: Comma-separated products to prefetch, or 'all' (off when unset)
+        KMA_PREFETCH_POINTS: Locations of the forecast products, as 'lat,lon;lat,lon'
+        KMA_PREFETCH_JITTER: Largest random delay in seconds after an issuance
+
+    Args:
+        api_key: KMA API key
+
+    Returns:
+        The scheduler, not yet started, or None when prefetching is off
+    """
+    products = parse_products(os.getenv('KMA_PREFETCH', ''))
+    if not products or not api_key:
+        configure_prefetch(enabled=False)
+        return None
+    jitter = os.getenv('KMA_PREFETCH_JITTER')
+    jobs = prefetch_jobs(api_key, products, parse_points(os.getenv('KMA_PREFETCH_POINTS', '')))
+    if not jobs:
+        configure_prefetch(enabled=False)
+        return None
+    configure_prefetch()
+    return PrefetchScheduler(jobs, jitter=float(jitter) if jitter else DEFAULT_JITTER)
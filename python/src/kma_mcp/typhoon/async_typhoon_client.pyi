@@ -0,0 +1,10 @@
+# Generated by scripts/generate_async_stubs.py from the sync client; do not edit.
+from typing import Any
+
+from kma_mcp.core.client import AsyncKMAClient
+
+class AsyncTyphoonClient(AsyncKMAClient):
+    async def get_current_typhoons(self) -> dict[str, Any]: ...
+    async def get_typhoon_by_id(self, typhoon_id: str) -> dict[str, Any]: ...
+    async def get_typhoon_forecast(self, typhoon_id: str) -> dict[str, Any]: ...
+    async def get_typhoon_history(self, year: int | str) -> dict[str, Any]: ...
@@ -0,0 +1,16 @@
+# Generated by scripts/generate_async_stubs.py from the sync client; do not edit.
+from datetime import datetime
+from typing import Any
+
+from kma_mcp.core.client import AsyncKMAClient
+
+class AsyncRadiosondeClient(AsyncKMAClient):
+    async def get_upper_air_data(
+        self, tm: str | datetime, stn: int | str = 0, pa: float | None = None
+    ) -> dict[str, Any]: ...
+    async def get_stability_indices(
+        self, tm1: str | datetime, tm2: str | datetime, stn: int | str = 0
+    ) -> dict[str, Any]: ...
+    async def get_maximum_altitude_data(
+        self, tm1: str | datetime, tm2: str | datetime, stn: int | str = 0
+    ) -> dict[str, Any]: ...
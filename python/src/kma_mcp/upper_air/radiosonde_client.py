@@ -7,10 +7,10 @@ including temperature, humidity, wind data at various altitude levels.
 from datetime import datetime
 from typing import Any
 
-import httpx
+from kma_mcp.core.client import KMAClient
 
 
-class RadiosondeClient:
+class RadiosondeClient(KMAClient):
     """Client for accessing KMA Upper-Air (Radiosonde) observation data.
 
     Provides access to atmospheric profiles including:
@@ -20,46 +20,6 @@ class RadiosondeClient:
     - Atmospheric stability indices
     """
 
-    BASE_URL = 'https://apihub.kma.go.kr/api/typ01/url'
-
-    def __init__(self, auth_key: str, timeout: float = 30.0):
-        """Initialize the Radiosonde client.
-
-        Args:
-            auth_key: KMA API authentication key
-            timeout: Request timeout in seconds (default: 30.0)
-        """
-        self.auth_key = auth_key
-        self._client = httpx.Client(timeout=timeout)
-
-    def __enter__(self) -> 'RadiosondeClient':
-        """Context manager entry."""
-        return self
-
-    def __exit__(self, *args: object) -> None:
-        """Context manager exit."""
-        self.close()
-
-    def close(self) -> None:
-        """Close the HTTP client."""
-        self._client.close()
-
-    def _make_request(self, endpoint: str, params: dict[str, Any]) -> dict[str, Any]:
-        """Make an API request.
-
-        Args:
-            endpoint: API endpoint name
-            params: Query parameters
-
-        Returns:
-            JSON response as dictionary
-        """
-        params['authKey'] = self.auth_key
-        url = f'{self.BASE_URL}/{endpoint}'
-        response = self._client.get(url, params=params)
-        response.raise_for_status()
-        return response.json()
-
     def get_upper_air_data(
         self, tm: str | datetime, stn: int | str = 0, pa: float | None = None
     ) -> dict[str, Any]:
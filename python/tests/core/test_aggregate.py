@@ -0,0 +1,148 @@
+"""Unit tests for server-side observation summaries."""
+
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from kma_mcp.core.aggregate import Aggregator, aggregate
+from kma_mcp.core.parsing import parse_fixed_width
+from kma_mcp.surface.aws_client import AWSClient
+from kma_mcp.surface.station_index import StationIndex
+from kma_mcp.tools import async_surface_tools, surface_tools
+from kma_mcp.tools.memo import clear_caches
+
+BODY = """#START7777
+# YYMMDDHHMI STN  TA    HM
+202501011300 112  1.0  50.0
+202501011200 108 -1.5  60.0
+202501011210 112  0.5 -99.0
+202501011300 108 -0.5  55.0
+202501011400 108  0.0  52.0
+#7777END
+"""
+
+
+@pytest.fixture
+def data() -> dict:
+    """Parse the sample body."""
+    return parse_fixed_width(BODY)
+
+
+def test_station_hour_buckets(data):
+    """Test rows are reduced per station and hour, with missing values skipped."""
+    summary = aggregate(data)
+
+    assert summary['STN'] == [108, 108, 108, 112, 112]
+    assert summary['TM'] == [f'202501011{hour}00' for hour in '23423']
+    assert summary['TA_mean'] == [-1.5, -0.5, 0.0, 0.5, 1.0]
+    assert summary['HM_max'][3] is None
+
+
+def test_whole_period_over_all_stations(data):
+    """Test grouping everything into one row."""
+    summary = aggregate(
+        data, ['ta', 'HM'], group_by='all', bucket='all', statistics=('mean', 'sum', 'count')
+    )
+
+    assert summary == {
+        'rows': [5],
+        'TA_mean': [pytest.approx(-0.1)],
+        'TA_sum': [pytest.approx(-0.5)],
+        'TA_count': [5],
+        'HM_mean': [pytest.approx(54.25)],
+        'HM_sum': [217.0],
+        'HM_count': [4],
+    }
+
+
+def test_regions_and_days(data):
+    """Test stations are grouped by their region, unknown stations separately."""
+    summary = aggregate(data, ['TA'], group_by='region', bucket='day', regions={108: '서울'})
+
+    assert summary['REGION'] == ['unknown', '서울']
+    assert summary['TM'] == ['202501010000'] * 2
+    assert summary['rows'] == [2, 3]
+    assert summary['TA_min'] == [0.5, -1.5]
+
+
+def test_windows_merge_like_one_table(data):
+    """Test feeding the rows in two windows gives the same summary as one table."""
+    aggregator = Aggregator(['TA', 'HM'], bucket='day', statistics=('mean', 'min', 'count'))
+    split = {name: values[:2] for name, values in data.items()}
+    rest = {name: values[2:] for name, values in data.items()}
+    aggregator.add(split)
+    aggregator.add(rest)
+
+    assert aggregator.result() == aggregate(
+        data, ['TA', 'HM'], bucket='day', statistics=('mean', 'min', 'count')
+    )
+
+
+@pytest.mark.parametrize(
+    ('options', 'message'),
+    [
+        ({'bucket': 'week'}, 'bucket'),
+        ({'statistics': ('median',)}, 'statistic'),
+        ({'group_by': 'region'}, 'regions'),
+        ({'variables': ['WS']}, 'Unknown variables'),
+    ],
+)
+def test_invalid_options(data, options, message):
+    """Test unsupported options are rejected."""
+    with pytest.raises(ValueError, match=message):
+        aggregate(data, **options)
+
+
+def test_large_table_is_vectorized():
+    """Test a day of minutely data from 700 stations is summarized quickly."""
+    rows = 700 * 1440
+    minutes = np.arange(rows) // 700
+    times = [f'20250101{minute // 60:02d}{minute % 60:02d}' for minute in minutes.tolist()]
+    table = {'TM': times, 'STN': (np.arange(rows) % 700).tolist(), 'TA': np.ones(rows).tolist()}
+
+    summary = aggregate(table, bucket='hour')
+
+    assert len(summary['STN']) == 700 * 24
+    assert set(summary['rows']) == {60}
+
+
+def test_region_map_from_station_list():
+    """Test station provinces come from the legal district code."""
+    stations = parse_fixed_width(
+        '# STN_ID LON LAT STN_KO LAW_ID\n108 126.97 37.57 서울 1111010100\n'
+        '159 129.03 35.10 부산 2614010100\n'
+    )
+
+    assert StationIndex.from_response(stations).region_map() == {108: '서울', 159: '부산'}
+
+
+def test_summary_tool(data):
+    """Test the tool reduces every window, without repeated rows, and returns only the summary."""
+    clear_caches()
+    surface_tools.set_api_key('test_key')
+    with patch.object(AWSClient, 'get_minutely_data', return_value=data) as mock:
+        result = surface_tools.get_observation_summary(
+            '202501011200', '202501021300', variables='TA', bucket='all', output_format='csv'
+        )
+
+    assert mock.call_count == 2
+    assert result == 'STN,rows,TA_mean,TA_min,TA_max\n108,3,-0.7,-1.5,0.0\n112,2,0.8,0.5,1.0'
+    assert surface_tools.get_observation_summary('1', '2', source='x').startswith('Error')
+    surface_tools.set_api_key('')
+
+
+@pytest.mark.asyncio
+async def test_async_summary_tool(data):
+    """Test the async tool summarizes the windows fetched concurrently."""
+    clear_caches()
+    async_surface_tools.set_api_key('test_key')
+    with patch(
+        'kma_mcp.surface.async_aws_client.AsyncAWSClient.get_minutely_data', return_value=data
+    ):
+        result = await async_surface_tools.get_observation_summary(
+            '202501011200', '202501011300', variables='TA', group_by='all', bucket='day'
+        )
+
+    assert result == '{"TM":"202501010000","rows":5,"TA_mean":-0.1,"TA_min":-1.5,"TA_max":1.0}'
+    async_surface_tools.set_api_key('')
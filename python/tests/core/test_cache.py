@@ -0,0 +1,271 @@
+"""Unit tests for the persistent response cache."""
+
+from collections.abc import Iterator
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import httpx
+import pytest
+
+from kma_mcp.core import cache as cache_module
+from kma_mcp.core import transport
+from kma_mcp.core.cache import (
+    KST,
+    AsyncCachingTransport,
+    CacheClass,
+    CachingTransport,
+    MemoryCacheBackend,
+    ResponseCache,
+    SQLiteCacheBackend,
+    cache_key,
+    carries_data,
+    classify,
+)
+from kma_mcp.surface.asos_client import ASOSClient
+from kma_mcp.surface.async_asos_client import AsyncASOSClient
+
+NOW = datetime(2025, 6, 1, 12, 0, tzinfo=KST)
+
+
+@pytest.fixture(autouse=True)
+def reset_cache() -> Iterator[None]:
+    """Disable the process-wide cache and close shared clients after each test."""
+    yield
+    cache_module.configure_cache(None)
+    transport.close_http_clients()
+
+
+@pytest.fixture
+def calls() -> list[httpx.Request]:
+    """Collect requests that reached the network."""
+    return []
+
+
+@pytest.fixture
+def upstream(calls: list[httpx.Request]) -> httpx.MockTransport:
+    """Create a fake API Hub answering every request with a small text body."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(200, text='# TM STN TA\n202001011200 108 1.5\n')
+
+    return httpx.MockTransport(handler)
+
+
+class TestClassify:
+    """Test request classification."""
+
+    @pytest.mark.parametrize(
+        ('endpoint', 'params', 'expected'),
+        [
+            ('/api/typ01/url/kma_sfcdd3.php', {'tm1': '20200101', 'tm2': '20200131'}, 'immutable'),
+            ('/api/typ01/url/kma_sfctm2.php', {'tm': '202506011100'}, 'live'),
+            ('/api/typ01/url/kma_sfctm2.php', {'stn': '0'}, 'live'),
+            ('/api/typ01/url/kma_typ_hist.php', {'year': '2020'}, 'immutable'),
+            ('/api/typ01/url/kma_typ_hist.php', {'year': '2025'}, 'live'),
+            ('/api/typ01/url/kma_clm_month.php', {'mm1': '1'}, 'immutable'),
+            ('/api/typ01/url/kma_stnlist.php', {'stn': '0'}, 'slow'),
+            ('/api/typ02/openApi/FcstZoneInfoService/getFcstZoneCd', {}, 'slow'),
+            ('/api/typ02/openApi/VilageFcstInfoService', {'base_date': '20250520'}, 'immutable'),
+            ('/api/typ01/url/kma_sfctm2.php', {'tm': 'latest'}, 'live'),
+            ('/cgi-bin/url/nph-aws2_min', {'tm1': '202401010000', 'stn': '0'}, 'live'),
+            ('/cgi-bin/url/nph-aws2_min', {'tm1': '202401010000', 'tm2': '202506011100'}, 'live'),
+            (
+                '/api/typ01/url/kma_snow1.php',
+                {'tm_st': '202401010000', 'tm': '202401020000'},
+                'immutable',
+            ),
+            ('/api/typ01/url/sfc_season2.php', {'year1': '2020', 'year2': '2025'}, 'live'),
+        ],
+    )
+    def test_classify(self, endpoint: str, params: dict[str, str], expected: str) -> None:
+        """Test classes for past, current and reference requests."""
+        assert classify(endpoint, params, now=NOW) == expected
+
+    def test_settle_period(self) -> None:
+        """Test recent past data stays live until the settle period passes."""
+        params = {'tm1': '20250530', 'tm2': '20250530'}
+
+        assert classify('kma_sfcdd3.php', params, now=NOW) == CacheClass.LIVE
+        assert (
+            classify('kma_sfcdd3.php', params, now=NOW, settle=timedelta(hours=1))
+            == CacheClass.IMMUTABLE
+        )
+
+
+def test_cache_key_ignores_auth_key_and_order() -> None:
+    """Test that keys do not depend on the auth key or parameter order."""
+    first = httpx.URL('https://apihub.kma.go.kr/x.php', params={'a': '1', 'b': '2', 'authKey': 'k'})
+    second = httpx.URL('https://apihub.kma.go.kr/x.php', params={'b': '2', 'a': '1'})
+    other = httpx.URL('https://apihub.kma.go.kr/x.php', params={'a': '1', 'b': '3'})
+
+    assert cache_key(first) == cache_key(second)
+    assert cache_key(first) != cache_key(other)
+
+
+@pytest.mark.parametrize(
+    ('body', 'expected'),
+    [
+        (b'#START7777\n# TM STN TA\n202001011200 108 1.5\n#7777END\n', True),
+        (b'#START7777\n# TM STN TA\n#7777END\n', False),
+        (b'{"response":{"header":{"resultCode":"00","resultMsg":"NORMAL_SERVICE"}}}', True),
+        (b'{"response":{"header":{"resultCode":"03","resultMsg":"NO_DATA"}}}', False),
+        (b'<OpenAPI_ServiceResponse><cmmMsgHeader><returnReasonCode>30', False),
+        (b'{"result":{"status":403,"message":"invalid authKey"}}', False),
+        (b'', False),
+    ],
+)
+def test_carries_data(body: bytes, expected: bool) -> None:  # noqa: FBT001
+    """Test bodies holding data are told apart from errors and empty results."""
+    assert carries_data(body) is expected
+
+
+class TestBackends:
+    """Test cache storage backends."""
+
+    @pytest.fixture(params=['memory', 'sqlite'])
+    def backend(self, request: pytest.FixtureRequest, tmp_path: Path):
+        """Create each backend type."""
+        if request.param == 'memory':
+            return MemoryCacheBackend()
+        return SQLiteCacheBackend(tmp_path / 'cache' / 'responses.sqlite')
+
+    def test_round_trip_and_expiry(self, backend) -> None:
+        """Test stored entries are returned until they expire."""
+        backend.set('fresh', b'body', 'text/plain', expires=1e12)
+        backend.set('stale', b'body', 'text/plain', expires=1.0)
+
+        assert backend.get('fresh') == (b'body', 'text/plain')
+        assert backend.get('stale') is None
+        assert backend.get('missing') is None
+
+        backend.clear()
+        assert backend.get('fresh') is None
+
+    def test_sqlite_persists(self, tmp_path: Path) -> None:
+        """Test that the SQLite backend survives reopening."""
+        path = tmp_path / 'responses.sqlite'
+        first = SQLiteCacheBackend(path)
+        first.set('key', b'body', 'text/plain', expires=1e12)
+        first.close()
+
+        assert SQLiteCacheBackend(path).get('key') == (b'body', 'text/plain')
+
+
+class TestCachingTransport:
+    """Test the transport wrappers with real clients."""
+
+    def test_immutable_requests_hit(self, upstream, calls) -> None:
+        """Test that repeated historical queries are served from the cache."""
+        cache = ResponseCache(MemoryCacheBackend())
+        http_client = httpx.Client(transport=CachingTransport(upstream, cache))
+
+        with ASOSClient('key', http_client=http_client) as client:
+            first = client.get_daily_period('20200101', '20200131')
+            second = client.get_daily_period('20200101', '20200131')
+
+        assert first == second == {'TM': ['202001011200'], 'STN': [108], 'TA': [1.5]}
+        assert len(calls) == 1
+        assert cache.stats()['immutable'] == {'hits': 1, 'misses': 1}
+
+    def test_live_requests_bypass(self, upstream, calls) -> None:
+        """Test that current data is not cached by default."""
+        cache = ResponseCache(MemoryCacheBackend())
+        http_client = httpx.Client(transport=CachingTransport(upstream, cache))
+        now = datetime.now(KST).strftime('%Y%m%d%H00')
+
+        with ASOSClient('key', http_client=http_client) as client:
+            client.get_hourly_data(now)
+            client.get_hourly_data(now)
+
+        assert len(calls) == 2
+        assert cache.stats()['live'] == {'hits': 0, 'misses': 0}
+
+    def test_live_ttl_enables_caching(self, upstream, calls) -> None:
+        """Test that a live TTL caches current data too."""
+        cache = ResponseCache(MemoryCacheBackend(), ttls={CacheClass.LIVE: 60})
+        http_client = httpx.Client(transport=CachingTransport(upstream, cache))
+        now = datetime.now(KST).strftime('%Y%m%d%H00')
+
+        with ASOSClient('key', http_client=http_client) as client:
+            client.get_hourly_data(now)
+            client.get_hourly_data(now)
+
+        assert len(calls) == 1
+        assert cache.stats()['live'] == {'hits': 1, 'misses': 1}
+
+    def test_errors_not_cached(self, calls) -> None:
+        """Test that error responses are never stored."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            return httpx.Response(500)
+
+        cache = ResponseCache(MemoryCacheBackend())
+        http_client = httpx.Client(transport=CachingTransport(httpx.MockTransport(handler), cache))
+
+        with ASOSClient('key', http_client=http_client) as client:
+            for _ in range(2):
+                with pytest.raises(httpx.HTTPStatusError):
+                    client.get_daily_period('20200101', '20200131')
+
+        assert len(calls) == 2
+
+    def test_kma_errors_with_status_200_not_cached(self, calls) -> None:
+        """Test that an error the API Hub returns with status 200 is not served to others."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            return httpx.Response(200, json={'result': {'status': 403, 'message': 'bad key'}})
+
+        cache = ResponseCache(MemoryCacheBackend())
+        http_client = httpx.Client(transport=CachingTransport(httpx.MockTransport(handler), cache))
+
+        with ASOSClient('key', http_client=http_client) as client:
+            client.get_daily_period('20200101', '20200131')
+        with ASOSClient('other_key', http_client=http_client) as client:
+            client.get_daily_period('20200101', '20200131')
+
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_async_transport(self, upstream, calls) -> None:
+        """Test that async clients share the same cache."""
+        cache = ResponseCache(MemoryCacheBackend())
+        http_client = httpx.AsyncClient(transport=AsyncCachingTransport(upstream, cache))
+
+        async with AsyncASOSClient('key', http_client=http_client) as client:
+            await client.get_daily_period('20200101', '20200131')
+            data = await client.get_daily_period('20200101', '20200131')
+        await http_client.aclose()
+
+        assert data['STN'] == [108]
+        assert len(calls) == 1
+
+
+class TestConfiguration:
+    """Test process-wide cache configuration."""
+
+    def test_disabled_by_default(self) -> None:
+        """Test that shared clients have no cache unless configured."""
+        assert cache_module.get_cache() is None
+        assert not isinstance(transport.get_http_client()._transport, CachingTransport)
+
+    def test_shared_client_uses_configured_cache(self, tmp_path: Path) -> None:
+        """Test that the shared client wraps its transport once a cache is configured."""
+        cache_module.configure_cache(tmp_path / 'responses.sqlite')
+
+        assert isinstance(cache_module.get_cache(), ResponseCache)
+        assert isinstance(transport.get_http_client()._transport, CachingTransport)
+
+    def test_configure_from_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test KMA_CACHE_* variables."""
+        monkeypatch.setenv('KMA_CACHE_PATH', ':memory:')
+        monkeypatch.setenv('KMA_CACHE_TTL_LIVE', '30')
+        monkeypatch.setenv('KMA_CACHE_SETTLE_HOURS', '6')
+
+        cache = cache_module.configure_cache_from_env()
+
+        assert isinstance(cache.backend, MemoryCacheBackend)
+        assert cache.ttls[CacheClass.LIVE] == 30
+        assert cache.settle == timedelta(hours=6)
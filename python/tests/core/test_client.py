@@ -0,0 +1,136 @@
+"""Unit tests for the shared client base classes."""
+
+import ast
+import importlib
+import inspect
+import pkgutil
+from pathlib import Path
+
+import httpx
+import pytest
+
+import kma_mcp
+from kma_mcp.core.client import AsyncKMAClient, KMAClient, async_client
+from kma_mcp.forecast.async_forecast_client import AsyncForecastClient
+from kma_mcp.satellite.async_satellite_client import AsyncSatelliteClient
+from kma_mcp.satellite.satellite_client import SatelliteClient
+from kma_mcp.surface.async_uv_client import AsyncUVClient
+from kma_mcp.surface.uv_client import UVClient
+
+
+def client_pairs() -> list[tuple[type[KMAClient], type[AsyncKMAClient]]]:
+    """Find every sync client and its async variant."""
+    pairs = []
+    for info in pkgutil.walk_packages(kma_mcp.__path__, 'kma_mcp.'):
+        if not info.name.rsplit('.', 1)[-1].startswith('async_'):
+            continue
+        module = importlib.import_module(info.name)
+        for value in vars(module).values():
+            if isinstance(value, type) and value.__module__ == info.name:
+                sync = vars(importlib.import_module(info.name.replace('.async_', '.')))
+                pairs.append((sync[value.__name__.removeprefix('Async')], value))
+    return pairs
+
+
+def recorder(requests: list[httpx.Request]) -> httpx.MockTransport:
+    """Build a transport recording requests and answering with an empty JSON object."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={'ok': True})
+
+    return httpx.MockTransport(handler)
+
+
+def test_every_client_has_matching_async_variant() -> None:
+    """Test async clients expose the same endpoints, with the same signatures, as coroutines."""
+    pairs = client_pairs()
+    assert len(pairs) == 21
+
+    for sync, aio in pairs:
+        endpoints = [name for name, _ in inspect.getmembers(sync, inspect.isfunction)]
+        for name in endpoints:
+            if name.startswith('_'):
+                continue
+            method = getattr(aio, name)
+            assert inspect.iscoroutinefunction(method), f'{aio.__name__}.{name}'
+            assert inspect.signature(method) == inspect.signature(getattr(sync, name))
+
+
+def test_async_stubs_match_sync_clients() -> None:
+    """Test the generated stubs declare every sync endpoint with its signature.
+
+    Regenerate them with ``python scripts/generate_async_stubs.py`` when this fails.
+    """
+
+    def methods(path: Path, name: str) -> dict[str, str]:
+        tree = ast.parse(path.read_text(encoding='utf-8'))
+        cls = next(n for n in tree.body if isinstance(n, ast.ClassDef) and n.name == name)
+        return {
+            node.name: f'{ast.unparse(node.args)} -> {node.returns and ast.unparse(node.returns)}'
+            for node in cls.body
+            if isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef)
+            and not node.name.startswith('_')
+        }
+
+    for sync, aio in client_pairs():
+        stub = Path(inspect.getfile(aio)).with_suffix('.pyi')
+        assert stub.exists(), f'{stub.name} is missing'
+        expected = methods(Path(inspect.getfile(sync)), sync.__name__)
+        assert methods(stub, aio.__name__) == expected, f'{stub.name} is out of date'
+
+
+def test_async_client_metadata() -> None:
+    """Test the derived class is named and documented after the sync class."""
+    assert AsyncUVClient.__name__ == 'AsyncUVClient'
+    assert AsyncUVClient.__module__ == 'kma_mcp.surface.async_uv_client'
+    assert AsyncUVClient.__doc__.startswith('Async client for KMA UV')
+    assert not issubclass(AsyncUVClient, UVClient)
+    assert SatelliteClient('key').timeout == AsyncSatelliteClient('key').timeout == 60.0
+
+
+@pytest.mark.asyncio
+async def test_sync_and_async_send_identical_requests() -> None:
+    """Test one endpoint declaration produces the same request on both transports."""
+    requests: list[httpx.Request] = []
+
+    with httpx.Client(transport=recorder(requests)) as http:
+        sync = UVClient('test_key', http_client=http).get_observation_data('202203211500')
+    async with httpx.AsyncClient(transport=recorder(requests)) as http:
+        client = AsyncUVClient('test_key', http_client=http)
+        result = await client.get_observation_data('202203211500')
+
+    assert sync == result == {'ok': True}
+    assert requests[0].url == requests[1].url
+    assert requests[0].url.params['authKey'] == 'test_key'
+
+
+@pytest.mark.asyncio
+async def test_local_results_and_custom_base_url() -> None:
+    """Test results computed without a request are awaitable, and base URLs are honoured."""
+    requests: list[httpx.Request] = []
+
+    async with httpx.AsyncClient(transport=recorder(requests)) as http:
+        client = AsyncForecastClient('test_key', http_client=http)
+        local = await client.convert_grid_to_coords(60, 127)
+        await client.convert_grid_to_coords(60, 127, local=False)
+
+    assert local['X'] == [60]
+    assert len(requests) == 1
+    assert str(requests[0].url).startswith(f'{AsyncForecastClient.CGI_BASE_URL}/nph-dfs_xy_lonlat')
+
+
+def test_derive_custom_client() -> None:
+    """Test subclasses of a client keep inherited endpoints in the async variant."""
+
+    class Station(UVClient):
+        """Client for one UV station."""
+
+        def get_station_data(self, tm: str) -> dict:
+            return self.get_observation_data(tm, stn=132)
+
+    derived = async_client(Station, __name__)
+
+    assert inspect.iscoroutinefunction(derived.get_station_data)
+    assert inspect.iscoroutinefunction(derived.get_observation_data)
+    assert derived.__doc__ == 'Async client for one UV station.'
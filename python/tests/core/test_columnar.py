@@ -0,0 +1,138 @@
+"""Unit tests for the columnar observation frame."""
+
+import numpy as np
+import pytest
+
+from kma_mcp.core.columnar import ObservationFrame, to_frame
+from kma_mcp.core.parsing import parse_fixed_width
+
+BODY = """#START7777
+# YYMMDDHHMI STN  TA    HM
+202501011300 112  1.0  50.0
+202501011200 108 -1.5  60.0
+202501011200 112  0.5 -99.0
+202501011300 108 -0.5  55.0
+202501011400 108  0.0  52.0
+#7777END
+"""
+
+
+@pytest.fixture
+def frame() -> ObservationFrame:
+    """Create a frame from the sample body."""
+    return to_frame(parse_fixed_width(BODY))
+
+
+def test_from_columns_sorts_by_station_then_time(frame):
+    """Test that rows are sorted by station and time."""
+    assert len(frame) == 5
+    assert frame.station_column == 'STN'
+    assert frame.time_column == 'YYMMDDHHMI'
+    assert frame['STN'].tolist() == [108, 108, 108, 112, 112]
+    assert frame['TA'].tolist() == [-1.5, -0.5, 0.0, 0.5, 1.0]
+    assert frame.stations.tolist() == [108, 112]
+
+
+def test_column_types(frame):
+    """Test column dtypes and missing values."""
+    assert frame['STN'].dtype == np.int64
+    assert frame['TA'].dtype == np.float64
+    assert frame.times.dtype == np.dtype('datetime64[s]')
+    assert frame.times[0] == np.datetime64('2025-01-01T12:00')
+    assert np.isnan(frame['HM'][3])
+
+
+def test_station_is_zero_copy_view(frame):
+    """Test that selecting a station returns views."""
+    seoul = frame.station(108)
+
+    assert len(seoul) == 3
+    assert seoul['TA'].base is not None
+    assert np.shares_memory(seoul['TA'], frame['TA'])
+    assert len(frame.station('112')) == 2
+    assert len(frame.station(999)) == 0
+
+
+def test_between_single_station(frame):
+    """Test time range selection on one station."""
+    rows = frame.station(108).between('202501011300', '202501011400')
+
+    assert rows['TA'].tolist() == [-0.5, 0.0]
+    assert np.shares_memory(rows['TA'], frame['TA'])
+
+
+def test_between_all_stations(frame):
+    """Test time range selection across stations."""
+    rows = frame.between(start='202501011300')
+
+    assert rows['STN'].tolist() == [108, 108, 112]
+
+
+def test_between_without_time_column():
+    """Test that time selection requires a time column."""
+    frame = ObservationFrame.from_columns({'STN': [108], 'TA': [1.0]})
+
+    with pytest.raises(ValueError, match='no time column'):
+        frame.between('202501010000')
+
+
+def test_to_frame_from_json_records():
+    """Test building a frame from an API Hub JSON document."""
+    data = {
+        'response': {
+            'body': {
+                'items': {
+                    'item': [
+                        {'stnId': '108', 'tm': '2025-01-01 13:00', 'ta': '1.0'},
+                        {'stnId': '108', 'tm': '2025-01-01 12:00', 'ta': None},
+                    ]
+                }
+            }
+        }
+    }
+
+    frame = to_frame(data)
+
+    assert frame.station_column == 'stnId'
+    assert frame.stations.tolist() == [108]
+    assert frame.time_column == 'tm'
+    assert frame.times[0] == np.datetime64('2025-01-01T12:00')
+    assert np.isnan(frame['ta'][0])
+
+
+def test_to_dict_round_trip(frame):
+    """Test converting back to columnar lists."""
+    data = frame.station(112).to_dict()
+
+    assert data['STN'] == [112, 112]
+    assert data['TA'] == [0.5, 1.0]
+
+
+def test_to_pandas(frame):
+    """Test conversion to pandas."""
+    pytest.importorskip('pandas')
+
+    df = frame.to_pandas()
+
+    assert list(df.columns) == frame.columns
+    assert df['TA'].tolist() == frame['TA'].tolist()
+
+
+def test_to_arrow(frame):
+    """Test conversion to Arrow, with NaN mapped to null."""
+    pytest.importorskip('pyarrow')
+
+    table = frame.to_arrow()
+
+    assert table.num_rows == 5
+    assert table.column('HM').null_count == 1
+
+
+def test_mixed_time_formats():
+    """Test time columns mixing widths and placeholders."""
+    frame = ObservationFrame.from_columns({'TM_ED': ['-', '20001231', '2025-01-01 12:00']})
+
+    # Rows are sorted by time, unparseable values last
+    assert frame.times[0] == np.datetime64('2000-12-31T00:00')
+    assert frame.times[1] == np.datetime64('2025-01-01T12:00')
+    assert np.isnat(frame.times[2])
@@ -0,0 +1,112 @@
+"""Unit tests for decoding large responses in worker processes."""
+
+from collections.abc import Iterator
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import shared_memory
+from unittest.mock import Mock
+
+import httpx
+import pytest
+
+from kma_mcp.core import offload
+from kma_mcp.core.offload import ParseOffloader, decode_packed, pack_columns, unpack
+from kma_mcp.core.parsing import decode_response, parse_fixed_width
+from kma_mcp.surface.async_aws_client import AsyncAWSClient
+
+HEADER = '# YYMMDDHHMI STN  WD   WS     PA    TA  WW\n'
+
+
+def aws_body(rows: int) -> bytes:
+    """Build an all-station body with missing ints and floats, and a text column."""
+    lines = [HEADER]
+    for row in range(rows):
+        wd = -9 if row % 7 == 0 else row % 360
+        ta = -99.0 if row % 5 == 0 else round(row % 400 / 10 - 10, 1)
+        lines.append(
+            f'202506011200 {100 + row:4d} {wd:3d} {row % 13 * 0.3:4.1f} '
+            f'{1000 + row % 30:6.1f} {ta:5.1f}  {"RA" if row % 3 else "-"}\n'
+        )
+    return ''.join(lines).encode()
+
+
+@pytest.fixture(autouse=True)
+def reset_offload() -> Iterator[None]:
+    """Decode inline again after each test."""
+    yield
+    offload.configure_offload(max_workers=0)
+
+
+@pytest.mark.parametrize('shared', [True, False])
+def test_packed_columns_decode_like_inline_parsing(shared):
+    """Test the hand-off returns the same values, column order and missing values."""
+    columns = parse_fixed_width(aws_body(500))
+    # A column mixing ints and floats stays a list
+    columns['MIXED'] = [1, 2.5, None] * 50 + [0] * 350
+
+    packed = pack_columns(columns, shared=shared)
+    result = unpack(packed)
+
+    assert result == columns
+    assert list(result) == list(columns)
+    assert result['WD'][0] is None
+    assert isinstance(result['STN'][0], int)
+    if shared:
+        with pytest.raises(FileNotFoundError):
+            shared_memory.SharedMemory(name=packed[1][0])
+
+
+def test_json_bodies_are_returned_as_is():
+    """Test JSON bodies are decoded as JSON, like decode_response does."""
+    assert unpack(decode_packed(b'{"response": {"body": {"items": [1, 2]}}}')) == {
+        'response': {'body': {'items': [1, 2]}}
+    }
+
+
+@pytest.mark.asyncio
+async def test_async_client_decodes_large_bodies_in_workers():
+    """Test bodies above the threshold are decoded in a worker, smaller ones inline."""
+    large, small = aws_body(5000), aws_body(3)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=large if request.url.params['stn'] == '0' else small)
+
+    offloader = offload.configure_offload(threshold=len(small) + 1, max_workers=1)
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    async with AsyncAWSClient('key', http_client=http_client) as client:
+        everything = await client.get_minutely_data(tm2='202506011200', stn=0)
+        one = await client.get_minutely_data(tm2='202506011200', stn=108)
+    await http_client.aclose()
+    offloader.shutdown()
+
+    assert everything == parse_fixed_width(large)
+    assert one == parse_fixed_width(small)
+    assert offloader.stats() == {'inline': 1, 'offloaded': 1, 'fallbacks': 0}
+
+
+@pytest.mark.asyncio
+async def test_broken_pool_falls_back_to_inline_decoding():
+    """Test a dead worker pool costs a fallback, not a failed request."""
+    offloader = ParseOffloader(threshold=0)
+    pool = Mock()
+    pool.submit.side_effect = BrokenProcessPool('worker died')
+    offloader._pool = pool
+    response = httpx.Response(200, content=aws_body(10))
+
+    assert await offloader.decode(response) == decode_response(response)
+    assert offloader.stats()['fallbacks'] == 1
+    assert offloader._pool is None
+    pool.shutdown.assert_called_once()
+
+
+def test_configure_offload_from_env(monkeypatch):
+    """Test KMA_PARSE_* variables set the pool size and threshold, and 0 disables it."""
+    monkeypatch.setenv('KMA_PARSE_WORKERS', '3')
+    monkeypatch.setenv('KMA_PARSE_THRESHOLD', '1024')
+
+    offloader = offload.configure_offload_from_env()
+
+    assert offloader is offload.get_offloader()
+    assert (offloader.max_workers, offloader.threshold) == (3, 1024)
+    monkeypatch.setenv('KMA_PARSE_WORKERS', '0')
+    assert offload.configure_offload_from_env() is None
+    assert offload.get_offloader() is None
@@ -0,0 +1,119 @@
+"""Unit tests for KMA response parsing."""
+
+from unittest.mock import Mock, patch
+
+import httpx
+
+from kma_mcp.core.parsing import decode_response, parse_fixed_width
+from kma_mcp.surface.asos_client import ASOSClient
+
+SFCTM2_BODY = """#START7777
+#--------------------------------------------------------------------------
+#  기상청 지상관측 시간자료 [입력인수형태][예] ?tm=201007151200&stn=0&help=1
+#--------------------------------------------------------------------------
+# YYMMDDHHMI STN  WD   WS GST  GST     PA    TA    HM     RN     RN  WW
+#        KST  ID  16  m/s  WD   WS    hPa     C     %    DAY    JUN  CD
+201007151200  90  18  2.8  -9 -9.0 1003.8  27.0  75.0   -9.0   -9.0  WX
+201007151200 108  20  3.1  21 10.5 1004.1 -99.0  80.0    1.5   -9.0
+#7777END
+"""
+
+
+class TestParseFixedWidth:
+    """Test fixed-width text parsing."""
+
+    def test_header_and_types(self) -> None:
+        """Test column names come from the header and values are typed."""
+        data = parse_fixed_width(SFCTM2_BODY)
+
+        assert list(data)[:4] == ['YYMMDDHHMI', 'STN', 'WD', 'WS']
+        assert data['YYMMDDHHMI'] == ['201007151200', '201007151200']
+        assert data['STN'] == [90, 108]
+        assert data['WS'] == [2.8, 3.1]
+        assert data['PA'] == [1003.8, 1004.1]
+
+    def test_missing_values(self) -> None:
+        """Test missing-value sentinels are mapped to None."""
+        data = parse_fixed_width(SFCTM2_BODY)
+
+        assert data['GST'] == [None, 21]
+        assert data['TA'] == [27.0, None]
+        assert data['RN'] == [None, 1.5]
+
+    def test_temperature_of_minus_nine(self) -> None:
+        """Test a real -9.0 temperature is kept while -9.0 still marks missing wind."""
+        body = (
+            '# TM STN WS TA TD\n202501011200 108 -9.0 -9.0 -9.0\n202501011300 108  1.2 -9.5 -99.0\n'
+        )
+        data = parse_fixed_width(body)
+
+        assert data['TA'] == [-9.0, -9.5]
+        assert data['TD'] == [-9.0, None]
+        assert data['WS'] == [None, 1.2]
+
+    def test_duplicate_names(self) -> None:
+        """Test repeated header names get numbered suffixes."""
+        data = parse_fixed_width(SFCTM2_BODY)
+
+        assert 'GST_2' in data
+        assert data['RN_2'] == [None, None]
+
+    def test_blank_field_uses_column_bounds(self) -> None:
+        """Test rows with blank fields are sliced at header boundaries."""
+        data = parse_fixed_width(SFCTM2_BODY)
+
+        assert data['WW'] == ['WX', None]
+
+    def test_comma_separated(self) -> None:
+        """Test disp=1 comma-separated rows."""
+        body = '# TM,STN,TA,=\n202501011200,108,1.5,=\n202501011300,108,-99.0,=\n'
+        data = parse_fixed_width(body)
+
+        assert data == {
+            'TM': ['202501011200', '202501011300'],
+            'STN': [108, 108],
+            'TA': [1.5, None],
+        }
+
+    def test_euc_kr_bytes(self) -> None:
+        """Test EUC-KR encoded bodies are decoded."""
+        body = '# STN NAME\n108 서울\n'.encode('cp949')
+
+        assert parse_fixed_width(body) == {'STN': [108], 'NAME': ['서울']}
+
+    def test_custom_missing(self) -> None:
+        """Test the missing-value set can be overridden."""
+        data = parse_fixed_width('# STN TA\n108 -9.0\n', missing=frozenset())
+
+        assert data['TA'] == [-9.0]
+
+    def test_empty_body(self) -> None:
+        """Test an empty body yields no columns."""
+        assert parse_fixed_width('') == {}
+
+
+class TestDecodeResponse:
+    """Test response decoding."""
+
+    def test_json_response(self) -> None:
+        """Test JSON bodies are returned as-is."""
+        response = httpx.Response(200, json={'response': {'body': {}}})
+
+        assert decode_response(response) == {'response': {'body': {}}}
+
+    def test_text_response(self) -> None:
+        """Test fixed-width bodies are parsed into columns."""
+        response = httpx.Response(200, content=SFCTM2_BODY.encode('cp949'))
+
+        assert decode_response(response)['STN'] == [90, 108]
+
+    @patch('httpx.Client.get')
+    def test_client_returns_columns(self, mock_get: Mock) -> None:
+        """Test clients expose parsed text responses."""
+        request = httpx.Request('GET', ASOSClient.BASE_URL)
+        mock_get.return_value = httpx.Response(200, content=SFCTM2_BODY.encode(), request=request)
+
+        with ASOSClient('test_key') as client:
+            data = client.get_hourly_data(tm='201007151200')
+
+        assert data['TA'] == [27.0, None]
@@ -0,0 +1,167 @@
+"""Unit tests for issuance-aligned prefetching."""
+
+import asyncio
+import random
+from collections.abc import Iterator
+from datetime import datetime, timedelta
+
+import httpx
+import pytest
+
+from kma_mcp.core import prefetch, transport
+from kma_mcp.core.cache import KST
+from kma_mcp.core.prefetch import (
+    AsyncPrefetchTransport,
+    PrefetchJob,
+    PrefetchScheduler,
+    PrefetchStore,
+    every,
+)
+from kma_mcp.surface.async_aws_client import AsyncAWSClient
+
+NOW = datetime(2025, 6, 1, 12, 0, 30, tzinfo=KST)
+
+
+@pytest.fixture(autouse=True)
+def reset_prefetch() -> Iterator[None]:
+    """Disable the process-wide prefetch store after each test."""
+    yield
+    prefetch.configure_prefetch(enabled=False)
+
+
+@pytest.fixture
+def calls() -> list[httpx.Request]:
+    """Collect requests that reached the network."""
+    return []
+
+
+@pytest.fixture
+def upstream(calls: list[httpx.Request]) -> httpx.MockTransport:
+    """Create a fake API Hub answering every request with a small text body."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(200, text='# TM STN TA\n202506011200 108 21.5\n')
+
+    return httpx.MockTransport(handler)
+
+
+def test_every_aligns_to_the_period():
+    """Test periodic schedules return the next boundary strictly after now."""
+    minutely = every(60)
+
+    assert minutely(NOW) == datetime(2025, 6, 1, 12, 1, tzinfo=KST)
+    assert minutely(datetime(2025, 6, 1, 12, 1, tzinfo=KST)) == datetime(
+        2025, 6, 1, 12, 2, tzinfo=KST
+    )
+
+
+def test_jitter_is_capped_by_the_period():
+    """Test a run is delayed by at most the jitter, and never by a quarter period or more."""
+
+    async def fetch() -> None: ...
+
+    scheduler = PrefetchScheduler(
+        [PrefetchJob('aws', fetch, every(60))],
+        jitter=300,
+        rng=random.Random(0),  # noqa: S311
+    )
+    delays = [
+        (scheduler.due(scheduler.jobs[0], NOW) - datetime(2025, 6, 1, 12, 1, tzinfo=KST))
+        for _ in range(200)
+    ]
+
+    assert min(delays) >= timedelta(0)
+    assert max(delays) <= timedelta(seconds=15)
+
+
+@pytest.mark.asyncio
+async def test_prefetched_responses_serve_later_requests(upstream, calls):
+    """Test a prefetch fills the store and the same request is then answered from memory."""
+    store = PrefetchStore()
+    http_client = httpx.AsyncClient(transport=AsyncPrefetchTransport(upstream, store))
+
+    async def fetch() -> None:
+        async with AsyncAWSClient('key', http_client=http_client) as client:
+            await client.get_minutely_data(tm2='202506011200', stn=0)
+
+    scheduler = PrefetchScheduler([PrefetchJob('aws', fetch, every(3600))], warm_on_start=False)
+    assert await scheduler.run(scheduler.jobs[0])
+
+    async with AsyncAWSClient('other key', http_client=http_client) as client:
+        data = await client.get_minutely_data(tm2='202506011200', stn=0)
+        await client.get_minutely_data(tm2='202506011201', stn=0)
+    await http_client.aclose()
+
+    assert data['TA'] == [21.5]
+    assert len(calls) == 2
+    assert store.stats() == {'stored': 1, 'hits': 1, 'held': 1}
+    assert scheduler.stats()['aws']['runs'] == 1
+
+
+@pytest.mark.asyncio
+async def test_expired_responses_are_not_served(upstream, calls):
+    """Test responses are only served until the next issuance."""
+    store = PrefetchStore()
+    http_client = httpx.AsyncClient(transport=AsyncPrefetchTransport(upstream, store))
+    request = http_client.build_request('GET', 'https://apihub.kma.go.kr/api/typ01/url/a.php')
+    response = await http_client.send(request)
+    store.store(request, response, expires=0.0)
+
+    await http_client.get('https://apihub.kma.go.kr/api/typ01/url/a.php')
+    await http_client.aclose()
+
+    assert len(calls) == 2
+    assert store.hits == 0
+
+
+def test_errors_returned_with_status_200_are_not_kept():
+    """Test an API Hub error answered with status 200 is not stored for other keys."""
+    store = PrefetchStore()
+    request = httpx.Request('GET', 'https://apihub.kma.go.kr/api/typ01/url/a.php?authKey=bad')
+    response = httpx.Response(
+        200, json={'result': {'status': 403, 'message': 'invalid key'}}, request=request
+    )
+
+    store.store(request, response, expires=NOW.timestamp() + 3600)
+
+    assert len(store) == 0
+    assert store.lookup(request) is None
+
+
+@pytest.mark.asyncio
+async def test_scheduler_runs_jobs_and_survives_failures():
+    """Test jobs warm on start, failures are counted, and stop cancels the tasks."""
+    ran = asyncio.Event()
+
+    async def fetch() -> None:
+        ran.set()
+
+    async def broken() -> None:
+        msg = 'upstream down'
+        raise RuntimeError(msg)
+
+    scheduler = PrefetchScheduler(
+        [PrefetchJob('ok', fetch, every(3600)), PrefetchJob('broken', broken, every(3600))]
+    )
+    scheduler.start()
+    await asyncio.wait_for(ran.wait(), 1)
+    await asyncio.sleep(0)
+    assert scheduler.running
+    await scheduler.stop()
+
+    assert not scheduler.running
+    assert scheduler.stats()['ok']['runs'] == 1
+    assert scheduler.stats()['broken']['failures'] == 1
+
+
+@pytest.mark.asyncio
+async def test_shared_client_uses_configured_store():
+    """Test the shared async client answers from the store once prefetching is enabled."""
+    await transport.aclose_http_clients()
+    assert not isinstance(transport.get_async_http_client()._transport, AsyncPrefetchTransport)
+    await transport.aclose_http_clients()
+
+    prefetch.configure_prefetch()
+    assert isinstance(transport.get_async_http_client()._transport, AsyncPrefetchTransport)
+    await transport.aclose_http_clients()
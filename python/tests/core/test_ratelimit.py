@@ -0,0 +1,318 @@
+"""Unit tests for rate limiting, priorities and the quota ledger."""
+
+import asyncio
+import threading
+import time
+from datetime import datetime, timedelta
+
+import httpx
+import pytest
+
+from kma_mcp.core import ratelimit
+from kma_mcp.core.cache import KST
+from kma_mcp.core.ratelimit import (
+    AsyncRateLimitedTransport,
+    AsyncRateLimiter,
+    Priority,
+    QuotaExceededError,
+    QuotaLedger,
+    RateLimitedTransport,
+    RateLimiter,
+    SQLiteTokenBucket,
+    TokenBucket,
+    configure_rate_limit_from_env,
+    current_priority,
+    endpoint_family,
+    quota_status,
+)
+from kma_mcp.core.resilience import Resilience, ResilientTransport
+from kma_mcp.core.windowing import fetch_period
+
+
+class Clock:
+    """Manually advanced clock."""
+
+    def __init__(self, now: float = 0.0) -> None:
+        """Start at the given time."""
+        self.now = now
+
+    def __call__(self) -> float:
+        """Return the current time."""
+        return self.now
+
+
+class TestTokenBucket:
+    """Test the in-process and SQLite token buckets."""
+
+    def test_burst_then_rate(self) -> None:
+        """Test the bucket allows a burst and then refills at the rate."""
+        clock = Clock()
+        bucket = TokenBucket(rate=2, burst=2, clock=clock)
+
+        assert [bucket.reserve(), bucket.reserve()] == [0.0, 0.0]
+        assert bucket.reserve() == pytest.approx(0.5)
+        clock.now = 0.5
+        assert bucket.reserve() == 0.0
+
+    def test_sqlite_bucket_shared(self, tmp_path) -> None:
+        """Test two buckets on one file (e.g. two processes) share the tokens."""
+        clock = Clock(1000.0)
+        first = SQLiteTokenBucket(tmp_path / 'rate.sqlite', rate=1, burst=2, clock=clock)
+        second = SQLiteTokenBucket(tmp_path / 'rate.sqlite', rate=1, burst=2, clock=clock)
+
+        assert first.reserve() == 0.0
+        assert second.reserve() == 0.0
+        assert first.reserve() == pytest.approx(1.0)
+        first.close()
+        second.close()
+
+
+class TestPriorities:
+    """Test waiting requests are served in priority order."""
+
+    @pytest.mark.asyncio
+    async def test_async_interactive_overtakes_bulk(self) -> None:
+        """Test an interactive request queued after bulk ones is served first."""
+        limiter = AsyncRateLimiter(TokenBucket(rate=100, burst=1))
+        await limiter.acquire()
+        order: list[str] = []
+
+        async def request(name: str, priority: Priority) -> None:
+            await limiter.acquire(priority)
+            order.append(name)
+
+        bulk = [asyncio.create_task(request(f'bulk{i}', Priority.BULK)) for i in range(3)]
+        await asyncio.sleep(0)
+        interactive = asyncio.create_task(request('interactive', Priority.INTERACTIVE))
+        await asyncio.gather(*bulk, interactive)
+
+        assert order == ['interactive', 'bulk0', 'bulk1', 'bulk2']
+        assert limiter.granted[Priority.BULK] == 3
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_skipped(self) -> None:
+        """Test a cancelled waiter does not block or consume a later grant."""
+        limiter = AsyncRateLimiter(TokenBucket(rate=100, burst=1))
+        await limiter.acquire()
+        cancelled = asyncio.create_task(limiter.acquire(Priority.INTERACTIVE))
+        waiting = asyncio.create_task(limiter.acquire(Priority.BULK))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+
+        await asyncio.wait_for(waiting, timeout=1)
+
+        assert limiter.granted[Priority.BULK] == 1
+
+    @pytest.mark.asyncio
+    async def test_token_granted_to_cancelled_waiter_is_returned(self) -> None:
+        """Test a waiter cancelled just after its grant puts the token back."""
+        clock = Clock()
+        bucket = TokenBucket(rate=1, burst=1, clock=clock)
+        limiter = AsyncRateLimiter(bucket)
+        await limiter.acquire()
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+
+        clock.now = 1.0
+        limiter._dispatch()
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        assert bucket.reserve() == 0.0
+        assert limiter.granted[Priority.INTERACTIVE] == 1
+
+    def test_sync_interactive_overtakes_bulk(self) -> None:
+        """Test threads waiting for tokens are served in priority order."""
+        limiter = RateLimiter(TokenBucket(rate=10, burst=1))
+        limiter.acquire()
+        order: list[str] = []
+
+        def request(name: str, priority: Priority) -> None:
+            limiter.acquire(priority)
+            order.append(name)
+
+        bulk = threading.Thread(target=request, args=('bulk', Priority.BULK))
+        bulk.start()
+        time.sleep(0.02)
+        interactive = threading.Thread(target=request, args=('interactive', Priority.INTERACTIVE))
+        interactive.start()
+        bulk.join()
+        interactive.join()
+
+        assert order == ['interactive', 'bulk']
+
+    def test_windowed_fetches_are_bulk(self) -> None:
+        """Test period windows are requested at bulk priority."""
+        seen: list[Priority] = []
+
+        def get_daily_period(**period: str) -> dict:
+            seen.append(current_priority())
+            return {'TM': [period['tm1']]}
+
+        list(fetch_period(get_daily_period, '20240101', '20240301'))
+
+        assert seen == [Priority.BULK] * 2
+        assert current_priority() is Priority.INTERACTIVE
+
+
+class TestQuotaLedger:
+    """Test daily quota accounting."""
+
+    def test_limits_per_family_and_day(self) -> None:
+        """Test each family has its own daily count, reset at KST midnight."""
+        now = datetime(2025, 1, 1, 23, 59, tzinfo=KST)
+        ledger = QuotaLedger(2, limits={'kma_sfctm2.php': 1}, clock=lambda: now)
+
+        ledger.spend('kma_sfctm2.php')
+        with pytest.raises(QuotaExceededError, match=r'kma_sfctm2\.php'):
+            ledger.spend('kma_sfctm2.php')
+        ledger.spend('nph-dfs_shrt_grd')
+
+        assert ledger.remaining('nph-dfs_shrt_grd') == 1
+        assert ledger.status()['kma_sfctm2.php'] == {'used': 1, 'limit': 1, 'remaining': 0}
+        now += timedelta(minutes=1)
+        assert ledger.used('kma_sfctm2.php') == 0
+
+    def test_sqlite_ledger_shared(self, tmp_path) -> None:
+        """Test ledgers on one file count calls from every process."""
+        first = QuotaLedger(3, path=tmp_path / 'quota.sqlite')
+        second = QuotaLedger(3, path=tmp_path / 'quota.sqlite')
+
+        first.spend('kma_sfctm2.php')
+        second.spend('kma_sfctm2.php')
+
+        assert first.remaining('kma_sfctm2.php') == 1
+        first.close()
+        second.close()
+
+
+@pytest.mark.parametrize(
+    ('url', 'family'),
+    [
+        ('https://apihub.kma.go.kr/api/typ01/url/kma_sfctm2.php?tm=1', 'kma_sfctm2.php'),
+        ('https://apihub.kma.go.kr/api/typ01/cgi-bin/url/nph-dfs_shrt_grd', 'nph-dfs_shrt_grd'),
+        (
+            'https://apihub.kma.go.kr/api/typ02/openApi/VilageFcstInfoService_2.0/getVilageFcst',
+            'VilageFcstInfoService_2.0',
+        ),
+    ],
+)
+def test_endpoint_family(url: str, family: str) -> None:
+    """Test URLs are grouped into quota families."""
+    assert endpoint_family(httpx.URL(url)) == family
+
+
+def test_quota_exhaustion_is_not_retried() -> None:
+    """Test a spent quota fails at once instead of being retried."""
+    calls: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(200, json={})
+
+    ledger = QuotaLedger(1)
+    limiter = RateLimiter(TokenBucket(rate=1000, burst=10))
+    transport = ResilientTransport(
+        RateLimitedTransport(httpx.MockTransport(handler), limiter, ledger), Resilience()
+    )
+    client = httpx.Client(transport=transport)
+    url = 'https://apihub.kma.go.kr/api/typ01/url/kma_sfctm2.php'
+
+    client.get(url)
+    with pytest.raises(QuotaExceededError):
+        client.get(url)
+
+    assert len(calls) == 1
+    assert limiter.granted[Priority.INTERACTIVE] == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelled_wait_spends_no_quota() -> None:
+    """Test quota is only spent once a request has its token."""
+    limiter = AsyncRateLimiter(TokenBucket(rate=1, burst=1, clock=Clock()))
+    await limiter.acquire()
+    ledger = QuotaLedger(10)
+    upstream = httpx.MockTransport(lambda _request: httpx.Response(200, json={}))
+    transport = AsyncRateLimitedTransport(upstream, limiter, ledger)
+
+    async with httpx.AsyncClient(transport=transport) as client:
+        with pytest.raises(TimeoutError):
+            await asyncio.wait_for(
+                client.get('https://apihub.kma.go.kr/api/typ01/url/kma_sfctm2.php'), timeout=0.01
+            )
+
+    assert ledger.used('kma_sfctm2.php') == 0
+
+
+def test_waiters_on_a_later_event_loop_are_served() -> None:
+    """Test a timer left pending by a closed event loop does not stall the next loop."""
+    limiter = AsyncRateLimiter(TokenBucket(rate=20, burst=1))
+
+    async def cancel_a_waiter() -> None:
+        await limiter.acquire()
+        with pytest.raises(TimeoutError):
+            await asyncio.wait_for(limiter.acquire(), timeout=0.001)
+
+    async def wait_for_a_token() -> None:
+        await asyncio.wait_for(limiter.acquire(), timeout=1)
+
+    asyncio.run(cancel_a_waiter())
+    asyncio.run(wait_for_a_token())
+
+    assert limiter.granted[Priority.INTERACTIVE] == 2
+
+
+def test_waiters_on_other_threads_loops_are_served() -> None:
+    """Test a token freed on one event loop is handed to a waiter on another."""
+    limiter = AsyncRateLimiter(TokenBucket(rate=1000, burst=1))
+    other = asyncio.new_event_loop()
+    thread = threading.Thread(target=other.run_forever, daemon=True)
+    thread.start()
+
+    async def hold_then_release() -> None:
+        await limiter.acquire()
+        waiter = asyncio.run_coroutine_threadsafe(limiter.acquire(), other)
+        await asyncio.sleep(0.05)
+        limiter.release()
+        await asyncio.wrap_future(waiter)
+
+    try:
+        asyncio.run(asyncio.wait_for(hold_then_release(), timeout=2))
+    finally:
+        other.call_soon_threadsafe(other.stop)
+        thread.join(timeout=5)
+        other.close()
+
+    assert limiter.granted[Priority.INTERACTIVE] == 1
+
+
+def test_rejected_request_returns_its_token() -> None:
+    """Test a request refused by the quota gives its rate limit token back."""
+    bucket = TokenBucket(rate=1, burst=1, clock=Clock())
+    transport = RateLimitedTransport(
+        httpx.MockTransport(lambda _request: httpx.Response(200, json={})),
+        RateLimiter(bucket),
+        QuotaLedger(0),
+    )
+
+    with pytest.raises(QuotaExceededError):
+        httpx.Client(transport=transport).get('https://apihub.kma.go.kr/api/typ01/url/kma_wn.php')
+
+    assert bucket.reserve() == 0.0
+
+
+def test_configure_from_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test rate limiting can be disabled and quotas set from the environment."""
+    monkeypatch.setenv('KMA_RATE_LIMIT', '0')
+    monkeypatch.setenv('KMA_DAILY_QUOTA', '100')
+    try:
+        configure_rate_limit_from_env()
+
+        assert ratelimit._limiter is None
+        assert ratelimit._ledger.daily_limit == 100
+        assert quota_status() == {}
+    finally:
+        monkeypatch.delenv('KMA_RATE_LIMIT')
+        monkeypatch.delenv('KMA_DAILY_QUOTA')
+        configure_rate_limit_from_env()
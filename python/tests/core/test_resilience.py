@@ -0,0 +1,279 @@
+"""Unit tests for retries, circuit breakers and hedging."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from kma_mcp.core.ratelimit import QuotaExceededError
+from kma_mcp.core.resilience import (
+    AsyncResilientTransport,
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
+    Resilience,
+    ResilientTransport,
+    RetryPolicy,
+    configure_resilience_from_env,
+    get_resilience,
+)
+from kma_mcp.core.transport import close_http_clients, get_http_client
+from kma_mcp.surface.asos_client import ASOSClient
+
+URL = 'https://apihub.kma.go.kr/api/typ01/url/kma_sfctm2.php'
+
+
+class Clock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        """Start at zero."""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """Return the current time."""
+        return self.now
+
+
+def scripted(statuses: list[int | Exception], calls: list[httpx.Request]) -> httpx.MockTransport:
+    """Build a transport answering with the given statuses (or raising) in order."""
+    script = iter(statuses)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        outcome = next(script)
+        if isinstance(outcome, Exception):
+            raise outcome
+        headers = {'Retry-After': '7'} if outcome == 429 else {}
+        return httpx.Response(outcome, json={'status': outcome}, headers=headers)
+
+    return httpx.MockTransport(handler)
+
+
+def make_client(
+    statuses: list[int | Exception], policy: RetryPolicy, delays: list[float]
+) -> tuple[httpx.Client, Resilience, list[httpx.Request]]:
+    """Build a client whose transport retries a scripted upstream."""
+    calls: list[httpx.Request] = []
+    resilience = Resilience(policy, jitter=lambda: 1.0)
+    transport = ResilientTransport(scripted(statuses, calls), resilience, sleep=delays.append)
+    return httpx.Client(transport=transport), resilience, calls
+
+
+class TestRetries:
+    """Test retry and backoff behaviour of the sync transport."""
+
+    def test_retries_until_success(self) -> None:
+        """Test 5xx and connection errors are retried with exponential backoff."""
+        delays: list[float] = []
+        client, resilience, calls = make_client(
+            [503, httpx.ConnectError('reset'), 200], RetryPolicy(base_delay=0.5), delays
+        )
+
+        response = client.get(URL)
+
+        assert response.status_code == 200
+        assert len(calls) == 3
+        assert delays == [0.5, 1.0]
+        stats = resilience.stats()
+        assert (stats['requests'], stats['attempts'], stats['retries']) == (1, 3, 2)
+        assert stats['amplification'] == 3.0
+
+    def test_retry_after_honoured_and_capped(self) -> None:
+        """Test Retry-After replaces the backoff, bounded by max_delay."""
+        delays: list[float] = []
+        client, resilience, _ = make_client([429, 200], RetryPolicy(max_delay=5.0), delays)
+
+        client.get(URL)
+
+        assert delays == [5.0]
+        assert resilience.stats()['retry_after'] == 1
+
+    def test_exhausted_returns_last_response(self) -> None:
+        """Test the final retryable response reaches raise_for_status unchanged."""
+        client, resilience, calls = make_client([500, 502], RetryPolicy(max_attempts=2), [])
+
+        response = client.get(URL)
+
+        assert response.status_code == 502
+        assert len(calls) == 2
+        assert resilience.stats()['exhausted'] == 1
+
+    def test_client_errors_not_retried(self) -> None:
+        """Test 4xx other than 429 is returned at once."""
+        client, _, calls = make_client([401], RetryPolicy(), [])
+
+        assert client.get(URL).status_code == 401
+        assert len(calls) == 1
+
+    def test_non_idempotent_not_retried(self) -> None:
+        """Test POST requests pass through."""
+        client, resilience, calls = make_client([503], RetryPolicy(), [])
+
+        assert client.post(URL).status_code == 503
+        assert len(calls) == 1
+        assert resilience.stats()['requests'] == 0
+
+
+class TestCircuitBreaker:
+    """Test circuit breaker state transitions."""
+
+    def test_opens_then_probes(self) -> None:
+        """Test the circuit opens, lets one probe through, and closes on success."""
+        clock = Clock()
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10, clock=clock)
+
+        breaker.record_failure()
+        assert breaker.allow()
+        assert breaker.record_failure()
+        assert not breaker.allow()
+
+        clock.now = 10
+        assert breaker.state is CircuitState.HALF_OPEN
+        assert breaker.allow()
+        assert not breaker.allow()
+        breaker.record_success()
+        assert breaker.state is CircuitState.CLOSED
+
+    def test_failed_probe_reopens(self) -> None:
+        """Test a failed probe opens the circuit for another reset period."""
+        clock = Clock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+        breaker.record_failure()
+        clock.now = 10
+        assert breaker.allow()
+
+        assert breaker.record_failure()
+        clock.now = 15
+        assert not breaker.allow()
+
+    def test_open_circuit_fails_fast(self) -> None:
+        """Test requests to an endpoint with an open circuit are rejected without I/O."""
+        policy = RetryPolicy(max_attempts=1, failure_threshold=2)
+        client, resilience, calls = make_client([500, 500, 200], policy, [])
+
+        client.get(URL)
+        client.get(URL)
+        with pytest.raises(CircuitOpenError):
+            client.get(URL)
+
+        assert len(calls) == 2
+        stats = resilience.stats()
+        assert (stats['circuit_opened'], stats['circuit_rejected']) == (1, 1)
+        assert stats['open_circuits'] == 1
+
+    def test_probe_failing_before_the_endpoint_is_released(self) -> None:
+        """Test a probe ending in a non-transport error lets the next request probe."""
+        clock = Clock()
+        calls: list[httpx.Request] = []
+        upstream = scripted([500, QuotaExceededError('quota spent'), 200], calls)
+        policy = RetryPolicy(max_attempts=1, failure_threshold=1, reset_timeout=10)
+        transport = ResilientTransport(upstream, Resilience(policy, clock=clock))
+        client = httpx.Client(transport=transport)
+
+        client.get(URL)
+        clock.now = 10
+        with pytest.raises(QuotaExceededError):
+            client.get(URL)
+
+        assert client.get(URL).status_code == 200
+        assert len(calls) == 3
+
+    @pytest.mark.asyncio
+    async def test_cancelled_probe_is_released(self) -> None:
+        """Test a probe cancelled by a timeout lets the next request probe."""
+        clock = Clock()
+        attempts = 0
+
+        async def handler(_request: httpx.Request) -> httpx.Response:
+            nonlocal attempts
+            attempts += 1
+            if attempts == 2:
+                await asyncio.sleep(10)
+            return httpx.Response(500 if attempts == 1 else 200)
+
+        policy = RetryPolicy(max_attempts=1, failure_threshold=1, reset_timeout=10)
+        transport = AsyncResilientTransport(
+            httpx.MockTransport(handler), Resilience(policy, clock=clock)
+        )
+
+        async with httpx.AsyncClient(transport=transport) as client:
+            await client.get(URL)
+            clock.now = 10
+            with pytest.raises(TimeoutError):
+                await asyncio.wait_for(client.get(URL), timeout=0.01)
+            response = await client.get(URL)
+
+        assert response.status_code == 200
+        assert attempts == 3
+
+
+class TestAsyncTransport:
+    """Test the async transport, including hedging."""
+
+    @pytest.mark.asyncio
+    async def test_async_retries(self) -> None:
+        """Test async requests are retried like sync ones."""
+        calls: list[httpx.Request] = []
+        resilience = Resilience(RetryPolicy(base_delay=0), jitter=lambda: 1.0)
+        transport = AsyncResilientTransport(scripted([504, 200], calls), resilience)
+
+        async with httpx.AsyncClient(transport=transport) as client:
+            response = await client.get(URL)
+
+        assert response.status_code == 200
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_hedged_request_wins(self) -> None:
+        """Test a slow first attempt is raced by a hedge and the faster answer is used."""
+        started = 0
+
+        async def handler(_request: httpx.Request) -> httpx.Response:
+            nonlocal started
+            started += 1
+            if started == 1:
+                await asyncio.sleep(10)
+            return httpx.Response(200, json={'attempt': started})
+
+        resilience = Resilience(RetryPolicy(hedge_delay=0.01))
+        transport = AsyncResilientTransport(httpx.MockTransport(handler), resilience)
+
+        async with httpx.AsyncClient(transport=transport) as client:
+            response = await asyncio.wait_for(client.get(URL), timeout=1)
+
+        assert response.json() == {'attempt': 2}
+        stats = resilience.stats()
+        assert (stats['hedges'], stats['hedge_wins'], stats['attempts']) == (1, 1, 1)
+
+    @pytest.mark.asyncio
+    async def test_fast_request_not_hedged(self) -> None:
+        """Test requests answering before the hedge delay are sent once."""
+        calls: list[httpx.Request] = []
+        resilience = Resilience(RetryPolicy(hedge_delay=1.0))
+        transport = AsyncResilientTransport(scripted([200], calls), resilience)
+
+        async with httpx.AsyncClient(transport=transport) as client:
+            await client.get(URL)
+
+        assert len(calls) == 1
+        assert resilience.stats()['hedges'] == 0
+
+
+def test_clients_and_shared_pool_use_resilience(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test standalone clients and the shared pool are built on the resilient transport."""
+    monkeypatch.setenv('KMA_RETRY_MAX_ATTEMPTS', '2')
+    monkeypatch.setenv('KMA_HEDGE_DELAY', '1.5')
+    configure_resilience_from_env()
+    close_http_clients()
+    try:
+        assert get_resilience().policy.max_attempts == 2
+        assert get_resilience().policy.hedge_delay == 1.5
+        with ASOSClient('test_key') as client:
+            assert isinstance(client._client._transport, ResilientTransport)
+        assert isinstance(get_http_client()._transport, ResilientTransport)
+    finally:
+        monkeypatch.delenv('KMA_RETRY_MAX_ATTEMPTS')
+        monkeypatch.delenv('KMA_HEDGE_DELAY')
+        configure_resilience_from_env()
+        close_http_clients()
@@ -0,0 +1,166 @@
+"""Unit tests for the local observation store."""
+
+from collections.abc import Iterator
+from datetime import datetime, timedelta
+
+import httpx
+import pytest
+
+from kma_mcp.core import store as store_module
+from kma_mcp.core.cache import KST
+from kma_mcp.core.store import ObservationStore, configure_store, find_gaps
+from kma_mcp.surface.asos_client import ASOSClient
+from kma_mcp.surface.async_asos_client import AsyncASOSClient
+
+HOUR = timedelta(hours=1)
+
+
+def _time(text: str) -> datetime:
+    return datetime.strptime(text, '%Y%m%d%H%M')  # noqa: DTZ007
+
+
+@pytest.fixture
+def store() -> Iterator[ObservationStore]:
+    """Enable an in-process store for the test."""
+    yield configure_store(':memory:')  # type: ignore[misc]
+    configure_store(None)
+
+
+@pytest.fixture
+def calls() -> list[tuple[str, str, str]]:
+    """Collect the (tm1, tm2, stn) of requests that reached the network."""
+    return []
+
+
+@pytest.fixture
+def upstream(calls: list[tuple[str, str, str]]) -> httpx.MockTransport:
+    """Create a fake API Hub answering hourly rows of two stations for any period."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        params = request.url.params
+        calls.append((params['tm1'], params['tm2'], params['stn']))
+        lines = ['#START7777', '# TM STN TA']
+        time, end = _time(params['tm1']), _time(params['tm2'])
+        while time <= end:
+            lines.extend(
+                f'{time:%Y%m%d%H%M} {stn} {time.hour}.5'
+                for stn in (108, 112)
+                if params['stn'] in {'0', str(stn)}
+            )
+            time += HOUR
+        return httpx.Response(200, text='\n'.join([*lines, '#7777END']))
+
+    return httpx.MockTransport(handler)
+
+
+def test_find_gaps():
+    """Test the planner returns the uncovered parts of a range."""
+    covered = [
+        (_time('202501010200'), _time('202501010300')),
+        (_time('202501010500'), _time('202501010500')),
+    ]
+
+    assert find_gaps(_time('202501010000'), _time('202501010800'), covered, HOUR) == [
+        (_time('202501010000'), _time('202501010100')),
+        (_time('202501010400'), _time('202501010400')),
+        (_time('202501010600'), _time('202501010800')),
+    ]
+    assert find_gaps(_time('202501010200'), _time('202501010300'), covered, HOUR) == []
+
+
+def test_only_gaps_are_fetched(store, upstream, calls):
+    """Test overlapping requests fetch only the hours not held locally."""
+    with ASOSClient('key', http_client=httpx.Client(transport=upstream)) as client:
+        first = client.get_hourly_period('202501010000', '202501010500')
+        second = client.get_hourly_period('202501010300', '202501010800')
+        third = client.get_hourly_period('202501010200', '202501010700', stn=108)
+
+    assert calls == [('202501010000', '202501010500', '0'), ('202501010600', '202501010800', '0')]
+    assert first['TM'][:3] == ['202501010000', '202501010000', '202501010100']
+    assert second['TM'][0] == '202501010300'
+    assert len(second['STN']) == 12
+    assert third == {
+        'TM': [f'202501010{hour}00' for hour in '234567'],
+        'STN': [108] * 6,
+        'TA': [2.5, 3.5, 4.5, 5.5, 6.5, 7.5],
+    }
+    assert store.stats() == {'series': 1, 'observations': 18, 'coverage': 1}
+
+
+@pytest.mark.usefixtures('store')
+def test_station_requests_do_not_cover_all_stations(upstream, calls):
+    """Test rows of one station do not answer a request for every station."""
+    with ASOSClient('key', http_client=httpx.Client(transport=upstream)) as client:
+        client.get_hourly_period('202501010000', '202501010300', stn=108)
+        client.get_hourly_period('202501010000', '202501010300', stn=108)
+        data = client.get_hourly_period('202501010000', '202501010300')
+
+    assert len(calls) == 2
+    assert data['STN'] == [108, 112] * 4
+
+
+def test_recent_rows_are_not_stored(upstream, calls):
+    """Test rows newer than the settle period are fetched on every request."""
+    now = datetime.now(KST).replace(tzinfo=None)
+    store = configure_store(':memory:', settle=now - _time('202501010300'))
+    try:
+        with ASOSClient('key', http_client=httpx.Client(transport=upstream)) as client:
+            client.get_hourly_period('202501010000', '202501010500')
+            data = client.get_hourly_period('202501010000', '202501010500')
+    finally:
+        configure_store(None)
+
+    assert calls[1] == ('202501010400', '202501010500', '0')
+    assert data['TM'][-1] == '202501010500'
+    assert len(data['TM']) == 12
+    assert store is not None
+    assert store.stats()['observations'] == 8
+
+
+def test_error_documents_are_passed_through(store):
+    """Test responses that are not tables are returned as they are and not stored."""
+    error = {'result': {'status': 403, 'message': 'quota exceeded'}}
+    upstream = httpx.MockTransport(lambda _: httpx.Response(200, json=error))
+    with ASOSClient('key', http_client=httpx.Client(transport=upstream)) as client:
+        assert client.get_hourly_period('202501010000', '202501010500') == error
+
+    assert store.stats()['coverage'] == 0
+
+
+def test_other_series_and_endpoints_are_separate(store, upstream, calls):
+    """Test requests with other parameters or unstored endpoints bypass the rows held."""
+    with ASOSClient('key', http_client=httpx.Client(transport=upstream)) as client:
+        client.get_element_data('202501010000', '202501010100', obs='TA', stn=108)
+        client.get_element_data('202501010000', '202501010100', obs='TA', stn=108)
+
+    assert len(calls) == 2
+    assert store.stats()['series'] == 0
+
+
+def test_compact_merges_coverage(store):
+    """Test compaction drops station intervals inside all-station ones."""
+    series = store.series_id('kma_sfctm3.php', {'help': '0'})
+    store._conn.executemany(
+        'INSERT INTO coverage VALUES (?, ?, ?, ?)',
+        [
+            (series, 0, '202501010000', '202501010500'),
+            (series, 0, '202501010300', '202501010800'),
+            (series, 108, '202501010100', '202501010200'),
+            (series, 108, '202501011000', '202501011100'),
+        ],
+    )
+
+    assert store.compact() == {'intervals_before': 4, 'intervals_after': 2}
+    assert store_module.get_store() is store
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures('store')
+async def test_async_read_through(upstream, calls):
+    """Test the async clients read through the same store."""
+    async with AsyncASOSClient('key', http_client=httpx.AsyncClient(transport=upstream)) as client:
+        await client.get_hourly_period('202501010000', '202501010500')
+        data = await client.get_hourly_period('202501010100', '202501010200', stn=112)
+
+    assert len(calls) == 1
+    assert data == {'TM': ['202501010100', '202501010200'], 'STN': [112, 112], 'TA': [1.5, 2.5]}
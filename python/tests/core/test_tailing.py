@@ -0,0 +1,121 @@
+"""Unit tests for tailing live minutely feeds."""
+
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from kma_mcp.core.tailing import TailCursor, atail, tail
+
+
+class Feed:
+    """Minutely observations of two stations, served like ``get_minutely_data``."""
+
+    def __init__(self) -> None:
+        """Start an empty feed at 12:00."""
+        self.rows: dict[tuple[str, int], float] = {}
+        self.now = datetime(2025, 1, 1, 12, 0)  # noqa: DTZ001
+        self.requests: list[tuple[str, str]] = []
+
+    def advance(self, minutes: int) -> None:
+        """Let time pass, both stations reporting every minute."""
+        for _ in range(minutes):
+            self.now += timedelta(minutes=1)
+            for stn in (108, 112):
+                self.rows[self.now.strftime('%Y%m%d%H%M'), stn] = 1.0
+
+    def __call__(self, tm1: str, tm2: str, **_: object) -> dict[str, list]:
+        """Return the rows observed from tm1 to tm2."""
+        self.requests.append((tm1, tm2))
+        keys = sorted(key for key in self.rows if tm1 <= key[0] <= tm2)
+        return {
+            'YYMMDDHHMI': [tm for tm, _ in keys],
+            'STN': [stn for _, stn in keys],
+            'TA': [self.rows[key] for key in keys],
+        }
+
+
+@pytest.fixture
+def feed() -> Feed:
+    """Create a feed with five minutes of data."""
+    feed = Feed()
+    feed.advance(5)
+    return feed
+
+
+def test_polls_request_and_yield_only_new_minutes(feed):
+    """Test later polls start after the newest observation and skip seen rows."""
+    cursor = TailCursor(lookback=timedelta(0), clock=lambda: feed.now)
+
+    first = cursor.update([feed(*cursor.window())])
+    feed.advance(2)
+    second = cursor.update([feed(*cursor.window())])
+
+    assert feed.requests == [('202501011205', '202501011205'), ('202501011206', '202501011207')]
+    assert first == {'YYMMDDHHMI': ['202501011205'] * 2, 'STN': [108, 112], 'TA': [1.0, 1.0]}
+    assert second['YYMMDDHHMI'] == ['202501011206', '202501011206', '202501011207', '202501011207']
+    assert cursor.last_seen == {108: '202501011207', 112: '202501011207'}
+
+
+def test_lookback_picks_up_late_and_corrected_rows(feed):
+    """Test rows arriving late or changing within the lookback are yielded once."""
+    cursor = TailCursor(since='202501011201', lookback=timedelta(minutes=3), clock=lambda: feed.now)
+    assert len(cursor.update([feed(*cursor.window())])['STN']) == 10
+
+    feed.rows['202501011204', 112] = 2.0
+    feed.rows['202501011203', 120] = 3.0
+    assert cursor.window() == ('202501011203', '202501011205')
+    rows = cursor.update([feed(*cursor.window())])
+
+    assert list(zip(rows['YYMMDDHHMI'], rows['STN'], rows['TA'], strict=True)) == [
+        ('202501011203', 120, 3.0),
+        ('202501011204', 112, 2.0),
+    ]
+    assert cursor.update([feed(*cursor.window())]) == {'YYMMDDHHMI': [], 'STN': [], 'TA': []}
+
+
+def test_rejects_responses_without_times():
+    """Test JSON responses cannot be tailed, and negative lookbacks are rejected."""
+    with pytest.raises(ValueError, match='columnar'):
+        TailCursor().update([{'response': {'body': {}}}])
+    with pytest.raises(ValueError, match='lookback'):
+        TailCursor(lookback=timedelta(minutes=-1))
+
+
+def test_tail_catches_up_after_a_stall(feed):
+    """Test a long gap is fetched in legal windows and empty polls are not yielded."""
+    method = Mock(side_effect=feed)
+    cursor = TailCursor(since='202412311200', clock=lambda: feed.now)
+
+    polls = list(tail(method, cursor=cursor, interval=0, polls=2, stn=0))
+
+    assert method.call_count == 3
+    assert method.call_args_list[0].kwargs == {
+        'tm1': '202412311200',
+        'tm2': '202501011159',
+        'stn': 0,
+    }
+    assert len(polls) == 1
+    assert len(polls[0]['STN']) == 10
+
+
+@pytest.mark.asyncio
+async def test_atail_yields_new_rows(feed):
+    """Test the async generator follows the feed across polls."""
+    ticks = iter(range(3))
+
+    def clock() -> datetime:
+        # Every poll after the first sees one more minute of data
+        if next(ticks):
+            feed.advance(1)
+        return feed.now
+
+    method = AsyncMock(side_effect=feed)
+    cursor = TailCursor(lookback=timedelta(0), clock=clock)
+    polls = [rows async for rows in atail(method, cursor=cursor, interval=0, polls=3)]
+
+    assert [rows['YYMMDDHHMI'] for rows in polls] == [
+        ['202501011205'] * 2,
+        ['202501011206'] * 2,
+        ['202501011207'] * 2,
+    ]
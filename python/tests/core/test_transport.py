@@ -0,0 +1,145 @@
+"""Unit tests for the shared HTTP transport."""
+
+import asyncio
+import threading
+from collections.abc import Iterator
+from unittest.mock import Mock, patch
+
+import httpx
+import pytest
+
+from kma_mcp.core import transport
+from kma_mcp.surface.async_aws_client import AsyncAWSClient
+from kma_mcp.surface.aws_client import AWSClient
+
+
+@pytest.fixture(autouse=True)
+def reset_transport() -> Iterator[None]:
+    """Close shared clients and restore default pool settings after each test."""
+    yield
+    transport.close_http_clients()
+    transport.configure(
+        max_connections=transport.DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections=transport.DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=transport.DEFAULT_KEEPALIVE_EXPIRY,
+        timeout=transport.DEFAULT_TIMEOUT,
+    )
+
+
+class TestSharedSyncClient:
+    """Test the process-wide sync client."""
+
+    def test_returns_same_instance(self) -> None:
+        """Test repeated calls share one pooled client."""
+        client = transport.get_http_client()
+        assert isinstance(client, httpx.Client)
+        assert transport.get_http_client() is client
+
+    def test_recreated_after_close(self) -> None:
+        """Test a new client is created after the pool is closed."""
+        client = transport.get_http_client()
+        transport.close_http_clients()
+        assert client.is_closed
+        assert transport.get_http_client() is not client
+
+    def test_configure_limits(self) -> None:
+        """Test pool limits can be configured."""
+        transport.configure(max_connections=5, max_keepalive_connections=2, timeout=5.0)
+        assert transport._limits.max_connections == 5
+        assert transport._limits.max_keepalive_connections == 2
+        assert transport.get_http_client().timeout.connect == 5.0
+
+    def test_configure_zero(self) -> None:
+        """Test zero is a setting, not a request to keep the current value."""
+        transport.configure(max_keepalive_connections=0, keepalive_expiry=0)
+        assert transport._limits.max_keepalive_connections == 0
+        assert transport._limits.keepalive_expiry == 0
+        assert transport._limits.max_connections == transport.DEFAULT_MAX_CONNECTIONS
+
+    def test_configure_from_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test pool limits are read from KMA_HTTP_* variables."""
+        monkeypatch.setenv('KMA_HTTP_MAX_CONNECTIONS', '42')
+        monkeypatch.setenv('KMA_HTTP_KEEPALIVE_EXPIRY', '12.5')
+        monkeypatch.setenv('KMA_HTTP2', 'false')
+        transport.configure_from_env()
+        assert transport._limits.max_connections == 42
+        assert transport._limits.keepalive_expiry == 12.5
+        assert transport._use_http2() is False
+
+
+class TestClientInjection:
+    """Test clients reuse an injected HTTP client."""
+
+    def test_shared_client_not_closed(self) -> None:
+        """Test closing a client leaves the shared pool open."""
+        shared = transport.get_http_client()
+        with AWSClient('test_key', http_client=shared) as client:
+            assert client._client is shared
+        assert not shared.is_closed
+
+    def test_owned_client_closed(self) -> None:
+        """Test a client without injection still closes its own HTTP client."""
+        with AWSClient('test_key') as client:
+            own = client._client
+        assert own.is_closed
+
+    @patch('httpx.Client.get')
+    def test_request_uses_client_timeout(self, mock_get: Mock) -> None:
+        """Test per-client timeout is applied when sharing the pool."""
+        mock_response = Mock()
+        mock_response.json.return_value = {'ok': True}
+        mock_get.return_value = mock_response
+
+        client = AWSClient('test_key', timeout=7.0, http_client=transport.get_http_client())
+        client.get_minutely_data(tm2='202501011200', stn=108)
+
+        assert mock_get.call_args.kwargs['timeout'] == 7.0
+
+
+class TestSharedAsyncClient:
+    """Test the async client pool."""
+
+    @pytest.mark.asyncio
+    async def test_returns_same_instance_in_loop(self) -> None:
+        """Test repeated calls within one event loop share a client."""
+        client = transport.get_async_http_client()
+        assert transport.get_async_http_client() is client
+        await transport.aclose_http_clients()
+        assert client.is_closed
+
+    @pytest.mark.asyncio
+    async def test_shared_client_not_closed(self) -> None:
+        """Test closing an async client leaves the shared pool open."""
+        shared = transport.get_async_http_client()
+        async with AsyncAWSClient('test_key', http_client=shared) as client:
+            assert client._client is shared
+        assert not shared.is_closed
+        await transport.aclose_http_clients()
+
+    @pytest.mark.asyncio
+    async def test_each_loop_has_its_own_client(self) -> None:
+        """Test a loop in another thread neither replaces nor leaks this loop's client."""
+        other = asyncio.new_event_loop()
+        thread = threading.Thread(target=other.run_forever, daemon=True)
+        thread.start()
+
+        async def shared() -> httpx.AsyncClient:
+            return transport.get_async_http_client()
+
+        try:
+            client = transport.get_async_http_client()
+            theirs = asyncio.run_coroutine_threadsafe(shared(), other).result(timeout=5)
+            assert theirs is not client
+            assert transport.get_async_http_client() is client
+
+            await transport.aclose_http_clients()
+            for _ in range(100):
+                if theirs.is_closed:
+                    break
+                await asyncio.sleep(0.01)
+            assert client.is_closed
+            assert theirs.is_closed
+        finally:
+            other.call_soon_threadsafe(other.stop)
+            thread.join(timeout=5)
+            other.close()
@@ -0,0 +1,163 @@
+"""Unit tests for period window splitting and fan-out."""
+
+import asyncio
+import itertools
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from kma_mcp.core.windowing import (
+    DAILY,
+    HOURLY,
+    PeriodSpec,
+    afetch_period,
+    fetch_period,
+    merge_chunks,
+    split_period,
+)
+
+
+def _parse(tm: str) -> datetime:
+    return datetime.strptime(tm, '%Y%m%d%H%M')  # noqa: DTZ007
+
+
+def _chunk(tm1: str, tm2: str, **_: object) -> dict[str, list]:
+    """Return one row per hour of the window for two stations, boundary included twice."""
+    start, end = _parse(tm1), _parse(tm2)
+    # Simulate an API that also returns the hour before tm1
+    start -= timedelta(hours=1)
+    times = []
+    while start <= end:
+        times.append(start.strftime('%Y%m%d%H%M'))
+        start += timedelta(hours=1)
+    return {
+        'TM': [tm for tm in times for _ in (108, 112)],
+        'STN': [stn for _ in times for stn in (108, 112)],
+    }
+
+
+def test_split_period_daily():
+    """Test splitting a daily span into 31-day windows."""
+    assert split_period('20250101', '20250305', DAILY) == [
+        ('20250101', '20250131'),
+        ('20250201', '20250303'),
+        ('20250304', '20250305'),
+    ]
+
+
+def test_split_period_hourly_covers_span_without_gaps():
+    """Test that hourly windows are contiguous and within the limit."""
+    windows = split_period('201501010000', '202412312300', HOURLY)
+
+    assert windows[0][0] == '201501010000'
+    assert windows[-1][1] == '202412312300'
+    for (_, end), (start, _) in itertools.pairwise(windows):
+        assert _parse(start) - _parse(end) == timedelta(hours=1)
+    for start, end in windows:
+        assert _parse(end) - _parse(start) < timedelta(days=31)
+
+
+def test_split_period_single_window_and_datetime():
+    """Test a span shorter than the limit and datetime inputs."""
+    assert split_period(_parse('202501010000'), _parse('202501020000'), HOURLY) == [
+        ('202501010000', '202501020000')
+    ]
+
+
+def test_split_period_rejects_reversed_span():
+    """Test that an end before the start is rejected."""
+    with pytest.raises(ValueError, match='after end time'):
+        split_period('20250201', '20250101', DAILY)
+
+
+def test_fetch_period_deduplicates_boundaries():
+    """Test that sync fetching yields ordered windows without boundary duplicates."""
+    method = Mock(side_effect=_chunk)
+    method.__name__ = 'get_hourly_period'
+    spec = PeriodSpec(timedelta(hours=3), timedelta(hours=1), '%Y%m%d%H%M')
+
+    chunks = list(fetch_period(method, '202501010000', '202501010800', spec=spec, stn=0))
+    merged = merge_chunks(chunks)
+
+    assert method.call_count == 3
+    assert method.call_args_list[0].kwargs == {
+        'tm1': '202501010000',
+        'tm2': '202501010200',
+        'stn': 0,
+    }
+    assert merged['TM'][0] == '202412312300'
+    assert len(set(zip(merged['TM'], merged['STN'], strict=True))) == len(merged['TM'])
+    assert merged['TM'] == sorted(merged['TM'])
+    assert len(merged['TM']) == 10 * 2
+
+
+def test_fetch_period_infers_spec_from_method_name():
+    """Test that known client methods do not need an explicit spec."""
+    method = Mock(return_value={'response': {}})
+    method.__name__ = 'get_daily_period'
+
+    chunks = list(fetch_period(method, '20250101', '20250305'))
+
+    assert len(chunks) == 3
+    assert chunks[0] == {'response': {}}
+
+
+def test_fetch_period_unknown_method_requires_spec():
+    """Test that unknown methods must be given a spec."""
+    method = Mock()
+    method.__name__ = 'get_something'
+
+    with pytest.raises(ValueError, match='pass spec explicitly'):
+        list(fetch_period(method, '20250101', '20250105'))
+
+
+def test_merge_chunks_pads_missing_columns():
+    """Test merging windows whose columns differ."""
+    merged = merge_chunks([{'TM': ['1'], 'TA': [1.0]}, {'TM': ['2'], 'HM': [50.0]}])
+
+    assert merged == {'TM': ['1', '2'], 'TA': [1.0, None], 'HM': [None, 50.0]}
+
+
+@pytest.mark.asyncio
+async def test_afetch_period_orders_and_bounds_concurrency():
+    """Test async fan-out: time order kept and concurrency bounded."""
+    in_flight = 0
+    peak = 0
+
+    async def fetch(tm1: str, tm2: str, **kwargs: object) -> dict[str, list]:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        # Later windows finish first
+        await asyncio.sleep(0.01 * (20 - int(tm1[-4:-2])) / 10)
+        in_flight -= 1
+        return _chunk(tm1, tm2, **kwargs)
+
+    method = AsyncMock(side_effect=fetch)
+    method.__name__ = 'get_hourly_period'
+    spec = PeriodSpec(timedelta(hours=2), timedelta(hours=1), '%Y%m%d%H%M')
+
+    chunks = [
+        chunk
+        async for chunk in afetch_period(
+            method, '202501010000', '202501011900', spec=spec, concurrency=3
+        )
+    ]
+    merged = merge_chunks(chunks)
+
+    assert method.await_count == 10
+    assert peak <= 3
+    assert merged['TM'] == sorted(merged['TM'])
+    assert len(set(zip(merged['TM'], merged['STN'], strict=True))) == len(merged['TM'])
+
+
+@pytest.mark.asyncio
+async def test_afetch_period_rejects_bad_concurrency():
+    """Test that concurrency must be positive."""
+    method = AsyncMock()
+    method.__name__ = 'get_hourly_period'
+
+    with pytest.raises(ValueError, match='concurrency'):
+        async for _ in afetch_period(method, '202501010000', '202501020000', concurrency=0):
+            pass
@@ -220,7 +220,7 @@ class TestForecastClientRequests:
         mock_response.raise_for_status = Mock()
         mock_get.return_value = mock_response
 
-        result = forecast_client.convert_grid_to_coords(x=60, y=127)
+        result = forecast_client.convert_grid_to_coords(x=60, y=127, local=False)
 
         assert result == mock_response_data
         assert 'nph-dfs_xy_lonlat' in mock_get.call_args.args[0]
@@ -240,13 +240,24 @@ class TestForecastClientRequests:
         mock_response.raise_for_status = Mock()
         mock_get.return_value = mock_response
 
-        result = forecast_client.convert_coords_to_grid(lon=127.5, lat=36.5)
+        result = forecast_client.convert_coords_to_grid(lon=127.5, lat=36.5, local=False)
 
         assert result == mock_response_data
         assert 'nph-dfs_xy_lonlat' in mock_get.call_args.args[0]
         assert mock_get.call_args.kwargs['params']['lon'] == '127.5'
         assert mock_get.call_args.kwargs['params']['lat'] == '36.5'
 
+    @patch('httpx.Client.get')
+    def test_convert_grid_locally(self, mock_get: Mock, forecast_client: ForecastClient) -> None:
+        """Test grid conversions are computed without a request by default."""
+        grid = forecast_client.convert_coords_to_grid(lon=126.9780, lat=37.5665)
+        coords = forecast_client.convert_grid_to_coords(x=60, y=127)
+
+        assert (grid['X'], grid['Y']) == ([60], [127])
+        assert coords['LAT'][0] == pytest.approx(37.579871, abs=1e-6)
+        assert coords['LON'][0] == pytest.approx(126.989352, abs=1e-6)
+        mock_get.assert_not_called()
+
     # Category 3: Village Forecast Messages Tests
     @patch('httpx.Client.get')
     def test_get_weather_situation(
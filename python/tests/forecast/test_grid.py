@@ -0,0 +1,158 @@
+"""Unit tests for village forecast grid decoding and storage."""
+
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+import numpy as np
+import pytest
+
+from kma_mcp.forecast.async_forecast_client import AsyncForecastClient
+from kma_mcp.forecast.forecast_client import ForecastClient
+from kma_mcp.forecast.grid import GRID_SHAPE, GridKey, GridStore, decode_grid
+
+SIZE = GRID_SHAPE[0] * GRID_SHAPE[1]
+
+
+def make_values() -> np.ndarray:
+    """Build a grid whose value encodes its position, with one missing point."""
+    values = np.arange(SIZE, dtype=np.float32) / 10
+    values[1] = -99.0
+    return values
+
+
+def ascii_body(values: np.ndarray) -> bytes:
+    """Format values like the ASCII grid variant (10 per line, comma separated)."""
+    rows = [
+        ', '.join(f'{value:.1f}' for value in values[start : start + 10]) + ','
+        for start in range(0, len(values), 10)
+    ]
+    return '\n'.join(['# grid data', *rows]).encode()
+
+
+def binary_body(values: np.ndarray, order: str = '<') -> bytes:
+    """Encode values like the binary variant (grid count + floats)."""
+    return np.array([SIZE], f'{order}i4').tobytes() + values.astype(f'{order}f4').tobytes()
+
+
+@pytest.mark.parametrize(
+    'body',
+    [ascii_body(make_values()), binary_body(make_values()), binary_body(make_values(), '>')],
+    ids=['ascii', 'binary-le', 'binary-be'],
+)
+def test_decode_grid(body):
+    """Test both variants decode to the same bottom-left ordered array."""
+    grid = decode_grid(body)
+
+    assert grid.shape == GRID_SHAPE
+    assert grid.dtype == np.float32
+    assert np.isnan(grid[0, 1])
+    # Grid point (x, y) = (60, 127)
+    assert grid[126, 59] == pytest.approx((126 * 149 + 59) / 10)
+
+
+def test_decode_grid_with_leading_count():
+    """Test the ASCII variant that starts with the grid count."""
+    body = f'{SIZE}\n'.encode() + ascii_body(make_values())
+
+    assert decode_grid(body)[0, 0] == 0.0
+
+
+def test_decode_grid_too_short():
+    """Test partial grids are rejected."""
+    with pytest.raises(ValueError, match='expected'):
+        decode_grid(b'1.0, 2.0, 3.0')
+
+
+class TestGridStore:
+    """Test the memory-mapped grid store."""
+
+    KEY = GridKey('shrt', 'TMP', '202501010500', '202501010600')
+
+    def test_put_and_read(self, tmp_path) -> None:
+        """Test stored grids are memory-mapped and sliced by grid number."""
+        store = GridStore(tmp_path)
+        grid = decode_grid(binary_body(make_values()))
+
+        stored = store.put(self.KEY, grid)
+
+        assert isinstance(stored, np.memmap)
+        assert self.KEY in store
+        assert store.point(self.KEY, x=60, y=127) == pytest.approx(grid[126, 59])
+        np.testing.assert_array_equal(store.bbox(self.KEY, 59, 126, 61, 128), grid[125:128, 58:61])
+        assert store.point(GridKey('shrt', 'TMP', '202501010800', ''), 60, 127) is None
+
+    def test_series_over_cycles(self, tmp_path) -> None:
+        """Test one point is read from every stored cycle in time order."""
+        store = GridStore(tmp_path)
+        for hour in (8, 5, 2):
+            grid = np.full(GRID_SHAPE, float(hour), dtype=np.float32)
+            store.put(GridKey('shrt', 'TMP', f'20250101{hour:02d}00', '202501011200'), grid)
+        store.put(GridKey('shrt', 'REH', '202501010200', '202501011200'), np.zeros(GRID_SHAPE))
+
+        series = store.series('shrt', 'TMP', x=60, y=127)
+
+        assert [key.tmfc for key in series] == ['202501010200', '202501010500', '202501010800']
+        assert list(series.values()) == [2.0, 5.0, 8.0]
+        assert len(store.keys()) == 4
+
+    @pytest.mark.parametrize(('x', 'y'), [(0, 127), (150, 127), (60, 0), (60, 254), (-1, -1)])
+    def test_point_outside_grid(self, tmp_path, x, y) -> None:
+        """Test points outside the grid are rejected instead of wrapping around."""
+        store = GridStore(tmp_path)
+        store.put(self.KEY, np.zeros(GRID_SHAPE))
+
+        with pytest.raises(ValueError, match='outside'):
+            store.point(self.KEY, x, y)
+        with pytest.raises(ValueError, match='outside'):
+            store.bbox(self.KEY, x, y, 149, 253)
+        with pytest.raises(ValueError, match='outside'):
+            store.series('shrt', 'TMP', x, y)
+
+    def test_bbox_corners_in_order(self, tmp_path) -> None:
+        """Test a box given upper-right corner first is rejected."""
+        with pytest.raises(ValueError, match='lower-left'):
+            GridStore(tmp_path).bbox(self.KEY, 61, 128, 59, 126)
+
+    def test_invalid_key(self, tmp_path) -> None:
+        """Test key components cannot escape the store directory."""
+        with pytest.raises(ValueError, match='Invalid grid key'):
+            GridStore(tmp_path).path(GridKey('shrt', '../TMP', '202501010500'))
+
+
+@patch('httpx.Client.get')
+def test_client_grid_array_uses_store(mock_get: Mock, tmp_path) -> None:
+    """Test the client decodes a grid once and then serves it from the store."""
+    mock_response = Mock()
+    mock_response.content = binary_body(make_values())
+    mock_response.raise_for_status = Mock()
+    mock_get.return_value = mock_response
+    store = GridStore(tmp_path)
+
+    with ForecastClient('test_key') as client:
+        first = client.get_village_grid_array(
+            'shrt', 'TMP', '202501010500', '202501010600', store=store
+        )
+        second = client.get_village_grid_array(
+            'shrt', 'TMP', '202501010500', '202501010600', store=store
+        )
+        with pytest.raises(ValueError, match='Unknown grid product'):
+            client.get_village_grid_array('xxx', 'TMP', '202501010500')
+
+    np.testing.assert_array_equal(first, second)
+    assert mock_get.call_count == 1
+    assert 'nph-dfs_shrt_grd' in mock_get.call_args.args[0]
+    assert mock_get.call_args.kwargs['params']['vars'] == 'TMP'
+
+
+@pytest.mark.asyncio
+@patch('httpx.AsyncClient.get')
+async def test_async_grid_latlon_array(mock_get) -> None:
+    """Test the async client requests and decodes the binary lat/lon grid."""
+    mock_response = MagicMock()
+    mock_response.content = binary_body(make_values())
+    mock_get.side_effect = AsyncMock(return_value=mock_response)
+
+    async with AsyncForecastClient('test_key') as client:
+        grid = await client.get_grid_latlon_array(fct='SHRT', latlon='lon')
+
+    assert grid.shape == GRID_SHAPE
+    assert mock_get.call_args.kwargs['params']['disp'] == 'B'
@@ -0,0 +1,106 @@
+"""Unit tests for batched multi-point village forecasts."""
+
+import asyncio
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from kma_mcp.forecast.async_forecast_client import AsyncForecastClient
+from kma_mcp.forecast.forecast_client import ForecastClient
+from kma_mcp.forecast.grid import GRID_SHAPE
+from kma_mcp.forecast.points import aforecast_points, forecast_points, plan_points, valid_times
+from kma_mcp.tools import forecast_tools
+
+SEOUL = (37.5665, 126.9780)
+SEOUL_NEARBY = (37.5670, 126.9785)
+BUSAN = (35.1796, 129.0756)
+TOKYO = (35.6762, 139.6503)
+
+
+def fake_grid(_product: str, var: str, _tmfc: str, tmef: str, **_kwargs: object) -> np.ndarray:
+    """Return a grid whose values encode grid position and valid hour."""
+    y, x = np.mgrid[1 : GRID_SHAPE[0] + 1, 1 : GRID_SHAPE[1] + 1]
+    grid = (x * 1000 + y + int(tmef[8:10]) / 100).astype(np.float32)
+    if var == 'PCP':
+        grid[:] = np.nan
+    return grid
+
+
+def test_plan_points_groups_cells():
+    """Test locations in the same cell share one cell and outside ones are flagged."""
+    plan = plan_points([SEOUL, BUSAN, SEOUL_NEARBY, TOKYO])
+
+    assert plan.cells.tolist() == [[60, 127], [98, 76]]
+    assert plan.cell_index.tolist() == [0, 1, 0, -1]
+
+
+def test_valid_times():
+    """Test valid times start one hour after the issue."""
+    assert valid_times('202501312300', 2) == ['202502010000', '202502010100']
+
+
+def test_forecast_points_fetches_each_grid_once():
+    """Test upstream requests scale with variables x hours, not with locations."""
+    points = [SEOUL, BUSAN, SEOUL_NEARBY] * 100 + [TOKYO]
+    with patch.object(ForecastClient, 'get_village_grid_array', side_effect=fake_grid) as mock:
+        results = forecast_points(
+            ForecastClient('test_key'), points, '202501010500', ['TMP', 'PCP'], hours=3
+        )
+
+    assert mock.call_count == 6
+    assert len(results) == 301
+    seoul = results[0]
+    assert (seoul['nx'], seoul['ny']) == (60, 127)
+    assert seoul['tmef'] == ['202501010600', '202501010700', '202501010800']
+    assert seoul['TMP'] == [60127.06, 60127.07, 60127.08]
+    assert seoul['PCP'] == [None, None, None]
+    assert results[1]['TMP'][0] == 98076.06
+    assert 'error' in results[-1]
+
+
+@pytest.mark.asyncio
+async def test_aforecast_points_concurrency():
+    """Test the async variant limits concurrent downloads."""
+    active = 0
+    peak = 0
+
+    async def fetch(*args, **kwargs) -> np.ndarray:
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.001)
+        active -= 1
+        return fake_grid(*args, **kwargs)
+
+    with patch.object(AsyncForecastClient, 'get_village_grid_array', side_effect=fetch) as mock:
+        results = await aforecast_points(
+            AsyncForecastClient('test_key'), [SEOUL, BUSAN], '202501010500', hours=6, concurrency=2
+        )
+
+    assert mock.await_count == 24
+    assert peak == 2
+    assert results[1]['SKY'][-1] == 98076.11
+
+
+def test_no_requests_when_all_outside():
+    """Test no grid is downloaded when no location is inside the grid."""
+    with patch.object(ForecastClient, 'get_village_grid_array') as mock:
+        results = forecast_points(ForecastClient('test_key'), [TOKYO], '202501010500')
+
+    mock.assert_not_called()
+    assert 'error' in results[0]
+
+
+def test_village_forecast_batch_tool():
+    """Test the batch tool parses variables and validates hours."""
+    forecast_tools.set_api_key('test_key')
+    with patch.object(ForecastClient, 'get_village_grid_array', side_effect=fake_grid) as mock:
+        result = forecast_tools.get_village_forecast_batch(
+            [list(SEOUL), list(BUSAN)], '202501010500', variables='TMP, REH', hours=2
+        )
+
+    assert mock.call_count == 4
+    assert '"REH":[60127.06,60127.07]' in result
+    assert forecast_tools.get_village_forecast_batch([list(SEOUL)], hours=0).startswith('Error')
+    forecast_tools.set_api_key('')
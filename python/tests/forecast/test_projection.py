@@ -0,0 +1,136 @@
+"""Unit tests for the local village forecast grid projection."""
+
+from datetime import datetime
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from kma_mcp.core.cache import KST
+from kma_mcp.forecast.issuance import (
+    latest_ultra_short_base,
+    latest_village_base,
+    next_ultra_short_available,
+    next_village_available,
+)
+from kma_mcp.forecast.projection import GRID_NX, GRID_NY, grid_to_latlon, in_grid, latlon_to_grid
+from kma_mcp.tools import forecast_tools
+
+# Grid numbers published by KMA for administrative districts (lat, lon, x, y)
+KMA_GRID_POINTS = [
+    (37.5635694, 126.9800083, 60, 127),  # Seoul Jung-gu
+    (35.1770194, 129.0769528, 98, 76),  # Busan Busanjin-gu
+    (35.8685417, 128.6035528, 89, 90),  # Daegu Jung-gu
+    (37.4532333, 126.7073528, 55, 124),  # Incheon Namdong-gu
+    (35.1569750, 126.8533639, 58, 74),  # Gwangju Seo-gu
+    (36.3471194, 127.3865667, 67, 100),  # Daejeon Seo-gu
+    (35.5354083, 129.3136889, 102, 84),  # Ulsan Nam-gu
+    (33.4856944, 126.5003333, 52, 38),  # Jeju-si
+]
+
+# Coordinate ranges documented for nph-dfs_xy_lonlat (x, y, lat, lon)
+DOMAIN_CORNERS = [
+    (1, GRID_NY, 43.393490, 123.310165),
+    (GRID_NX, 1, 31.651814, 131.642),
+]
+
+
+@pytest.mark.parametrize(('lat', 'lon', 'x', 'y'), KMA_GRID_POINTS)
+def test_latlon_to_grid_matches_kma(lat, lon, x, y):
+    """Test coordinates map to the grid numbers published by KMA."""
+    assert latlon_to_grid(lat, lon) == (x, y)
+
+
+@pytest.mark.parametrize(('x', 'y', 'lat', 'lon'), DOMAIN_CORNERS)
+def test_grid_corners_match_documented_range(x, y, lat, lon):
+    """Test the domain corners reproduce the documented coordinate range."""
+    assert grid_to_latlon(x, y) == pytest.approx((lat, lon), abs=1e-3)
+
+
+def test_round_trip_whole_grid():
+    """Test every grid point converts to coordinates and back to itself."""
+    y, x = np.mgrid[1 : GRID_NY + 1, 1 : GRID_NX + 1]
+
+    lat, lon = grid_to_latlon(x.ravel(), y.ravel())
+    back_x, back_y = latlon_to_grid(lat, lon)
+
+    assert back_x.dtype == np.int64
+    np.testing.assert_array_equal(back_x, x.ravel())
+    np.testing.assert_array_equal(back_y, y.ravel())
+
+
+def test_array_input_matches_scalar():
+    """Test vectorized conversion agrees with point-by-point conversion."""
+    lats = np.array([point[0] for point in KMA_GRID_POINTS])
+    lons = np.array([point[1] for point in KMA_GRID_POINTS])
+
+    x, y = latlon_to_grid(lats, lons)
+
+    assert x.tolist() == [point[2] for point in KMA_GRID_POINTS]
+    assert y.tolist() == [point[3] for point in KMA_GRID_POINTS]
+
+
+def test_in_grid():
+    """Test the domain check for scalars and arrays."""
+    assert in_grid(60, 127)
+    assert not in_grid(0, 127)
+    assert in_grid(np.array([1, 150]), np.array([253, 1])).tolist() == [True, False]
+
+
+@pytest.mark.parametrize(
+    ('now', 'expected'),
+    [
+        (datetime(2025, 1, 1, 9, 30, tzinfo=KST), ('20250101', '0800')),
+        (datetime(2025, 1, 1, 8, 5, tzinfo=KST), ('20250101', '0500')),
+        (datetime(2025, 1, 1, 1, 0, tzinfo=KST), ('20241231', '2300')),
+        (datetime(2025, 1, 1, 2, 10), ('20250101', '0200')),  # noqa: DTZ001
+    ],
+)
+def test_latest_village_base(now, expected):
+    """Test the latest available issue accounts for the publication delay."""
+    assert latest_village_base(now) == expected
+
+
+@pytest.mark.parametrize(
+    ('now', 'expected'),
+    [
+        (datetime(2025, 1, 1, 9, 50, tzinfo=KST), ('20250101', '0930')),
+        (datetime(2025, 1, 1, 9, 40, tzinfo=KST), ('20250101', '0830')),
+        (datetime(2025, 1, 1, 0, 10), ('20241231', '2330')),  # noqa: DTZ001
+    ],
+)
+def test_latest_ultra_short_base(now, expected):
+    """Test the half-hourly issues become available 15 minutes after issue."""
+    assert latest_ultra_short_base(now) == expected
+
+
+@pytest.mark.parametrize(
+    ('now', 'village', 'ultra_short'),
+    [
+        (datetime(2025, 1, 1, 2, 10, tzinfo=KST), (1, 1, 5, 10), (1, 1, 2, 45)),
+        (datetime(2025, 1, 1, 9, 44, tzinfo=KST), (1, 1, 11, 10), (1, 1, 9, 45)),
+        (datetime(2025, 1, 1, 23, 50), (1, 2, 2, 10), (1, 2, 0, 45)),  # noqa: DTZ001
+    ],
+)
+def test_next_availability(now, village, ultra_short):
+    """Test the next issues become available strictly after now, across midnight."""
+    assert next_village_available(now) == datetime(2025, *village, 0, tzinfo=KST)
+    assert next_ultra_short_available(now) == datetime(2025, *ultra_short, 0, tzinfo=KST)
+    assert latest_village_base(next_village_available(now))[1] == f'{village[2]:02d}00'
+
+
+def test_village_forecast_by_location_tool():
+    """Test the tool requests the grid cell of the location."""
+    forecast_tools.set_api_key('test_key')
+    with patch(
+        'kma_mcp.forecast.forecast_client.ForecastClient.get_village_forecast',
+        return_value={'items': []},
+    ) as mock_get:
+        result = forecast_tools.get_village_forecast_by_location(
+            37.5665, 126.9780, base_date='20250101', base_time='0500'
+        )
+
+    assert result == '{"items":[]}'
+    mock_get.assert_called_once_with(base_date='20250101', base_time='0500', nx=60, ny=127)
+    assert forecast_tools.get_village_forecast_by_location(0.0, 0.0).startswith('Error')
+    forecast_tools.set_api_key('')
@@ -0,0 +1,153 @@
+"""Unit tests for warning change events."""
+
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from kma_mcp.core.parsing import parse_fixed_width
+from kma_mcp.forecast import warning_events
+from kma_mcp.forecast.warning_events import WarningState, active_warnings, awatch, watch
+from kma_mcp.tools import async_forecast_tools, forecast_tools
+from kma_mcp.tools.memo import clear_caches
+
+HEADER = '# REG_UP, REG_KO, REG_ID, TM_FC, TM_EF, WRN, LVL, CMD,\n'
+MORNING = parse_fixed_width(
+    HEADER + 'L1100000, 서울동남권, L1100100, 202501010600, 202501010600, 한파, 주의, 발표, =\n'
+    'L1100000, 서울동북권, L1100200, 202501010600, 202501010600, 한파, 주의, 발표, =\n'
+    'L1000000, 강원북부산지, L1010100, 202501010600, 202501010700, 대설, 예비, 발표, =\n'
+)
+NOON = parse_fixed_width(
+    HEADER + 'L1100000, 서울동남권, L1100100, 202501011100, 202501011200, 한파, 경보, 변경, =\n'
+    'L1100000, 서울동북권, L1100200, 202501010600, 202501010600, 한파, 주의, 발표, =\n'
+    'L1000000, 강원북부산지, L1010100, 202501011100, 202501011100, 대설, 예비, 해제, =\n'
+    'L1000000, 강원중부산지, L1010200, 202501011100, 202501011200, 대설, 주의, 발표, =\n'
+)
+
+
+def _changes(events) -> list[tuple]:
+    return [(event.kind, event.zone, event.warning, event.level) for event in events]
+
+
+def test_diff_reports_each_kind_of_change():
+    """Test issues, upgrades and lifts are found, and unchanged warnings skipped."""
+    state = WarningState()
+    first = state.update(MORNING)
+    second = state.update(NOON)
+
+    assert [event.kind for event in first] == ['issue'] * 3
+    assert _changes(second) == [
+        ('lift', 'L1010100', '대설', None),
+        ('issue', 'L1010200', '대설', 2),
+        ('upgrade', 'L1100100', '한파', 3),
+    ]
+    assert second[2].previous_level == 2
+    assert second[2].time == '202501011200'
+    assert [event.seq for event in state.events_since(3)] == [4, 5, 6]
+    assert state.active[('L1100200', '한파')] == 2
+
+    assert state.update(NOON) == []
+    assert _changes(state.update(MORNING)) == [
+        ('issue', 'L1010100', '대설', 1),
+        ('lift', 'L1010200', '대설', None),
+        ('downgrade', 'L1100100', '한파', 2),
+    ]
+
+
+def test_subscriptions_receive_matching_events():
+    """Test subscribers get only their kinds and zones, until they unsubscribe."""
+    state = WarningState()
+    seoul, upgrades = Mock(), Mock()
+    state.subscribe(seoul, zones=['L1100100'])
+    unsubscribe = state.subscribe(upgrades, kinds={'upgrade'})
+
+    state.update(MORNING)
+    unsubscribe()
+    state.update(NOON)
+
+    assert [_changes(call.args[0]) for call in seoul.call_args_list] == [
+        [('issue', 'L1100100', '한파', 2)],
+        [('upgrade', 'L1100100', '한파', 3)],
+    ]
+    upgrades.assert_not_called()
+    with pytest.raises(ValueError, match='Unknown event kinds'):
+        state.subscribe(seoul, kinds={'extend'})
+
+
+def test_history_is_bounded_and_other_responses_rejected():
+    """Test only the last events are kept and non-warning responses raise."""
+    state = WarningState(history=2)
+    state.update(MORNING)
+
+    assert [event.seq for event in state.events_since()] == [2, 3]
+    with pytest.raises(ValueError, match='not a warning list'):
+        active_warnings({'result': {'status': 500}})
+
+
+def test_watch_yields_only_polls_with_changes():
+    """Test the poller skips polls that changed nothing."""
+    method = Mock(side_effect=[MORNING, MORNING, NOON])
+
+    polls = list(watch(method, interval=0, polls=3, stn=0))
+
+    assert [len(events) for events in polls] == [3, 3]
+    assert method.call_args.kwargs == {'stn': 0}
+
+
+@pytest.mark.asyncio
+async def test_awatch_yields_changes():
+    """Test the async poller follows the same state."""
+    state = WarningState()
+    method = AsyncMock(side_effect=[MORNING, NOON])
+
+    polls = [events async for events in awatch(method, state=state, interval=0, polls=2)]
+
+    assert len(polls) == 2
+    assert state.seq == 6
+
+
+@pytest.fixture
+def fresh_state(monkeypatch) -> WarningState:
+    """Give the tools an empty shared warning state."""
+    clear_caches()
+    state = WarningState()
+    monkeypatch.setattr(warning_events, '_state', state)
+    return state
+
+
+def test_warning_changes_tool(fresh_state):
+    """Test the tool polls once per minute and returns changes after a seq."""
+    forecast_tools.set_api_key('test_key')
+    with patch(
+        'kma_mcp.forecast.warning_client.WarningClient.get_current_warnings', return_value=MORNING
+    ) as mock_get:
+        first = forecast_tools.get_weather_warning_changes()
+        again = forecast_tools.get_weather_warning_changes(since=3)
+        lifts = forecast_tools.get_weather_warning_changes(kinds='lift')
+
+    assert mock_get.call_count == 1
+    assert len(first.splitlines()) == 3
+    assert '"kind":"issue"' in first
+    assert again == 'No warning changes after seq 3 (latest seq: 3)'
+    assert lifts.startswith('No warning changes')
+    assert fresh_state.seq == 3
+    assert forecast_tools.get_weather_warning_changes(kinds='moved').startswith('Error')
+    forecast_tools.set_api_key('')
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures('fresh_state')
+async def test_async_warning_changes_tool():
+    """Test the async tool returns only the changes after the given seq."""
+    async_forecast_tools.set_api_key('test_key')
+    with patch(
+        'kma_mcp.forecast.async_warning_client.AsyncWarningClient.get_current_warnings',
+        new=AsyncMock(side_effect=[MORNING, NOON]),
+    ):
+        await async_forecast_tools.get_weather_warning_changes()
+        clear_caches()  # the next minute
+        result = await async_forecast_tools.get_weather_warning_changes(
+            since=3, kinds='upgrade,lift', fields=['seq', 'kind', 'zone'], output_format='csv'
+        )
+
+    assert result == 'seq,kind,zone\n4,lift,L1010100\n6,upgrade,L1100100'
+    async_forecast_tools.set_api_key('')
@@ -0,0 +1,172 @@
+"""Unit tests for the warning zone index."""
+
+import time
+from unittest.mock import AsyncMock, patch
+
+import numpy as np
+import pytest
+
+from kma_mcp.core.parsing import parse_fixed_width
+from kma_mcp.forecast.zones import ZoneIndex, select_zones
+from kma_mcp.surface.station_index import StationIndex, chord_to_km, unit_vectors
+from kma_mcp.tools import async_forecast_tools, forecast_tools
+from kma_mcp.tools.memo import clear_caches
+
+AWS = parse_fixed_width(
+    '# STN_ID LON LAT STN_KO\n'
+    '400 127.0470 37.5137 강남\n'
+    '410 126.9658 37.5714 기상청\n'
+    '102 124.6305 37.9741 백령도\n'
+)
+ZONE_TABLE = parse_fixed_width(
+    '# STN_ID REG_ID REG_KO\n'
+    '400 L1100100 서울동남권\n'
+    '410 L1100200 서울서북권\n'
+    '102 L1011300 서해5도\n'
+    '999 L9999999 없음\n'
+)
+WARNINGS = parse_fixed_width(
+    '# REG_UP, REG_KO, REG_ID, TM_FC, TM_EF, WRN, LVL, CMD,\n'
+    'L1100000, 서울동남권, L1100100, 202501010600, 202501010600, 한파, 주의, 발표, =\n'
+    'L1100000, 서울서북권, L1100200, 202501010600, 202501010600, 한파, 경보, 발표, =\n'
+)
+
+
+def test_from_table_joins_stations():
+    """Test sites are located through the station index, unknown ones dropped."""
+    zones = ZoneIndex.from_table(ZONE_TABLE, stations=StationIndex.from_responses(aws=AWS))
+
+    assert len(zones) == 3
+    assert zones.zones['L1011300'] == '서해5도'
+    assert zones.locate(37.57, 126.97)['zone_id'] == 'L1100200'
+    assert zones.locate(37.50, 127.06)['zone_name'] == '서울동남권'
+    with pytest.raises(ValueError, match='no coordinates'):
+        ZoneIndex.from_table(ZONE_TABLE)
+
+
+def test_from_table_with_empty_station_index():
+    """Test no site is located when the station index is empty."""
+    zones = ZoneIndex.from_table(ZONE_TABLE, stations=StationIndex([], [], []))
+
+    assert len(zones) == 0
+    assert zones.locate(37.57, 126.97)['zone_id'] is None
+
+
+def test_locations_far_from_every_site_have_no_zone():
+    """Test the distance limit applies on and off the grid."""
+    zones = ZoneIndex.from_table(
+        {'REG_ID': ['A', 'B'], 'LAT': [37.0, 35.0], 'LON': [127.0, 129.0]}, max_distance_km=30
+    )
+
+    assert zones.locate(37.1, 127.0)['distance_km'] == pytest.approx(11.1, abs=0.1)
+    rows = zones.locate_many([37.1, 36.0], [127.0, 128.0])
+    assert rows['zone_id'] == ['A', None]
+    assert rows['distance_km'] == [pytest.approx(11.1, abs=0.1), None]
+    assert zones.locate(36.0, 128.0)['zone_id'] is None
+    assert zones.locate(20.0, 127.0)['zone_id'] is None
+    assert zones.locate(float('nan'), 127.0)['zone_id'] is None
+    assert ZoneIndex([], [], []).locate_many([37.0], [127.0])['zone_id'] == [None]
+
+
+def test_grid_lookups_match_brute_force():
+    """Test the bucketed lookup finds the same nearest site as comparing every site."""
+    rng = np.random.default_rng(7)
+    lat, lon = rng.uniform(33, 38.5, 600), rng.uniform(125, 130, 600)
+    zones = ZoneIndex([f'Z{site}' for site in range(600)], lat, lon, max_distance_km=None)
+    points_lat, points_lon = rng.uniform(32.5, 39, 2000), rng.uniform(124.5, 130.5, 2000)
+
+    located = zones.locate_many(points_lat, points_lon)
+
+    sites, points = unit_vectors(lat, lon), unit_vectors(points_lat, points_lon)
+    distances = chord_to_km(np.linalg.norm(points[:, None, :] - sites[None, :, :], axis=2))
+    expected = [f'Z{site}' for site in distances.argmin(axis=1)]
+    assert located['zone_id'] == expected
+    assert np.allclose(located['distance_km'], distances.min(axis=1), atol=1e-3)
+    assert zones.locate(points_lat[0], points_lon[0])['zone_id'] == expected[0]
+
+
+def test_batch_lookup_is_fast():
+    """Test thousands of points resolve without a per-point scan."""
+    rng = np.random.default_rng(1)
+    lat, lon = rng.uniform(33, 38.5, 700), rng.uniform(125, 130, 700)
+    zones = ZoneIndex([str(site) for site in range(700)], lat, lon)
+
+    start = time.perf_counter()
+    zones.locate_many(rng.uniform(33, 38.5, 10_000), rng.uniform(125, 130, 10_000))
+
+    assert time.perf_counter() - start < 1.0
+
+
+def test_select_zones():
+    """Test warning rows are kept by zone."""
+    selected = select_zones(WARNINGS, ['L1100200'])
+
+    assert selected['LVL'] == ['경보']
+    with pytest.raises(ValueError, match='no zone column'):
+        select_zones({'STN': [1]}, ['L1100200'])
+
+
+@pytest.fixture
+def zone_sources():
+    """Serve the zone table and station list to both tool modules."""
+    clear_caches()
+    with (
+        patch(
+            'kma_mcp.forecast.forecast_client.ForecastClient.get_aws_warning_zone_code',
+            return_value=ZONE_TABLE,
+        ),
+        patch('kma_mcp.surface.station_client.StationClient.get_aws_stations', return_value=AWS),
+        patch(
+            'kma_mcp.forecast.async_forecast_client.AsyncForecastClient.get_aws_warning_zone_code',
+            new=AsyncMock(return_value=ZONE_TABLE),
+        ),
+        patch(
+            'kma_mcp.surface.async_station_client.AsyncStationClient.get_aws_stations',
+            new=AsyncMock(return_value=AWS),
+        ),
+    ):
+        yield
+
+
+@pytest.mark.usefixtures('zone_sources')
+def test_warning_zone_tools():
+    """Test the sync tools resolve locations and filter the warnings of their zone."""
+    forecast_tools.set_api_key('test_key')
+    with patch(
+        'kma_mcp.forecast.warning_client.WarningClient.get_current_warnings', return_value=WARNINGS
+    ):
+        result = forecast_tools.get_warnings_at_location(37.57, 126.97, fields=['REG_ID', 'LVL'])
+        island = forecast_tools.get_warnings_at_location(37.97, 124.63)
+        sea = forecast_tools.get_warnings_at_location(30.0, 135.0)
+
+    assert result == '{"REG_ID":"L1100200","LVL":"경보"}'
+    assert island == 'No active warnings in zone L1011300 (서해5도)'
+    assert sea == 'Location (30.0, 135.0) is not in any warning zone'
+
+    batch = forecast_tools.get_warning_zones_batch(
+        [[37.57, 126.97], [37.50, 127.06], [30.0, 135.0]],
+        fields=['zone_id'],
+        output_format='csv',
+    )
+    assert batch == 'zone_id\nL1100200\nL1100100\n'
+    assert forecast_tools.get_warning_zones_batch([[37.5]]).startswith('Error')
+    forecast_tools.set_api_key('')
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures('zone_sources')
+async def test_async_warning_zone_tools():
+    """Test the async tools share the same behaviour."""
+    async_forecast_tools.set_api_key('test_key')
+    with patch(
+        'kma_mcp.forecast.async_warning_client.AsyncWarningClient.get_current_warnings',
+        new=AsyncMock(return_value=WARNINGS),
+    ):
+        result = await async_forecast_tools.get_warnings_at_location(
+            37.50, 127.06, fields=['REG_KO', 'WRN'], output_format='csv'
+        )
+
+    batch = await async_forecast_tools.get_warning_zones_batch([[37.97, 124.63]])
+    assert result == 'REG_KO,WRN\n서울동남권,한파'
+    assert '"zone_id":"L1011300"' in batch
+    async_forecast_tools.set_api_key('')
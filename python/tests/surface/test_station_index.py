@@ -0,0 +1,127 @@
+"""Unit tests for the local station index."""
+
+import time
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from kma_mcp.core.parsing import parse_fixed_width
+from kma_mcp.surface.station_index import StationIndex
+from kma_mcp.tools import surface_tools
+from kma_mcp.tools.memo import clear_caches
+
+ASOS_BODY = """#START7777
+# STN_ID   LON        LAT       HT     STN_KO   TM_ED
+     108  126.9658   37.5714   85.8    서울     -
+     112  126.6249   37.4776   68.9    인천     -
+     159  129.0320   35.1047   69.6    부산     -
+     999  127.0000   37.5000   10.0    폐지     20001231
+#7777END
+"""
+
+AWS_BODY = """# STN_ID   LON        LAT       HT     STN_KO
+     400  127.0470   37.5137   33.0    강남
+     410  126.9780   37.5665   -99.0   기상청
+"""
+
+
+@pytest.fixture
+def index() -> StationIndex:
+    """Build an index from sample ASOS and AWS station lists."""
+    return StationIndex.from_responses(
+        asos=parse_fixed_width(ASOS_BODY), aws=parse_fixed_width(AWS_BODY)
+    )
+
+
+def test_from_responses(index):
+    """Test columns are detected and stations typed."""
+    assert len(index) == 6
+    assert index.station_ids.tolist() == [108, 112, 159, 999, 400, 410]
+    assert index.types.tolist() == ['ASOS'] * 4 + ['AWS'] * 2
+    assert index.active.tolist() == [True, True, True, False, True, True]
+    assert index.names[0] == '서울'
+
+
+def test_nearest(index):
+    """Test nearest stations are ordered by distance."""
+    stations = index.nearest(37.5665, 126.9780, count=3)
+
+    assert [station['station_id'] for station in stations] == [410, 108, 400]
+    assert stations[0]['distance_km'] == 0.0
+    assert stations[0]['altitude_m'] is None
+    assert 1.0 < stations[1]['distance_km'] < 2.0
+
+
+def test_nearest_filters(index):
+    """Test station type and active filters."""
+    asos = index.nearest(37.5, 127.0, count=2, station_type='asos')
+    with_closed = index.nearest(37.5, 127.0, count=1, active_only=False)
+
+    assert [station['station_id'] for station in asos] == [108, 112]
+    assert with_closed[0]['station_id'] == 999
+    assert index.nearest(37.5, 127.0, count=0) == []
+
+
+def test_within(index):
+    """Test radius queries."""
+    stations = index.within(37.5665, 126.9780, radius_km=10)
+
+    assert [station['station_id'] for station in stations] == [410, 108, 400]
+    # Seoul to Busan is about 325 km
+    assert [station['station_id'] for station in index.within(37.5665, 126.9780, 300)] == [
+        410,
+        108,
+        400,
+        112,
+    ]
+
+
+def test_missing_columns():
+    """Test station lists without coordinates are rejected."""
+    with pytest.raises(ValueError, match='latitude/longitude'):
+        StationIndex.from_response({'STN': [108], 'NAME': ['서울']})
+
+
+def test_active_with_explicit_now():
+    """Test closing dates relative to a given time."""
+    data = parse_fixed_width(ASOS_BODY)
+
+    index = StationIndex.from_response(data, now=datetime(1999, 1, 1))  # noqa: DTZ001
+
+    assert index.active.all()
+
+
+def test_nearest_is_fast(index):
+    """Test a query over a few thousand stations takes well under a millisecond."""
+    big = StationIndex.concat([index] * 500)
+    big.nearest(37.5, 127.0, count=5)
+
+    start = time.perf_counter()
+    for _ in range(100):
+        big.nearest(37.5, 127.0, count=5)
+    assert (time.perf_counter() - start) / 100 < 0.005
+
+
+def test_get_nearby_stations_tool():
+    """Test the tool downloads station lists once and answers locally."""
+    clear_caches()
+    surface_tools.set_api_key('test_key')
+    with (
+        patch(
+            'kma_mcp.surface.station_client.StationClient.get_asos_stations',
+            return_value=parse_fixed_width(ASOS_BODY),
+        ) as mock_asos,
+        patch(
+            'kma_mcp.surface.station_client.StationClient.get_aws_stations',
+            return_value=parse_fixed_width(AWS_BODY),
+        ),
+    ):
+        first = surface_tools.get_nearby_stations(37.5665, 126.9780, count=1)
+        second = surface_tools.get_nearby_stations(35.1, 129.0, station_type='asos', count=1)
+
+    assert '"station_id":410' in first
+    assert '"station_id":159' in second
+    assert mock_asos.call_count == 1
+    assert surface_tools.get_nearby_stations(37.5, 127.0, station_type='x').startswith('Error')
+    surface_tools.set_api_key('')
@@ -0,0 +1,100 @@
+"""Start-up benchmark for the MCP servers.
+
+Each test runs the server in a fresh interpreter, as an MCP client spawning
+it would, and reports the measured times as test properties.
+"""
+
+import json
+import os
+import subprocess
+import sys
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+SRC = Path(__file__).resolve().parents[1] / 'src'
+
+# Modules that must not be imported before the first tool call
+DEFERRED = [
+    'numpy',
+    'kma_mcp.core.aggregate',
+    'kma_mcp.core.columnar',
+    'kma_mcp.forecast.forecast_client',
+    'kma_mcp.surface.aws_client',
+    'kma_mcp.surface.async_aws_client',
+]
+
+FIRST_TOOL_CALL = """
+import asyncio, json, sys, time
+
+start = time.perf_counter()
+import httpx
+
+def handle_request(self, request):
+    return httpx.Response(200, json={'stn': [104], 'ta': [3.5]}, request=request)
+
+httpx.HTTPTransport.handle_request = handle_request
+
+from fastmcp import Client
+from kma_mcp.mcp_server import mcp
+
+imported = time.perf_counter()
+
+async def call():
+    async with Client(mcp) as client:
+        return await client.call_tool('get_aws_current_weather', {'station_id': 104})
+
+result = asyncio.run(call())
+print(json.dumps({
+    'import': imported - start,
+    'first_tool': time.perf_counter() - start,
+    'text': result.content[0].text,
+}))
+"""
+
+
+def run_python(*args: str) -> subprocess.CompletedProcess[str]:
+    """Run a fresh interpreter with the package on the path and a test API key."""
+    env = {
+        **os.environ,
+        'PYTHONPATH': os.pathsep.join([str(SRC), os.environ.get('PYTHONPATH', '')]),
+        'KMA_API_KEY': 'test_key',
+    }
+    return subprocess.run(  # noqa: S603
+        [sys.executable, *args], capture_output=True, text=True, env=env, check=True, timeout=60
+    )
+
+
+def import_times(stderr: str) -> dict[str, tuple[int, int]]:
+    """Parse ``-X importtime`` output into (self, cumulative) microseconds per module."""
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        own, cumulative, name = line.removeprefix('import time:').split('|')
+        times[name.strip()] = (int(own), int(cumulative))
+    return times
+
+
+@pytest.mark.slow
+def test_server_import_defers_clients(record_property: Callable[[str, object], None]) -> None:
+    """Test importing the server loads no client module and no NumPy."""
+    times = import_times(run_python('-X', 'importtime', '-c', 'import kma_mcp.mcp_server').stderr)
+
+    assert not [name for name in DEFERRED if name in times]
+    own = sum(own for name, (own, _) in times.items() if name.startswith('kma_mcp'))
+    record_property('kma_mcp_import_ms', own / 1000)
+    record_property('server_import_ms', times['kma_mcp.mcp_server'][1] / 1000)
+    assert own < 500_000
+
+
+@pytest.mark.slow
+def test_time_to_first_tool_response(record_property: Callable[[str, object], None]) -> None:
+    """Test the first tool call loads its client lazily and answers."""
+    report = json.loads(run_python('-c', FIRST_TOOL_CALL).stdout.splitlines()[-1])
+
+    record_property('server_import_s', report['import'])
+    record_property('first_tool_response_s', report['first_tool'])
+    assert report['text'] == '{"stn":104,"ta":3.5}'
+    assert report['first_tool'] < 30
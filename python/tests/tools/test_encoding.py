@@ -0,0 +1,93 @@
+"""Unit tests for tool output encodings."""
+
+from unittest.mock import patch
+
+import pytest
+
+from kma_mcp.tools import paging, surface_tools
+from kma_mcp.tools.encoding import Encoding
+from kma_mcp.tools.memo import clear_caches
+from kma_mcp.tools.paging import get_result_page, next_cursor, paginate
+
+COLUMNS = {
+    'TM': ['202501011200', '202501011200'],
+    'STN': [108, 112],
+    'TA': [-1.54, None],
+    'HM': [60.25, 71.0],
+}
+
+
+class TestEncoding:
+    """Test the compact formats, projection and rounding."""
+
+    def test_csv_header_and_rows(self) -> None:
+        """Test CSV writes the column names once and missing values as empty cells."""
+        assert paginate(COLUMNS, output_format='csv') == (
+            'TM,STN,TA,HM\n202501011200,108,-1.54,60.25\n202501011200,112,,71.0'
+        )
+
+    def test_projection_and_rounding(self) -> None:
+        """Test fields select columns case-insensitively, in order, and digits round."""
+        assert paginate(COLUMNS, fields=['ta', 'stn'], output_format='tsv', digits=1) == (
+            'TA\tSTN\n-1.5\t108\n\t112'
+        )
+        assert paginate(COLUMNS, fields=['HM'], digits=0) == '{"HM":60}\n{"HM":71}'
+
+    def test_rounding_keeps_non_finite_values(self) -> None:
+        """Test NaN and infinities are written unchanged instead of failing to round."""
+        data = [{'TA': float('nan'), 'HM': float('inf'), 'WS': 1.6}]
+
+        assert paginate(data, digits=0) == '{"TA":NaN,"HM":Infinity,"WS":2}'
+        assert paginate(data, output_format='csv', digits=0) == 'TA,HM,WS\nnan,inf,2'
+
+    def test_quoting_and_nested_values(self) -> None:
+        """Test cells with delimiters are quoted and nested values written as JSON."""
+        data = [{'name': 'Seoul, KR', 'TMP': [1.25, 2.0]}]
+
+        assert paginate(data, output_format='csv', digits=1) == 'name,TMP\n"Seoul, KR","[1.2,2.0]"'
+
+    def test_non_table_records_stay_json(self) -> None:
+        """Test records that are not tables are written as JSON in every format."""
+        assert paginate([1.26, 'a'], output_format='csv', digits=1) == '1.3\n"a"'
+
+    @pytest.mark.parametrize(
+        ('options', 'message'),
+        [
+            ({'output_format': 'xml'}, 'output_format'),
+            ({'digits': -1}, 'digits'),
+            ({'fields': ['WS']}, 'Unknown fields'),
+        ],
+    )
+    def test_invalid_options(self, options: dict, message: str) -> None:
+        """Test invalid options are rejected with a helpful message."""
+        with pytest.raises(ValueError, match=message):
+            paginate(COLUMNS, **options)
+
+    def test_pages_keep_format(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test every CSV page repeats the header and the cursor is a comment line."""
+        monkeypatch.setattr(paging, '_page_bytes', 15)
+        page = paginate(COLUMNS, output_format='csv', fields=['STN', 'TA'])
+
+        assert page.splitlines()[:2] == ['STN,TA', '108,-1.54']
+        assert page.splitlines()[-1].startswith('# {"next_cursor":')
+        assert get_result_page(next_cursor(page)) == 'STN,TA\n112,'
+
+    def test_reused_across_records(self) -> None:
+        """Test one encoding can be reused for records of the same shape."""
+        encoding = Encoding('csv', fields=('ta',))
+        columns = encoding.columns({'STN': 108, 'TA': 1.0})
+
+        assert [encoding.line(row, columns) for row in ({'TA': 1.0}, {'TA': None})] == ['1.0', '']
+
+
+def test_tool_output_options() -> None:
+    """Test tools pass the output options through and report invalid ones."""
+    clear_caches()
+    surface_tools.set_api_key('test_key')
+    with patch('kma_mcp.surface.aws_client.AWSClient.get_minutely_data', return_value=COLUMNS):
+        table = surface_tools.get_aws_current_weather(fields=['stn', 'ta'], output_format='csv')
+        error = surface_tools.get_aws_current_weather(output_format='xml')
+
+    assert table == 'STN,TA\n108,-1.54\n112,'
+    assert error.startswith('Error')
+    surface_tools.set_api_key('')
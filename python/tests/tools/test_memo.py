@@ -0,0 +1,155 @@
+"""Unit tests for tool result memoization."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from kma_mcp.tools import async_surface_tools
+from kma_mcp.tools.memo import ToolCache, clear_caches, memoize
+
+
+@pytest.fixture(autouse=True)
+def reset_caches():
+    """Start every test with empty tool caches."""
+    clear_caches()
+    yield
+    clear_caches()
+
+
+class TestToolCache:
+    """Test the LRU/TTL cache."""
+
+    def test_expiry_aligned_to_period(self) -> None:
+        """Test entries expire at the next issuance boundary."""
+        cache = ToolCache(period=60)
+
+        assert cache.expiry(120.0) == 180.0
+        assert cache.expiry(179.9) == 180.0
+
+    def test_lru_eviction(self) -> None:
+        """Test the least recently used entry is evicted first."""
+        cache = ToolCache(period=3600, maxsize=2)
+        cache.set(('a',), 1)
+        cache.set(('b',), 2)
+        cache.get(('a',))
+        cache.set(('c',), 3)
+
+        assert cache.get(('a',)) == (True, 1)
+        assert cache.get(('b',)) == (False, None)
+
+    def test_expired_entry_is_a_miss(self) -> None:
+        """Test stale entries are not returned."""
+        cache = ToolCache(period=60)
+        with patch('kma_mcp.tools.memo.time.time', return_value=100.0):
+            cache.set(('a',), 1)
+        with patch('kma_mcp.tools.memo.time.time', return_value=120.0):
+            assert cache.get(('a',)) == (False, None)
+
+
+class TestMemoize:
+    """Test the memoize decorator."""
+
+    def test_sync_results_cached_per_arguments(self) -> None:
+        """Test repeated sync calls with equal arguments hit the cache."""
+        calls = []
+
+        @memoize(3600)
+        def tool(station_id: int = 0) -> str:
+            calls.append(station_id)
+            return f'data {station_id}'
+
+        assert tool() == tool(station_id=0) == 'data 0'
+        assert tool(108) == 'data 108'
+        assert calls == [0, 108]
+        assert tool.cache.hits == 1
+
+    def test_errors_not_cached(self) -> None:
+        """Test error strings are recomputed on the next call."""
+        calls = []
+
+        @memoize(3600)
+        def tool() -> str:
+            calls.append(1)
+            return 'Error fetching data: timeout'
+
+        tool()
+        tool()
+
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_async_calls_coalesced(self) -> None:
+        """Test concurrent identical async calls share one upstream fetch."""
+        calls = []
+
+        @memoize(3600)
+        async def tool(station_id: int = 0) -> str:
+            calls.append(station_id)
+            await asyncio.sleep(0.01)
+            return f'data {station_id}'
+
+        results = await asyncio.gather(*(tool(108) for _ in range(10)), tool(112))
+
+        assert results == ['data 108'] * 10 + ['data 112']
+        assert calls == [108, 112]
+        assert await tool(108) == 'data 108'
+        assert calls == [108, 112]
+
+    @pytest.mark.asyncio
+    async def test_async_exception_shared(self) -> None:
+        """Test a failed fetch raises in every waiting caller and is not cached."""
+        calls = []
+
+        @memoize(3600)
+        async def tool() -> str:
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            msg = 'boom'
+            raise RuntimeError(msg)
+
+        results = await asyncio.gather(tool(), tool(), return_exceptions=True)
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert len(calls) == 1
+        with pytest.raises(RuntimeError):
+            await tool()
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_does_not_cancel_waiters(self) -> None:
+        """Test waiters fetch again when the caller doing the fetch is cancelled."""
+        started = asyncio.Event()
+
+        @memoize(3600)
+        async def tool() -> str:
+            started.set()
+            await asyncio.sleep(0.01)
+            return 'data'
+
+        leader = asyncio.create_task(tool())
+        await started.wait()
+        waiter = asyncio.create_task(tool())
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        assert await waiter == 'data'
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+
+
+@pytest.mark.asyncio
+async def test_current_tool_single_upstream_fetch() -> None:
+    """Test concurrent get_aws_current_weather calls make one API request."""
+    async_surface_tools.set_api_key('test_key')
+    with patch(
+        'kma_mcp.surface.async_aws_client.AsyncAWSClient.get_minutely_data',
+        return_value={'TM': ['202501011200'], 'STN': [108]},
+    ) as mock_get:
+        results = await asyncio.gather(
+            *(async_surface_tools.get_aws_current_weather(108) for _ in range(5))
+        )
+
+    assert len(set(results)) == 1
+    assert mock_get.await_count == 1
+    async_surface_tools.set_api_key('')
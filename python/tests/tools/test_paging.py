@@ -0,0 +1,139 @@
+"""Unit tests for paged JSON-lines tool output."""
+
+import json
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from kma_mcp.tools import paging, surface_tools
+from kma_mcp.tools.memo import clear_caches, memoize
+from kma_mcp.tools.paging import (
+    ResultStore,
+    configure_paging,
+    get_result_page,
+    next_cursor,
+    paginate,
+    records,
+)
+
+COLUMNS = {'TM': ['202501011200'] * 50, 'STN': list(range(50)), 'TA': [1.5] * 50}
+
+
+@pytest.fixture(autouse=True)
+def small_pages():
+    """Use pages of about ten rows and an empty result store."""
+    configure_paging(page_bytes=400)
+    clear_caches()
+    yield
+    configure_paging()
+    clear_caches()
+
+
+def read_all(page: str) -> list[dict]:
+    """Follow the cursors of a paged result and return every record."""
+    rows = []
+    while True:
+        cursor = next_cursor(page)
+        lines = page.splitlines()
+        rows += [json.loads(line) for line in (lines[:-1] if cursor else lines)]
+        if cursor is None:
+            return rows
+        page = get_result_page(cursor)
+
+
+class TestRecords:
+    """Test how results are split into records."""
+
+    def test_columnar_rows(self) -> None:
+        """Test columnar data yields one record per row."""
+        rows = records({'STN': [108, 112], 'TA': [-1.5, None]})
+
+        assert list(rows) == [{'STN': 108, 'TA': -1.5}, {'STN': 112, 'TA': None}]
+
+    def test_openapi_items(self) -> None:
+        """Test Open API documents yield their items."""
+        document = {'response': {'header': {}, 'body': {'items': {'item': {'a': 1}}}}}
+
+        assert records(document) == [{'a': 1}]
+        assert records({'a': 1, 'b': [1]}) == [{'a': 1, 'b': [1]}]
+
+    def test_numpy_values(self) -> None:
+        """Test NumPy scalars and arrays are written as plain JSON."""
+        assert paginate({'TA': np.array([1.5, 2.0])}) == '{"TA":1.5}\n{"TA":2.0}'
+        assert paginate({'grid': np.zeros((1, 2))}) == '{"grid":[[0.0,0.0]]}'
+
+    def test_empty_result_keeps_columns(self) -> None:
+        """Test a result without rows still shows its columns."""
+        assert paginate({'TM': [], 'STN': []}) == '{"TM":[],"STN":[]}'
+
+
+class TestPaging:
+    """Test pages and cursors."""
+
+    def test_small_result_single_page(self) -> None:
+        """Test a result within the budget has no cursor."""
+        page = paginate({'STN': [108], 'TA': [3.5]})
+
+        assert page == '{"STN":108,"TA":3.5}'
+        assert next_cursor(page) is None
+
+    def test_pages_cover_all_rows(self) -> None:
+        """Test following cursors returns every row once, in bounded pages."""
+        page = paginate(COLUMNS)
+
+        assert len(page.encode()) <= 400 + 100
+        assert json.loads(page.splitlines()[-1])['remaining_rows'] < 50
+        assert [row['STN'] for row in read_all(page)] == list(range(50))
+        assert len(paging._store) == 0
+
+    def test_oversized_record_still_progresses(self) -> None:
+        """Test a record larger than the page is returned alone."""
+        page = paginate([{'text': 'x' * 1000}, {'text': 'y'}])
+
+        assert page.splitlines()[0] == json.dumps({'text': 'x' * 1000}, separators=(',', ':'))
+        assert read_all(page)[-1] == {'text': 'y'}
+
+    def test_unknown_cursor(self) -> None:
+        """Test an unknown or malformed cursor returns an error."""
+        assert get_result_page('nope:10').startswith('Error')
+        assert get_result_page('nope').startswith('Error')
+
+    def test_store_expiry_and_eviction(self) -> None:
+        """Test results expire after the TTL and the oldest is evicted first."""
+        now = [0.0]
+        store = ResultStore(ttl=10, maxsize=2, clock=lambda: now[0])
+        first, second = store.put([1]), store.put([2])
+        store.get(first)
+        store.put([3])
+
+        assert store.get(second) is None
+        now[0] = 10.0
+        assert store.get(first) is None
+
+    def test_partial_results_not_memoized(self) -> None:
+        """Test first pages with a cursor are recomputed rather than cached."""
+        calls = []
+
+        @memoize(86400)
+        def tool(rows: int) -> str:
+            calls.append(rows)
+            return paginate({'STN': list(range(rows))})
+
+        tool(2)
+        tool(2)
+        tool(500)
+        tool(500)
+
+        assert calls == [2, 500, 500]
+
+
+def test_tool_returns_pages() -> None:
+    """Test a large tool result is returned page by page."""
+    surface_tools.set_api_key('test_key')
+    with patch('kma_mcp.surface.aws_client.AWSClient.get_minutely_data', return_value=COLUMNS):
+        page = surface_tools.get_aws_minutely_weather('202501011200', '202501011300')
+
+    assert next_cursor(page) is not None
+    assert len(read_all(page)) == 50
+    surface_tools.set_api_key('')
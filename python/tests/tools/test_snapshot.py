@@ -0,0 +1,191 @@
+"""Unit tests for the concurrent weather snapshot tool."""
+
+import asyncio
+import json
+import time
+from datetime import datetime
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from kma_mcp.core.parsing import parse_fixed_width
+from kma_mcp.tools import async_surface_tools, surface_tools
+from kma_mcp.tools.memo import clear_caches
+from kma_mcp.tools.snapshot import (
+    gather_sources,
+    hourly_forecast,
+    last_complete_hour,
+    nearest_row,
+    parse_sources,
+)
+
+ASOS = parse_fixed_width(
+    '# STN_ID LON LAT STN_KO\n108 126.9658 37.5714 서울\n112 126.6249 37.4776 인천\n'
+)
+AWS = parse_fixed_width('# STN_ID LON LAT STN_KO\n400 127.0470 37.5137 강남\n')
+UV = {'TM': ['202501011200'] * 2, 'STN': [112, 108], 'UV_B': [0.1, 0.2]}
+FORECAST = {
+    'response': {
+        'body': {
+            'items': {
+                'item': [
+                    {'fcstDate': '20250101', 'fcstTime': time, 'category': name, 'fcstValue': value}
+                    for time, name, value in (
+                        ('1300', 'T1H', '-1'),
+                        ('1300', 'SKY', '1'),
+                        ('1400', 'T1H', '0'),
+                    )
+                ]
+            }
+        }
+    }
+}
+
+
+@pytest.fixture
+def stations():
+    """Serve the station lists to both tool modules."""
+    clear_caches()
+    with (
+        patch('kma_mcp.surface.station_client.StationClient.get_asos_stations', return_value=ASOS),
+        patch('kma_mcp.surface.station_client.StationClient.get_aws_stations', return_value=AWS),
+        patch(
+            'kma_mcp.surface.async_station_client.AsyncStationClient.get_asos_stations',
+            new=AsyncMock(return_value=ASOS),
+        ),
+        patch(
+            'kma_mcp.surface.async_station_client.AsyncStationClient.get_aws_stations',
+            new=AsyncMock(return_value=AWS),
+        ),
+    ):
+        yield
+
+
+def test_nearest_reporting_row():
+    """Test the nearest station that reported is picked, with its distance."""
+    ranked = [
+        {'station_id': 410, 'name': '기상청', 'distance_km': 0.1},
+        {'station_id': 108, 'name': '서울', 'distance_km': 1.2},
+    ]
+
+    assert nearest_row(UV, ranked) == {
+        'TM': '202501011200',
+        'STN': 108,
+        'UV_B': 0.2,
+        'station_name': '서울',
+        'distance_km': 1.2,
+    }
+    assert nearest_row(UV, ranked[:1]) is None
+    with pytest.raises(ValueError, match='observation table'):
+        nearest_row({'result': 'error'}, ranked)
+
+
+def test_forecast_and_source_helpers():
+    """Test forecast items are grouped by hour and source lists are checked."""
+    assert hourly_forecast(FORECAST) == [
+        {'time': '202501011300', 'T1H': '-1', 'SKY': '1'},
+        {'time': '202501011400', 'T1H': '0'},
+    ]
+    assert last_complete_hour(datetime(2025, 1, 1, 12, 5)) == '202501011100'  # noqa: DTZ001
+    assert parse_sources('AWS, warnings,aws') == ['aws', 'warnings']
+    with pytest.raises(ValueError, match='Unknown sources'):
+        parse_sources('aws,radar')
+
+
+@pytest.mark.asyncio
+async def test_slow_source_times_out_alone():
+    """Test sources run concurrently and a slow one does not hold back the rest."""
+
+    async def fast() -> str:
+        await asyncio.sleep(0.05)
+        return 'fast'
+
+    async def slow() -> str:
+        await asyncio.sleep(5)
+        return 'slow'
+
+    async def broken() -> str:
+        msg = 'upstream down'
+        raise RuntimeError(msg)
+
+    start = time.perf_counter()
+    results = await gather_sources({'a': fast, 'b': fast, 'c': slow, 'd': broken}, timeout=0.2)
+
+    assert time.perf_counter() - start < 0.5
+    assert [(r['source'], r['status'], r['data']) for r in results] == [
+        ('a', 'ok', 'fast'),
+        ('b', 'ok', 'fast'),
+        ('c', 'timeout', None),
+        ('d', 'error', None),
+    ]
+    assert results[3]['error'] == 'upstream down'
+
+
+@pytest.mark.usefixtures('stations')
+def test_snapshot_tool_partial_results():
+    """Test the sync tool returns what arrived in time and reports the rest."""
+    surface_tools.set_api_key('test_key')
+
+    def slow_dust(*_: object, **__: object) -> dict:
+        time.sleep(1)
+        return UV
+
+    with (
+        patch('kma_mcp.surface.aws_client.AWSClient.get_minutely_data', return_value=AWS) as aws,
+        patch('kma_mcp.surface.uv_client.UVClient.get_observation_data', return_value=UV),
+        patch('kma_mcp.surface.dust_client.DustClient.get_hourly_data', side_effect=slow_dust),
+        patch(
+            'kma_mcp.forecast.forecast_client.ForecastClient.get_ultra_short_term_forecast',
+            return_value=FORECAST,
+        ),
+    ):
+        start = time.perf_counter()
+        result = surface_tools.get_weather_snapshot(
+            37.5665, 126.9780, sources='aws,uv,dust,forecast', timeout_s=0.3
+        )
+        elapsed = time.perf_counter() - start
+
+    records = [json.loads(line) for line in result.splitlines()]
+    assert elapsed < 0.9
+    assert aws.call_args.kwargs == {'stn': 400}
+    assert [r['status'] for r in records] == ['ok', 'ok', 'timeout', 'ok']
+    assert records[1]['data']['STN'] == 108
+    assert records[3]['data'][0] == {'time': '202501011300', 'T1H': '-1', 'SKY': '1'}
+    assert surface_tools.get_weather_snapshot(37.5, 127.0, sources='x').startswith('Error')
+    surface_tools.set_api_key('')
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures('stations')
+async def test_async_snapshot_tool():
+    """Test the async tool fans out and isolates failing sources."""
+    async_surface_tools.set_api_key('test_key')
+
+    async def slow_snow(*_: object, **__: object) -> dict:
+        await asyncio.sleep(5)
+        return UV
+
+    with (
+        patch(
+            'kma_mcp.surface.async_uv_client.AsyncUVClient.get_observation_data', return_value=UV
+        ),
+        patch(
+            'kma_mcp.surface.async_snow_client.AsyncSnowClient.get_snow_depth',
+            side_effect=slow_snow,
+        ),
+        patch(
+            'kma_mcp.forecast.async_warning_client.AsyncWarningClient.get_current_warnings',
+            side_effect=RuntimeError('HTTP 500'),
+        ),
+    ):
+        result = await async_surface_tools.get_weather_snapshot(
+            37.5665, 126.9780, sources='uv,snow,warnings', timeout_s=0.2, output_format='csv'
+        )
+
+    lines = result.splitlines()
+    assert lines[0] == 'source,status,elapsed_ms,data,error'
+    assert lines[1].startswith('uv,ok,')
+    assert lines[2].startswith('snow,timeout,')
+    assert lines[3].startswith('warnings,error,')
+    assert lines[3].endswith('HTTP 500')
+    async_surface_tools.set_api_key('')
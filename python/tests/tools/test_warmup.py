@@ -0,0 +1,102 @@
+"""Unit tests for the prefetch jobs of the async MCP server."""
+
+from collections.abc import Iterator
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from kma_mcp.core import prefetch, transport
+from kma_mcp.core.prefetch import PrefetchScheduler
+from kma_mcp.forecast.issuance import latest_village_base
+from kma_mcp.tools import async_forecast_tools, warmup
+from kma_mcp.tools.memo import clear_caches
+
+SEOUL = (37.5665, 126.9780)
+BUSAN = (35.1796, 129.0756)
+
+
+@pytest.fixture(autouse=True)
+def reset_prefetch() -> Iterator[None]:
+    """Disable the prefetch store after each test."""
+    yield
+    prefetch.configure_prefetch(enabled=False)
+
+
+def test_parse_settings():
+    """Test product lists and locations are checked."""
+    assert warmup.parse_products('all') == list(warmup.PRODUCTS)
+    assert warmup.parse_products(' AWS,warnings,aws ') == ['aws', 'warnings']
+    assert warmup.parse_products('') == []
+    assert warmup.parse_points('37.5,127.0; 35.1,129.0;') == [(37.5, 127.0), (35.1, 129.0)]
+    with pytest.raises(ValueError, match='Unknown prefetch products'):
+        warmup.parse_products('radar')
+    with pytest.raises(ValueError, match="'lat,lon'"):
+        warmup.parse_points('37.5')
+
+
+@pytest.mark.asyncio
+async def test_forecast_job_requests_each_grid_cell_once():
+    """Test the village job asks for what get_village_forecast_by_location asks for."""
+    nearby = (SEOUL[0] + 0.001, SEOUL[1] + 0.001)
+    jobs = warmup.prefetch_jobs('key', ['village'], [SEOUL, nearby, BUSAN, (0.0, 0.0)])
+    with patch(
+        'kma_mcp.forecast.async_forecast_client.AsyncForecastClient.get_village_forecast',
+        new=AsyncMock(return_value={}),
+    ) as mock_get:
+        await jobs[0].fetch()
+
+    base_date, base_time = latest_village_base()
+    assert [job.name for job in jobs] == ['village']
+    assert [call.kwargs for call in mock_get.call_args_list] == [
+        {'base_date': base_date, 'base_time': base_time, 'nx': 60, 'ny': 127},
+        {'base_date': base_date, 'base_time': base_time, 'nx': 98, 'ny': 76},
+    ]
+    # Without locations, forecast products are skipped
+    assert [job.name for job in warmup.prefetch_jobs('key', ['ultra_short', 'aws'])] == ['aws']
+
+
+@pytest.mark.asyncio
+async def test_tool_is_served_from_prefetched_warnings(monkeypatch):
+    """Test a tool call after the warnings job is answered without an upstream request."""
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(200, text='# REG_ID TM_EF WRN LVL\nL1100100 202501010600 W 2\n')
+
+    monkeypatch.setattr(httpx, 'AsyncHTTPTransport', lambda **_: httpx.MockTransport(handler))
+    await transport.aclose_http_clients()
+    prefetch.configure_prefetch()
+    clear_caches()
+    async_forecast_tools.set_api_key('test_key')
+
+    scheduler = PrefetchScheduler(warmup.prefetch_jobs('test_key', ['warnings']))
+    assert await scheduler.run(scheduler.jobs[0])
+    result = await async_forecast_tools.get_current_weather_warnings(output_format='csv')
+
+    assert result == 'REG_ID,TM_EF,WRN,LVL\nL1100100,202501010600,W,2'
+    assert len(calls) == 1
+    assert prefetch.get_prefetch_store().hits == 1
+    async_forecast_tools.set_api_key('')
+    await transport.aclose_http_clients()
+
+
+def test_prefetch_from_env(monkeypatch):
+    """Test KMA_PREFETCH* variables build the scheduler and enable the store."""
+    monkeypatch.setenv('KMA_PREFETCH', 'all')
+    monkeypatch.setenv('KMA_PREFETCH_POINTS', f'{SEOUL[0]},{SEOUL[1]}')
+    monkeypatch.setenv('KMA_PREFETCH_JITTER', '5')
+
+    scheduler = warmup.prefetch_from_env('key')
+
+    assert [job.name for job in scheduler.jobs] == ['village', 'ultra_short', 'warnings', 'aws']
+    assert scheduler.jitter == 5.0
+    assert prefetch.get_prefetch_store() is not None
+
+    monkeypatch.setenv('KMA_PREFETCH', 'village')
+    monkeypatch.delenv('KMA_PREFETCH_POINTS')
+    assert warmup.prefetch_from_env('key') is None
+    assert prefetch.get_prefetch_store() is None
+    monkeypatch.delenv('KMA_PREFETCH')
+    assert warmup.prefetch_from_env('key') is None
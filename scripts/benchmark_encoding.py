@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""Benchmark the size and serialization time of the tool output encodings.
+
+Serializes a synthetic all-station AWS minutely result (the shape returned by
+``AWSClient.get_minutely_data(stn=0)``) in every encoding, as one page, and
+compares it with the ``str(data)`` the tools used to return:
+
+    python scripts/benchmark_encoding.py
+    python scripts/benchmark_encoding.py --stations 700 --minutes 60
+
+Token counts use tiktoken's ``cl100k_base`` encoding when it is installed and
+a rough regex tokenizer (words, runs of up to three digits, punctuation)
+otherwise.
+"""
+
+import argparse
+import random
+import re
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+# Add src directory to Python path
+src_path = Path(__file__).parent.parent / 'python' / 'src'
+sys.path.insert(0, str(src_path))
+
+from kma_mcp.tools.paging import configure_paging, paginate  # noqa: E402
+
+COLUMNS = ['WD1', 'WS1', 'WDS', 'WSS', 'WD10', 'WS10', 'TA', 'RE', 'RN-15m', 'RN-60m']
+COLUMNS += ['RN-12H', 'RN-DAY', 'HM', 'PA', 'PS', 'TD']
+
+
+def synthetic_result(stations: int, minutes: int) -> dict[str, list[Any]]:
+    """Build columnar data shaped like an all-station AWS minutely response."""
+    rng = random.Random(0)  # noqa: S311
+    rows = stations * minutes
+    data: dict[str, list[Any]] = {
+        'TM': [f'2025010112{minute:02d}' for minute in range(minutes) for _ in range(stations)],
+        'STN': [90 + station for _ in range(minutes) for station in range(stations)],
+    }
+    for name in COLUMNS:
+        data[name] = [
+            None if rng.random() < 0.05 else round(rng.uniform(-20, 1000), 1) for _ in range(rows)
+        ]
+    return data
+
+
+def count_tokens() -> tuple[str, Callable[[str], int]]:
+    """Return the name and function of the available token counter."""
+    try:
+        import tiktoken
+    except ImportError:
+        pattern = re.compile(r'[A-Za-z]+|\d{1,3}|[^\sA-Za-z\d]')
+        return 'approx', lambda text: len(pattern.findall(text))
+    encoding = tiktoken.get_encoding('cl100k_base')
+    return 'cl100k', lambda text: len(encoding.encode(text))
+
+
+def _measure(encode: Callable[[], str], repeat: int) -> tuple[str, float]:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        text = encode()
+        best = min(best, time.perf_counter() - start)
+    return text, best * 1000
+
+
+def main() -> None:
+    """Run the encoding benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--stations', type=int, default=700, help='Stations per minute')
+    parser.add_argument('--minutes', type=int, default=1, help='Minutes in the result')
+    parser.add_argument('--repeat', type=int, default=5, help='Runs per encoding (best is kept)')
+    args = parser.parse_args()
+
+    data = synthetic_result(args.stations, args.minutes)
+    # Serialize the whole result as one page
+    configure_paging(page_bytes=sys.maxsize)
+    tokenizer, tokens = count_tokens()
+    scenarios: dict[str, Callable[[], str]] = {
+        'str(data) (before)': lambda: str(data),
+        'jsonl': lambda: paginate(data),
+        'csv': lambda: paginate(data, output_format='csv'),
+        'tsv': lambda: paginate(data, output_format='tsv'),
+        'csv digits=0': lambda: paginate(data, output_format='csv', digits=0),
+        'csv STN,TA,HM,WS1': lambda: paginate(
+            data, fields=['STN', 'TA', 'HM', 'WS1'], output_format='csv'
+        ),
+    }
+
+    print(f'{args.stations * args.minutes} rows x {len(data)} columns, tokens: {tokenizer}')
+    print(f'{"encoding":<20} {"bytes":>10} {"tokens":>9} {"vs str":>7} {"time":>10}')
+    baseline = None
+    for label, encode in scenarios.items():
+        text, elapsed = _measure(encode, args.repeat)
+        size = len(text.encode())
+        baseline = baseline or size
+        print(
+            f'{label:<20} {size:>10,} {tokens(text):>9,} '
+            f'{baseline / size:>6.1f}x {elapsed:>7.1f} ms'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,442 @@
+#!/usr/bin/env python3
+"""Benchmark the clients and both MCP servers against a local API Hub stand-in.
+
+Serves representative endpoints from ``scripts/kma_standin.py`` (synthesized
+bodies, or responses recorded with ``kma_standin.py --record``) and measures:
+
+- ``client``: per-call latency (p50/p95) of the sync clients over the shared pool
+- ``parse``: decoding throughput of each response body (rows/s and MB/s)
+- ``memory``: Python heap high-water mark (tracemalloc) of one client call
+- ``scaling``: calls/s of N concurrent calls, sync clients on N threads and
+  async clients on one event loop
+- ``server``: tool-call latency and concurrent calls/s through ``mcp_server``
+  and ``async_mcp_server`` (in-memory MCP client)
+
+Rate limiting is off unless ``--rate-limit`` is given, so the numbers show the
+cost of the code rather than the configured request budget. Each run is saved
+to ``.benchmarks/`` under its time and commit, and compared with the previous
+run (or ``--compare FILE``):
+
+    python scripts/benchmark_suite.py
+    python scripts/benchmark_suite.py --quick --only client,parse
+    python scripts/benchmark_suite.py --replay recordings/
+"""
+
+import argparse
+import asyncio
+import importlib
+import json
+import logging
+import math
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import httpx
+from kma_standin import StandIn, use_standin
+
+# Add src directory to Python path
+src_path = Path(__file__).parent.parent / 'python' / 'src'
+sys.path.insert(0, str(src_path))
+
+from kma_mcp.core.parsing import decode_response  # noqa: E402
+from kma_mcp.core.ratelimit import configure_rate_limit  # noqa: E402
+from kma_mcp.core.transport import close_http_clients, get_http_client  # noqa: E402
+
+RESULTS_DIR = Path(__file__).parent.parent / '.benchmarks'
+SECTIONS = ('client', 'parse', 'memory', 'scaling', 'server')
+# A metric is flagged when it gets worse than the baseline by more than this share
+REGRESSION = 0.10
+
+# Client calls: (client module, class, method, arguments, decoder of the body)
+CLIENT_CALLS: dict[str, tuple[str, str, str, dict[str, Any], str]] = {
+    'asos_month_all': (
+        'kma_mcp.surface.asos_client',
+        'ASOSClient',
+        'get_hourly_period',
+        {'tm1': '202501010000', 'tm2': '202501312300', 'stn': 0},
+        'response',
+    ),
+    'aws_hour_all': (
+        'kma_mcp.surface.aws_client',
+        'AWSClient',
+        'get_minutely_data',
+        {'tm1': '202501011100', 'tm2': '202501011200', 'stn': 0},
+        'response',
+    ),
+    'aws_minute_one': (
+        'kma_mcp.surface.aws_client',
+        'AWSClient',
+        'get_minutely_data',
+        {'tm1': '202501011200', 'tm2': '202501011200', 'stn': 108},
+        'response',
+    ),
+    'village_grid': (
+        'kma_mcp.forecast.forecast_client',
+        'ForecastClient',
+        'get_village_grid_array',
+        {'product': 'shrt', 'var': 'TMP', 'tmfc': '202501010500', 'tmef': '202501010600'},
+        'grid',
+    ),
+    'warnings': (
+        'kma_mcp.forecast.warning_client',
+        'WarningClient',
+        'get_current_warnings',
+        {'stn': 0},
+        'response',
+    ),
+    'mid_temperature': (
+        'kma_mcp.forecast.forecast_client',
+        'ForecastClient',
+        'get_medium_term_temperature_forecast',
+        {'reg_id': '11B10101', 'tm_fc': '202501010600'},
+        'response',
+    ),
+}
+
+# Tool calls of the server benchmark: (tool, arguments)
+TOOL_CALLS: dict[str, tuple[str, dict[str, Any]]] = {
+    'aws_current_one': ('get_aws_current_weather', {'station_id': 108}),
+    'aws_hour_all': (
+        'get_aws_minutely_weather',
+        {'start_time': '202501011100', 'end_time': '202501011200', 'station_id': 0},
+    ),
+    'warnings': ('get_current_weather_warnings', {}),
+}
+
+Metrics = dict[str, float]
+
+
+def _client_class(module: str, name: str, *, asynchronous: bool = False) -> type:
+    if asynchronous:
+        package, _, leaf = module.rpartition('.')
+        module, name = f'{package}.async_{leaf}', f'Async{name}'
+    return getattr(importlib.import_module(module), name)
+
+
+def _rows(result: Any) -> int:  # noqa: ANN401
+    """Count the rows of a decoded result: grid points, OpenAPI items or table rows."""
+    if hasattr(result, 'size'):
+        return int(result.size)
+    if isinstance(result, dict) and 'response' in result:
+        items = result['response'].get('body', {}).get('items', {}) or {}
+        item = items.get('item', []) if isinstance(items, dict) else items
+        return len(item) if isinstance(item, list) else 1
+    if isinstance(result, dict) and result:
+        first = next(iter(result.values()))
+        return len(first) if isinstance(first, list) else 1
+    return 0
+
+
+def _percentiles(prefix: str, timings: list[float]) -> Metrics:
+    timings = sorted(timings)
+    p95 = timings[math.ceil(len(timings) * 0.95) - 1]
+    return {f'{prefix}.p50_ms': statistics.median(timings), f'{prefix}.p95_ms': p95}
+
+
+def _timed(call: Callable[[], Any], repeat: int) -> list[float]:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        call()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def _sync_call(name: str, http_client: httpx.Client | None = None) -> Callable[[], Any]:
+    module, cls_name, method, kwargs, _ = CLIENT_CALLS[name]
+    cls = _client_class(module, cls_name)
+
+    def call() -> Any:  # noqa: ANN401
+        with cls('benchmark', http_client=http_client or get_http_client()) as client:
+            return getattr(client, method)(**kwargs)
+
+    return call
+
+
+def bench_client(repeat: int) -> Metrics:
+    """Per-call latency of each client call over the shared connection pool."""
+    metrics: Metrics = {}
+    for name in CLIENT_CALLS:
+        call = _sync_call(name)
+        metrics[f'client.{name}.rows'] = _rows(call())
+        metrics |= _percentiles(f'client.{name}', _timed(call, repeat))
+    return metrics
+
+
+def bench_parse(repeat: int) -> Metrics:
+    """Decoding throughput of each response body, without the request."""
+    from kma_mcp.forecast.grid import decode_grid
+
+    metrics: Metrics = {}
+    for name, (*_, decoder) in CLIENT_CALLS.items():
+        responses: list[httpx.Response] = []
+
+        def keep(response: httpx.Response, responses: list[httpx.Response] = responses) -> None:
+            response.read()
+            responses.append(response)
+
+        hooks = {'response': [keep]}
+        with httpx.Client(event_hooks=hooks) as http_client:
+            _sync_call(name, http_client)()
+
+        def decode(bodies: list[httpx.Response] = responses, decoder: str = decoder) -> int:
+            if decoder == 'grid':
+                return sum(_rows(decode_grid(response.content)) for response in bodies)
+            return sum(_rows(decode_response(response)) for response in bodies)
+
+        rows = decode()
+        size = sum(len(response.content) for response in responses)
+        seconds = min(_timed(decode, repeat)) / 1000
+        metrics[f'parse.{name}.rows_per_s'] = rows / seconds
+        metrics[f'parse.{name}.mb_per_s'] = size / 1e6 / seconds
+    return metrics
+
+
+def bench_memory() -> Metrics:
+    """Python heap high-water mark of one call of each client call."""
+    metrics: Metrics = {}
+    for name in CLIENT_CALLS:
+        call = _sync_call(name)
+        call()  # Import modules and open connections outside the measurement
+        tracemalloc.start()
+        call()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        metrics[f'memory.{name}.peak_mb'] = peak / 1e6
+    return metrics
+
+
+async def _concurrently(calls: list[Callable[[], Awaitable[Any]]]) -> list[float]:
+    async def timed(call: Callable[[], Awaitable[Any]]) -> float:
+        start = time.perf_counter()
+        await call()
+        return (time.perf_counter() - start) * 1000
+
+    return await asyncio.gather(*(timed(call) for call in calls))
+
+
+def bench_scaling(levels: list[int], rounds: int) -> Metrics:
+    """Calls/s of N concurrent single-station AWS calls, sync threads vs async tasks."""
+    module, cls_name, method, kwargs, _ = CLIENT_CALLS['aws_minute_one']
+    sync_cls = _client_class(module, cls_name)
+    async_cls = _client_class(module, cls_name, asynchronous=True)
+    metrics: Metrics = {}
+
+    def sync_call(station: int) -> float:
+        start = time.perf_counter()
+        with sync_cls('benchmark', http_client=get_http_client()) as client:
+            getattr(client, method)(**{**kwargs, 'stn': station})
+        return (time.perf_counter() - start) * 1000
+
+    async def async_round(n: int) -> tuple[float, list[float]]:
+        from kma_mcp.core.transport import get_async_http_client
+
+        async def call(station: int) -> Any:  # noqa: ANN401
+            async with async_cls('benchmark', http_client=get_async_http_client()) as client:
+                return await getattr(client, method)(**{**kwargs, 'stn': station})
+
+        await call(100)
+        timings: list[float] = []
+        start = time.perf_counter()
+        for _ in range(rounds):
+            timings += await _concurrently(
+                [lambda station=station: call(station) for station in range(100, 100 + n)]
+            )
+        return time.perf_counter() - start, timings
+
+    for n in levels:
+        with ThreadPoolExecutor(n) as pool:
+            list(pool.map(sync_call, range(100, 100 + n)))
+            start = time.perf_counter()
+            timings = []
+            for _ in range(rounds):
+                timings += pool.map(sync_call, range(100, 100 + n))
+            elapsed = time.perf_counter() - start
+        metrics[f'scaling.sync.n{n}.calls_per_s'] = n * rounds / elapsed
+        metrics |= _percentiles(f'scaling.sync.n{n}', timings)
+
+        elapsed, timings = asyncio.run(async_round(n))
+        metrics[f'scaling.async.n{n}.calls_per_s'] = n * rounds / elapsed
+        metrics |= _percentiles(f'scaling.async.n{n}', timings)
+    return metrics
+
+
+async def _bench_server(label: str, module: str, repeat: int, levels: list[int]) -> Metrics:
+    from fastmcp import Client
+
+    from kma_mcp.tools.memo import clear_caches
+
+    server = importlib.import_module(module)
+    metrics: Metrics = {}
+    async with Client(server.mcp) as client:
+
+        async def call(tool: str, arguments: dict[str, Any]) -> None:
+            clear_caches()  # Measure the upstream path, not the memoized result
+            result = await client.call_tool(tool, arguments)
+            text = result.content[0].text
+            if text.startswith('Error'):
+                msg = f'{label} {tool} failed: {text}'
+                raise RuntimeError(msg)
+
+        for name, (tool, arguments) in TOOL_CALLS.items():
+            await call(tool, arguments)
+            timings = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                await call(tool, arguments)
+                timings.append((time.perf_counter() - start) * 1000)
+            metrics |= _percentiles(f'server.{label}.{name}', timings)
+
+        tool, arguments = TOOL_CALLS['aws_current_one']
+        for n in levels:
+            calls = [
+                lambda station=station: call(tool, {**arguments, 'station_id': station})
+                for station in range(100, 100 + n)
+            ]
+            start = time.perf_counter()
+            timings = await _concurrently(calls)
+            elapsed = time.perf_counter() - start
+            metrics[f'server.{label}.n{n}.calls_per_s'] = n / elapsed
+            metrics |= _percentiles(f'server.{label}.n{n}', timings)
+    return metrics
+
+
+def bench_server(repeat: int, levels: list[int]) -> Metrics:
+    """Tool-call latency and concurrent calls/s through both MCP servers."""
+    metrics: Metrics = {}
+    for label, module in (('sync', 'kma_mcp.mcp_server'), ('async', 'kma_mcp.async_mcp_server')):
+        metrics |= asyncio.run(_bench_server(label, module, repeat, levels))
+    from kma_mcp.core.offload import get_offloader
+
+    offloader = get_offloader()
+    if offloader is not None:
+        offloader.shutdown()
+    return metrics
+
+
+def _git(*args: str) -> str:
+    result = subprocess.run(['git', *args], capture_output=True, text=True, check=False)  # noqa: S603, S607
+    return result.stdout.strip()
+
+
+def save(metrics: Metrics, source: str, directory: Path) -> Path:
+    """Write a run to ``directory`` as ``<UTC time>-<commit>.json``."""
+    commit = _git('rev-parse', '--short', 'HEAD') or 'unknown'
+    created = datetime.now(UTC)
+    run = {
+        'commit': commit,
+        'dirty': bool(_git('status', '--porcelain', '--untracked-files=no')),
+        'created': created.isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'machine': f'{platform.system()} {platform.machine()} ({os.cpu_count()} CPUs)',
+        'source': source,
+        'metrics': metrics,
+    }
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f'{created:%Y%m%dT%H%M%S}-{commit}.json'
+    path.write_text(json.dumps(run, indent=2) + '\n')
+    return path
+
+
+def compare(metrics: Metrics, baseline: Path) -> None:
+    """Print each metric next to the baseline run, flagging regressions."""
+    run = json.loads(baseline.read_text())
+    print(f'\nCompared with {baseline.name} ({run["commit"]}{"+" if run["dirty"] else ""})')
+    for name, value in metrics.items():
+        before = run['metrics'].get(name)
+        if not before:
+            continue
+        change = value / before - 1
+        # Throughput should go up, everything else (latency, memory) down
+        worse = -change if name.endswith('_per_s') else change
+        flag = '  <- regression' if worse > REGRESSION else ''
+        print(f'{name:<45} {before:>12.2f} -> {value:>12.2f} {change:>+7.1%}{flag}')
+
+
+def _print(metrics: Metrics) -> None:
+    for name, value in metrics.items():
+        print(f'{name:<45} {value:>12.2f}')
+
+
+def main() -> None:
+    """Run the benchmark suite."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--only', help=f'Comma-separated sections (default: {",".join(SECTIONS)})')
+    parser.add_argument('--repeat', type=int, default=20, help='Calls per latency measurement')
+    parser.add_argument('--concurrency', default='1,8,32', help='Concurrent calls to scale to')
+    parser.add_argument('--quick', action='store_true', help='Fewer calls and levels')
+    parser.add_argument('--replay', type=Path, help='Serve responses recorded in this directory')
+    parser.add_argument('--rate-limit', action='store_true', help='Keep the default rate limit')
+    parser.add_argument('--compare', type=Path, help='Run to compare with (default: the last)')
+    parser.add_argument('--no-save', action='store_true', help='Do not save the run')
+    args = parser.parse_args()
+
+    # One log line per request and tool call would drown the results
+    for name in ('httpx', 'mcp'):
+        logging.getLogger(name).setLevel(logging.WARNING)
+
+    sections = args.only.split(',') if args.only else list(SECTIONS)
+    unknown = set(sections) - set(SECTIONS)
+    if unknown:
+        parser.error(f'Unknown sections {sorted(unknown)}, expected some of {", ".join(SECTIONS)}')
+    repeat = 5 if args.quick else args.repeat
+    levels = [1, 8] if args.quick else [int(n) for n in args.concurrency.split(',')]
+
+    # Settings the MCP servers read at import: no persistent state, no prefetching
+    os.environ |= {'KMA_API_KEY': 'benchmark', 'KMA_CACHE_PATH': '', 'KMA_STORE_PATH': ''}
+    os.environ |= {'KMA_PREFETCH': '', 'KMA_RATE_LIMIT': '' if args.rate_limit else '0'}
+    if not args.rate_limit:
+        configure_rate_limit(None)
+    standin = StandIn(replay=args.replay)
+    use_standin(standin.url)
+    source = f'replay:{args.replay}' if args.replay else 'synthetic'
+    print(f'Stand-in at {standin.url} ({source}), sections: {", ".join(sections)}')
+
+    metrics: Metrics = {}
+    try:
+        for section in sections:
+            started = time.perf_counter()
+            if section == 'client':
+                result = bench_client(repeat)
+            elif section == 'parse':
+                result = bench_parse(repeat)
+            elif section == 'memory':
+                result = bench_memory()
+            elif section == 'scaling':
+                result = bench_scaling(levels, max(repeat // 4, 2))
+            else:
+                result = bench_server(repeat, levels)
+            print(f'\n[{section}] {time.perf_counter() - started:.1f} s')
+            _print(result)
+            metrics |= result
+    finally:
+        close_http_clients()
+        standin.close()
+
+    if sys.platform != 'win32':
+        import resource
+
+        # ru_maxrss is in KB on Linux and in bytes on macOS
+        scale = 1e6 if sys.platform == 'darwin' else 1e3
+        metrics['process.max_rss_mb'] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / scale
+
+    runs = sorted(RESULTS_DIR.glob('*.json')) if RESULTS_DIR.exists() else []
+    baseline = args.compare or (runs[-1] if runs else None)
+    if baseline is not None:
+        compare(metrics, baseline)
+    if not args.no_save:
+        print(f'\nSaved {save(metrics, source, RESULTS_DIR)}')
+
+
+if __name__ == '__main__':
+    main()
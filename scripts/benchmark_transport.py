@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""Benchmark per-call latency with and without the shared HTTP transport.
+
+Compares the pattern the MCP tools used to follow (a new client, and therefore
+a new connection, per tool call) against clients that share the pooled
+transport from ``kma_mcp.core.transport``.
+
+By default the benchmark runs against a local keep-alive HTTP server so it can
+run offline. Point it at the real API Hub to include TLS handshake costs:
+
+    python scripts/benchmark_transport.py --calls 50
+    KMA_API_KEY=... python scripts/benchmark_transport.py \
+        --base-url https://apihub.kma.go.kr/api/typ01/cgi-bin/url
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import threading
+import time
+from collections.abc import Callable
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# Add src directory to Python path
+src_path = Path(__file__).parent.parent / 'python' / 'src'
+sys.path.insert(0, str(src_path))
+
+from kma_mcp.core.transport import close_http_clients, get_http_client  # noqa: E402
+from kma_mcp.surface.aws_client import AWSClient  # noqa: E402
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def do_GET(self) -> None:
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+
+def _measure(call: Callable[[], object], calls: int) -> list[float]:
+    timings = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        call()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def _report(label: str, timings: list[float]) -> None:
+    timings = sorted(timings)
+    p95 = timings[int(len(timings) * 0.95) - 1]
+    print(
+        f'{label:<22} mean {statistics.mean(timings):8.2f} ms  '
+        f'p50 {statistics.median(timings):8.2f} ms  p95 {p95:8.2f} ms'
+    )
+
+
+def main() -> None:
+    """Run the transport benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--calls', type=int, default=200, help='Calls per scenario')
+    parser.add_argument('--base-url', help='CGI base URL (default: local stand-in server)')
+    args = parser.parse_args()
+
+    server = None
+    base_url = args.base_url
+    if base_url is None:
+        server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        base_url = f'http://127.0.0.1:{server.server_address[1]}'
+    AWSClient.CGI_BASE_URL = base_url
+    auth_key = os.getenv('KMA_API_KEY', 'benchmark')
+
+    def per_call_client() -> None:
+        with AWSClient(auth_key) as client:
+            client.get_minutely_data(tm2='202501011200', stn=108)
+
+    def shared_client() -> None:
+        with AWSClient(auth_key, http_client=get_http_client()) as client:
+            client.get_minutely_data(tm2='202501011200', stn=108)
+
+    print(f'{args.calls} calls against {base_url}')
+    _report('new client per call', _measure(per_call_client, args.calls))
+    _report('shared pooled client', _measure(shared_client, args.calls))
+
+    close_http_clients()
+    if server is not None:
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""Generate type stubs for the async clients.
+
+The async clients are derived from the sync ones at runtime with
+``async_client`` (see ``kma_mcp.core.client``), so a type checker sees
+``AsyncASOSClient`` only as ``type[AsyncKMAClient]``. This script writes a
+``.pyi`` stub next to every ``async_*_client.py`` module, declaring each public
+method of the sync client as a coroutine with the same signature:
+
+    python scripts/generate_async_stubs.py
+    python scripts/generate_async_stubs.py --check  # fail if a stub is out of date
+
+Run it after changing the signature of a client method.
+"""
+
+import argparse
+import ast
+import builtins
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+PACKAGE = Path(__file__).parent.parent / 'python' / 'src' / 'kma_mcp'
+HEADER = '# Generated by scripts/generate_async_stubs.py from the sync client; do not edit.\n'
+
+
+def _derived(tree: ast.Module) -> list[tuple[str, str]]:
+    """Return ``(async name, sync name)`` of every ``X = async_client(Y, __name__)``."""
+    return [
+        (node.targets[0].id, node.value.args[0].id)
+        for node in tree.body
+        if isinstance(node, ast.Assign)
+        and isinstance(node.value, ast.Call)
+        and isinstance(node.value.func, ast.Name)
+        and node.value.func.id == 'async_client'
+        and isinstance(node.targets[0], ast.Name)
+        and isinstance(node.value.args[0], ast.Name)
+    ]
+
+
+def _imported_from(tree: ast.Module, name: str) -> str:
+    """Return the module a name is imported from."""
+    for node in tree.body:
+        if isinstance(node, ast.ImportFrom) and any(
+            (alias.asname or alias.name) == name for alias in node.names
+        ):
+            return node.module or ''
+    msg = f'{name} is not imported'
+    raise LookupError(msg)
+
+
+def _module_path(module: str) -> Path:
+    return PACKAGE.parent.joinpath(*module.split('.')).with_suffix('.py')
+
+
+def _names(nodes: list[ast.expr | None]) -> set[str]:
+    """Return the names, other than builtins, referenced by annotations."""
+    return {
+        child.id
+        for node in nodes
+        if node is not None
+        for child in ast.walk(node)
+        if isinstance(child, ast.Name) and not hasattr(builtins, child.id)
+    }
+
+
+def _stub_method(method: ast.FunctionDef) -> tuple[str, set[str]]:
+    """Return the async stub of a public method and the names it references."""
+    args = method.args
+    defaults = [*args.defaults, *(d for d in args.kw_defaults if d is not None)]
+    for default in defaults:
+        if not isinstance(default, ast.Constant | ast.UnaryOp):
+            msg = f'{method.name}: only literal defaults can be written to a stub'
+            raise ValueError(msg)
+    annotations = [arg.annotation for arg in (*args.posonlyargs, *args.args, *args.kwonlyargs)]
+    returns = f' -> {ast.unparse(method.returns)}' if method.returns else ''
+    stub = f'    async def {method.name}({ast.unparse(args)}){returns}: ...'
+    return stub, _names([*annotations, method.returns])
+
+
+def _imports(tree: ast.Module, names: set[str], module: str) -> list[str]:
+    """Return import statements binding ``names``, as the sync module imports them."""
+    lines = []
+    missing = set(names)
+    for node in tree.body:
+        if isinstance(node, ast.Import | ast.ImportFrom):
+            aliases = [alias for alias in node.names if (alias.asname or alias.name) in missing]
+            if not aliases:
+                continue
+            missing -= {alias.asname or alias.name for alias in aliases}
+            if isinstance(node, ast.Import):
+                lines.append(ast.unparse(ast.Import(aliases)))
+            else:
+                lines.append(ast.unparse(ast.ImportFrom(node.module, aliases, node.level)))
+    # Whatever is left is defined in the sync module itself
+    lines.extend(f'from {module} import {name}' for name in sorted(missing))
+    return lines
+
+
+def render(path: Path) -> str | None:
+    """Return the stub of an async client module, or None if it derives no client."""
+    tree = ast.parse(path.read_text(encoding='utf-8'))
+    pairs = _derived(tree)
+    if not pairs:
+        return None
+
+    imports: list[str] = ['from kma_mcp.core.client import AsyncKMAClient']
+    classes: list[str] = []
+    for async_name, sync_name in pairs:
+        module = _imported_from(tree, sync_name)
+        sync_tree = ast.parse(_module_path(module).read_text(encoding='utf-8'))
+        sync_class = next(
+            node
+            for node in sync_tree.body
+            if isinstance(node, ast.ClassDef) and node.name == sync_name
+        )
+        if [ast.unparse(base) for base in sync_class.bases] != ['KMAClient']:
+            msg = f'{sync_name} must derive from KMAClient directly'
+            raise ValueError(msg)
+
+        methods: list[str] = []
+        names: set[str] = set()
+        for node in sync_class.body:
+            if isinstance(node, ast.FunctionDef) and not node.name.startswith('_'):
+                stub, used = _stub_method(node)
+                methods.append(stub)
+                names |= used
+        imports += _imports(sync_tree, names, module)
+        classes.append(f'class {async_name}(AsyncKMAClient):\n' + '\n'.join(methods or ['    ...']))
+
+    source = HEADER + '\n'.join(imports) + '\n\n' + '\n\n'.join(classes) + '\n'
+    return _format(source, path.with_suffix('.pyi'))
+
+
+def _format(source: str, path: Path) -> str:
+    """Sort the imports and format the stub like the rest of the code base."""
+    ruff = shutil.which('ruff')
+    if ruff is None:
+        sys.exit('ruff is needed to format the stubs')
+    stdin = ['--stdin-filename', str(path), '-']
+    for command in (
+        [ruff, 'check', '--select', 'I', '--fix', '--quiet', *stdin],
+        [ruff, 'format', '--quiet', *stdin],
+    ):
+        source = subprocess.run(  # noqa: S603
+            command, input=source, capture_output=True, text=True, check=True
+        ).stdout
+    return source
+
+
+def main() -> None:
+    """Write or check the stub of every async client module."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--check', action='store_true', help='Fail if a stub is out of date')
+    args = parser.parse_args()
+
+    stale = []
+    for path in sorted(PACKAGE.rglob('async_*_client.py')):
+        stub = render(path)
+        if stub is None:
+            continue
+        target = path.with_suffix('.pyi')
+        if target.exists() and target.read_text(encoding='utf-8') == stub:
+            continue
+        stale.append(target)
+        if not args.check:
+            target.write_text(stub, encoding='utf-8')
+            print(f'wrote {target.relative_to(PACKAGE.parent)}')
+
+    if args.check and stale:
+        for target in stale:
+            print(f'out of date: {target.relative_to(PACKAGE.parent)}')
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""Local stand-in for the KMA API Hub, for benchmarks and offline runs.
+
+Serves the endpoints below over HTTP/1.1 keep-alive, in the API Hub's
+formats, with bodies sized by the query like the real ones (``stn=0`` returns
+every station, ``tm1``/``tm2`` one block of rows per minute or hour):
+
+- ``kma_sfctm3.php``: hourly ASOS period, fixed-width text
+- ``nph-aws2_min``: minutely AWS, fixed-width text
+- ``nph-dfs_shrt_grd``: village forecast grid, 149 x 253 ASCII values
+- ``kma_wn.php``: current warnings, comma-separated text
+- ``MidFcstInfoService/*``: medium-term forecast, OpenAPI JSON
+
+Bodies are synthesized by default. Record real responses once, then replay
+them instead::
+
+    KMA_API_KEY=... python scripts/kma_standin.py --record recordings/
+    python scripts/kma_standin.py --replay recordings/ --port 8088
+
+Point the clients at a running stand-in with :func:`use_standin`.
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import threading
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qsl, urlsplit
+
+import httpx
+
+# Add src directory to Python path
+src_path = Path(__file__).parent.parent / 'python' / 'src'
+sys.path.insert(0, str(src_path))
+
+from kma_mcp.core.cache import KST  # noqa: E402
+from kma_mcp.core.client import (  # noqa: E402
+    CGI_URL,
+    OPENAPI_URL,
+    TYP01_URL,
+    AsyncKMAClient,
+    KMAClient,
+)
+
+ASOS_STATIONS = 97
+AWS_STATIONS = 700
+GRID_NX, GRID_NY = 149, 253
+
+ASOS_COLUMNS = 'STN WD WS GST GST GST PA PS PT PR TA TD HM PV RN RN RN RN SD SD SD WC WP WW'
+ASOS_COLUMNS += ' CA CA CH CT CT CT CT VS SS SI ST TS TE TE TE TE ST WH BF IR IX'
+AWS_COLUMNS = 'STN WD1 WS1 WDS WSS WD10 WS10 TA RE RN-15m RN-60m RN-12H RN-DAY HM PA PS TD'
+
+# Representative request of each endpoint: (base URL, path, query) for --record
+REQUESTS = {
+    'kma_sfctm3.php': (
+        TYP01_URL,
+        'kma_sfctm3.php',
+        {'tm1': '202501010000', 'tm2': '202501312300', 'stn': '0'},
+    ),
+    'nph-aws2_min': (
+        CGI_URL,
+        'nph-aws2_min',
+        {'tm1': '202501011100', 'tm2': '202501011200', 'stn': '0'},
+    ),
+    'nph-dfs_shrt_grd': (CGI_URL, 'nph-dfs_shrt_grd', {'tmfc': '0', 'vars': 'TMP'}),
+    'kma_wn.php': (TYP01_URL, 'kma_wn.php', {'stn': '0'}),
+    'getMidTa': (
+        OPENAPI_URL,
+        'MidFcstInfoService/getMidTa',
+        {'regId': '11B10101', 'tmFc': '0', 'dataType': 'JSON'},
+    ),
+}
+
+WARNING_NAMES = ['강풍', '호우', '한파', '건조', '폭풍해일', '풍랑', '태풍', '대설', '황사', '폭염']
+WARNING_LEVELS = ['예비', '주의', '경보']
+
+
+def _kst(value: str) -> datetime:
+    return datetime.strptime(value, '%Y%m%d%H%M').replace(tzinfo=KST)
+
+
+def _times(params: dict[str, str], step: timedelta) -> list[str]:
+    """Return the observation times from tm1 to tm2 (one time when only tm2 is given)."""
+    end = _kst(params.get('tm2') or params.get('tm') or '202501011200')
+    start = _kst(params['tm1']) if params.get('tm1') else end
+    count = max(int((end - start) / step) + 1, 1)
+    return [(start + step * i).strftime('%Y%m%d%H%M') for i in range(count)]
+
+
+def _stations(params: dict[str, str], count: int, first: int) -> list[int]:
+    stn = int(params.get('stn') or 0)
+    return list(range(first, first + count)) if stn == 0 else [stn]
+
+
+def _value(rng: random.Random, missing: str = '-99.0') -> str:
+    return missing if rng.random() < 0.05 else f'{rng.uniform(-20, 40):.1f}'
+
+
+@lru_cache(maxsize=32)
+def _fixed_width(columns: str, times: tuple[str, ...], stations: tuple[int, ...]) -> bytes:
+    names = columns.split()[1:]
+    rng = random.Random(len(times) * len(stations))  # noqa: S311
+    lines = ['#START7777', f'# YYMMDDHHMI {columns}']
+    for tm in times:
+        for stn in stations:
+            values = ' '.join(f'{_value(rng):>6}' for _ in names)
+            lines.append(f'{tm} {stn:4d} {values}')
+    lines.append('#7777END')
+    return ('\n'.join(lines) + '\n').encode()
+
+
+def sfctm3(params: dict[str, str]) -> tuple[bytes, str]:
+    """Hourly ASOS observations of a period."""
+    times = _times(params, timedelta(hours=1))
+    stations = _stations(params, ASOS_STATIONS, 90)
+    return _fixed_width(ASOS_COLUMNS, tuple(times), tuple(stations)), 'text/plain'
+
+
+def aws2_min(params: dict[str, str]) -> tuple[bytes, str]:
+    """Minutely AWS observations of a period."""
+    times = _times(params, timedelta(minutes=1))
+    stations = _stations(params, AWS_STATIONS, 90)
+    return _fixed_width(AWS_COLUMNS, tuple(times), tuple(stations)), 'text/plain'
+
+
+@lru_cache(maxsize=4)
+def _grid(var: str) -> bytes:
+    rng = random.Random(var)  # noqa: S311
+    rows = (
+        ', '.join(f'{rng.uniform(-10, 30):.2f}' for _ in range(GRID_NX)) for _ in range(GRID_NY)
+    )
+    return ('\n'.join(rows) + '\n').encode()
+
+
+def shrt_grd(params: dict[str, str]) -> tuple[bytes, str]:
+    """One village forecast grid variable."""
+    return _grid(params.get('vars', 'TMP')), 'text/plain'
+
+
+@lru_cache(maxsize=1)
+def _warnings() -> bytes:
+    rng = random.Random(0)  # noqa: S311
+    lines = ['#START7777', '# REG_UP, REG_KO, REG_ID, TM_FC, TM_EF, WRN, LVL, CMD,']
+    for zone in range(180):
+        region = f'L{1000000 + zone // 10 * 10000}'
+        lines.append(
+            f'{region}, 구역{zone}, L{1000000 + zone * 100}, 202501010600, 202501010700, '
+            f'{rng.choice(WARNING_NAMES)}, {rng.choice(WARNING_LEVELS)}, 발표, ='
+        )
+    lines.append('#7777END')
+    return ('\n'.join(lines) + '\n').encode()
+
+
+def kma_wn(_params: dict[str, str]) -> tuple[bytes, str]:
+    """Every warning in force."""
+    return _warnings(), 'text/plain'
+
+
+def mid_fcst(params: dict[str, str]) -> tuple[bytes, str]:
+    """Medium-term forecast of one region, as the OpenAPI returns it."""
+    rng = random.Random(params.get('regId', ''))  # noqa: S311
+    item: dict[str, object] = {'regId': params.get('regId', '11B10101')}
+    for day in range(3, 11):
+        low = rng.randint(-5, 15)
+        item |= {f'taMin{day}': low, f'taMax{day}': low + rng.randint(3, 12)}
+        item |= {f'taMin{day}Low': 0, f'taMin{day}High': 0}
+    body = {
+        'response': {
+            'header': {'resultCode': '00', 'resultMsg': 'NORMAL_SERVICE'},
+            'body': {
+                'dataType': 'JSON',
+                'items': {'item': [item]},
+                'pageNo': 1,
+                'numOfRows': 10,
+                'totalCount': 1,
+            },
+        }
+    }
+    return json.dumps(body, ensure_ascii=False).encode(), 'application/json;charset=UTF-8'
+
+
+# Synthesized body of each endpoint, keyed by the last path segment
+ENDPOINTS: dict[str, Callable[[dict[str, str]], tuple[bytes, str]]] = {
+    'kma_sfctm3.php': sfctm3,
+    'nph-aws2_min': aws2_min,
+    'nph-dfs_shrt_grd': shrt_grd,
+    'kma_wn.php': kma_wn,
+    'getMidTa': mid_fcst,
+    'getMidLandFcst': mid_fcst,
+    'getMidFcst': mid_fcst,
+    'getMidSeaFcst': mid_fcst,
+}
+
+
+def _recording(directory: Path, endpoint: str) -> tuple[bytes, str] | None:
+    for path in directory.glob(f'{endpoint}.*'):
+        content_type = 'application/json' if path.suffix == '.json' else 'text/plain'
+        return path.read_bytes(), content_type
+    return None
+
+
+class StandIn:
+    """KMA API Hub stand-in served from a background thread."""
+
+    def __init__(self, port: int = 0, replay: Path | None = None) -> None:
+        """Start serving on 127.0.0.1.
+
+        Args:
+            port: Port to listen on (0 for any free port)
+            replay: Directory of recorded responses served instead of synthesized ones
+        """
+        self.requests = 0
+        standin = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            disable_nagle_algorithm = True
+
+            def do_GET(self) -> None:
+                url = urlsplit(self.path)
+                endpoint = url.path.rsplit('/', 1)[-1]
+                standin.requests += 1
+                found = _recording(replay, endpoint) if replay is not None else None
+                if found is None and endpoint in ENDPOINTS:
+                    found = ENDPOINTS[endpoint](dict(parse_qsl(url.query)))
+                if found is None:
+                    self.send_error(404, f'No stand-in for {endpoint}')
+                    return
+                body, content_type = found
+                self.send_response(200)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args: object) -> None:
+                pass
+
+        self._server = ThreadingHTTPServer(('127.0.0.1', port), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    @property
+    def url(self) -> str:
+        """Root URL of the stand-in."""
+        return f'http://127.0.0.1:{self._server.server_address[1]}'
+
+    def close(self) -> None:
+        """Stop serving."""
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def use_standin(url: str) -> None:
+    """Send every sync and async client request to the stand-in at ``url``."""
+    for cls in (KMAClient, AsyncKMAClient):
+        cls.BASE_URL = TYP01_URL.replace('https://apihub.kma.go.kr', url)
+        cls.CGI_BASE_URL = CGI_URL.replace('https://apihub.kma.go.kr', url)
+        cls.OPENAPI_BASE_URL = OPENAPI_URL.replace('https://apihub.kma.go.kr', url)
+
+
+def record(directory: Path, auth_key: str) -> None:
+    """Save the API Hub's answer to each representative request for replay."""
+    directory.mkdir(parents=True, exist_ok=True)
+    with httpx.Client(timeout=120) as client:
+        for endpoint, (base_url, path, params) in REQUESTS.items():
+            response = client.get(f'{base_url}/{path}', params={**params, 'authKey': auth_key})
+            response.raise_for_status()
+            suffix = '.json' if 'json' in response.headers.get('Content-Type', '') else '.txt'
+            (directory / f'{endpoint}{suffix}').write_bytes(response.content)
+            print(f'{endpoint:<18} {len(response.content):>12,} bytes')
+
+
+def main() -> None:
+    """Serve the stand-in, or record real responses for it."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--port', type=int, default=8088, help='Port to listen on')
+    parser.add_argument('--replay', type=Path, help='Directory of recorded responses to serve')
+    parser.add_argument('--record', type=Path, help='Record real responses into this directory')
+    args = parser.parse_args()
+
+    if args.record is not None:
+        auth_key = os.getenv('KMA_API_KEY')
+        if not auth_key:
+            parser.error('--record needs KMA_API_KEY')
+        record(args.record, auth_key)
+        return
+
+    standin = StandIn(args.port, args.replay)
+    print(f'KMA API Hub stand-in on {standin.url} (Ctrl-C to stop)')
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        standin.close()
+
+
+if __name__ == '__main__':
+    main()